@@ -5,8 +5,7 @@ Streamlit 기반 인터랙티브 웹 애플리케이션
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime
 import os
 import sys
@@ -15,6 +14,9 @@ import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
+from src.analysis.columns import STATION_COLUMNS, LINE_COLUMNS, find_column, get_hour_columns
+from src.analysis.hourly_cube import WEEKDAY_NAMES, weekday_of
+from src.visualization.plotly_renderer import PlotlyChartRenderer
 from src.config.settings import DATA_DIR
 
 # 페이지 설정
@@ -30,32 +32,48 @@ st.title("🚇 서울시 지하철 이용 패턴 분석 대시보드")
 st.markdown("---")
 
 
-@st.cache_data
-def load_subway_data():
+@st.cache_resource
+def load_subway_analyzer():
     """
-    지하철 데이터 로드 (캐싱)
+    지하철 데이터 로드 및 분석기 생성 (캐싱)
+
+    분석기와 인덱스(누적합, 역별 정렬 데이터)는 세션 간에 같은 객체를 공유한다.
+    (cache_data는 재실행마다 전체를 pickle 복사하므로 인덱스 조회 이점이 사라짐)
+    화면 코드는 분석기의 데이터를 필터링만 하고 수정하지 않는다.
+
+    Returns:
+        tuple: (분석기, 노선 목록) - 데이터가 없으면 (None, [])
     """
     # data/raw 폴더에서 가장 최근 CSV 파일 찾기
     raw_data_path = os.path.join(DATA_DIR, 'raw')
-    
+
     if not os.path.exists(raw_data_path):
-        return None
-    
+        return None, []
+
     csv_files = [f for f in os.listdir(raw_data_path) if f.endswith('.csv')]
-    
+
     if not csv_files:
-        return None
-    
+        return None, []
+
     # 가장 최근 파일 선택
     latest_file = sorted(csv_files)[-1]
     filepath = os.path.join(raw_data_path, latest_file)
-    
+
     # 분석기로 데이터 로드
     analyzer = SubwayPatternAnalyzer(filepath)
     analyzer.load_data()
-    df = analyzer.preprocess_data()
-    
-    return df, analyzer
+    if analyzer.preprocess_data() is None:
+        return None, []
+
+    # 날짜 범위 조회용 누적합 인덱스 + 역 상세 조회용 역별 정렬 데이터
+    analyzer.build_prefix_index()
+    analyzer.build_station_layout()
+
+    # 노선 목록은 로드 시 한 번만 (factorize 고유값, 결측 제외)
+    line_col = find_column(analyzer.df_processed, LINE_COLUMNS)
+    line_names = pd.factorize(analyzer.df_processed[line_col], sort=True)[1].tolist() if line_col else []
+
+    return analyzer, line_names
 
 
 # 사이드바 - 필터링 옵션
@@ -63,278 +81,353 @@ st.sidebar.header("📊 필터 옵션")
 
 # 데이터 로드
 data_load_state = st.sidebar.text('데이터 로딩 중...')
-result = load_subway_data()
+analyzer, line_names = load_subway_analyzer()
 
-if result is None:
+if analyzer is None:
     st.error("❌ 데이터를 찾을 수 없습니다. 먼저 데이터를 수집해주세요.")
     st.stop()
 
-df, analyzer = result
+df = analyzer.df_processed
 data_load_state.text('데이터 로드 완료! ✅')
 
+station_col = find_column(df, STATION_COLUMNS)
+line_col = find_column(df, LINE_COLUMNS)
+hour_columns = get_hour_columns(df)
+
 # 필터 - 날짜 범위
+# (필터는 선택값만 정하고, 행 필터링은 인덱스로 조회할 수 없는 경우에만 아래에서 수행)
+date_start, date_end = None, None
 if 'USE_DT' in df.columns:
-    min_date = df['USE_DT'].min()
-    max_date = df['USE_DT'].max()
-    
+    if analyzer.prefix_index is not None and len(analyzer.prefix_index.dates) > 0:
+        min_date = pd.Timestamp(analyzer.prefix_index.dates[0])
+        max_date = pd.Timestamp(analyzer.prefix_index.dates[-1])
+    else:
+        min_date = df['USE_DT'].min()
+        max_date = df['USE_DT'].max()
+
     date_range = st.sidebar.date_input(
         "📅 날짜 범위",
         value=(min_date, max_date),
         min_value=min_date,
         max_value=max_date
     )
-    
+
     if len(date_range) == 2:
-        df = df[(df['USE_DT'] >= pd.Timestamp(date_range[0])) & 
-                (df['USE_DT'] <= pd.Timestamp(date_range[1]))]
+        date_start, date_end = pd.Timestamp(date_range[0]), pd.Timestamp(date_range[1])
 
 # 필터 - 노선 선택
-if 'LN_NM' in df.columns:
-    lines = ['전체'] + sorted(df['LN_NM'].unique().tolist())
-    selected_line = st.sidebar.selectbox("🚉 노선 선택", lines)
-    
-    if selected_line != '전체':
-        df = df[df['LN_NM'] == selected_line]
+selected_line = '전체'
+if line_col:
+    selected_line = st.sidebar.selectbox("🚉 노선 선택", ['전체'] + line_names)
 
 # 필터 - 평일/주말
+day_type = '전체'
 if 'DAY_TYPE' in df.columns:
     day_type = st.sidebar.radio("📆 요일 구분", ['전체', '평일', '주말'])
-    
-    if day_type == '평일':
-        df = df[df['DAY_TYPE'] == '평일']
-    elif day_type == '주말':
-        df = df[df['DAY_TYPE'] == '주말']
+
+# 필터 - 히트맵 역 수
+heatmap_top_n = st.sidebar.slider("🔥 히트맵 표시 역 수", min_value=10, max_value=700, value=30, step=10)
 
 st.sidebar.markdown("---")
 
+# 차트 렌더러 (대용량 데이터는 WebGL + 서버 측 집계)
+renderer = PlotlyChartRenderer()
+
+# 집계 데이터 준비
+# 날짜 범위 필터만 적용된 경우 누적합 인덱스로 조회 (기간 내 행 재스캔 없음)
+index = analyzer.prefix_index if (selected_line == '전체' and day_type == '전체') else None
+
+station_names = np.array([], dtype=object)
+hour_values = np.array([], dtype=np.int64)
+station_boarding = np.zeros((0, 0))
+station_alighting = np.zeros((0, 0))
+daily_dates = np.array([], dtype='datetime64[D]')
+daily_boarding = np.array([])
+daily_alighting = np.array([])
+
+if index is not None:
+    station_names = index.stations
+    hour_values = index.hours
+    station_boarding = index.hourly('boarding', date_start, date_end)
+    station_alighting = index.hourly('alighting', date_start, date_end)
+    daily_dates, daily_boarding = index.daily('boarding', date_start, date_end)
+    _, daily_alighting = index.daily('alighting', date_start, date_end)
+    daily_boarding = daily_boarding.sum(axis=0)
+    daily_alighting = daily_alighting.sum(axis=0)
+elif hour_columns:
+    # 노선/요일 구분이 선택된 경우에만 행 필터링
+    mask = np.ones(len(df), dtype=bool)
+    if date_start is not None:
+        mask &= ((df['USE_DT'] >= date_start) & (df['USE_DT'] <= date_end)).to_numpy()
+    if selected_line != '전체':
+        mask &= (df[line_col] == selected_line).to_numpy()
+    if day_type != '전체':
+        mask &= (df['DAY_TYPE'] == day_type).to_numpy()
+    df = df[mask]
+
+    if len(df) > 0:
+        boarding_cols = [on for _, on, _ in hour_columns]
+        alighting_cols = [off for _, _, off in hour_columns]
+        hour_values = np.array([hour for hour, _, _ in hour_columns])
+
+        station_hourly = (df.groupby(station_col)[boarding_cols + alighting_cols].sum()
+                          if station_col else df[boarding_cols + alighting_cols].sum().to_frame('전체').T)
+        station_names = station_hourly.index.to_numpy(dtype=object)
+        station_boarding = station_hourly[boarding_cols].to_numpy()
+        station_alighting = station_hourly[alighting_cols].to_numpy()
+
+        if 'USE_DT' in df.columns:
+            daily_sum = df.groupby('USE_DT')[boarding_cols + alighting_cols].sum()
+            daily_dates = daily_sum.index.values.astype('datetime64[D]')
+            daily_boarding = daily_sum[boarding_cols].sum(axis=1).to_numpy()
+            daily_alighting = daily_sum[alighting_cols].sum(axis=1).to_numpy()
+
+station_totals = station_boarding.sum(axis=1) + station_alighting.sum(axis=1)
+hour_labels = [f'{hour}시' for hour in hour_values]
+
 # 메인 대시보드
 col1, col2, col3, col4 = st.columns(4)
 
 # KPI 지표
 with col1:
-    total_stations = df['STATN_NM'].nunique() if 'STATN_NM' in df.columns else 0
+    total_stations = int((station_totals > 0).sum())
     st.metric("총 역 수", f"{total_stations:,}")
 
 with col2:
-    total_lines = df['LN_NM'].nunique() if 'LN_NM' in df.columns else 0
+    total_lines = (1 if selected_line != '전체' else len(line_names)) if line_col else 0
     st.metric("총 노선 수", f"{total_lines}")
 
 with col3:
     # 승차 인원 계산
-    boarding_cols = [col for col in df.columns if 'GET_ON_NOPE' in col]
-    if boarding_cols:
-        total_boarding = df[boarding_cols].sum().sum()
-        st.metric("총 승차 인원", f"{total_boarding:,.0f}")
+    if hour_columns:
+        st.metric("총 승차 인원", f"{station_boarding.sum():,.0f}")
     else:
         st.metric("총 승차 인원", "N/A")
 
 with col4:
     # 하차 인원 계산
-    alighting_cols = [col for col in df.columns if 'GET_OFF_NOPE' in col]
-    if alighting_cols:
-        total_alighting = df[alighting_cols].sum().sum()
-        st.metric("총 하차 인원", f"{total_alighting:,.0f}")
+    if hour_columns:
+        st.metric("총 하차 인원", f"{station_alighting.sum():,.0f}")
     else:
         st.metric("총 하차 인원", "N/A")
 
 st.markdown("---")
 
 # 탭으로 구분된 분석 뷰
-tab1, tab2, tab3, tab4 = st.tabs(["📈 시간대별 분석", "📊 요일별 분석", "🏆 역별 순위", "🔥 히트맵"])
+tab1, tab2, tab3, tab4, tab5 = st.tabs(["📈 시간대별 분석", "📊 요일별 분석", "🏆 역별 순위", "🔥 히트맵", "🔎 역 상세"])
 
 with tab1:
     st.subheader("⏰ 시간대별 이용 패턴")
-    
-    # 시간대별 데이터 집계
-    boarding_cols = [col for col in df.columns if 'GET_ON_NOPE' in col]
-    alighting_cols = [col for col in df.columns if 'GET_OFF_NOPE' in col]
-    
-    if boarding_cols and alighting_cols:
-        hourly_data = []
-        for hour in range(4, 25):  # 4시~24시
-            hour_str = f"{hour:02d}"
-            boarding_col = f'HR_{hour_str}_GET_ON_NOPE'
-            alighting_col = f'HR_{hour_str}_GET_OFF_NOPE'
-            
-            if boarding_col in df.columns and alighting_col in df.columns:
-                hourly_data.append({
-                    '시간대': f'{hour}시',
-                    '승차': df[boarding_col].sum(),
-                    '하차': df[alighting_col].sum()
-                })
-        
-        hourly_df = pd.DataFrame(hourly_data)
-        
+
+    if len(hour_values) > 0:
+        # 시간대별 데이터 집계
+        hourly_df = pd.DataFrame({
+            '시간대': hour_labels,
+            '승차': station_boarding.sum(axis=0),
+            '하차': station_alighting.sum(axis=0)
+        })
+
         # Plotly 라인 차트
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=hourly_df['시간대'], 
-            y=hourly_df['승차'],
-            mode='lines+markers',
-            name='승차',
-            line=dict(color='#1f77b4', width=3)
-        ))
-        fig.add_trace(go.Scatter(
-            x=hourly_df['시간대'], 
-            y=hourly_df['하차'],
-            mode='lines+markers',
-            name='하차',
-            line=dict(color='#ff7f0e', width=3)
-        ))
-        
-        fig.update_layout(
+        fig = renderer.line_chart(
+            hourly_df['시간대'],
+            {'승차': hourly_df['승차'], '하차': hourly_df['하차']},
             title="시간대별 승하차 인원",
             xaxis_title="시간대",
             yaxis_title="인원 (명)",
-            hovermode='x unified',
-            height=500
+            colors={'승차': '#1f77b4', '하차': '#ff7f0e'},
+            chart_id='hourly'
         )
-        
+
         st.plotly_chart(fig, use_container_width=True)
-        
+
+        # 일별 추이 (기간이 길면 WebGL + 집계)
+        if len(daily_dates) > 0:
+            fig = renderer.line_chart(
+                daily_dates,
+                {'승차': daily_boarding, '하차': daily_alighting},
+                title="일별 승하차 추이",
+                xaxis_title="날짜",
+                yaxis_title="인원 (명)",
+                colors={'승차': '#1f77b4', '하차': '#ff7f0e'},
+                height=400,
+                chart_id='daily'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
         # 데이터 테이블
         with st.expander("📋 상세 데이터 보기"):
             st.dataframe(hourly_df, use_container_width=True)
 
 with tab2:
     st.subheader("📅 요일별 이용 패턴")
-    
-    if 'WEEKDAY_KR' in df.columns and boarding_cols:
-        weekday_order = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
-        
-        weekday_data = []
-        for weekday in weekday_order:
-            weekday_df = df[df['WEEKDAY_KR'] == weekday]
-            if len(weekday_df) > 0:
-                total_boarding = weekday_df[boarding_cols].sum().sum()
-                total_alighting = weekday_df[alighting_cols].sum().sum()
-                weekday_data.append({
-                    '요일': weekday,
-                    '승차': total_boarding,
-                    '하차': total_alighting,
-                    '총합': total_boarding + total_alighting
-                })
-        
-        weekday_df = pd.DataFrame(weekday_data)
-        
+
+    if len(daily_dates) > 0:
+        # 일별 합계 → 요일별 합계
+        weekdays = weekday_of(daily_dates)
+        weekday_boarding = np.bincount(weekdays, weights=daily_boarding, minlength=7)
+        weekday_alighting = np.bincount(weekdays, weights=daily_alighting, minlength=7)
+        present = np.bincount(weekdays, minlength=7) > 0
+
+        weekday_df = pd.DataFrame({
+            '요일': np.array(WEEKDAY_NAMES)[present],
+            '승차': weekday_boarding[present],
+            '하차': weekday_alighting[present],
+            '총합': (weekday_boarding + weekday_alighting)[present]
+        })
+
         # Plotly 바 차트
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=weekday_df['요일'],
-            y=weekday_df['승차'],
-            name='승차',
-            marker_color='#1f77b4'
-        ))
-        fig.add_trace(go.Bar(
-            x=weekday_df['요일'],
-            y=weekday_df['하차'],
-            name='하차',
-            marker_color='#ff7f0e'
-        ))
-        
-        fig.update_layout(
+        fig = renderer.bar_chart(
+            weekday_df['요일'],
+            {'승차': weekday_df['승차'], '하차': weekday_df['하차']},
             title="요일별 승하차 인원",
             xaxis_title="요일",
             yaxis_title="인원 (명)",
+            colors={'승차': '#1f77b4', '하차': '#ff7f0e'},
             barmode='group',
-            height=500
+            chart_id='weekday'
         )
-        
+
         st.plotly_chart(fig, use_container_width=True)
-        
+
         with st.expander("📋 상세 데이터 보기"):
             st.dataframe(weekday_df, use_container_width=True)
 
 with tab3:
     st.subheader("🏆 역별 이용 순위 TOP 20")
-    
-    if 'STATN_NM' in df.columns and boarding_cols:
-        # 역별 총 승하차 인원 계산
-        station_data = df.groupby('STATN_NM').agg({
-            **{col: 'sum' for col in boarding_cols},
-            **{col: 'sum' for col in alighting_cols}
-        }).reset_index()
-        
-        station_data['총승차'] = station_data[boarding_cols].sum(axis=1)
-        station_data['총하차'] = station_data[alighting_cols].sum(axis=1)
-        station_data['총이용'] = station_data['총승차'] + station_data['총하차']
-        
+
+    if station_col and len(station_names) > 0:
+        # 역별 총 승하차 인원
+        station_data = pd.DataFrame({
+            '역명': station_names,
+            '총승차': station_boarding.sum(axis=1),
+            '총하차': station_alighting.sum(axis=1),
+            '총이용': station_totals
+        })
+
         # TOP 20
-        top20 = station_data.nlargest(20, '총이용')[['STATN_NM', '총승차', '총하차', '총이용']]
+        top20 = station_data.nlargest(20, '총이용')
         top20 = top20.sort_values('총이용', ascending=True)  # 수평 막대 그래프용
-        
+
         # Plotly 수평 막대 그래프
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            y=top20['STATN_NM'],
-            x=top20['총승차'],
-            name='승차',
-            orientation='h',
-            marker_color='#1f77b4'
-        ))
-        fig.add_trace(go.Bar(
-            y=top20['STATN_NM'],
-            x=top20['총하차'],
-            name='하차',
-            orientation='h',
-            marker_color='#ff7f0e'
-        ))
-        
-        fig.update_layout(
+        fig = renderer.bar_chart(
+            top20['역명'],
+            {'승차': top20['총승차'], '하차': top20['총하차']},
             title="역별 이용 순위 TOP 20",
             xaxis_title="인원 (명)",
             yaxis_title="역명",
+            colors={'승차': '#1f77b4', '하차': '#ff7f0e'},
+            orientation='h',
             barmode='stack',
-            height=600
+            height=600,
+            chart_id='stations'
         )
-        
+
         st.plotly_chart(fig, use_container_width=True)
-        
+
         with st.expander("📋 상세 데이터 보기"):
             st.dataframe(top20.sort_values('총이용', ascending=False), use_container_width=True)
 
 with tab4:
-    st.subheader("🔥 역별 시간대별 히트맵 (TOP 30)")
-    
-    if 'STATN_NM' in df.columns and boarding_cols:
-        # TOP 30 역 선택
-        station_totals = df.groupby('STATN_NM')[boarding_cols + alighting_cols].sum().sum(axis=1)
-        top30_stations = station_totals.nlargest(30).index.tolist()
-        
-        # 히트맵 데이터 준비
-        heatmap_data = []
-        for station in top30_stations:
-            station_df = df[df['STATN_NM'] == station]
-            row = {'역명': station}
-            for hour in range(4, 25):
-                boarding_col = f'HR_{hour:02d}_GET_ON_NOPE'
-                alighting_col = f'HR_{hour:02d}_GET_OFF_NOPE'
-                if boarding_col in df.columns and alighting_col in df.columns:
-                    total = station_df[boarding_col].sum() + station_df[alighting_col].sum()
-                    row[f'{hour}시'] = total
-            heatmap_data.append(row)
-        
-        heatmap_df = pd.DataFrame(heatmap_data)
-        heatmap_df = heatmap_df.set_index('역명')
-        
+    heatmap_metric = st.radio("표시 값", ["총 이용", "순유출입 (승차 - 하차)", "누적 수지"], horizontal=True)
+    st.subheader(f"🔥 역별 시간대별 히트맵 (TOP {heatmap_top_n})")
+
+    if station_col and len(station_names) > 0:
+        if heatmap_metric == "총 이용":
+            # 총 이용객 기준 상위 N개 역
+            heatmap_values = station_boarding + station_alighting
+            ranking = station_totals
+            colorscale, zmid = 'YlOrRd', None
+        else:
+            # 순유출입 = 승차 - 하차 (+ 유출 / - 흡수), 누적 수지는 시간축 누적합
+            heatmap_values = station_boarding - station_alighting
+            if heatmap_metric == "누적 수지":
+                heatmap_values = np.cumsum(heatmap_values, axis=1)
+            ranking = np.abs(heatmap_values).max(axis=1)
+            colorscale, zmid = 'RdBu_r', 0
+
+        top_n = min(heatmap_top_n, len(station_names))
+        top = np.argsort(-ranking, kind='stable')[:top_n]
+
         # Plotly 히트맵
-        fig = go.Figure(data=go.Heatmap(
-            z=heatmap_df.values,
-            x=heatmap_df.columns,
-            y=heatmap_df.index,
-            colorscale='YlOrRd',
-            hoverongaps=False
-        ))
-        
-        fig.update_layout(
-            title="역별 시간대별 이용 패턴",
+        fig = renderer.heatmap(
+            heatmap_values[top],
+            x_labels=hour_labels,
+            y_labels=station_names[top],
+            title=f"역별 시간대별 {heatmap_metric}",
             xaxis_title="시간대",
             yaxis_title="역명",
-            height=800
+            colorscale=colorscale,
+            zmid=zmid,
+            height=max(800, min(top_n, renderer.max_heatmap_rows) * 12),
+            chart_id='heatmap'
         )
-        
+
         st.plotly_chart(fig, use_container_width=True)
 
+with tab5:
+    st.subheader("🔎 역 상세 조회")
+
+    layout = analyzer.station_layout
+    if layout is not None and len(layout.stations) > 0:
+        # 역별 오프셋 인덱스로 해당 역의 연속 구간만 조회 (노선/요일 필터와 무관)
+        default_station = station_names[np.argmax(station_totals)] if len(station_totals) > 0 else None
+        station_options = layout.stations.tolist()
+        selected_station = st.selectbox(
+            "🚉 역 선택",
+            station_options,
+            index=station_options.index(default_station) if default_station in station_options else 0
+        )
+
+        detail = analyzer.get_station_detail(selected_station, date_start, date_end)
+        station_daily = detail['daily']
+        station_hourly = detail['hourly']
+
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            st.metric("총 승차 인원", f"{station_daily['BOARDING'].sum():,.0f}")
+        with col_b:
+            st.metric("총 하차 인원", f"{station_daily['ALIGHTING'].sum():,.0f}")
+        with col_c:
+            daily_mean = station_daily['TOTAL'].mean() if len(station_daily) > 0 else 0
+            st.metric("일평균 이용객", f"{daily_mean:,.0f}")
+
+        # 시간대별 승하차
+        fig = renderer.bar_chart(
+            [f'{hour}시' for hour in station_hourly['HOUR']],
+            {'승차': station_hourly['BOARDING'], '하차': station_hourly['ALIGHTING']},
+            title=f"{selected_station} 시간대별 승하차 인원",
+            xaxis_title="시간대",
+            yaxis_title="인원 (명)",
+            colors={'승차': '#1f77b4', '하차': '#ff7f0e'},
+            barmode='group',
+            height=450,
+            chart_id='station_hourly'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+        # 일별 추이
+        if len(station_daily) > 0:
+            fig = renderer.line_chart(
+                station_daily['USE_DT'].values,
+                {'승차': station_daily['BOARDING'].values, '하차': station_daily['ALIGHTING'].values},
+                title=f"{selected_station} 일별 승하차 추이",
+                xaxis_title="날짜",
+                yaxis_title="인원 (명)",
+                colors={'승차': '#1f77b4', '하차': '#ff7f0e'},
+                height=400,
+                chart_id='station_daily'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+        with st.expander("📋 상세 데이터 보기"):
+            st.dataframe(station_daily, use_container_width=True)
+
+# 차트 페이로드 크기
+with st.sidebar.expander("📦 차트 페이로드"):
+    for chart_id, n_bytes in renderer.payload_log.items():
+        st.text(f"{chart_id}: {n_bytes / 1024:,.1f} KB")
+    st.text(f"합계: {renderer.total_payload_bytes() / 1024:,.1f} KB")
+
 # 푸터
 st.markdown("---")
 st.markdown("""
@@ -16,7 +16,6 @@ sys.path.insert(0, project_root)
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-from src.analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
 
 def find_latest_data_file(data_path="data/raw/"):
     """
@@ -60,9 +59,13 @@ def main():
     print("  1. 빠른 분석 (기본 통계만)")
     print("  2. 상세 분석 (시간대/요일별 패턴)")
     print("  3. 전체 분석 (역별 특성 포함)")
-    print("  4. 종합 보고서 생성 (CSV 파일 저장)")
+    print("  4. 종합 보고서 생성 (CSV + HTML 파일 저장)")
+    print("  5. 월별 비교 보고서 (data/raw/의 모든 월 파일)")
     
-    choice = input("\n선택 (1-4): ").strip()
+    choice = input("\n선택 (1-5): ").strip()
+    
+    # pandas 등 무거운 모듈은 데이터 파일 확인 뒤에 import (파일이 없을 때 빨리 종료하도록)
+    from src.analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
     
     # 분석기 초기화
     analyzer = SubwayPatternAnalyzer(data_file)
@@ -96,7 +99,24 @@ def main():
         
     elif choice == "4":
         print("🚀 종합 보고서 생성 중...\n")
-        results = analyzer.generate_summary_report()
+        results = analyzer.generate_summary_report(html=True)
+        
+    elif choice == "5":
+        print("🚀 월별 비교 보고서 생성 중...\n")
+        monthly_files = sorted(glob(os.path.join("data/raw/", "subway_hourly_*.csv")))
+        others = []
+        for filepath in monthly_files:
+            if filepath == data_file:
+                continue
+            other = SubwayPatternAnalyzer(filepath)
+            other.load_data()
+            other.preprocess_data()
+            others.append(other)
+        
+        # 가장 이른 달부터 순서대로 비교
+        analyzers = sorted([analyzer] + others, key=lambda a: a.data_path)
+        comparison = analyzers[0].compare_months(analyzers[1:])
+        results = analyzer.generate_summary_report(comparison=comparison, html=True)
         
     else:
         print("❌ 잘못된 선택입니다.")
@@ -106,7 +126,7 @@ def main():
     print("✅ 분석 완료!")
     print("=" * 60)
     
-    if choice != "4":
+    if choice not in ("4", "5"):
         print("\n💡 다음 단계:")
         print("   python scripts/visualize_patterns.py  # 시각화 생성")
 
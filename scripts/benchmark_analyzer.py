@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+분석기 규모별 벤치마크 (합성 데이터)
+
+합성 CardSubwayTime 데이터(1개월 ~ 5년, 기본 600개 역)를 만들어 규모마다
+로드 → 전처리 → analyze_* 각각 → 이상 탐지 / 수요 예측 → 종합 보고서 → 전체 차트 시간을 잰다.
+결과는 JSON 이력 파일에 실행 단위로 추가하고, 같은 머신의 이전 실행과 비교해
+느려진 단계(회귀)를 표시한다. 규모별 단계 표는 CSV로도 저장한다.
+
+합성 CSV는 --data-dir에 (규모, 역 수, 시드, 생성기 버전)별로 한 번만 만들고 재사용한다.
+
+사용 예:
+    python scripts/benchmark_analyzer.py                         # 1m 6m 1y
+    python scripts/benchmark_analyzer.py --scales 1m 1y 5y --no-charts
+    python scripts/benchmark_analyzer.py --scales 1m --repeat 3 --fail-on-regression
+    python scripts/benchmark_analyzer.py --baseline 87f6c0c      # 특정 커밋 실행과 비교
+"""
+
+import sys
+import os
+import io
+import argparse
+import contextlib
+import csv
+import gc
+import json
+import platform
+import re
+import subprocess
+import time
+from datetime import datetime
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+HISTORY_VERSION = 1
+
+# 분석기 단계 (메서드 이름, 인자) - 종합 보고서는 save_path를 실행 시 채움
+ANALYZER_STEPS = [
+    ('analyze_basic_stats', {}),
+    ('analyze_time_pattern', {}),
+    ('analyze_weekday_pattern', {}),
+    ('analyze_station_characteristics', {'top_n': 20}),
+    ('analyze_peak_hours', {}),
+    ('analyze_net_flow', {}),
+    ('analyze_station_clusters', {}),
+    ('detect_anomalies', {}),
+    ('forecast_demand', {}),
+    ('generate_summary_report', {'html': True}),
+]
+
+
+def parse_scale(text):
+    """
+    규모 문자열 → 개월 수 ('1m' → 1, '6m' → 6, '1y' → 12, '5y' → 60)
+    """
+    match = re.fullmatch(r'(\d+)([my])', text.strip().lower())
+    if not match:
+        raise ValueError(f"규모 형식 오류: {text} (예: 1m, 6m, 1y, 5y)")
+    months = int(match.group(1)) * (12 if match.group(2) == 'y' else 1)
+    if not 1 <= months <= 120:
+        raise ValueError(f"규모는 1개월 ~ 10년이어야 합니다: {text}")
+    return months
+
+
+def git_info():
+    """
+    현재 커밋 (짧은 해시, 작업 트리 변경 여부) - git이 없으면 (None, None)
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=project_root,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        return commit, bool(status)
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def environment_info():
+    """
+    실행 환경 (비교 대상을 같은 머신/버전으로 제한할 때 사용)
+    """
+    import numpy as np
+    import pandas as pd
+    import src
+
+    return {
+        'host': platform.node(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'package': src.__version__,
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def ensure_dataset(data_dir, scale, months, args):
+    """
+    규모별 합성 CSV 준비 (있으면 재사용)
+
+    Returns:
+        tuple: (CSV 경로, 생성 시간(초), 재사용 여부)
+    """
+    from src.data_collection.synthetic_data import SYNTHETIC_VERSION, write_synthetic_csv
+
+    filename = (f"synthetic_{scale}_{args.stations}st_{args.lines}ln_seed{args.seed}"
+                f"_from{args.start}_v{SYNTHETIC_VERSION}.csv")
+    filepath = os.path.join(data_dir, filename)
+    if os.path.exists(filepath):
+        return filepath, 0.0, True
+
+    print(f"🧪 합성 데이터 생성: {scale} ({months}개월 × {args.stations}개 역) → {filepath}")
+    started = time.perf_counter()
+    write_synthetic_csv(filepath, start=args.start, months=months, n_stations=args.stations,
+                        n_lines=args.lines, seed=args.seed)
+    return filepath, time.perf_counter() - started, False
+
+
+def run_once(data_file, output_dir, charts, render_profile):
+    """
+    한 규모를 한 번 실행하고 최상위 단계별 기록 반환
+
+    Returns:
+        tuple: (단계 이름 → 기록 dict, 전처리 후 행 수)
+    """
+    from src.analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
+    from src.instrumentation.stage_recorder import StageRecorder
+
+    recorder = StageRecorder(memory=False)
+    analyzer = recorder.wrap(SubwayPatternAnalyzer(data_file), label='analyzer')
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        if analyzer.load_data() is None:
+            raise RuntimeError(f"데이터 로드 실패: {data_file}")
+        # 여러 달 파일이므로 월 범위 검사 없이 전체 기간 유지
+        analyzer.preprocess_data(check_month=False)
+        for name, kwargs in ANALYZER_STEPS:
+            if name == 'generate_summary_report':
+                kwargs = dict(kwargs, save_path=os.path.join(output_dir, 'reports'))
+            try:
+                getattr(analyzer, name)(**kwargs)
+            except Exception:
+                pass  # 실패는 recorder 기록(status='error')에 남음
+
+        if charts:
+            from src.visualization.subway_visualizer import SubwayVisualizer
+
+            visualizer = SubwayVisualizer(save_path=os.path.join(output_dir, 'charts'), cache=False,
+                                          profile=render_profile)
+            recorder.wrap(visualizer, label='visualizer')
+            try:
+                visualizer.generate_all_charts(analyzer)
+            except Exception:
+                pass
+
+    rows = len(analyzer.df_processed) if analyzer.df_processed is not None else 0
+    # 보고서/차트 안에서 다시 부른 analyze_*는 하위 단계(depth ≥ 1)이므로 최상위만 사용
+    stages = {}
+    for record in recorder.records:
+        if record['depth'] == 0:
+            stages[record['stage']] = record
+    del analyzer
+    return stages, rows
+
+
+def benchmark_scale(scale, months, args):
+    """
+    한 규모 벤치마크 (repeat번 실행, 단계마다 가장 빠른 경과 시간 사용)
+
+    Returns:
+        dict: 규모별 결과 (이력 파일에 그대로 저장)
+    """
+    data_file, generate_s, reused = ensure_dataset(args.data_dir, scale, months, args)
+    output_dir = os.path.join(args.output, 'runs', scale)
+
+    best = {}
+    rows = 0
+    for _ in range(args.repeat):
+        gc.collect()
+        stages, rows = run_once(data_file, output_dir, not args.no_charts, args.render_profile)
+        for name, record in stages.items():
+            current = best.get(name)
+            if current is None or (record['status'] == 'ok' and record['wall_s'] < current['wall_s']):
+                best[name] = record
+
+    return {
+        'scale': scale,
+        'months': months,
+        'stations': args.stations,
+        'lines': args.lines,
+        'seed': args.seed,
+        'start': args.start,
+        'rows': rows,
+        'csv_mb': round(os.path.getsize(data_file) / 1024 ** 2, 1),
+        'generate_s': round(generate_s, 2) if not reused else None,
+        'repeat': args.repeat,
+        'stages': {
+            name: {'wall_s': record['wall_s'], 'cpu_s': record['cpu_s'],
+                   'rss_peak_mb': record['rss_peak_mb'], 'status': record['status'],
+                   **({'error': record['error']} if 'error' in record else {})}
+            for name, record in best.items()
+        },
+        'total_wall_s': round(sum(record['wall_s'] for record in best.values()), 3),
+    }
+
+
+def load_history(filepath):
+    """
+    벤치마크 이력 읽기 (없으면 빈 이력)
+    """
+    if not os.path.exists(filepath):
+        return {'version': HISTORY_VERSION, 'runs': []}
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_history(filepath, history):
+    """
+    벤치마크 이력 저장 (임시 파일에 쓴 뒤 교체)
+    """
+    os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, filepath)
+
+
+def _same_dataset(a, b):
+    return all(a.get(key) == b.get(key) for key in ('scale', 'stations', 'lines', 'seed', 'start'))
+
+
+def find_baseline(runs, result, host, baseline=None):
+    """
+    비교 대상 규모 결과 찾기 (같은 머신, 같은 합성 데이터 조건의 가장 최근 실행)
+
+    Args:
+        runs (list): 이전 실행 기록 (현재 실행 제외)
+        result (dict): 현재 규모 결과
+        host (str): 현재 머신 이름
+        baseline (str): 커밋 해시 접두어 또는 라벨 (None이면 가장 최근 실행)
+
+    Returns:
+        tuple: (실행 기록, 규모 결과) - 없으면 (None, None)
+    """
+    for run in reversed(runs):
+        if run['environment'].get('host') != host:
+            continue
+        if baseline and not ((run.get('git_commit') or '').startswith(baseline) or run.get('label') == baseline):
+            continue
+        for previous in run['scales']:
+            if _same_dataset(previous, result):
+                return run, previous
+    return None, None
+
+
+def compare(result, previous, threshold, min_seconds):
+    """
+    단계별 이전 실행 대비 비율과 회귀 여부
+
+    회귀: 비율 > threshold 이고 증가량 > min_seconds (아주 짧은 단계의 흔들림 제외)
+
+    Returns:
+        list: dict (stage, wall_s, previous_wall_s, ratio, regression)
+    """
+    rows = []
+    for name, current in result['stages'].items():
+        before = previous['stages'].get(name) if previous else None
+        row = {'stage': name, 'wall_s': current['wall_s'], 'previous_wall_s': None, 'ratio': None,
+               'regression': False, 'status': current['status']}
+        if before and before.get('status') == 'ok' and current['status'] == 'ok' and before['wall_s'] > 0:
+            ratio = current['wall_s'] / before['wall_s']
+            row.update(previous_wall_s=before['wall_s'], ratio=round(ratio, 3),
+                       regression=ratio > threshold and current['wall_s'] - before['wall_s'] > min_seconds)
+        rows.append(row)
+    return rows
+
+
+def print_scale_table(result, rows, baseline_run):
+    """
+    규모 하나의 단계별 표 출력
+    """
+    reference = "비교 대상 없음"
+    if baseline_run is not None:
+        reference = f"비교: {baseline_run.get('git_commit') or '-'} ({baseline_run['timestamp']})"
+    print(f"\n📏 {result['scale']}: {result['months']}개월 × {result['stations']}개 역, "
+          f"{result['rows']:,}행, CSV {result['csv_mb']:,.1f}MB - {reference}")
+    print(f"   {'단계':<40} {'경과(초)':>9} {'CPU(초)':>9} {'이전(초)':>9} {'비율':>7}")
+    for row in rows:
+        cpu = result['stages'][row['stage']]['cpu_s']
+        previous = f"{row['previous_wall_s']:>9.3f}" if row['previous_wall_s'] is not None else f"{'-':>9}"
+        ratio = f"{row['ratio']:>6.2f}x" if row['ratio'] is not None else f"{'-':>7}"
+        flag = " ⚠️ 회귀" if row['regression'] else (" ❌ 실패" if row['status'] != 'ok' else "")
+        print(f"   {row['stage']:<40} {row['wall_s']:>9.3f} {cpu:>9.3f} {previous} {ratio}{flag}")
+    print(f"   {'합계':<40} {result['total_wall_s']:>9.3f}")
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description="분석기 규모별 벤치마크 (합성 데이터)")
+    parser.add_argument("--scales", nargs="+", default=["1m", "6m", "1y"],
+                        help="규모 목록 (예: 1m 6m 1y 5y)")
+    parser.add_argument("--stations", type=int, default=600, help="역 수")
+    parser.add_argument("--lines", type=int, default=9, help="노선 수")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 시드")
+    parser.add_argument("--start", default="2020-01", help="합성 데이터 시작 월 (YYYY-MM)")
+    parser.add_argument("--repeat", type=int, default=1, help="규모별 반복 횟수 (단계마다 최솟값 사용)")
+    parser.add_argument("--no-charts", action="store_true", help="차트 렌더링 단계 생략")
+    parser.add_argument("--render-profile", default="draft", help="차트 저장 프로파일")
+    parser.add_argument("--data-dir", default="data/synthetic/", help="합성 CSV 폴더 (재사용)")
+    parser.add_argument("--output", default="results/benchmarks/", help="결과 저장 폴더")
+    parser.add_argument("--history", default=None,
+                        help="JSON 이력 파일 (기본값: <output>/analyzer_history.json)")
+    parser.add_argument("--label", default=None, help="실행 라벨 (예: 'before-index')")
+    parser.add_argument("--baseline", default=None, help="비교할 커밋 해시 접두어 또는 라벨 (기본값: 직전 실행)")
+    parser.add_argument("--threshold", type=float, default=1.2, help="회귀 판정 비율 (기본값: 1.2배)")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="회귀 판정 최소 증가량(초)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="회귀가 있으면 종료 코드 1")
+    args = parser.parse_args()
+
+    try:
+        scales = [(scale.strip().lower(), parse_scale(scale)) for scale in args.scales]
+    except ValueError as e:
+        parser.error(str(e))
+    if args.repeat < 1:
+        parser.error("--repeat는 1 이상이어야 합니다.")
+    history_path = args.history or os.path.join(args.output, "analyzer_history.json")
+
+    commit, dirty = git_info()
+    environment = environment_info()
+    print("🚇 분석기 규모별 벤치마크")
+    print("=" * 60)
+    print(f"🔖 커밋: {commit or '-'}{' (변경 있음)' if dirty else ''}, pandas {environment['pandas']}, "
+          f"Python {environment['python']}, CPU {environment['cpu_count']}개")
+    print(f"📏 규모: {', '.join(scale for scale, _ in scales)} (반복 {args.repeat}회, "
+          f"차트 {'생략' if args.no_charts else args.render_profile})")
+
+    history = load_history(history_path)
+    previous_runs = list(history['runs'])
+    timestamp = datetime.now()
+    run = {
+        'timestamp': timestamp.isoformat(timespec='seconds'),
+        'git_commit': commit,
+        'git_dirty': dirty,
+        'label': args.label,
+        'environment': environment,
+        'scales': [],
+    }
+
+    table = []
+    regressions = []
+    for scale, months in scales:
+        result = benchmark_scale(scale, months, args)
+        run['scales'].append(result)
+        baseline_run, previous = find_baseline(previous_runs, result, environment['host'], args.baseline)
+        rows = compare(result, previous, args.threshold, args.min_seconds)
+        print_scale_table(result, rows, baseline_run)
+        for row in rows:
+            table.append({'SCALE': scale, 'MONTHS': months, 'ROWS': result['rows'], 'STAGE': row['stage'],
+                          'WALL_S': row['wall_s'], 'CPU_S': result['stages'][row['stage']]['cpu_s'],
+                          'PREVIOUS_WALL_S': row['previous_wall_s'], 'RATIO': row['ratio'],
+                          'REGRESSION': row['regression'], 'STATUS': row['status']})
+            if row['regression']:
+                regressions.append(f"{scale} {row['stage']} ({row['ratio']:.2f}x)")
+
+    history['runs'].append(run)
+    save_history(history_path, history)
+
+    filepath = os.path.join(args.output, f"analyzer_benchmark_{timestamp.strftime('%Y%m%d_%H%M%S')}.csv")
+    with open(filepath, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['SCALE', 'MONTHS', 'ROWS', 'STAGE', 'WALL_S', 'CPU_S',
+                                               'PREVIOUS_WALL_S', 'RATIO', 'REGRESSION', 'STATUS'])
+        writer.writeheader()
+        writer.writerows(table)
+    print(f"\n💾 이력 추가: {history_path} (실행 {len(history['runs'])}회)")
+    print(f"💾 단계별 결과: {filepath}")
+
+    failed = [f"{row['SCALE']} {row['STAGE']}" for row in table if row['STATUS'] != 'ok']
+    if failed:
+        print(f"❌ 실패한 단계: {', '.join(failed)}")
+    if regressions:
+        print(f"⚠️  회귀 의심 ({args.threshold:.2f}배 초과): {', '.join(regressions)}")
+        if args.fail_on_regression:
+            return 1
+    elif any(find_baseline(previous_runs, result, environment['host'], args.baseline)[0]
+             for result in run['scales']):
+        print("✅ 회귀 없음")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+저장 프로파일별 차트 렌더링 시간 / 파일 크기 벤치마크
+
+시간대별, 요일별, 역별 TOP 20, 히트맵 차트 4종을 프로파일마다 (캐시 없이) 그려
+렌더링 시간과 파일 크기를 표로 출력하고 CSV로 저장한다.
+
+사용 예:
+    python scripts/benchmark_render_profiles.py
+    python scripts/benchmark_render_profiles.py --data data/raw/subway_hourly_2024-08.csv --profiles draft standard
+"""
+
+import sys
+import os
+import io
+import argparse
+import contextlib
+import tempfile
+import time
+from datetime import datetime
+from glob import glob
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.visualization.render_profiles import RENDER_PROFILES
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description="저장 프로파일별 렌더링 벤치마크")
+    parser.add_argument("--data", default=None, help="CSV 경로 (기본값: data/raw/의 최신 파일)")
+    parser.add_argument("--profiles", nargs="+", default=list(RENDER_PROFILES),
+                        choices=list(RENDER_PROFILES), help="비교할 프로파일")
+    parser.add_argument("--repeat", type=int, default=1, help="차트별 반복 횟수 (최소 시간 사용)")
+    parser.add_argument("--output", default="results/", help="결과 CSV 저장 폴더")
+    args = parser.parse_args()
+
+    data_file = args.data
+    if data_file is None:
+        files = sorted(glob(os.path.join("data/raw/", "subway_hourly_*.csv")))
+        if not files:
+            print("❌ 데이터 파일을 찾을 수 없습니다. --data로 경로를 지정하세요.")
+            return
+        data_file = files[-1]
+
+    # matplotlib/pandas는 인자 확인 뒤에 import (--help, 오류 종료가 빠르도록)
+    import matplotlib
+    matplotlib.use('Agg')
+    import pandas as pd
+
+    from src.analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
+    from src.visualization.subway_visualizer import SubwayVisualizer, station_heatmap_table
+
+    print(f"📂 데이터: {data_file}")
+    analyzer = SubwayPatternAnalyzer(data_file)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if analyzer.load_data() is None or analyzer.preprocess_data() is None:
+            print("❌ 데이터 로드 실패")
+            return
+        charts = [
+            ('hourly', 'plot_hourly_pattern', {'hourly_df': analyzer.analyze_time_pattern()}),
+            ('weekday', 'plot_weekday_pattern', {'weekday_df': analyzer.analyze_weekday_pattern()}),
+            ('stations', 'plot_top_stations',
+             {'station_df': analyzer.analyze_station_characteristics(top_n=20), 'top_n': 20}),
+            ('heatmap', 'plot_heatmap_table',
+             {'top_stations': station_heatmap_table(analyzer.df_processed, 30), 'top_n': 30}),
+        ]
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with contextlib.redirect_stdout(io.StringIO()):
+            visualizer = SubwayVisualizer(save_path=tmp_dir, cache=False)
+
+        for profile in args.profiles:
+            for name, method, kwargs in charts:
+                if any(value is None for value in kwargs.values()):
+                    continue
+                best = None
+                for i in range(args.repeat):
+                    started = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        filepath = getattr(visualizer, method)(
+                            **kwargs, profile=profile, save_filename=f"{name}_{profile}_{i}."
+                            f"{RENDER_PROFILES[profile]['format']}")
+                    seconds = time.perf_counter() - started
+                    best = seconds if best is None else min(best, seconds)
+                rows.append({
+                    'PROFILE': profile,
+                    'CHART': name,
+                    'FORMAT': RENDER_PROFILES[profile]['format'],
+                    'SECONDS': round(best, 3),
+                    'SIZE_KB': round(os.path.getsize(filepath) / 1024, 1),
+                })
+                print(f"   {profile:<12} {name:<9} {best:>6.2f}초 {rows[-1]['SIZE_KB']:>9,.1f}KB")
+
+    result = pd.DataFrame(rows)
+    summary = result.groupby('PROFILE', sort=False)[['SECONDS', 'SIZE_KB']].sum()
+
+    print("\n" + "=" * 60)
+    print("📊 프로파일별 합계 (차트 4종)")
+    print("=" * 60)
+    print(summary.to_string())
+
+    os.makedirs(args.output, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = os.path.join(args.output, f"render_profiles_{timestamp}.csv")
+    result.to_csv(filepath, index=False, encoding='utf-8-sig')
+    print(f"\n💾 저장: {filepath}")
+
+
+if __name__ == "__main__":
+    main()
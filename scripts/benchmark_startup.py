@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+실행 진입점별 시작(import) 시간 벤치마크
+
+app.py와 scripts/의 각 스크립트에서 모듈 최상위 import 문만 뽑아
+`python -X importtime`으로 새 프로세스에서 실행하고, 누적 import 시간과
+가장 무거운 패키지를 표로 출력한다. 예산(scripts/startup_budget.json)을 넘는
+진입점이 있으면 종료 코드 1을 반환하므로 정기 작업에서 추적할 수 있다.
+결과 CSV는 --output을 지정했을 때만 저장한다.
+
+예산은 진입점 유형별 목표값이며, 현재 트리가 여유를 두고 통과하도록 정했다.
+- 150ms: 인자/API 키/데이터 파일 확인 뒤에 pandas 등을 import하는 스크립트 (인터프리터 시작 수준)
+- 250ms: 시작 시 numpy가 필요한 스크립트 (load_test_api)
+- 1500ms: 대시보드 (streamlit + pandas가 시작 시 모두 필요, 측정 약 1,300ms, plotly는 첫 차트에서 import)
+
+사용 예:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --repeat 5 --top 3
+    python scripts/benchmark_startup.py app.py scripts/analyze_patterns.py
+    python scripts/benchmark_startup.py --output results/
+"""
+
+import argparse
+import ast
+import csv
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+from glob import glob
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(project_root, "scripts", "startup_budget.json")
+
+
+def entry_points():
+    """
+    벤치마크 대상 진입점 (프로젝트 루트 기준 상대 경로)
+    """
+    scripts = sorted(glob(os.path.join(project_root, "scripts", "*.py")))
+    paths = [os.path.join(project_root, "app.py")] + scripts
+    return [os.path.relpath(path, project_root) for path in paths if os.path.exists(path)]
+
+
+def import_source(filepath):
+    """
+    스크립트의 모듈 최상위 import 문만 모은 소스 (main() 등은 실행하지 않음)
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=filepath)
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.unparse(node) for node in imports)
+
+
+def parse_importtime(stderr):
+    """
+    -X importtime 출력 파싱
+
+    Returns:
+        tuple: (전체 import 시간(ms), 최상위 패키지별 누적 시간(ms) dict)
+    """
+    prefix = "import time:"
+    total_us = 0
+    top_level = {}
+    for line in stderr.splitlines():
+        if not line.startswith(prefix) or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len(prefix):].split("|", 2)
+        total_us += int(self_us)
+        # 들여쓰기가 없는 항목이 스크립트가 직접(또는 처음) import한 최상위 모듈
+        name = name[1:]
+        if not name.startswith(" "):
+            package = name.split(".")[0]
+            top_level[package] = top_level.get(package, 0) + int(cumulative_us)
+    return total_us / 1000, {name: us / 1000 for name, us in top_level.items()}
+
+
+def measure(entry, repeat=3):
+    """
+    진입점 하나의 import 시간 측정 (repeat회 중 최솟값)
+
+    Returns:
+        dict: ENTRY, IMPORT_MS, TOP (무거운 패키지 목록)
+    """
+    source = import_source(os.path.join(project_root, entry))
+    env = dict(os.environ, PYTHONPATH=project_root + os.pathsep + os.environ.get("PYTHONPATH", ""))
+
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", source],
+                                cwd=project_root, env=env, capture_output=True, text=True)
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "오류"
+            return {'ENTRY': entry, 'IMPORT_MS': None, 'TOP': {}, 'ERROR': error}
+        total_ms, top_level = parse_importtime(result.stderr)
+        if best is None or total_ms < best['IMPORT_MS']:
+            best = {'ENTRY': entry, 'IMPORT_MS': total_ms, 'TOP': top_level, 'ERROR': None}
+    return best
+
+
+def load_budget(path=BUDGET_PATH):
+    """
+    진입점별 import 시간 예산(ms) 불러오기
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description="진입점별 시작(import) 시간 벤치마크")
+    parser.add_argument("entries", nargs="*", help="측정할 진입점 (기본값: app.py + scripts/*.py)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument("--top", type=int, default=3, help="진입점별로 표시할 무거운 패키지 수")
+    parser.add_argument("--budget", default=BUDGET_PATH, help="예산 JSON 경로")
+    parser.add_argument("--output", default=None, help="결과 CSV 저장 폴더 (지정한 경우에만 저장)")
+    args = parser.parse_args()
+
+    entries = args.entries or entry_points()
+    budget = load_budget(args.budget)
+
+    print(f"⏱️  시작 시간 측정 ({len(entries)}개 진입점, {args.repeat}회 중 최솟값)")
+    print(f"   {'진입점':<38} {'import(ms)':>10} {'예산(ms)':>9}  무거운 패키지")
+
+    rows = []
+    over_budget = []
+    for entry in entries:
+        result = measure(entry, args.repeat)
+        limit = budget.get(entry)
+        if result['ERROR']:
+            print(f"   {entry:<38} {'실패':>10} {'' if limit is None else limit:>9}  {result['ERROR']}")
+        else:
+            top = sorted(result['TOP'].items(), key=lambda item: -item[1])[:args.top]
+            heavy = ", ".join(f"{name} {ms:,.0f}" for name, ms in top)
+            status = ""
+            if limit is not None and result['IMPORT_MS'] > limit:
+                status = " ⚠️"
+                over_budget.append(entry)
+            print(f"   {entry:<38} {result['IMPORT_MS']:>10,.0f} "
+                  f"{'' if limit is None else f'{limit:,}':>9}  {heavy}{status}")
+        rows.append({
+            'ENTRY': entry,
+            'IMPORT_MS': None if result['IMPORT_MS'] is None else round(result['IMPORT_MS'], 1),
+            'BUDGET_MS': limit,
+            'ERROR': result['ERROR'] or '',
+        })
+
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = os.path.join(args.output, f"startup_{timestamp}.csv")
+        with open(filepath, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['ENTRY', 'IMPORT_MS', 'BUDGET_MS', 'ERROR'])
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"\n💾 저장: {filepath}")
+
+    if over_budget:
+        print(f"❌ 예산 초과: {', '.join(over_budget)}")
+        return 1
+    print("✅ 모든 진입점이 예산 이내입니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+월별 데이터 파일로 스트리밍 스케치 누적 갱신 스크립트
+
+이미 반영한 월은 건너뛰므로 새 달 파일이 추가될 때마다 다시 실행하면 된다.
+
+사용 예:
+    python scripts/build_sketches.py
+    python scripts/build_sketches.py --data-dir data/raw/ --output data/processed/sketches.pkl
+"""
+
+import sys
+import os
+import argparse
+from glob import glob
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description="월별 스트리밍 스케치 누적 갱신")
+    parser.add_argument("--data-dir", default="data/raw/", help="월별 CSV 디렉토리")
+    parser.add_argument("--output", default="data/processed/sketches.pkl", help="스케치 저장 경로")
+    parser.add_argument("--measure", default="boarding", choices=["boarding", "alighting", "total"],
+                        help="분위수 대상")
+    args = parser.parse_args()
+
+    files = sorted(glob(os.path.join(args.data_dir, "subway_hourly_*.csv")))
+    if not files:
+        print(f"❌ 데이터 파일을 찾을 수 없습니다: {args.data_dir}")
+        return
+
+    # pandas 등 무거운 모듈은 인자 확인 뒤에 import (--help, 오류 종료가 빠르도록)
+    from src.analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
+    from src.analysis.sketches import SubwaySketches
+
+    if os.path.exists(args.output):
+        sketches = SubwaySketches.load(args.output)
+        print(f"📂 기존 스케치 불러오기: {args.output} ({', '.join(sketches.months)})")
+    else:
+        sketches = SubwaySketches(measure=args.measure)
+
+    for filepath in files:
+        # 파일명의 월(subway_hourly_YYYY-MM.csv)이 이미 반영됐으면 건너뜀
+        month = os.path.basename(filepath)[len("subway_hourly_"):-len(".csv")]
+        if month in sketches.months:
+            print(f"⏭️  {month}: 이미 반영됨")
+            continue
+
+        analyzer = SubwayPatternAnalyzer(filepath)
+        if analyzer.load_data() is None:
+            continue
+        analyzer.preprocess_data()
+        analyzer.update_sketches(sketches)
+
+    sketches.save(args.output)
+    print(f"\n✅ 스케치 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
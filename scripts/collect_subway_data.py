@@ -9,8 +9,6 @@ from datetime import datetime, timedelta
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-from src.data_collection.seoul_subway_data_collector import SeoulSubwayDataCollector
-
 
 def get_year_month_input(prompt, default_ym=None):
     """
@@ -51,6 +49,9 @@ def main():
 
     print("✅ API 키 확인 완료")
 
+    # pandas 등 무거운 모듈은 API 키 확인 뒤에 import (키가 없을 때 빨리 종료하도록)
+    from src.data_collection.seoul_subway_data_collector import SeoulSubwayDataCollector
+
     # 데이터 수집기 초기화
     collector = SeoulSubwayDataCollector(api_key)
 
@@ -117,7 +118,8 @@ def main():
         print("\n" + "=" * 50)
         print("✅ 데이터 수집 성공!")
         print("=" * 50)
-        collector.explore_data_structure(df)
+        collector.explore_data_structure(
+            df, json_path=f"data/raw/subway_hourly_{year_month}_profile.json")
 
         print("\n💡 다음 단계:")
         print("   python scripts/analyze_patterns.py  # 패턴 분석 실행")
@@ -7,8 +7,6 @@ import os
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-from src.data_collection.topis_data_collector import TopisDataCollector
-
 
 def main():
     """
@@ -28,6 +26,9 @@ def main():
 
     print("✅ API 키 확인 완료")
 
+    # pandas 등 무거운 모듈은 API 키 확인 뒤에 import (키가 없을 때 빨리 종료하도록)
+    from src.data_collection.topis_data_collector import TopisDataCollector
+
     # 데이터 수집기 초기화
     collector = TopisDataCollector(api_key)
 
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+로컬 API 서버 부하 테스트 스크립트 (엔드포인트별 p50/p99 지연시간)
+
+사용 예:
+    python scripts/serve_api.py &
+    python scripts/load_test_api.py --requests 2000 --concurrency 16
+    python scripts/load_test_api.py --etag   # If-None-Match 재검증 포함
+"""
+
+import argparse
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+DEFAULT_PATHS = [
+    '/hourly',
+    '/hourly?day_type=평일',
+    '/weekday',
+    '/stations/rank?top_n=20',
+    '/stations/rank?top_n=50&day_type=주말',
+    '/stations/heatmap?top_n=30',
+]
+
+
+def send_request(base_url, path, etag_cache=None):
+    """
+    요청 1회 실행
+
+    Returns:
+        tuple: (경로, HTTP 상태 코드, 지연시간(ms), 응답 크기)
+    """
+    url = base_url.rstrip('/') + urllib.parse.quote(path, safe='/?=&')
+    request = urllib.request.Request(url)
+    if etag_cache is not None and path in etag_cache:
+        request.add_header('If-None-Match', etag_cache[path])
+
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            body = response.read()
+            status = response.status
+            if etag_cache is not None and response.headers.get('ETag'):
+                etag_cache[path] = response.headers['ETag']
+    except urllib.error.HTTPError as e:
+        body = b''
+        status = e.code
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    return path, status, elapsed_ms, len(body)
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description="로컬 API 서버 부하 테스트")
+    parser.add_argument('--url', default='http://127.0.0.1:8000', help="서버 주소")
+    parser.add_argument('--requests', type=int, default=1000, help="총 요청 수")
+    parser.add_argument('--concurrency', type=int, default=8, help="동시 요청 수")
+    parser.add_argument('--etag', action='store_true', help="ETag 재검증 요청 (If-None-Match) 사용")
+    args = parser.parse_args()
+
+    print("⏱️  API 부하 테스트")
+    print("=" * 60)
+    print(f"   서버: {args.url}")
+    print(f"   요청: {args.requests:,}건 / 동시 {args.concurrency}개 / ETag {'사용' if args.etag else '미사용'}")
+
+    etag_cache = {} if args.etag else None
+    paths = [DEFAULT_PATHS[i % len(DEFAULT_PATHS)] for i in range(args.requests)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda p: send_request(args.url, p, etag_cache), paths))
+    wall_time = time.perf_counter() - start
+
+    latencies = defaultdict(list)
+    statuses = defaultdict(int)
+    for path, status, elapsed_ms, _ in results:
+        latencies[path].append(elapsed_ms)
+        statuses[status] += 1
+
+    print(f"\n📊 엔드포인트별 지연시간 (ms):")
+    print(f"{'경로':<40} {'건수':>6} {'p50':>8} {'p99':>8}")
+    print("-" * 66)
+    for path in DEFAULT_PATHS:
+        values = np.array(latencies[path])
+        if len(values) == 0:
+            continue
+        print(f"{path:<40} {len(values):>6} {np.percentile(values, 50):>8.2f} {np.percentile(values, 99):>8.2f}")
+
+    all_values = np.array([r[2] for r in results])
+    print("-" * 66)
+    print(f"{'전체':<40} {len(all_values):>6} {np.percentile(all_values, 50):>8.2f} "
+          f"{np.percentile(all_values, 99):>8.2f}")
+
+    print(f"\n📈 처리량: {len(results) / wall_time:,.0f} req/s ({wall_time:.2f}초)")
+    print(f"📋 상태 코드: " + ", ".join(f"{code}={count:,}" for code, count in sorted(statuses.items())))
+
+
+if __name__ == "__main__":
+    main()
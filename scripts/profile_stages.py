@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+단계별 시간 / 메모리 계측 실행
+
+분석기(로드, 전처리, analyze_* 전체, 종합 보고서)와 시각화(전체 차트)를 계측 모드로 실행해
+단계마다 경과/CPU 시간, 힙 고점, RSS, 행 수를 JSON-lines로 남기고 요약 표를 출력한다.
+--profile을 주면 가장 느린 단계의 cProfile 통계(.pstats)도 저장한다.
+
+사용 예:
+    python scripts/profile_stages.py
+    python scripts/profile_stages.py --data data/raw/subway_hourly_2024-08.csv --profile
+    python scripts/profile_stages.py --month 2024-09 --no-charts   # 파일이 없으면 API로 수집
+"""
+
+import sys
+import os
+import io
+import argparse
+import contextlib
+import csv
+from datetime import datetime
+from glob import glob
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.instrumentation.stage_recorder import StageRecorder
+
+
+def run_step(label, func, quiet, *args, **kwargs):
+    """
+    단계 하나 실행 (실패해도 다음 단계 계속)
+    """
+    try:
+        if quiet:
+            with contextlib.redirect_stdout(io.StringIO()):
+                return func(*args, **kwargs)
+        return func(*args, **kwargs)
+    except Exception as e:
+        print(f"❌ {label} 실패: {type(e).__name__}: {e}")
+        return None
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description="단계별 시간 / 메모리 계측")
+    parser.add_argument("--data", default=None, help="CSV 경로 (기본값: data/raw/의 최신 파일)")
+    parser.add_argument("--month", default=None, help="YYYY-MM (data/raw/에 파일이 없으면 API로 수집 후 계측)")
+    parser.add_argument("--output", default="results/instrumentation/", help="기록 저장 폴더")
+    parser.add_argument("--render-profile", default="standard", help="차트 저장 프로파일")
+    parser.add_argument("--no-charts", action="store_true", help="차트 렌더링 단계 생략")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 힙 측정 끄기 (시간 왜곡 없음)")
+    parser.add_argument("--profile", action="store_true", help="가장 느린 단계의 cProfile 통계 저장")
+    parser.add_argument("--quiet", action="store_true", help="단계별 진행 출력 숨기기")
+    args = parser.parse_args()
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    recorder = StageRecorder(jsonl_path=os.path.join(args.output, f"stages_{timestamp}.jsonl"),
+                             memory=not args.no_memory, profile=args.profile)
+
+    data_file = args.data
+    if data_file is None and args.month:
+        data_file = os.path.join("data/raw/", f"subway_hourly_{args.month}.csv")
+        if not os.path.exists(data_file):
+            from dotenv import load_dotenv
+            from src.data_collection.seoul_subway_data_collector import SeoulSubwayDataCollector
+
+            load_dotenv()
+            api_key = os.getenv('SEOUL_API_KEY')
+            if not api_key:
+                print("❌ API 키가 설정되지 않았습니다. (SEOUL_API_KEY)")
+                return 1
+            collector = recorder.wrap(SeoulSubwayDataCollector(api_key))
+            if run_step("수집", collector.get_subway_monthly_data, args.quiet, args.month) is None:
+                return 1
+    if data_file is None:
+        files = sorted(glob(os.path.join("data/raw/", "subway_hourly_*.csv")))
+        if not files:
+            print("❌ 데이터 파일을 찾을 수 없습니다. --data로 경로를 지정하세요.")
+            return 1
+        data_file = files[-1]
+
+    from src.analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
+
+    print(f"📂 데이터: {data_file}")
+    print(f"🔧 계측: 힙 측정 {'끔' if args.no_memory else '켬'}, cProfile {'켬' if args.profile else '끔'}")
+
+    analyzer = recorder.wrap(SubwayPatternAnalyzer(data_file))
+    if run_step("로드", analyzer.load_data, args.quiet) is None:
+        return 1
+    if run_step("전처리", analyzer.preprocess_data, args.quiet) is None:
+        return 1
+
+    steps = [
+        ("기본 통계", analyzer.analyze_basic_stats, {}),
+        ("시간대별", analyzer.analyze_time_pattern, {}),
+        ("요일별", analyzer.analyze_weekday_pattern, {}),
+        ("역별 특성", analyzer.analyze_station_characteristics, {'top_n': 20}),
+        ("피크 집중도", analyzer.analyze_peak_hours, {}),
+        ("순유입", analyzer.analyze_net_flow, {}),
+        ("역 군집", analyzer.analyze_station_clusters, {}),
+        ("이상 탐지", analyzer.detect_anomalies, {}),
+        ("수요 예측", analyzer.forecast_demand, {}),
+        ("종합 보고서", analyzer.generate_summary_report,
+         {'save_path': os.path.join(args.output, 'reports'), 'html': True}),
+    ]
+    for label, method, kwargs in steps:
+        run_step(label, method, args.quiet, **kwargs)
+
+    if not args.no_charts:
+        from src.visualization.subway_visualizer import SubwayVisualizer
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            visualizer = SubwayVisualizer(save_path=os.path.join(args.output, 'charts'), cache=False,
+                                          profile=args.render_profile)
+        recorder.wrap(visualizer)
+        run_step("차트", visualizer.generate_all_charts, args.quiet, analyzer)
+
+    rows = recorder.print_summary()
+    recorder.close()
+
+    summary_path = os.path.join(args.output, f"stage_summary_{timestamp}.csv")
+    with open(summary_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['stage', 'depth', 'calls', 'wall_s', 'cpu_s', 'py_peak_mb',
+                                               'rss_peak_mb', 'rows_in', 'rows_out', 'errors'],
+                                extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"\n💾 단계별 기록 (JSON-lines): {recorder.jsonl_path}")
+    print(f"💾 요약: {summary_path}")
+
+    if args.profile:
+        recorder.dump_slowest_profile(os.path.join(args.output, f"slowest_stage_{timestamp}.pstats"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
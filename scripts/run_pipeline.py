@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+비대화형 분석 파이프라인 (수집 → 읽기 → 전처리 → 분석 → 차트)
+
+단계마다 입력(파라미터 + 원본 파일 내용 + 상위 단계)의 해시를 캐시 키로 저장하므로
+다시 실행하면 바뀐 달/단계만 실행한다. 서로 독립인 단계(다른 달, 같은 달의 분석과 차트)는
+프로세스 풀에서 병렬 실행된다. 실패한 단계가 있으면 종료 코드 1 (cron 알림용).
+
+사용 예:
+    python scripts/run_pipeline.py --months 2024-01:2024-06
+    python scripts/run_pipeline.py --months 2024-08 --targets analyze --workers 1
+    python scripts/run_pipeline.py                  # data/raw/의 모든 달
+
+cron 예 (매일 새벽 3시):
+    0 3 * * * cd /path/to/project && python scripts/run_pipeline.py --months 2024-01:2024-12 >> logs/pipeline.log 2>&1
+"""
+
+import sys
+import os
+import argparse
+import csv
+import time
+from datetime import datetime
+from glob import glob
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.pipeline.runner import PipelineRunner, STATUS_CACHED, STATUS_FAILED, STATUS_RUN, STATUS_SKIPPED
+from src.pipeline.stages import STAGE_KINDS, TARGET_STAGES, build_pipeline, parse_months
+
+
+def available_months(raw_dir):
+    """
+    원본 폴더에 있는 월 목록
+    """
+    files = sorted(glob(os.path.join(raw_dir, "subway_hourly_*.csv")))
+    return [os.path.basename(path)[len("subway_hourly_"):-len(".csv")] for path in files]
+
+
+def print_summary(results, elapsed):
+    """
+    단계 종류별 시간 요약
+    """
+    print("\n" + "=" * 60)
+    print("⏱️  단계별 시간 요약")
+    print("=" * 60)
+    print(f"   {'단계':<11} {'실행':>4} {'캐시':>4} {'실패':>4} {'건너뜀':>5} {'실행 시간(초)':>13}")
+    for kind in STAGE_KINDS:
+        rows = [row for row in results if row['STAGE'] == kind]
+        if not rows:
+            continue
+        count = {status: sum(row['STATUS'] == status for row in rows)
+                 for status in (STATUS_RUN, STATUS_CACHED, STATUS_FAILED, STATUS_SKIPPED)}
+        seconds = sum(row['SECONDS'] for row in rows)
+        print(f"   {kind:<12} {count[STATUS_RUN]:>5} {count[STATUS_CACHED]:>5} {count[STATUS_FAILED]:>5} "
+              f"{count[STATUS_SKIPPED]:>6} {seconds:>13.2f}")
+    print(f"\n   전체 경과 시간: {elapsed:.2f}초 (단계 실행 시간 합계 "
+          f"{sum(row['SECONDS'] for row in results):.2f}초)")
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description="비대화형 분석 파이프라인")
+    parser.add_argument("--months", help="월 범위 (예: 2024-01:2024-06, 2024-01,2024-03; 기본값: data/raw/의 모든 달)")
+    parser.add_argument("--targets", nargs="+", default=list(TARGET_STAGES), choices=list(TARGET_STAGES),
+                        help="최종 단계 (기본값: 전부)")
+    parser.add_argument("--raw-dir", default="data/raw/", help="원본 CSV 폴더")
+    parser.add_argument("--results", default="results/pipeline/", help="보고서/차트 저장 폴더")
+    parser.add_argument("--cache-dir", default="data/processed/pipeline/", help="단계 캐시/로그 폴더")
+    parser.add_argument("--workers", type=int, default=None, help="최대 프로세스 수 (1이면 순차 실행)")
+    parser.add_argument("--profile", default="standard", help="차트 저장 프로파일")
+    parser.add_argument("--no-validate", action="store_true", help="무결성 검사 생략")
+    parser.add_argument("--no-html", action="store_true", help="HTML 보고서 생략")
+    parser.add_argument("--force", action="store_true", help="캐시를 무시하고 모든 단계 다시 실행")
+    args = parser.parse_args()
+
+    try:
+        months = parse_months(args.months) if args.months else available_months(args.raw_dir)
+    except ValueError as e:
+        parser.error(str(e))
+    if not months:
+        print(f"❌ 처리할 달이 없습니다. --months를 지정하거나 {args.raw_dir}에 데이터를 두세요.")
+        return 1
+
+    runner = PipelineRunner(cache_dir=args.cache_dir, max_workers=args.workers, force=args.force)
+    build_pipeline(runner, months, raw_dir=args.raw_dir, results_dir=args.results, targets=args.targets,
+                   profile=args.profile, validate=not args.no_validate, html=not args.no_html)
+
+    print("🚇 서울시 지하철 분석 파이프라인")
+    print("=" * 60)
+    print(f"📅 대상: {', '.join(months)} ({len(months)}개월, 단계 {len(runner.stages)}개, "
+          f"프로세스 {runner.max_workers}개)")
+    print(f"📝 단계별 로그: {os.path.join(args.cache_dir, 'logs')}\n")
+
+    started = time.perf_counter()
+    results = runner.run()
+    elapsed = time.perf_counter() - started
+    print_summary(results, elapsed)
+
+    os.makedirs(args.results, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = os.path.join(args.results, f"pipeline_run_{timestamp}.csv")
+    with open(filepath, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['STAGE', 'NAME', 'STATUS', 'SECONDS', 'ERROR'])
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"\n💾 실행 기록 저장: {filepath}")
+
+    failed = [row['NAME'] for row in results if row['STATUS'] == STATUS_FAILED]
+    if failed:
+        print(f"❌ 실패한 단계: {', '.join(failed)}")
+        return 1
+    print("✅ 파이프라인 완료")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
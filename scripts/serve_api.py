@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+지하철 분석 결과 로컬 API 서버 실행 스크립트
+
+사용 예:
+    python scripts/serve_api.py
+    python scripts/serve_api.py --data data/raw/subway_hourly_2024-08.csv --port 8000
+"""
+
+import sys
+import os
+import argparse
+from glob import glob
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+
+def find_latest_data_file(data_path="data/raw/"):
+    """
+    가장 최근 데이터 파일 찾기
+    """
+    pattern = os.path.join(data_path, "subway_hourly_*.csv")
+    files = glob(pattern)
+
+    if not files:
+        return None
+
+    return sorted(files)[-1]
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description="지하철 분석 결과 로컬 API 서버")
+    parser.add_argument('--data', help="분석할 CSV 파일 (기본값: data/raw/의 최신 파일)")
+    parser.add_argument('--host', default='127.0.0.1', help="바인딩 주소 (기본값: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8000, help="포트 (기본값: 8000)")
+    parser.add_argument('--verbose', action='store_true', help="요청 로그 출력")
+    args = parser.parse_args()
+
+    print("🌐 서울시 지하철 분석 API 서버")
+    print("=" * 60)
+
+    data_file = args.data or find_latest_data_file()
+    if not data_file:
+        print("\n❌ 데이터 파일을 찾을 수 없습니다.")
+        print("💡 먼저 데이터를 수집하세요:")
+        print("   python scripts/collect_subway_data.py")
+        return
+
+    # pandas 등 무거운 모듈은 인자 확인 뒤에 import (--help, 오류 종료가 빠르도록)
+    from src.analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
+    from src.api.aggregate_server import AggregateServer, AggregateStore
+
+    analyzer = SubwayPatternAnalyzer(data_file)
+    analyzer.load_data()
+    if analyzer.preprocess_data() is None:
+        print("❌ 데이터 전처리 실패")
+        return
+
+    store = AggregateStore.from_analyzer(analyzer)
+    server = AggregateServer(store, host=args.host, port=args.port, verbose=args.verbose)
+
+    host, port = server.server_address[:2]
+    print(f"✅ 데이터 버전: {store.version}")
+    print(f"🚀 서버 시작: http://{host}:{port}")
+    print("   /hourly, /weekday, /stations/rank, /stations/heatmap")
+    print("   (종료: Ctrl+C)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 서버를 종료합니다.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
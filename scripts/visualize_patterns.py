@@ -16,9 +16,6 @@ sys.path.insert(0, project_root)
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-from src.analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
-from src.visualization.subway_visualizer import SubwayVisualizer
-
 
 def find_latest_data_file(data_path="data/raw/"):
     """
@@ -53,6 +50,10 @@ def main():
     
     print(f"✅ 데이터 파일 발견: {data_file}")
     
+    # pandas 등 무거운 모듈은 데이터 파일 확인 뒤에 import (파일이 없을 때 빨리 종료하도록)
+    from src.analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
+    from src.visualization.subway_visualizer import SubwayVisualizer
+    
     # 분석기 초기화
     print("\n📂 데이터 로딩 및 전처리 중...")
     analyzer = SubwayPatternAnalyzer(data_file)
@@ -74,10 +75,11 @@ def main():
     print("  3. 역별 TOP 20 그래프")
     print("  4. 역별 시간대별 히트맵")
     print("  5. 모든 차트 생성 (1~4 전체)")
+    print("  6. 전체 역 시간대 프로파일 (소형 다중 차트 PDF)")
     print("  0. 종료")
     
     while True:
-        choice = input("\n선택 (0-5): ").strip()
+        choice = input("\n선택 (0-6): ").strip()
         
         if choice == "0":
             print("\n👋 프로그램을 종료합니다.")
@@ -114,14 +116,22 @@ def main():
             print("\n계속하려면 다른 옵션을 선택하세요...")
         
         elif choice == "5":
-            # 모든 차트 생성
-            charts = visualizer.generate_all_charts(analyzer)
+            # 모든 차트 생성 (차트별 프로세스 병렬 렌더링)
+            charts = visualizer.generate_all_charts(analyzer, parallel=True)
             print("\n✅ 모든 차트가 생성되었습니다!")
             print(f"📁 저장 경로: results/charts/")
             print("\n계속하려면 다른 옵션을 선택하세요...")
         
+        elif choice == "6":
+            # 전체 역 프로파일
+            print("\n" + "="*60)
+            profile_df = analyzer.get_station_profiles()
+            if profile_df is not None:
+                visualizer.plot_station_profiles(profile_df, output='pdf')
+            print("\n계속하려면 다른 옵션을 선택하세요...")
+        
         else:
-            print("❌ 잘못된 선택입니다. 0-5 사이의 숫자를 입력하세요.")
+            print("❌ 잘못된 선택입니다. 0-6 사이의 숫자를 입력하세요.")
 
 
 if __name__ == "__main__":
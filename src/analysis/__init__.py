@@ -1,7 +1,27 @@
 """
 데이터 분석 모듈
+
+하위 모듈은 이름을 처음 참조할 때 import한다 (PEP 562).
+패키지 import만으로 pandas까지 불러오지 않도록 하기 위함.
 """
 
-from .subway_pattern_analyzer import SubwayPatternAnalyzer
+import importlib
+
+_LAZY_ATTRS = {
+    'SubwayPatternAnalyzer': '.subway_pattern_analyzer',
+}
 
 __all__ = ['SubwayPatternAnalyzer']
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # 이후 참조는 모듈 속성으로 바로 찾음
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,277 @@
+"""
+역 × 시간대별 이상 이용량 탐지
+
+같은 요일끼리 비교하는 이동 기준선을 모든 역 × 시간대에 대해 한 번에 계산한다.
+- 'mad': 직전 window개 같은 요일의 중앙값 / MAD (이상치에 강건)
+- 'ewma': 요일별 지수가중 이동평균 / 분산 (상태만 유지하면 되므로 가벼움)
+
+두 방식 모두 상태(최근 이력 또는 EWMA 통계)를 보관하므로 새 일자/월 데이터가
+들어오면 update()로 새 일자만 점수화할 수 있다.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .hourly_cube import WEEKDAY_NAMES, check_measure, weekday_of
+
+MAD_SCALE = 1.4826  # 정규분포에서 MAD → 표준편차 환산 계수
+
+
+def _masked_median(windows, valid_count):
+    """
+    NaN이 섞인 윈도우의 중앙값 (마지막 축 기준)
+
+    np.sort는 NaN을 뒤로 보내므로 유효 개수 n에서 (n-1)//2, n//2 위치를 평균한다.
+    np.nanmedian보다 빠르다.
+    """
+    ordered = np.sort(windows, axis=-1)
+    n = np.maximum(valid_count, 1)
+    lo = np.take_along_axis(ordered, ((n - 1) // 2)[..., None], axis=-1)[..., 0]
+    hi = np.take_along_axis(ordered, (n // 2)[..., None], axis=-1)[..., 0]
+    median = (lo + hi) / 2.0
+    return np.where(valid_count > 0, median, np.nan)
+
+
+class StationAnomalyDetector:
+    """
+    요일 기준 이동 기준선 기반 역 × 시간대 이상 탐지기
+
+    점수 = (관측값 - 기준선) / 척도
+    척도는 max(1.4826 × MAD 또는 EWMA 표준편차, √기준선)으로,
+    이용량이 적은 시간대에서 작은 변동이 과대평가되지 않도록 포아송 잡음 수준을 하한으로 둔다.
+    """
+
+    def __init__(self, method='mad', window=8, min_periods=4, alpha=0.25,
+                 threshold=3.5, min_volume=100, measure='total'):
+        """
+        Args:
+            method (str): 'mad' (이동 중앙값/MAD) 또는 'ewma'
+            window (int): 기준선에 사용할 직전 같은 요일 수 ('mad')
+            min_periods (int): 점수를 계산하기 위한 최소 과거 관측 수
+            alpha (float): EWMA 가중치 ('ewma')
+            threshold (float): 이상으로 판단할 |점수| 기준
+            min_volume (int): 관측값·기준선이 모두 이 값 미만이면 무시
+            measure (str): 'total', 'boarding', 'alighting'
+        """
+        if method not in ('mad', 'ewma'):
+            raise ValueError(f"지원하지 않는 방식: {method}")
+        check_measure(measure)
+
+        self.method = method
+        self.window = window
+        self.min_periods = min_periods
+        self.alpha = alpha
+        self.threshold = threshold
+        self.min_volume = min_volume
+        self.measure = measure
+
+        self.stations = np.array([], dtype=object)
+        self.hours = None
+        self.last_date = None
+
+        # 'mad' 상태: 최근 window주 이력 [역, 일자, 시간대]
+        self.history = None
+        self.history_dates = np.array([], dtype='datetime64[D]')
+
+        # 'ewma' 상태: [역, 요일, 시간대]
+        self.ewma_mean = None
+        self.ewma_var = None
+        self.ewma_count = None
+
+    def _align_stations(self, cube_stations):
+        """
+        기존 상태의 역 목록에 새 역을 추가하고 새 데이터의 역 → 상태 인덱스 매핑 반환
+        """
+        lookup = {name: i for i, name in enumerate(self.stations)}
+        new_names = [name for name in cube_stations if name not in lookup]
+        if new_names:
+            n_old = len(self.stations)
+            self.stations = np.concatenate([self.stations, np.asarray(new_names, dtype=object)])
+            for i, name in enumerate(new_names):
+                lookup[name] = n_old + i
+
+            n_new, n_hours = len(new_names), len(self.hours)
+            if self.history is not None:
+                pad = np.full((n_new, self.history.shape[1], n_hours), np.nan)
+                self.history = np.concatenate([self.history, pad], axis=0)
+            if self.ewma_mean is not None:
+                self.ewma_mean = np.concatenate([self.ewma_mean, np.zeros((n_new, 7, n_hours))])
+                self.ewma_var = np.concatenate([self.ewma_var, np.zeros((n_new, 7, n_hours))])
+                self.ewma_count = np.concatenate(
+                    [self.ewma_count, np.zeros((n_new, 7, n_hours), dtype=np.int64)])
+
+        return np.array([lookup[name] for name in cube_stations], dtype=np.int64)
+
+    def update(self, cube):
+        """
+        새 데이터를 반영하고 아직 점수화하지 않은 일자의 이상치를 반환
+
+        이미 처리한 일자(last_date 이하)는 건너뛰므로 같은 월을 다시 넣어도 중복 탐지되지 않는다.
+
+        Args:
+            cube (HourlyCube): 역 × 일자 × 시간대 승하차 배열
+
+        Returns:
+            DataFrame: |점수| 내림차순 이상치 표
+        """
+        if self.hours is None:
+            self.hours = np.asarray(cube.hours, dtype=np.int64)
+        elif not np.array_equal(self.hours, cube.hours):
+            raise ValueError("기존 상태와 시간대 구성이 다릅니다.")
+
+        d0 = 0
+        if self.last_date is not None:
+            d0 = int(np.searchsorted(cube.dates, self.last_date, 'right'))
+        dates = cube.dates[d0:]
+        valid = ~np.isnat(dates)
+        dates = dates[valid]
+        if len(dates) == 0:
+            return self._empty_table()
+
+        rows = self._align_stations(cube.stations)
+
+        # 새 데이터를 상태의 역 순서로 배치 (이번 데이터에 없는 역 = 0명)
+        values = np.zeros((len(self.stations), len(dates), len(self.hours)), dtype=np.float64)
+        values[rows] = cube.measure(self.measure)[:, d0:][:, valid]
+
+        if self.method == 'mad':
+            baseline, scale = self._score_mad(values, dates)
+        else:
+            baseline, scale = self._score_ewma(values, dates)
+
+        self.last_date = dates[-1]
+        return self._build_table(values, baseline, scale, dates)
+
+    def _score_mad(self, values, dates):
+        """
+        같은 요일 직전 window개 관측의 중앙값/MAD 기준선 (요일별 7회 배열 연산)
+        """
+        n_history = len(self.history_dates)
+        if self.history is None:
+            self.history = np.empty((len(self.stations), 0, len(self.hours)))
+
+        combined = np.concatenate([self.history, values], axis=1)
+        combined_dates = np.concatenate([self.history_dates, dates])
+        weekdays = weekday_of(combined_dates)
+
+        baseline = np.full(values.shape, np.nan)
+        scale = np.full(values.shape, np.nan)
+
+        for weekday in range(7):
+            positions = np.flatnonzero(weekdays == weekday)
+            if len(positions) == 0:
+                continue
+            series = combined[:, positions, :]
+
+            # 앞쪽을 window개의 NaN으로 채우면 i번째 윈도우 = i번째 관측 직전 window개
+            padded = np.concatenate(
+                [np.full((series.shape[0], self.window, series.shape[2]), np.nan), series], axis=1)
+            windows = sliding_window_view(padded, self.window, axis=1)[:, :len(positions)]
+
+            valid_count = (~np.isnan(windows)).sum(axis=-1)
+            median = _masked_median(windows, valid_count)
+            mad = _masked_median(np.abs(windows - median[..., None]), valid_count)
+
+            ready = valid_count >= self.min_periods
+            median = np.where(ready, median, np.nan)
+            spread = np.maximum(MAD_SCALE * mad, np.sqrt(np.maximum(median, 1.0)))
+
+            # 새 일자 위치만 결과에 기록
+            is_new = positions >= n_history
+            targets = positions[is_new] - n_history
+            baseline[:, targets] = median[:, is_new]
+            scale[:, targets] = spread[:, is_new]
+
+        # 최근 window주 + 1일만 이력으로 보관
+        cutoff = combined_dates[-1] - np.timedelta64(7 * self.window, 'D')
+        keep = combined_dates > cutoff
+        self.history = combined[:, keep]
+        self.history_dates = combined_dates[keep]
+
+        return baseline, scale
+
+    def _score_ewma(self, values, dates):
+        """
+        요일별 EWMA 평균/분산 기준선 (일자 순서로 갱신, 역 × 시간대는 배열 연산)
+        """
+        shape = (len(self.stations), 7, len(self.hours))
+        if self.ewma_mean is None:
+            self.ewma_mean = np.zeros(shape)
+            self.ewma_var = np.zeros(shape)
+            self.ewma_count = np.zeros(shape, dtype=np.int64)
+
+        baseline = np.full(values.shape, np.nan)
+        scale = np.full(values.shape, np.nan)
+        weekdays = weekday_of(dates)
+        alpha = self.alpha
+
+        for d, weekday in enumerate(weekdays):
+            x = values[:, d, :]
+            mean = self.ewma_mean[:, weekday, :]
+            var = self.ewma_var[:, weekday, :]
+            count = self.ewma_count[:, weekday, :]
+
+            ready = count >= self.min_periods
+            baseline[:, d, :] = np.where(ready, mean, np.nan)
+            scale[:, d, :] = np.maximum(np.sqrt(var), np.sqrt(np.maximum(mean, 1.0)))
+
+            # 첫 관측은 그대로 평균으로 사용
+            first = count == 0
+            diff = x - mean
+            self.ewma_mean[:, weekday, :] = np.where(first, x, mean + alpha * diff)
+            self.ewma_var[:, weekday, :] = np.where(first, 0.0, (1 - alpha) * (var + alpha * diff ** 2))
+            self.ewma_count[:, weekday, :] = count + 1
+
+        return baseline, scale
+
+    def _empty_table(self):
+        return pd.DataFrame(columns=['STTN', 'USE_DT', 'WEEKDAY', 'HOUR', 'VALUE',
+                                     'BASELINE', 'SCORE', 'DIRECTION'])
+
+    def _build_table(self, values, baseline, scale, dates):
+        """
+        |점수| ≥ threshold인 칸만 추출해 순위표 생성
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            score = (values - baseline) / scale
+
+        volume = np.maximum(values, np.nan_to_num(baseline))
+        mask = (np.abs(score) >= self.threshold) & (volume >= self.min_volume)
+        flat = np.flatnonzero(mask)
+        if len(flat) == 0:
+            return self._empty_table()
+
+        flat = flat[np.argsort(-np.abs(score.ravel()[flat]), kind='stable')]
+        s, d, h = np.unravel_index(flat, values.shape)
+        selected_score = score.ravel()[flat]
+
+        return pd.DataFrame({
+            'STTN': self.stations[s],
+            'USE_DT': pd.to_datetime(dates[d]),
+            'WEEKDAY': np.asarray(WEEKDAY_NAMES, dtype=object)[weekday_of(dates[d])],
+            'HOUR': self.hours[h],
+            'VALUE': values.ravel()[flat].astype(np.int64),
+            'BASELINE': np.round(baseline.ravel()[flat], 1),
+            'SCORE': np.round(selected_score, 2),
+            'DIRECTION': np.where(selected_score > 0, '급증', '급감'),
+        })
+
+    def save(self, filepath):
+        """
+        탐지기 상태 저장 (pickle) - 다음 달 데이터에 이어서 update() 가능
+        """
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        pd.to_pickle(self.__dict__, filepath)
+        return filepath
+
+    @classmethod
+    def load(cls, filepath):
+        """
+        save()로 저장한 탐지기 불러오기
+        """
+        detector = cls.__new__(cls)
+        detector.__dict__.update(pd.read_pickle(filepath))
+        return detector
@@ -0,0 +1,289 @@
+"""
+근사 분석 모드: 층화 표본 기반 추정값과 표준오차
+
+층 = (노선, 역, 일자 유형). 각 층에서 비율 fraction만큼(최소 min_per_stratum행) 단순 무작위 추출하고,
+층화 추정량으로 합계를 추정한다.
+    T̂ = Σ_h N_h ȳ_h
+    Var(T̂) = Σ_h N_h² (1 - n_h / N_h) s_h² / n_h
+요일·기간 같은 층이 아닌 조건은 지시변수를 곱한 값(도메인 추정)으로 처리하고,
+비율 지표(아침 승차비 등)는 선형화(델타 방법)로 표준오차를 구한다.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from .columns import LINE_COLUMNS, STATION_COLUMNS, find_column, get_hour_columns
+from .hourly_cube import WEEKDAY_NAMES, weekday_of
+
+
+class StratifiedSample:
+    """
+    (노선, 역, 일자 유형) 층화 표본
+
+    Attributes:
+        fraction (float): 층별 추출 비율 (속도/정확도 조절)
+        hours (np.ndarray): 시간대
+        boarding, alighting (np.ndarray): 표본 행의 시간대별 승하차 [표본, 시간대]
+        dates (np.ndarray): 표본 행의 일자
+        strata (np.ndarray): 표본 행의 층 번호 (정렬됨)
+        population_sizes (np.ndarray): 층별 모집단 행 수 N_h
+        sample_sizes (np.ndarray): 층별 표본 행 수 n_h
+        stratum_station (np.ndarray): 층 → 역 번호
+        stations (np.ndarray): 역명
+    """
+
+    def __init__(self, df, fraction=0.05, min_per_stratum=2, seed=42):
+        """
+        Args:
+            df (DataFrame): 전처리된 데이터
+            fraction (float): 층별 추출 비율 (0 < fraction ≤ 1)
+            min_per_stratum (int): 층별 최소 표본 행 수 (분산 추정에 2 이상 필요)
+            seed (int): 난수 시드
+        """
+        if not 0 < fraction <= 1:
+            raise ValueError("fraction은 0보다 크고 1 이하여야 합니다.")
+
+        started = time.perf_counter()
+        hour_columns = get_hour_columns(df)
+        if not hour_columns:
+            raise ValueError("시간대별 컬럼을 찾을 수 없습니다.")
+
+        self.fraction = fraction
+        self.min_per_stratum = min_per_stratum
+        self.seed = seed
+        self.hours = np.array([hour for hour, _, _ in hour_columns], dtype=np.int64)
+
+        # 층 번호 = (노선, 역, 일자 유형) 조합
+        station_col = find_column(df, STATION_COLUMNS)
+        line_col = find_column(df, LINE_COLUMNS)
+        self.station_column = station_col or 'STTN'
+
+        if station_col:
+            station_codes, stations = pd.factorize(df[station_col], sort=True)
+            self.stations = np.asarray(stations, dtype=object)
+        else:
+            station_codes = np.zeros(len(df), dtype=np.int64)
+            self.stations = np.array(['전체'], dtype=object)
+
+        if line_col:
+            line_codes, _ = pd.factorize(df[line_col], sort=True)
+        else:
+            line_codes = np.zeros(len(df), dtype=np.int64)
+
+        if 'USE_DT' in df.columns:
+            all_dates = df['USE_DT'].to_numpy(dtype='datetime64[D]')
+            day_type_codes = (weekday_of(all_dates) >= 5).astype(np.int64)
+        else:
+            all_dates = np.full(len(df), np.datetime64('NaT'), dtype='datetime64[D]')
+            day_type_codes = np.zeros(len(df), dtype=np.int64)
+
+        # 역명/노선명이 비어 있는 행(factorize 코드 -1)은 제외 (HourlyCube와 동일)
+        # 그대로 두면 다른 역/노선의 층에 섞여 그 층의 가중치를 받음
+        rows = np.flatnonzero((station_codes >= 0) & (line_codes >= 0))
+        if len(rows) < len(df):
+            station_codes, line_codes = station_codes[rows], line_codes[rows]
+            all_dates, day_type_codes = all_dates[rows], day_type_codes[rows]
+        self.n_population = len(rows)
+
+        n_stations = len(self.stations)
+        raw_codes = (line_codes.astype(np.int64) * n_stations + station_codes) * 2 + day_type_codes
+        codes, uniques = pd.factorize(raw_codes, sort=True)
+        self.stratum_station = (np.asarray(uniques) // 2) % n_stations
+
+        self.population_sizes = np.bincount(codes).astype(np.float64)
+        self.sample_sizes = np.minimum(
+            np.maximum(np.ceil(self.population_sizes * fraction), min_per_stratum),
+            self.population_sizes)
+
+        # 층 안에서 난수 순위가 n_h 미만인 행 선택 (층 번호, 난수) 정렬 한 번
+        rng = np.random.default_rng(seed)
+        order = np.lexsort((rng.random(len(codes)), codes))
+        sorted_codes = codes[order]
+        starts = np.concatenate([[0], np.cumsum(self.population_sizes)[:-1]]).astype(np.int64)
+        rank = np.arange(len(codes)) - starts[sorted_codes]
+        chosen = order[rank < self.sample_sizes[sorted_codes]]
+
+        # 시간대 컬럼(무거운 부분)은 표본 행만 읽음
+        sample = df.iloc[rows[chosen]]
+        self.boarding = sample[[on for _, on, _ in hour_columns]].fillna(0).to_numpy(dtype=np.float64)
+        self.alighting = sample[[off for _, _, off in hour_columns]].fillna(0).to_numpy(dtype=np.float64)
+        self.dates = all_dates[chosen]
+        self.strata = codes[chosen]
+        self._sample_starts = np.concatenate(
+            [[0], np.cumsum(self.sample_sizes)[:-1]]).astype(np.int64)
+
+        # 요일별 모집단 행 수는 일자 컬럼만으로 정확히 계산
+        self._all_dates = all_dates
+
+        self.build_seconds = time.perf_counter() - started
+
+    def __len__(self):
+        return len(self.strata)
+
+    def _date_mask(self, dates, start_date=None, end_date=None):
+        mask = np.ones(len(dates), dtype=bool)
+        if start_date is not None:
+            mask &= dates >= np.datetime64(pd.Timestamp(start_date).date(), 'D')
+        if end_date is not None:
+            mask &= dates <= np.datetime64(pd.Timestamp(end_date).date(), 'D')
+        return mask
+
+    def _stratum_totals(self, Y):
+        """
+        층별 합계 추정값과 분산 [층, 열]
+        """
+        n = self.sample_sizes[:, None]
+        N = self.population_sizes[:, None]
+        sums = np.add.reduceat(Y, self._sample_starts, axis=0)
+        sumsq = np.add.reduceat(Y * Y, self._sample_starts, axis=0)
+
+        mean = sums / n
+        with np.errstate(invalid='ignore', divide='ignore'):
+            s2 = np.where(n > 1, (sumsq - n * mean * mean) / (n - 1), 0.0)
+        s2 = np.maximum(s2, 0.0)
+
+        total = N * mean
+        variance = N * N * (1 - n / N) * s2 / n
+        return total, variance
+
+    def _estimate(self, Y, group=None, n_groups=1):
+        """
+        도메인/그룹별 합계 추정값과 표준오차
+
+        Args:
+            Y (np.ndarray): [표본, 열] 값 (도메인 밖은 0)
+            group (np.ndarray): 층 → 그룹 번호 (None이면 전체 하나)
+
+        Returns:
+            tuple: (추정값 [그룹, 열], 표준오차 [그룹, 열])
+        """
+        total, variance = self._stratum_totals(Y)
+        if group is None:
+            return total.sum(axis=0, keepdims=True), np.sqrt(variance.sum(axis=0, keepdims=True))
+
+        estimate = np.zeros((n_groups, Y.shape[1]))
+        var = np.zeros((n_groups, Y.shape[1]))
+        np.add.at(estimate, group, total)
+        np.add.at(var, group, variance)
+        return estimate, np.sqrt(var)
+
+    def hourly_stats(self, start_date=None, end_date=None):
+        """
+        시간대별 총 승하차 추정값
+
+        Returns:
+            DataFrame: HOUR, TIME, BOARDING, BOARDING_SE, ALIGHTING, ALIGHTING_SE, TOTAL, TOTAL_SE
+        """
+        mask = self._date_mask(self.dates, start_date, end_date)[:, None]
+        Y = np.concatenate([self.boarding, self.alighting, self.boarding + self.alighting], axis=1) * mask
+        estimate, se = self._estimate(Y)
+
+        n_hours = len(self.hours)
+        estimate, se = estimate[0], se[0]
+        return pd.DataFrame({
+            'HOUR': self.hours,
+            'TIME': [f"{hour:02d}:00" for hour in self.hours],
+            'BOARDING': estimate[:n_hours].round(0),
+            'BOARDING_SE': se[:n_hours].round(0),
+            'ALIGHTING': estimate[n_hours:2 * n_hours].round(0),
+            'ALIGHTING_SE': se[n_hours:2 * n_hours].round(0),
+            'TOTAL': estimate[2 * n_hours:].round(0),
+            'TOTAL_SE': se[2 * n_hours:].round(0),
+        })
+
+    def weekday_stats(self, start_date=None, end_date=None):
+        """
+        요일별 평균 이용객 추정값 (analyze_weekday_pattern과 같은 행 단위 평균)
+
+        Returns:
+            DataFrame: 평균_승차, 평균_하차, 평균_총이용 (+ _SE), 데이터_일수 (인덱스: 요일명)
+        """
+        weekdays = weekday_of(self.dates)
+        mask = self._date_mask(self.dates, start_date, end_date)
+
+        daily_boarding = self.boarding.sum(axis=1)
+        daily_alighting = self.alighting.sum(axis=1)
+        one_hot = np.zeros((len(self), 7))
+        one_hot[np.arange(len(self)), weekdays] = mask
+
+        Y = np.concatenate([one_hot * daily_boarding[:, None],
+                            one_hot * daily_alighting[:, None],
+                            one_hot * (daily_boarding + daily_alighting)[:, None]], axis=1)
+        estimate, se = self._estimate(Y)
+        estimate, se = estimate[0].reshape(3, 7), se[0].reshape(3, 7)
+
+        # 요일별 모집단 행 수 / 일수 (정확값)
+        all_mask = self._date_mask(self._all_dates, start_date, end_date)
+        all_weekdays = weekday_of(self._all_dates[all_mask])
+        rows = np.bincount(all_weekdays, minlength=7).astype(np.float64)
+        unique_dates = np.unique(self._all_dates[all_mask])
+        days = np.bincount(weekday_of(unique_dates), minlength=7)
+        present = rows > 0
+
+        divisor = np.where(present, rows, 1.0)
+        return pd.DataFrame({
+            '평균_승차': estimate[0] / divisor,
+            '평균_승차_SE': se[0] / divisor,
+            '평균_하차': estimate[1] / divisor,
+            '평균_하차_SE': se[1] / divisor,
+            '평균_총이용': estimate[2] / divisor,
+            '평균_총이용_SE': se[2] / divisor,
+            '데이터_일수': days,
+        }, index=pd.Index(WEEKDAY_NAMES, name='WEEKDAY_KR'))[present].round(1)
+
+    def station_stats(self, start_date=None, end_date=None):
+        """
+        역별 출퇴근 시간대 승하차 / 유형 추정값
+
+        Returns:
+            DataFrame: MORNING_*/EVENING_* 구간 합계, TOTAL, TOTAL_SE,
+                       MORNING_RATIO(_SE), EVENING_RATIO(_SE), TYPE (인덱스: 역명)
+        """
+        mask = self._date_mask(self.dates, start_date, end_date)[:, None]
+        morning = np.isin(self.hours, [7, 8, 9])
+        evening = np.isin(self.hours, [18, 19, 20])
+
+        windows = np.stack([
+            self.boarding[:, morning].sum(axis=1),
+            self.alighting[:, morning].sum(axis=1),
+            self.boarding[:, evening].sum(axis=1),
+            self.alighting[:, evening].sum(axis=1),
+        ], axis=1) * mask
+        Y = np.concatenate([windows, windows.sum(axis=1, keepdims=True)], axis=1)
+
+        n_stations = len(self.stations)
+        estimate, se = self._estimate(Y, self.stratum_station, n_stations)
+        mb, ma, eb, ea, total = estimate.T
+
+        morning_denominator = mb + ma + 1
+        evening_denominator = eb + ea + 1
+        morning_ratio = mb / morning_denominator
+        evening_ratio = ea / evening_denominator
+
+        # 비율의 선형화 변수 u = (분자 - r × (분모 - 1)) / 분모
+        station_of_row = self.stratum_station[self.strata]
+        u_morning = (windows[:, 0] - morning_ratio[station_of_row] * (windows[:, 0] + windows[:, 1])) \
+            / morning_denominator[station_of_row]
+        u_evening = (windows[:, 3] - evening_ratio[station_of_row] * (windows[:, 2] + windows[:, 3])) \
+            / evening_denominator[station_of_row]
+        _, ratio_se = self._estimate(np.stack([u_morning, u_evening], axis=1),
+                                     self.stratum_station, n_stations)
+
+        station_type = np.where(morning_ratio > 0.6, '출근형',
+                                np.where(evening_ratio > 0.6, '퇴근형', '혼합형'))
+
+        return pd.DataFrame({
+            'MORNING_BOARDING': mb.round(0),
+            'MORNING_ALIGHTING': ma.round(0),
+            'EVENING_BOARDING': eb.round(0),
+            'EVENING_ALIGHTING': ea.round(0),
+            'TOTAL': total.round(0),
+            'TOTAL_SE': se[:, 4].round(0),
+            'MORNING_RATIO': morning_ratio,
+            'MORNING_RATIO_SE': ratio_se[:, 0],
+            'EVENING_RATIO': evening_ratio,
+            'EVENING_RATIO_SE': ratio_se[:, 1],
+            'TYPE': station_type,
+        }, index=pd.Index(self.stations, name=self.station_column))
@@ -0,0 +1,206 @@
+"""
+일자 단위 부트스트랩 신뢰구간 (완전 벡터화)
+
+모든 반복(replicate)의 재표본을 [반복, 일자] 인덱스 행렬 하나로 한 번에 뽑고,
+이를 일자별 가중치(재추출 횟수) 행렬 W로 바꾼 뒤 통계량을 행렬곱으로 계산한다.
+  반복별 합계 = W @ X  (X: [일자, ...])
+재표본은 요일별 층화 추출이므로 각 반복의 요일 구성은 원본과 같다.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .hourly_cube import WEEKDAY_NAMES, weekday_of
+
+STATION_TYPES = ('출근형', '퇴근형', '혼합형')
+
+
+def stratified_bootstrap_weights(strata, n_replicates=1000, seed=42):
+    """
+    층화 부트스트랩 가중치 행렬
+
+    일자를 층(strata) 순으로 정렬하면 층 g는 연속 구간 [start_g, start_g + n_g)가 된다.
+    균등 난수 행렬 U [반복, 일자] 하나로 각 칸의 재추출 위치 start + floor(U × n)을 구한다.
+
+    Args:
+        strata (np.ndarray): 일자별 층 번호 (예: 요일)
+        n_replicates (int): 반복 수
+        seed (int): 난수 시드
+
+    Returns:
+        np.ndarray: [반복, 일자] 재추출 횟수 (행 합 = 일자 수)
+    """
+    strata = np.asarray(strata)
+    n_days = len(strata)
+    rng = np.random.default_rng(seed)
+
+    order = np.argsort(strata, kind='stable')
+    sorted_strata = strata[order]
+    _, starts, counts = np.unique(sorted_strata, return_index=True, return_counts=True)
+    group = np.searchsorted(starts, np.arange(n_days), side='right') - 1
+
+    # [반복, 일자] 인덱스 행렬 (정렬된 위치 기준)
+    u = rng.random((n_replicates, n_days))
+    picks = starts[group] + (u * counts[group]).astype(np.int64)
+    picks = order[picks]
+
+    flat = (np.arange(n_replicates)[:, None] * n_days + picks).ravel()
+    weights = np.bincount(flat, minlength=n_replicates * n_days)
+    return weights.reshape(n_replicates, n_days).astype(np.float64)
+
+
+def percentile_interval(replicates, level=0.95, axis=0):
+    """
+    백분위 신뢰구간 (하한, 상한)
+    """
+    alpha = (1 - level) / 2
+    lower, upper = np.nanquantile(replicates, [alpha, 1 - alpha], axis=axis)
+    return lower, upper
+
+
+def bootstrap_weekday_ci(dates, daily_total, daily_rows, n_replicates=1000, seed=42, level=0.95):
+    """
+    요일별 / 평일·주말 평균 이용객 신뢰구간
+
+    통계량은 analyze_weekday_pattern과 같은 비율 추정량(합계 / 원본 행 수)이다.
+
+    Args:
+        dates (np.ndarray): 일자 (datetime64[D])
+        daily_total (np.ndarray): 일자별 총 이용객
+        daily_rows (np.ndarray): 일자별 원본 행 수
+        n_replicates (int): 반복 수
+        seed (int): 난수 시드
+        level (float): 신뢰수준
+
+    Returns:
+        dict: {
+            'weekday': 요일별 MEAN, LOWER, UPPER (인덱스: 요일명),
+            'day_type': 평일/주말 MEAN, LOWER, UPPER,
+            'weekday_vs_weekend': 평일이 주말보다 많은 비율(%)의 (추정값, 하한, 상한) 또는 None
+        }
+    """
+    weekdays = weekday_of(dates)
+    W = stratified_bootstrap_weights(weekdays, n_replicates, seed)
+
+    daily_total = np.asarray(daily_total, dtype=np.float64)
+    daily_rows = np.asarray(daily_rows, dtype=np.float64)
+
+    # [일자, 그룹] 지시 행렬: 요일 7개 + 평일/주말 2개
+    indicator = np.zeros((len(dates), 9))
+    indicator[np.arange(len(dates)), weekdays] = 1.0
+    indicator[np.arange(len(dates)), 7 + (weekdays >= 5)] = 1.0
+
+    numerator = daily_total @ indicator
+    denominator = daily_rows @ indicator
+    with np.errstate(invalid='ignore', divide='ignore'):
+        estimate = numerator / denominator
+        replicates = (W @ (indicator * daily_total[:, None])) / (W @ (indicator * daily_rows[:, None]))
+
+    lower, upper = percentile_interval(replicates, level)
+    present = denominator > 0
+
+    def frame(columns, labels):
+        keep = [c for c in columns if present[c]]
+        return pd.DataFrame({
+            'MEAN': estimate[keep],
+            'LOWER': lower[keep],
+            'UPPER': upper[keep],
+        }, index=pd.Index(np.asarray(labels, dtype=object)[[columns.index(c) for c in keep]])).round(0)
+
+    comparison = None
+    if present[7] and present[8]:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            diff = (replicates[:, 7] - replicates[:, 8]) / replicates[:, 8] * 100
+        diff_lower, diff_upper = percentile_interval(diff, level)
+        comparison = ((estimate[7] - estimate[8]) / estimate[8] * 100, diff_lower, diff_upper)
+
+    return {
+        'weekday': frame(list(range(7)), WEEKDAY_NAMES),
+        'day_type': frame([7, 8], ['평일', '주말']),
+        'weekday_vs_weekend': comparison,
+    }
+
+
+def classify_station_types(morning_ratio, evening_ratio):
+    """
+    역 유형 코드 (0=출근형, 1=퇴근형, 2=혼합형) - analyze_station_characteristics와 같은 규칙
+    """
+    return np.where(morning_ratio > 0.6, 0, np.where(evening_ratio > 0.6, 1, 2))
+
+
+def bootstrap_station_type_ci(dates, morning_boarding, morning_alighting,
+                              evening_boarding, evening_alighting,
+                              n_replicates=1000, seed=42, level=0.95, block_size=1000):
+    """
+    역 유형 분류의 부트스트랩 신뢰구간
+
+    일자를 재추출해 모든 역의 출퇴근 비율과 유형을 반복마다 다시 계산한다.
+    반복 × 역 행렬이 커지지 않도록 반복을 block_size씩 나눠 계산한다.
+
+    Args:
+        dates (np.ndarray): 일자 (datetime64[D])
+        morning_boarding, morning_alighting, evening_boarding, evening_alighting
+            (np.ndarray): [역, 일자] 시간대 구간 합계
+        n_replicates (int): 반복 수
+        seed (int): 난수 시드
+        level (float): 신뢰수준
+        block_size (int): 한 번에 계산할 반복 수
+
+    Returns:
+        dict: {
+            'stations': 역별 MORNING_RATIO_LOWER/UPPER, EVENING_RATIO_LOWER/UPPER,
+                        TYPE_STABILITY (원래 유형과 같게 분류된 반복 비율),
+            'type_share': 유형별 SHARE, LOWER, UPPER (%)
+        }
+    """
+    W = stratified_bootstrap_weights(weekday_of(dates), n_replicates, seed)
+    n_stations = morning_boarding.shape[0]
+
+    X = [np.asarray(m, dtype=np.float64).T for m in
+         (morning_boarding, morning_alighting, evening_boarding, evening_alighting)]
+
+    def ratios(mb, ma, eb, ea):
+        return mb / (mb + ma + 1), ea / (eb + ea + 1)
+
+    base_morning, base_evening = ratios(*[x.sum(axis=0) for x in X])
+    base_types = classify_station_types(base_morning, base_evening)
+
+    morning_reps = np.empty((n_replicates, n_stations))
+    evening_reps = np.empty((n_replicates, n_stations))
+    same_type = np.zeros(n_stations)
+    type_counts = np.empty((n_replicates, len(STATION_TYPES)))
+
+    for start in range(0, n_replicates, block_size):
+        block = W[start:start + block_size]
+        morning, evening = ratios(*[block @ x for x in X])
+        types = classify_station_types(morning, evening)
+
+        morning_reps[start:start + len(block)] = morning
+        evening_reps[start:start + len(block)] = evening
+        same_type += (types == base_types).sum(axis=0)
+        # 반복별 유형 개수: (반복, 유형) 평탄화 bincount
+        flat = (np.arange(len(block))[:, None] * len(STATION_TYPES) + types).ravel()
+        type_counts[start:start + len(block)] = np.bincount(
+            flat, minlength=len(block) * len(STATION_TYPES)).reshape(len(block), -1)
+
+    morning_lower, morning_upper = percentile_interval(morning_reps, level)
+    evening_lower, evening_upper = percentile_interval(evening_reps, level)
+
+    shares = type_counts / max(n_stations, 1) * 100
+    share_lower, share_upper = percentile_interval(shares, level)
+    base_share = np.bincount(base_types, minlength=len(STATION_TYPES)) / max(n_stations, 1) * 100
+
+    return {
+        'stations': pd.DataFrame({
+            'MORNING_RATIO_LOWER': morning_lower,
+            'MORNING_RATIO_UPPER': morning_upper,
+            'EVENING_RATIO_LOWER': evening_lower,
+            'EVENING_RATIO_UPPER': evening_upper,
+            'TYPE_STABILITY': same_type / n_replicates,
+        }),
+        'type_share': pd.DataFrame({
+            'SHARE': base_share,
+            'LOWER': share_lower,
+            'UPPER': share_upper,
+        }, index=pd.Index(STATION_TYPES, name='TYPE')).round(1),
+    }
@@ -0,0 +1,55 @@
+"""
+CardSubwayTime 컬럼명 상수 및 조회 헬퍼
+"""
+
+import re
+
+# 역명/노선명 컬럼 후보 (API 응답과 대시보드 데이터의 컬럼명이 다를 수 있음)
+STATION_COLUMNS = ('STTN', 'STATN_NM')
+LINE_COLUMNS = ('SBWY_ROUT_LN_NM', 'LN_NM')
+
+# 시간대별 승하차 컬럼 (예: HR_7_GET_ON_NOPE, HR_07_GET_OFF_NOPE)
+_HOUR_COLUMN_PATTERN = re.compile(r'^HR_(\d{1,2})_GET_(ON|OFF)_NOPE$')
+
+
+def find_column(df, candidates):
+    """
+    후보 컬럼명 중 데이터에 존재하는 첫 번째 컬럼 반환
+
+    Args:
+        df (DataFrame): 데이터프레임
+        candidates (tuple): 후보 컬럼명
+
+    Returns:
+        str: 컬럼명 (없으면 None)
+    """
+    for col in candidates:
+        if col in df.columns:
+            return col
+    return None
+
+
+def get_hour_columns(df):
+    """
+    시간대별 승하차 컬럼 찾기 (승차/하차가 모두 있는 시간대만)
+
+    Args:
+        df (DataFrame): 데이터프레임
+
+    Returns:
+        list: [(시간, 승차 컬럼, 하차 컬럼), ...] 시간 오름차순
+    """
+    boarding = {}
+    alighting = {}
+    for col in df.columns:
+        match = _HOUR_COLUMN_PATTERN.match(str(col))
+        if not match:
+            continue
+        hour = int(match.group(1))
+        if match.group(2) == 'ON':
+            boarding[hour] = col
+        else:
+            alighting[hour] = col
+
+    return [(hour, boarding[hour], alighting[hour])
+            for hour in sorted(boarding) if hour in alighting]
@@ -0,0 +1,199 @@
+"""
+역 × 시간대별 이용객 수요 예측 (요일 × 시간대 계절 회귀)
+
+모든 역 × 시간대 시계열이 같은 일자 축을 공유하므로 설계 행렬 X(요일 더미 + 선택적 추세)도
+하나로 같다. 따라서 시계열마다 모델을 따로 만들지 않고 Y = [일자, 역 × 시간대] 전체를
+우변으로 두고 np.linalg.lstsq를 한 번 호출해 모든 계수를 동시에 구한다.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from .hourly_cube import WEEKDAY_NAMES, check_measure, weekday_of
+
+
+class SeasonalForecaster:
+    """
+    요일 × 시간대 계절 선형 회귀 (전체 역 × 시간대 일괄 최소제곱)
+
+    y[역, 일자, 시간대] = β[요일, 역, 시간대] (+ γ[역, 시간대] × 경과 주)
+    """
+
+    def __init__(self, trend=False, half_life=None, measure='total'):
+        """
+        Args:
+            trend (bool): 선형 추세 항 포함 여부
+            half_life (float): 최근 관측 가중 반감기 (일, None이면 동일 가중)
+            measure (str): 'total', 'boarding', 'alighting'
+        """
+        self.trend = trend
+        self.half_life = half_life
+        self.measure = check_measure(measure)
+
+        self.stations = None
+        self.hours = None
+        self.coef_ = None  # [특성, 역, 시간대]
+        self.origin_ = None
+        self.last_date_ = None
+        self.fit_seconds_ = None
+
+    def _design(self, dates):
+        """
+        설계 행렬: 요일 더미 7개 (+ 기준일 대비 경과 주)
+        """
+        n_features = 7 + (1 if self.trend else 0)
+        X = np.zeros((len(dates), n_features))
+        X[np.arange(len(dates)), weekday_of(dates)] = 1.0
+        if self.trend:
+            X[:, 7] = (dates - self.origin_).astype(np.int64) / 7.0
+        return X
+
+    def fit(self, cube, end_date=None):
+        """
+        end_date까지의 데이터로 모든 역 × 시간대 계수 추정
+
+        Args:
+            cube (HourlyCube): 역 × 일자 × 시간대 승하차 배열
+            end_date: 학습 마지막 일자 (포함, None이면 끝까지)
+
+        Returns:
+            SeasonalForecaster: self
+        """
+        started = time.perf_counter()
+
+        _, d1 = cube.date_bounds(None, end_date)
+        dates = cube.dates[:d1]
+        valid = ~np.isnat(dates)
+        dates = dates[valid]
+        if len(dates) == 0:
+            raise ValueError("학습할 일자 데이터가 없습니다.")
+
+        values = cube.measure(self.measure)[:, :d1][:, valid]
+        n_stations, n_dates, n_hours = values.shape
+
+        self.stations = cube.stations
+        self.hours = cube.hours
+        self.origin_ = dates[-1]
+        self.last_date_ = dates[-1]
+
+        # [일자, 역 × 시간대] 우변 행렬 - 모든 시계열을 한 번에 풀기
+        Y = np.moveaxis(values, 1, 0).reshape(n_dates, -1).astype(np.float64)
+        X = self._design(dates)
+
+        if self.half_life:
+            age = (dates[-1] - dates).astype(np.int64)
+            sqrt_w = np.sqrt(0.5 ** (age / self.half_life))
+            X = X * sqrt_w[:, None]
+            Y = Y * sqrt_w[:, None]
+
+        coef, _, _, _ = np.linalg.lstsq(X, Y, rcond=None)
+        self.coef_ = coef.reshape(X.shape[1], n_stations, n_hours)
+
+        self.fit_seconds_ = time.perf_counter() - started
+        return self
+
+    def predict(self, horizon=7):
+        """
+        학습 마지막 일자 다음날부터 horizon일 예측
+
+        Returns:
+            tuple: (예측 일자 [horizon], 예측값 [역, horizon, 시간대])
+        """
+        if self.coef_ is None:
+            raise ValueError("먼저 fit()을 호출하세요.")
+
+        dates = self.last_date_ + np.arange(1, horizon + 1).astype('timedelta64[D]')
+        X = self._design(dates)
+        forecast = np.einsum('dp,psh->sdh', X, self.coef_)
+        return dates, np.maximum(forecast, 0.0)
+
+    def forecast_frame(self, horizon=7):
+        """
+        예측 결과를 긴 형식 표로 반환
+
+        Returns:
+            DataFrame: STTN, USE_DT, WEEKDAY, HOUR, FORECAST
+        """
+        dates, forecast = self.predict(horizon)
+        n_stations, n_dates, n_hours = forecast.shape
+
+        s, d, h = np.unravel_index(np.arange(forecast.size), forecast.shape)
+        return pd.DataFrame({
+            'STTN': self.stations[s],
+            'USE_DT': pd.to_datetime(dates[d]),
+            'WEEKDAY': np.asarray(WEEKDAY_NAMES, dtype=object)[weekday_of(dates[d])],
+            'HOUR': self.hours[h],
+            'FORECAST': np.round(forecast.ravel(), 1),
+        })
+
+
+def _seasonal_naive(cube, values, test_idx):
+    """
+    계절 naive 예측 (7일 전 같은 요일 값) - 해당 일자가 없으면 NaN
+    """
+    previous = cube.dates[test_idx] - np.timedelta64(7, 'D')
+    pos = np.searchsorted(cube.dates, previous)
+    pos = np.minimum(pos, len(cube.dates) - 1)
+    found = cube.dates[pos] == previous
+
+    naive = np.full((values.shape[0], len(test_idx), values.shape[2]), np.nan)
+    naive[:, found] = values[:, pos[found]]
+    return naive
+
+
+def backtest(cube, folds=4, horizon=7, trend=False, half_life=None, measure='total'):
+    """
+    롤링 원점 백테스트: 마지막 folds × horizon일을 horizon일씩 잘라
+    직전까지로 학습 → 다음 horizon일 예측을 반복한다.
+
+    Args:
+        cube (HourlyCube): 역 × 일자 × 시간대 승하차 배열
+        folds (int): 검증 구간 수
+        horizon (int): 구간 길이 (일)
+        trend, half_life, measure: SeasonalForecaster 설정
+
+    Returns:
+        DataFrame: 구간별 학습 일수, MAE, RMSE, WAPE(%), 계절 naive WAPE(%), 학습 시간(초)
+    """
+    values = cube.measure(measure).astype(np.float64)
+    last = cube.dates[-1]
+    results = []
+
+    for fold in range(folds, 0, -1):
+        cutoff = last - np.timedelta64(fold * horizon, 'D')
+        test_end = cutoff + np.timedelta64(horizon, 'D')
+
+        n_train = int(np.searchsorted(cube.dates, cutoff, 'right'))
+        test_idx = np.flatnonzero((cube.dates > cutoff) & (cube.dates <= test_end))
+        if n_train == 0 or len(test_idx) == 0:
+            continue
+
+        model = SeasonalForecaster(trend=trend, half_life=half_life, measure=measure)
+        model.fit(cube, end_date=pd.Timestamp(cutoff))
+        forecast_dates, forecast = model.predict(horizon)
+
+        # 실제 관측이 있는 일자만 비교
+        pos = np.searchsorted(forecast_dates, cube.dates[test_idx])
+        predicted = forecast[:, pos]
+        actual = values[:, test_idx]
+        errors = predicted - actual
+
+        naive = _seasonal_naive(cube, values, test_idx)
+        naive_ok = ~np.isnan(naive)
+        naive_wape = (np.abs(naive - actual)[naive_ok].sum() / max(actual[naive_ok].sum(), 1.0) * 100
+                      if naive_ok.any() else np.nan)
+
+        results.append({
+            'TEST_START': pd.Timestamp(cube.dates[test_idx[0]]),
+            'TEST_END': pd.Timestamp(cube.dates[test_idx[-1]]),
+            'TRAIN_DAYS': n_train,
+            'MAE': np.abs(errors).mean(),
+            'RMSE': np.sqrt((errors ** 2).mean()),
+            'WAPE': np.abs(errors).sum() / max(actual.sum(), 1.0) * 100,
+            'NAIVE_WAPE': naive_wape,
+            'FIT_SECONDS': model.fit_seconds_,
+        })
+
+    return pd.DataFrame(results)
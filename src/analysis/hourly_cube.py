@@ -0,0 +1,215 @@
+"""
+역 × 일자 × 시간대 승하차 배열 (HourlyCube)
+
+전처리된 데이터프레임(역/노선/일자 행 × 시간대 컬럼)을
+역별·일자별·시간대별 3차원 numpy 배열로 변환한다.
+같은 역·일자에 여러 노선 행이 있으면 합산한다 (groupby('STTN')과 동일).
+"""
+
+import numpy as np
+import pandas as pd
+
+from .columns import STATION_COLUMNS, find_column, get_hour_columns
+
+WEEKDAY_NAMES = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
+DAY_TYPES = ('평일', '주말')
+MEASURES = ('boarding', 'alighting', 'total')
+
+
+def weekday_of(dates):
+    """
+    datetime64 배열의 요일 (0=월요일, 6=일요일)
+    """
+    days = np.asarray(dates, dtype='datetime64[D]').view('int64')
+    return (days + 3) % 7  # 1970-01-01 = 목요일
+
+
+def check_measure(measure):
+    """
+    측정값 이름 검사 ('boarding', 'alighting', 'total')
+
+    Raises:
+        ValueError: 지원하지 않는 측정값
+    """
+    if measure not in MEASURES:
+        raise ValueError(f"지원하지 않는 측정값: {measure} (가능: {', '.join(MEASURES)})")
+    return measure
+
+
+def day_type_mask(dates, day_type=None):
+    """
+    일자 유형('평일'/'주말') 선택 마스크 (None 또는 '전체'면 모두 선택)
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    if day_type in (None, '전체'):
+        return np.ones(len(dates), dtype=bool)
+    if day_type not in DAY_TYPES:
+        raise ValueError(f"지원하지 않는 일자 유형: {day_type}")
+    is_weekend = weekday_of(dates) >= 5
+    return is_weekend if day_type == '주말' else ~is_weekend
+
+
+class HourlyCube:
+    """
+    역 × 일자 × 시간대 승하차 인원 배열
+
+    Attributes:
+        stations (np.ndarray): 역명 (정렬됨)
+        dates (np.ndarray): 일자 (datetime64[D], 정렬됨)
+        hours (np.ndarray): 시간대 (정렬됨)
+        boarding (np.ndarray): 승차 인원 [역, 일자, 시간대]
+        alighting (np.ndarray): 하차 인원 [역, 일자, 시간대]
+        row_counts (np.ndarray): 일자별 원본 행 수
+        cell_rows (np.ndarray): 역·일자별 원본 행 수 [역, 일자] (0이면 그날 그 역 데이터 없음)
+        station_column (str): 원본 역명 컬럼명
+    """
+
+    def __init__(self, stations, dates, hours, boarding, alighting, row_counts=None,
+                 station_column=None, cell_rows=None):
+        self.stations = np.asarray(stations, dtype=object)
+        self.dates = np.asarray(dates, dtype='datetime64[D]')
+        self.hours = np.asarray(hours, dtype=np.int64)
+        self.boarding = boarding
+        self.alighting = alighting
+        if row_counts is None:
+            row_counts = np.zeros(len(self.dates), dtype=np.int64)
+        self.row_counts = row_counts
+        self.cell_rows = cell_rows
+        self.station_column = station_column
+        self._station_lookup = None
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """
+        전처리된 데이터프레임으로부터 생성
+
+        역명 컬럼이 없으면 전체를 하나의 역('전체')으로, USE_DT가 없으면
+        전체를 하나의 일자(NaT)로 취급한다.
+
+        Args:
+            df (DataFrame): 전처리된 데이터 (USE_DT, 역명, HR_X_GET_ON/OFF_NOPE)
+
+        Returns:
+            HourlyCube: 생성된 배열 (시간대 컬럼이 없으면 None)
+        """
+        hour_columns = get_hour_columns(df)
+        if not hour_columns:
+            return None
+
+        station_col = find_column(df, STATION_COLUMNS)
+        if station_col:
+            station_codes, stations = pd.factorize(df[station_col], sort=True)
+            stations = np.asarray(stations, dtype=object)
+        else:
+            station_codes = np.zeros(len(df), dtype=np.int64)
+            stations = np.array(['전체'], dtype=object)
+
+        if 'USE_DT' in df.columns:
+            date_codes, dates = pd.factorize(df['USE_DT'].values.astype('datetime64[D]'), sort=True)
+        else:
+            date_codes = np.zeros(len(df), dtype=np.int64)
+            dates = np.array(['NaT'], dtype='datetime64[D]')
+
+        # 역명/일자가 비어 있는 행(factorize 코드 -1)은 제외 (groupby('STTN')과 동일)
+        valid = (station_codes >= 0) & (date_codes >= 0)
+        if not valid.all():
+            station_codes, date_codes = station_codes[valid], date_codes[valid]
+
+        n_stations, n_dates = len(stations), len(dates)
+        flat_codes = station_codes.astype(np.int64) * n_dates + date_codes
+        n_cells = n_stations * n_dates
+
+        def to_cube(columns):
+            values = df[columns].fillna(0).to_numpy(dtype=np.int64)
+            if not valid.all():
+                values = values[valid]
+            cube = np.empty((n_cells, len(columns)), dtype=np.int64)
+            for i in range(len(columns)):
+                cube[:, i] = np.bincount(flat_codes, weights=values[:, i], minlength=n_cells)
+            return cube.reshape(n_stations, n_dates, len(columns))
+
+        boarding = to_cube([on for _, on, _ in hour_columns])
+        alighting = to_cube([off for _, _, off in hour_columns])
+        row_counts = np.bincount(date_codes, minlength=n_dates)
+        cell_rows = np.bincount(flat_codes, minlength=n_cells).reshape(n_stations, n_dates)
+
+        return cls(stations, dates, [hour for hour, _, _ in hour_columns],
+                   boarding, alighting, row_counts, station_column=station_col, cell_rows=cell_rows)
+
+    @property
+    def total(self):
+        """
+        승차 + 하차 [역, 일자, 시간대]
+        """
+        return self.boarding + self.alighting
+
+    def measure(self, name):
+        """
+        측정값 배열 [역, 일자, 시간대]
+
+        Args:
+            name (str): 'boarding' (승차), 'alighting' (하차), 'total' (승차 + 하차)
+
+        Raises:
+            ValueError: 지원하지 않는 측정값
+        """
+        check_measure(name)
+        if name == 'boarding':
+            return self.boarding
+        if name == 'alighting':
+            return self.alighting
+        return self.total
+
+    @property
+    def weekdays(self):
+        """
+        일자별 요일 (0=월요일, 6=일요일)
+        """
+        return weekday_of(self.dates)
+
+    def station_codes(self, names):
+        """
+        역명 목록을 정수 인덱스로 변환
+
+        Args:
+            names (list): 역명 목록
+
+        Returns:
+            np.ndarray: 역 인덱스
+        """
+        if self._station_lookup is None:
+            self._station_lookup = {name: i for i, name in enumerate(self.stations)}
+        missing = [name for name in names if name not in self._station_lookup]
+        if missing:
+            raise KeyError(f"알 수 없는 역: {', '.join(map(str, missing[:5]))}")
+        return np.array([self._station_lookup[name] for name in names], dtype=np.int64)
+
+    def date_bounds(self, start=None, end=None):
+        """
+        날짜 범위 [start, end]를 일자 인덱스 구간 [d0, d1)로 변환
+
+        Args:
+            start: 시작일 (포함, None이면 처음부터)
+            end: 종료일 (포함, None이면 끝까지)
+        """
+        d0, d1 = 0, len(self.dates)
+        if start is not None:
+            d0 = int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start).date(), 'D'), 'left'))
+        if end is not None:
+            d1 = int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end).date(), 'D'), 'right'))
+        return d0, max(d0, d1)
+
+    def hour_bounds(self, hour_start=None, hour_end=None):
+        """
+        시간 범위 [hour_start, hour_end)를 시간대 인덱스 구간으로 변환
+
+        Args:
+            hour_start (int): 시작 시간 (포함)
+            hour_end (int): 종료 시간 (미포함)
+        """
+        h0, h1 = 0, len(self.hours)
+        if hour_start is not None:
+            h0 = int(np.searchsorted(self.hours, hour_start, 'left'))
+        if hour_end is not None:
+            h1 = int(np.searchsorted(self.hours, hour_end, 'left'))
+        return h0, max(h0, h1)
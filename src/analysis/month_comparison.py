@@ -0,0 +1,253 @@
+"""
+월별 비교 (역 정수 사전으로 정렬한 월 × 역 × 시간대 배열)
+
+파일마다 역명 컬럼(STTN / STATN_NM)과 역 구성이 달라도 공통 역 사전으로
+정수 코드를 부여해 [월, 역, 시간대] 배열 하나에 모은 뒤,
+연속한 월 간 증감/증감률/순위를 배열 연산 한 번으로 계산한다.
+"""
+
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+class StationDictionary:
+    """
+    역명 → 정수 코드 사전 (처음 등장한 순서대로 코드 부여)
+    """
+
+    def __init__(self, names=None):
+        self.names = []
+        self._codes = {}
+        if names is not None:
+            self.encode(names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def encode(self, names):
+        """
+        역명 목록을 정수 코드로 변환 (새 역명은 사전에 추가)
+
+        Returns:
+            np.ndarray: 역 코드
+        """
+        codes = np.empty(len(names), dtype=np.int64)
+        for i, name in enumerate(names):
+            key = str(name).strip()
+            code = self._codes.get(key)
+            if code is None:
+                code = len(self.names)
+                self._codes[key] = code
+                self.names.append(key)
+            codes[i] = code
+        return codes
+
+    def decode(self, codes):
+        """
+        정수 코드를 역명 배열로 변환
+        """
+        return np.asarray(self.names, dtype=object)[np.asarray(codes, dtype=np.int64)]
+
+
+def _month_label(cube):
+    dates = cube.dates[~np.isnat(cube.dates)]
+    if len(dates) == 0:
+        return None
+    return str(dates[0].astype('datetime64[M]'))
+
+
+class MonthlyComparison:
+    """
+    월별 비교 결과
+
+    Attributes:
+        months (list): 월 라벨 (입력 순서)
+        stations (np.ndarray): 공통 역 사전의 역명
+        hours (np.ndarray): 시간대
+        values (np.ndarray): [월, 역, 시간대] 이용객 (per_day=True면 하루 평균)
+        present (np.ndarray): [월, 역] 해당 월 데이터에 역이 있었는지
+    """
+
+    def __init__(self, months, dictionary, hours, values, present, per_day=True):
+        self.months = list(months)
+        self.dictionary = dictionary
+        self.stations = dictionary.decode(np.arange(len(dictionary)))
+        self.hours = np.asarray(hours, dtype=np.int64)
+        self.values = values
+        self.present = present
+        self.per_day = per_day
+
+        # 연속한 월 간 증감 [월 - 1, 역, 시간대] (한 번의 배열 연산)
+        previous, current = values[:-1], values[1:]
+        self.delta = current - previous
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.pct_change = np.where(previous > 0, self.delta / previous * 100, np.nan)
+
+        totals = values.sum(axis=2)
+        self.station_totals = totals
+        self.station_delta = totals[1:] - totals[:-1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.station_pct = np.where(totals[:-1] > 0, self.station_delta / totals[:-1] * 100, np.nan)
+
+        # 두 달 모두 존재한 역만 증감 비교 대상 (신설/폐지 역은 따로 표시)
+        self.comparable = present[1:] & present[:-1]
+
+    def station_table(self):
+        """
+        월 × 역 증감표
+
+        Returns:
+            DataFrame: MONTH, PREV_MONTH, STTN, PREV_TOTAL, TOTAL, DELTA, PCT_CHANGE, STATUS
+        """
+        n_pairs, n_stations = self.station_delta.shape
+        p, s = np.unravel_index(np.arange(n_pairs * n_stations), (n_pairs, n_stations))
+        keep = self.present[p, s] | self.present[p + 1, s]
+        p, s = p[keep], s[keep]
+
+        status = np.full(len(p), '유지', dtype=object)
+        status[~self.present[p, s]] = '신규'
+        status[~self.present[p + 1, s]] = '누락'
+
+        months = np.asarray(self.months, dtype=object)
+        return pd.DataFrame({
+            'MONTH': months[p + 1],
+            'PREV_MONTH': months[p],
+            'STTN': self.stations[s],
+            'PREV_TOTAL': self.station_totals[p, s].round(1),
+            'TOTAL': self.station_totals[p + 1, s].round(1),
+            'DELTA': self.station_delta[p, s].round(1),
+            'PCT_CHANGE': self.station_pct[p, s].round(2),
+            'STATUS': status,
+        })
+
+    def hourly_table(self):
+        """
+        월 × 시간대 네트워크 전체 증감표 (비교 가능한 역만 합산)
+
+        Returns:
+            DataFrame: MONTH, PREV_MONTH, HOUR, PREV_TOTAL, TOTAL, DELTA, PCT_CHANGE
+        """
+        mask = self.comparable[:, :, None]
+        previous = np.where(mask, self.values[:-1], 0).sum(axis=1)
+        current = np.where(mask, self.values[1:], 0).sum(axis=1)
+        delta = current - previous
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pct = np.where(previous > 0, delta / previous * 100, np.nan)
+
+        n_pairs, n_hours = delta.shape
+        p, h = np.unravel_index(np.arange(n_pairs * n_hours), (n_pairs, n_hours))
+        months = np.asarray(self.months, dtype=object)
+        return pd.DataFrame({
+            'MONTH': months[p + 1],
+            'PREV_MONTH': months[p],
+            'HOUR': self.hours[h],
+            'PREV_TOTAL': previous[p, h].round(1),
+            'TOTAL': current[p, h].round(1),
+            'DELTA': delta[p, h].round(1),
+            'PCT_CHANGE': pct[p, h].round(2),
+        })
+
+    def movers(self, k=10, by='DELTA'):
+        """
+        월별 증가/감소 상위 k개 역 (월 쌍 전체에 대해 argpartition 한 번)
+
+        Args:
+            k (int): 방향별 역 수
+            by (str): 'DELTA' (증감 인원) 또는 'PCT_CHANGE' (증감률)
+
+        Returns:
+            DataFrame: MONTH, DIRECTION, RANK, STTN, DELTA, PCT_CHANGE
+        """
+        scores = self.station_delta if by == 'DELTA' else self.station_pct
+        scores = np.where(self.comparable & ~np.isnan(scores), scores, np.nan)
+        n_pairs, n_stations = scores.shape
+        k = min(k, n_stations)
+        if k == 0 or n_pairs == 0:
+            return pd.DataFrame(columns=['MONTH', 'DIRECTION', 'RANK', 'STTN', 'DELTA', 'PCT_CHANGE'])
+
+        frames = []
+        for direction, signed in (('증가', scores), ('감소', -scores)):
+            filled = np.where(np.isnan(signed), -np.inf, signed)
+            top = np.argpartition(-filled, k - 1, axis=1)[:, :k]
+            order = np.argsort(-np.take_along_axis(filled, top, axis=1), axis=1, kind='stable')
+            top = np.take_along_axis(top, order, axis=1)
+
+            p = np.repeat(np.arange(n_pairs), k)
+            s = top.ravel()
+            valid = np.isfinite(filled[p, s]) & (filled[p, s] > 0)
+            frames.append(pd.DataFrame({
+                'MONTH': np.asarray(self.months, dtype=object)[p + 1],
+                'DIRECTION': direction,
+                'RANK': np.tile(np.arange(1, k + 1), n_pairs),
+                'STTN': self.stations[s],
+                'DELTA': self.station_delta[p, s].round(1),
+                'PCT_CHANGE': self.station_pct[p, s].round(2),
+            })[valid])
+
+        return pd.concat(frames, ignore_index=True).sort_values(
+            ['MONTH', 'DIRECTION', 'RANK'], kind='stable').reset_index(drop=True)
+
+    def save(self, save_path="results/", timestamp=None, top_k=10):
+        """
+        비교 결과 CSV 저장 (역별 증감, 시간대별 증감, 상위 변동 역)
+
+        Returns:
+            dict: 저장된 파일 경로
+        """
+        os.makedirs(save_path, exist_ok=True)
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        paths = {}
+        for name, table in (('station', self.station_table()),
+                            ('hourly', self.hourly_table()),
+                            ('movers', self.movers(top_k))):
+            path = os.path.join(save_path, f"month_comparison_{name}_{timestamp}.csv")
+            table.to_csv(path, index=False, encoding='utf-8-sig')
+            paths[name] = path
+        return paths
+
+
+def compare_months(cubes, labels=None, measure='total', per_day=True):
+    """
+    여러 달의 HourlyCube를 공통 역 사전/시간대로 정렬해 비교
+
+    Args:
+        cubes (list): 월별 HourlyCube (비교 순서대로)
+        labels (list): 월 라벨 (None이면 각 cube의 첫 일자로 'YYYY-MM' 생성)
+        measure (str): 'total', 'boarding', 'alighting'
+        per_day (bool): 월 길이 차이를 없애기 위해 하루 평균으로 비교
+
+    Returns:
+        MonthlyComparison: 비교 결과
+    """
+    if len(cubes) < 2:
+        raise ValueError("비교하려면 2개 이상의 월 데이터가 필요합니다.")
+
+    if labels is None:
+        labels = [_month_label(cube) or f'월{i + 1}' for i, cube in enumerate(cubes)]
+        # 같은 달이 두 번 들어오면 순서 번호로 구분
+        labels = [label if labels.count(label) == 1 else f'{label}#{labels[:i].count(label) + 1}'
+                  for i, label in enumerate(labels)]
+
+    dictionary = StationDictionary()
+    station_codes = [dictionary.encode(cube.stations) for cube in cubes]
+    hours = np.unique(np.concatenate([cube.hours for cube in cubes]))
+
+    values = np.zeros((len(cubes), len(dictionary), len(hours)), dtype=np.float64)
+    present = np.zeros((len(cubes), len(dictionary)), dtype=bool)
+
+    for m, (cube, codes) in enumerate(zip(cubes, station_codes)):
+        monthly = cube.measure(measure).sum(axis=1).astype(np.float64)
+        if per_day:
+            monthly /= max(int((~np.isnat(cube.dates)).sum()), 1)
+
+        # 공백만 다른 역명은 같은 코드가 되므로 대입 대신 누적
+        hour_pos = np.searchsorted(hours, cube.hours)
+        np.add.at(values[m], (codes[:, None], hour_pos[None, :]), monthly)
+        present[m] = values[m].sum(axis=1) > 0
+
+    return MonthlyComparison(labels, dictionary, hours, values, present, per_day=per_day)
@@ -0,0 +1,104 @@
+"""
+역별 순유출입(승차 - 하차)과 하루 누적 수지
+
+- 순유출입 NET = 승차 - 하차 (양수: 역 주변에서 네트워크로 승객을 내보냄 = 유출,
+  음수: 네트워크에서 역 주변으로 승객을 받아들임 = 흡수)
+- 누적 수지 BALANCE = 첫 시간대부터의 NET 누적합 (역 × 일자 × 시간대 배열에 cumsum 한 번)
+- 네트워크 전체의 누적 NET은 해당 시각까지 타고 아직 내리지 않은 승객 수(재차 인원)의 근사값이다.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .hourly_cube import day_type_mask
+
+
+def hour_column_labels(hours):
+    """
+    시간대 컬럼명 (H00, H01, ...) - API 히트맵 응답과 같은 형식
+    """
+    return [f'H{hour:02d}' for hour in hours]
+
+
+def compute_net_flow(cube, start_date=None, end_date=None, day_type=None, top_n=5):
+    """
+    역 × 시간대 평균 순유출입 / 누적 수지 계산
+
+    Args:
+        cube (HourlyCube): 역 × 일자 × 시간대 승하차 배열
+        start_date: 시작일 (포함)
+        end_date: 종료일 (포함)
+        day_type (str): '평일', '주말' 또는 None(전체)
+        top_n (int): 시간대별 유출/흡수 상위 역 수
+
+    Returns:
+        dict: {
+            'net': 역 × 시간대 하루 평균 순유출입 (인덱스: 역, 컬럼: H00..),
+            'balance': 역 × 시간대 하루 평균 누적 수지,
+            'network': 시간대별 네트워크 전체 BOARDING, ALIGHTING, NET, IN_NETWORK,
+            'extremes': 시간대별 유출/흡수 상위 역,
+            'n_days': 집계 일수
+        }
+    """
+    d0, d1 = cube.date_bounds(start_date, end_date)
+    selected = np.arange(d0, d1)[day_type_mask(cube.dates[d0:d1], day_type)]
+    n_days = len(selected)
+
+    # [역, 일자, 시간대] 전체에 대해 차감 + 시간축 누적합 한 번
+    net = cube.boarding[:, selected, :] - cube.alighting[:, selected, :]
+    balance = np.cumsum(net, axis=2)
+
+    divisor = max(n_days, 1)
+    mean_net = net.sum(axis=1) / divisor
+    mean_balance = balance.sum(axis=1) / divisor
+
+    columns = hour_column_labels(cube.hours)
+    station_index = pd.Index(cube.stations, name=cube.station_column or 'STTN')
+    net_df = pd.DataFrame(mean_net, index=station_index, columns=columns).round(1)
+    balance_df = pd.DataFrame(mean_balance, index=station_index, columns=columns).round(1)
+
+    network_boarding = cube.boarding[:, selected, :].sum(axis=(0, 1)) / divisor
+    network_alighting = cube.alighting[:, selected, :].sum(axis=(0, 1)) / divisor
+    network_net = mean_net.sum(axis=0)
+    network_df = pd.DataFrame({
+        'HOUR': cube.hours,
+        'BOARDING': network_boarding,
+        'ALIGHTING': network_alighting,
+        'NET': network_net,
+        'IN_NETWORK': np.cumsum(network_net),
+    }).round(1)
+
+    extremes_df = _hourly_extremes(mean_net, cube.stations, cube.hours, top_n)
+
+    return {
+        'net': net_df,
+        'balance': balance_df,
+        'network': network_df,
+        'extremes': extremes_df,
+        'n_days': n_days,
+    }
+
+
+def _hourly_extremes(mean_net, stations, hours, top_n):
+    """
+    시간대별 순유출 상위 / 순흡수 상위 역 (전체 정렬 없이 argpartition)
+    """
+    n_stations = mean_net.shape[0]
+    k = min(top_n, n_stations)
+    if k == 0:
+        return pd.DataFrame(columns=['HOUR', 'TOP_EMITTING', 'TOP_ABSORBING'])
+
+    def top_k(matrix):
+        # 열(시간대)마다 상위 k개 → k개만 정렬
+        part = np.argpartition(-matrix, k - 1, axis=0)[:k]
+        order = np.argsort(-np.take_along_axis(matrix, part, axis=0), axis=0, kind='stable')
+        return np.take_along_axis(part, order, axis=0)
+
+    emitting = top_k(mean_net)
+    absorbing = top_k(-mean_net)
+
+    return pd.DataFrame({
+        'HOUR': hours,
+        'TOP_EMITTING': [', '.join(stations[emitting[:, h]]) for h in range(len(hours))],
+        'TOP_ABSORBING': [', '.join(stations[absorbing[:, h]]) for h in range(len(hours))],
+    })
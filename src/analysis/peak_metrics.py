@@ -0,0 +1,102 @@
+"""
+역별 피크 시간대 / 첨두도(peakiness) 지표
+
+일자 유형(전체/평일/주말) 지시 행렬과의 행렬곱 한 번으로 [유형, 역, 시간대] 하루 평균 행렬을 만들고,
+argmax / argpartition으로 모든 역 × 유형의 지표를 동시에 계산한다.
+- PEAK_HOUR: 이용객이 가장 많은 시간대
+- PEAK_TO_MEAN: 피크 시간대 이용객 / 시간대 평균 이용객
+- TOP3_SHARE: 상위 3개 시간대가 하루 이용객에서 차지하는 비율
+"""
+
+import numpy as np
+import pandas as pd
+
+from .hourly_cube import day_type_mask
+
+DAY_TYPE_ORDER = ('전체', '평일', '주말')
+
+
+def compute_peak_metrics(cube, start_date=None, end_date=None, measure='total', top_hours=3):
+    """
+    모든 역 × 일자 유형의 피크 지표 계산
+
+    Args:
+        cube (HourlyCube): 역 × 일자 × 시간대 승하차 배열
+        start_date: 시작일 (포함)
+        end_date: 종료일 (포함)
+        measure (str): 'total', 'boarding', 'alighting'
+        top_hours (int): 집중도 계산에 사용할 상위 시간대 수
+
+    Returns:
+        DataFrame: DAY_TYPE, 역명, DAILY_AVG, PEAK_HOUR, PEAK_AVG, PEAK_TO_MEAN,
+                   TOP{n}_HOURS, TOP{n}_SHARE (이용객이 없는 역 × 유형은 제외)
+    """
+    d0, d1 = cube.date_bounds(start_date, end_date)
+    dates = cube.dates[d0:d1]
+    values = cube.measure(measure)[:, d0:d1, :]
+    n_hours = values.shape[2]
+    k = min(top_hours, n_hours)
+
+    # 일자 유형 지시 행렬 [일자, 유형] / 유형별 일수 → 하루 평균 [유형, 역, 시간대]
+    indicator = np.stack([day_type_mask(dates, day_type) for day_type in DAY_TYPE_ORDER], axis=1)
+    n_days = indicator.sum(axis=0)
+    weights = indicator / np.maximum(n_days, 1)
+    matrix = np.einsum('sdh,dt->tsh', values, weights)
+
+    daily = matrix.sum(axis=2)
+    peak_idx = matrix.argmax(axis=2)
+    peak_value = np.take_along_axis(matrix, peak_idx[..., None], axis=2)[..., 0]
+
+    top_idx = np.argpartition(-matrix, k - 1, axis=2)[..., :k]
+    top_values = np.take_along_axis(matrix, top_idx, axis=2)
+    order = np.argsort(-top_values, axis=2, kind='stable')
+    top_idx = np.take_along_axis(top_idx, order, axis=2)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        peak_to_mean = peak_value / (daily / n_hours)
+        top_share = top_values.sum(axis=2) / daily * 100
+
+    # 이용 기록이 있는 (유형, 역)만
+    t, s = np.nonzero((daily > 0) & (n_days[:, None] > 0))
+    hours = cube.hours
+    top_hours_label = [','.join(f'{hour:02d}' for hour in hours[row]) for row in top_idx[t, s]]
+
+    station_column = cube.station_column or 'STTN'
+    return pd.DataFrame({
+        'DAY_TYPE': np.asarray(DAY_TYPE_ORDER, dtype=object)[t],
+        station_column: cube.stations[s],
+        'DAILY_AVG': daily[t, s].round(0),
+        'PEAK_HOUR': hours[peak_idx[t, s]],
+        'PEAK_AVG': peak_value[t, s].round(0),
+        'PEAK_TO_MEAN': peak_to_mean[t, s].round(2),
+        f'TOP{k}_HOURS': top_hours_label,
+        f'TOP{k}_SHARE': top_share[t, s].round(1),
+    })
+
+
+def top_peaky_stations(metrics, k=10, by='PEAK_TO_MEAN', day_type='전체', min_daily=0):
+    """
+    첨두도 상위 k개 역 (전체 정렬 없이 argpartition 후 k개만 정렬)
+
+    Args:
+        metrics (DataFrame): compute_peak_metrics() 결과
+        k (int): 역 수
+        by (str): 기준 지표 ('PEAK_TO_MEAN', 'TOP3_SHARE', ...)
+        day_type (str): '전체', '평일', '주말'
+        min_daily (float): 하루 평균 이용객이 이 값 미만인 역 제외 (소규모 역 잡음 제거)
+
+    Returns:
+        DataFrame: 기준 지표 내림차순 상위 k개 행
+    """
+    subset = metrics[(metrics['DAY_TYPE'] == day_type) & (metrics['DAILY_AVG'] >= min_daily)]
+    if by not in subset.columns:
+        raise KeyError(f"알 수 없는 지표: {by}")
+
+    scores = subset[by].to_numpy(dtype=np.float64)
+    k = min(k, len(scores))
+    if k == 0:
+        return subset.iloc[:0]
+
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind='stable')]
+    return subset.iloc[top]
@@ -0,0 +1,183 @@
+"""
+역별 일자 × 시간대 누적합 인덱스 (임의 기간/시간대 합계 O(1) 조회)
+
+P[s, d, h] = 역 s의 일자 [0, d) × 시간대 [0, h) 합계 라고 하면
+일자 [d0, d1) × 시간대 [h0, h1) 합계는 배열 조회 4번으로 계산된다:
+
+    P[s, d1, h1] - P[s, d0, h1] - P[s, d1, h0] + P[s, d0, h0]
+"""
+
+import numpy as np
+
+from .hourly_cube import HourlyCube, check_measure, weekday_of
+
+
+def _prefix_sum_2d(cube):
+    """
+    [역, 일자, 시간대] 배열의 일자·시간대 2차원 누적합 (앞쪽 0 패딩)
+    """
+    n_stations, n_dates, n_hours = cube.shape
+    prefix = np.zeros((n_stations, n_dates + 1, n_hours + 1), dtype=np.int64)
+    np.cumsum(cube, axis=1, out=prefix[:, 1:, 1:])
+    np.cumsum(prefix[:, 1:, 1:], axis=2, out=prefix[:, 1:, 1:])
+    return prefix
+
+
+class PrefixSumIndex:
+    """
+    역별 (일자 × 시간대) 누적합 인덱스
+    """
+
+    def __init__(self, cube):
+        """
+        Args:
+            cube (HourlyCube): 역 × 일자 × 시간대 승하차 배열
+        """
+        self.stations = cube.stations
+        self.dates = cube.dates
+        self.hours = cube.hours
+        self.weekdays = weekday_of(cube.dates)
+        self._cube = cube
+
+        self._prefix = {
+            'boarding': _prefix_sum_2d(cube.boarding),
+            'alighting': _prefix_sum_2d(cube.alighting),
+        }
+        # 일자별 원본 행 수 누적합 (행 단위 평균 계산용)
+        self._row_prefix = np.concatenate([[0], np.cumsum(cube.row_counts)])
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """
+        전처리된 데이터프레임으로부터 인덱스 생성
+
+        Returns:
+            PrefixSumIndex: 인덱스 (시간대 컬럼이 없으면 None)
+        """
+        cube = HourlyCube.from_dataframe(df)
+        return cls(cube) if cube is not None else None
+
+    @property
+    def cube(self):
+        """
+        원본 HourlyCube
+        """
+        return self._cube
+
+    def _prefix_for(self, measure):
+        check_measure(measure)
+        return self._prefix[measure]
+
+    def _window(self, prefix, d0, d1, h0, h1, station_codes):
+        p = prefix if station_codes is None else prefix[station_codes]
+        return p[:, d1, h1] - p[:, d0, h1] - p[:, d1, h0] + p[:, d0, h0]
+
+    def query(self, measure='total', start=None, end=None,
+              hour_start=None, hour_end=None, stations=None):
+        """
+        역별 기간 × 시간대 합계
+
+        Args:
+            measure (str): 'boarding' | 'alighting' | 'total'
+            start: 시작일 (포함)
+            end: 종료일 (포함)
+            hour_start (int): 시작 시간 (포함)
+            hour_end (int): 종료 시간 (미포함)
+            stations (list): 역명 목록 (None이면 전체 역)
+
+        Returns:
+            np.ndarray: 역별 합계 (stations 순서)
+        """
+        d0, d1 = self._cube.date_bounds(start, end)
+        h0, h1 = self._cube.hour_bounds(hour_start, hour_end)
+        codes = None if stations is None else self._cube.station_codes(stations)
+
+        if measure == 'total':
+            return (self._window(self._prefix['boarding'], d0, d1, h0, h1, codes)
+                    + self._window(self._prefix['alighting'], d0, d1, h0, h1, codes))
+        return self._window(self._prefix_for(measure), d0, d1, h0, h1, codes)
+
+    def total(self, measure='total', start=None, end=None,
+              hour_start=None, hour_end=None, stations=None):
+        """
+        기간 × 시간대 × 역 집합 전체 합계
+        """
+        return int(self.query(measure, start, end, hour_start, hour_end, stations).sum())
+
+    def hourly(self, measure='total', start=None, end=None, stations=None):
+        """
+        역별 시간대별 합계 (기간 내)
+
+        Returns:
+            np.ndarray: [역, 시간대] 합계
+        """
+        d0, d1 = self._cube.date_bounds(start, end)
+        codes = None if stations is None else self._cube.station_codes(stations)
+
+        def per_hour(prefix):
+            p = prefix if codes is None else prefix[codes]
+            by_date = p[:, d1, :] - p[:, d0, :]
+            return np.diff(by_date, axis=1)
+
+        if measure == 'total':
+            return per_hour(self._prefix['boarding']) + per_hour(self._prefix['alighting'])
+        return per_hour(self._prefix_for(measure))
+
+    def daily(self, measure='total', start=None, end=None,
+              hour_start=None, hour_end=None, stations=None):
+        """
+        역별 일자별 합계 (시간대 범위 내)
+
+        Returns:
+            tuple: (일자 배열, [역, 일자] 합계)
+        """
+        d0, d1 = self._cube.date_bounds(start, end)
+        h0, h1 = self._cube.hour_bounds(hour_start, hour_end)
+        codes = None if stations is None else self._cube.station_codes(stations)
+
+        def per_date(prefix):
+            p = prefix if codes is None else prefix[codes]
+            by_hour = p[:, d0:d1 + 1, h1] - p[:, d0:d1 + 1, h0]
+            return np.diff(by_hour, axis=1)
+
+        if measure == 'total':
+            values = per_date(self._prefix['boarding']) + per_date(self._prefix['alighting'])
+        else:
+            values = per_date(self._prefix_for(measure))
+        return self.dates[d0:d1], values
+
+    def row_count(self, start=None, end=None):
+        """
+        기간 내 원본 행 수
+        """
+        d0, d1 = self._cube.date_bounds(start, end)
+        return int(self._row_prefix[d1] - self._row_prefix[d0])
+
+    def daily_row_counts(self, start=None, end=None):
+        """
+        기간 내 일자별 원본 행 수
+        """
+        d0, d1 = self._cube.date_bounds(start, end)
+        return np.diff(self._row_prefix[d0:d1 + 1])
+
+    def sliding_window(self, window_days, measure='total', hour_start=None,
+                       hour_end=None, stations=None):
+        """
+        역별 window_days일 이동 합계 (모든 구간을 한 번에 계산)
+
+        Returns:
+            tuple: (구간 종료일 배열, [역, 구간] 합계)
+        """
+        h0, h1 = self._cube.hour_bounds(hour_start, hour_end)
+        codes = None if stations is None else self._cube.station_codes(stations)
+
+        def windows(prefix):
+            p = prefix if codes is None else prefix[codes]
+            by_hour = p[:, :, h1] - p[:, :, h0]
+            return by_hour[:, window_days:] - by_hour[:, :-window_days]
+
+        if measure == 'total':
+            values = windows(self._prefix['boarding']) + windows(self._prefix['alighting'])
+        else:
+            values = windows(self._prefix_for(measure))
+        return self.dates[window_days - 1:], values
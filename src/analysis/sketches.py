@@ -0,0 +1,299 @@
+"""
+병합 가능한 스트리밍 스케치 (전체 이력을 메모리에 올리지 않는 고유값 수 / 분위수)
+
+- HyperLogLog: 고유 역 수 / 노선 수 (레지스터 2^p 바이트, 상대오차 ≈ 1.04 / √2^p)
+- KLL: 역별 시간대 이용객 분위수 (p95 시간당 승차 등, 크기 O(k log(n/k)))
+
+두 스케치 모두 merge()로 월별/파티션별 결과를 합칠 수 있고,
+SubwaySketches.update()를 월마다 호출하면 누적 메모리가 데이터 크기와 무관하게 유지된다.
+"""
+
+import copy
+import os
+
+import numpy as np
+import pandas as pd
+
+from .columns import LINE_COLUMNS, STATION_COLUMNS, find_column, get_hour_columns
+from .hourly_cube import HourlyCube, check_measure
+
+
+def _hash_values(values):
+    """
+    값 배열의 64비트 해시 (pandas 고정 키 해시 - 실행/프로세스가 달라도 같은 값)
+    """
+    series = pd.Series(np.asarray(values, dtype=object)).astype(str)
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(dtype=np.uint64)
+
+
+def _bit_length(x):
+    """
+    uint64 배열의 비트 길이 (이진 탐색 6단계)
+    """
+    x = x.copy()
+    length = np.zeros(len(x), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        upper = x >= (np.uint64(1) << np.uint64(shift))
+        length += shift * upper
+        x = np.where(upper, x >> np.uint64(shift), x)
+    return length + (x > 0)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog 고유값 수 추정기
+    """
+
+    def __init__(self, p=12):
+        """
+        Args:
+            p (int): 레지스터 인덱스 비트 수 (레지스터 2^p개)
+        """
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    def add(self, values):
+        """
+        값 배열 추가 (중복 포함 가능)
+        """
+        if len(values) == 0:
+            return self
+        hashes = _hash_values(values)
+        low_bits = 64 - self.p
+
+        index = (hashes >> np.uint64(low_bits)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << low_bits) - 1)
+        # 나머지 비트의 선행 0 개수 + 1
+        rank = (low_bits - _bit_length(remainder) + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other):
+        """
+        다른 HyperLogLog 병합 (레지스터별 최댓값)
+        """
+        if other.p != self.p:
+            raise ValueError("정밀도(p)가 다른 HyperLogLog는 병합할 수 없습니다.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        """
+        고유값 수 추정
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+
+        # 작은 범위 보정 (linear counting)
+        zeros = int((self.registers == 0).sum())
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+class KLLSketch:
+    """
+    KLL 분위수 스케치
+
+    레벨 h의 항목은 가중치 2^h를 가진다. 레벨 용량을 넘으면 정렬 후 짝수/홀수 위치 중
+    무작위로 절반을 다음 레벨로 올린다.
+    """
+
+    def __init__(self, k=200, seed=0):
+        """
+        Args:
+            k (int): 최상위 레벨 용량 (클수록 정확, 순위 오차 ≈ 1.7 / k)
+            seed (int): 압축 위치 선택 난수 시드
+        """
+        self.k = k
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self.n = 0
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _compress(self):
+        while sum(len(items) for items in self.levels) > sum(
+                self._capacity(h) for h in range(len(self.levels))):
+            for level, items in enumerate(self.levels):
+                if len(items) <= self._capacity(level):
+                    continue
+
+                items = np.sort(items)
+                # 홀수 개면 한 개는 현재 레벨에 남김
+                keep = items[:len(items) % 2]
+                pairs = items[len(items) % 2:]
+                promoted = pairs[self._rng.integers(2)::2]
+
+                self.levels[level] = keep
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                break
+
+    def add(self, values):
+        """
+        값 배열 일괄 추가
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(values) == 0:
+            return self
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        다른 KLL 스케치 병합 (레벨별 이어붙인 뒤 압축)
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """
+        분위수 추정
+
+        Args:
+            q (float 또는 list): 0~1 분위
+
+        Returns:
+            float 또는 np.ndarray
+        """
+        items = np.concatenate(self.levels)
+        if len(items) == 0:
+            return np.nan if np.isscalar(q) else np.full(len(q), np.nan)
+
+        weights = np.concatenate([np.full(len(items), 2.0 ** level)
+                                  for level, items in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        targets = np.asarray(q, dtype=np.float64) * cumulative[-1]
+        positions = np.minimum(np.searchsorted(cumulative, targets, side='left'), len(items) - 1)
+        return items[order][positions]
+
+    def size(self):
+        """
+        보관 중인 항목 수
+        """
+        return sum(len(items) for items in self.levels)
+
+
+class SubwaySketches:
+    """
+    월별로 갱신/병합 가능한 지하철 데이터 스케치 묶음
+
+    Attributes:
+        stations (HyperLogLog): 고유 역 수
+        lines (HyperLogLog): 고유 노선 수
+        station_quantiles (dict): 역명 → KLLSketch (역 × 일자 × 시간대 이용객 분포)
+        n_rows (int): 누적 행 수
+        months (list): 반영한 월
+    """
+
+    def __init__(self, measure='boarding', p=12, k=200):
+        """
+        Args:
+            measure (str): 분위수 대상 'boarding', 'alighting', 'total'
+            p (int): HyperLogLog 정밀도
+            k (int): KLL 용량
+        """
+        self.measure = check_measure(measure)
+        self.p = p
+        self.k = k
+        self.stations = HyperLogLog(p)
+        self.lines = HyperLogLog(p)
+        self.station_quantiles = {}
+        self.n_rows = 0
+        self.months = []
+
+    def update(self, df):
+        """
+        한 달(또는 파티션) 데이터 반영
+
+        Args:
+            df (DataFrame): 전처리된 데이터
+        """
+        station_col = find_column(df, STATION_COLUMNS)
+        line_col = find_column(df, LINE_COLUMNS)
+
+        # 결측 이름은 고유값으로 세지 않음 (정확 집계의 코드 -1 행 제외와 동일)
+        if station_col:
+            self.stations.add(df[station_col].dropna().unique())
+        if line_col:
+            self.lines.add(df[line_col].dropna().unique())
+        self.n_rows += len(df)
+
+        if 'USE_DT' in df.columns and len(df) > 0:
+            months = df['USE_DT'].dt.strftime('%Y-%m').unique()
+            self.months = sorted(set(self.months) | set(months))
+
+        if not station_col or 'USE_DT' not in df.columns or not get_hour_columns(df):
+            return self
+
+        # 환승역의 노선별 행을 합쳐 역 × 일자 × 시간대 값으로 (HourlyCube와 같은 집계)
+        cube = HourlyCube.from_dataframe(df)
+        values = cube.measure(self.measure)
+        observed = cube.cell_rows > 0  # 그날 데이터가 없는 역의 0은 넣지 않음
+
+        for code, name in enumerate(cube.stations):
+            sketch = self.station_quantiles.get(name)
+            if sketch is None:
+                sketch = self.station_quantiles[name] = KLLSketch(self.k, seed=code)
+            sketch.add(values[code][observed[code]])
+        return self
+
+    def merge(self, other):
+        """
+        다른 스케치 묶음 병합 (다른 기간/파티션)
+        """
+        if other.measure != self.measure:
+            raise ValueError("측정값이 다른 스케치는 병합할 수 없습니다.")
+        self.stations.merge(other.stations)
+        self.lines.merge(other.lines)
+        for name, sketch in other.station_quantiles.items():
+            if name in self.station_quantiles:
+                self.station_quantiles[name].merge(sketch)
+            else:
+                # 참조를 공유하면 이후 갱신이 원본 스케치까지 바꾸므로 복사
+                self.station_quantiles[name] = copy.deepcopy(sketch)
+        self.n_rows += other.n_rows
+        self.months = sorted(set(self.months) | set(other.months))
+        return self
+
+    def quantile_table(self, quantiles=(0.5, 0.95, 0.99)):
+        """
+        역별 시간대 이용객 분위수 표
+
+        Returns:
+            DataFrame: 인덱스 역명, 컬럼 P50, P95, P99, ...
+        """
+        names = sorted(self.station_quantiles)
+        columns = [f'P{round(q * 100):d}' for q in quantiles]
+        values = np.array([self.station_quantiles[name].quantile(list(quantiles)) for name in names])
+        return pd.DataFrame(values.reshape(len(names), len(quantiles)), columns=columns,
+                            index=pd.Index(names, name='STTN'))
+
+    def save(self, filepath):
+        """
+        스케치 저장 (pickle)
+        """
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        pd.to_pickle(self, filepath)
+        return filepath
+
+    @classmethod
+    def load(cls, filepath):
+        """
+        save()로 저장한 스케치 불러오기
+        """
+        return pd.read_pickle(filepath)
@@ -0,0 +1,257 @@
+"""
+역별 24시간 승하차 프로파일 기반 군집화 및 유사 역 검색
+
+- 프로파일: 역별 [승차 24개 + 하차 24개] 시간대 비율 벡터 (합 = 1)
+- 군집화: 행렬 연산 기반 배치 k-means (k-means++ 초기화)
+- 유사 역: 블록 단위 행렬곱으로 코사인 유사도 상위 k개 (메모리 = 블록 크기 × 역 수)
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def build_station_profiles(cube, start_date=None, end_date=None):
+    """
+    역별 정규화 시간대 프로파일 생성
+
+    Args:
+        cube (HourlyCube): 역 × 일자 × 시간대 승하차 배열
+        start_date: 시작일 (포함)
+        end_date: 종료일 (포함)
+
+    Returns:
+        tuple: (프로파일 [역, 2 × 시간대], 역별 총 이용객)
+    """
+    d0, d1 = cube.date_bounds(start_date, end_date)
+    boarding = cube.boarding[:, d0:d1, :].sum(axis=1)
+    alighting = cube.alighting[:, d0:d1, :].sum(axis=1)
+
+    raw = np.concatenate([boarding, alighting], axis=1).astype(np.float64)
+    totals = raw.sum(axis=1)
+    profiles = raw / np.where(totals > 0, totals, 1.0)[:, None]
+    return profiles, totals
+
+
+def _squared_distances(X, centers, x_sq=None):
+    """
+    ||x - c||^2 = ||x||^2 - 2 x·c + ||c||^2 (행렬곱 한 번으로 계산)
+    """
+    if x_sq is None:
+        x_sq = np.einsum('ij,ij->i', X, X)
+    c_sq = np.einsum('ij,ij->i', centers, centers)
+    distances = x_sq[:, None] - 2.0 * (X @ centers.T) + c_sq[None, :]
+    return np.maximum(distances, 0.0)
+
+
+class StationProfileClusterer:
+    """
+    역 프로파일 배치 k-means + 블록 행렬곱 유사 역 인덱스
+    """
+
+    def __init__(self, n_clusters=5, max_iter=100, tol=1e-6, n_init=4,
+                 block_size=2048, seed=42):
+        """
+        Args:
+            n_clusters (int): 군집 수
+            max_iter (int): 최대 반복 횟수
+            tol (float): 중심 이동량 수렴 기준
+            n_init (int): 초기화 반복 횟수 (관성이 가장 작은 결과 사용)
+            block_size (int): 거리/유사도 계산 블록 크기 (행 수)
+            seed (int): 난수 시드
+        """
+        self.n_clusters = n_clusters
+        self.max_iter = max_iter
+        self.tol = tol
+        self.n_init = n_init
+        self.block_size = block_size
+        self.seed = seed
+
+        self.labels_ = None
+        self.centers_ = None
+        self.inertia_ = None
+        self.n_iter_ = 0
+
+    def _assign(self, X, centers, x_sq):
+        """
+        블록 단위 최근접 중심 할당
+
+        Returns:
+            tuple: (군집 번호, 최근접 중심까지 거리^2)
+        """
+        labels = np.empty(len(X), dtype=np.int64)
+        min_dist = np.empty(len(X), dtype=np.float64)
+        for start in range(0, len(X), self.block_size):
+            end = start + self.block_size
+            distances = _squared_distances(X[start:end], centers, x_sq[start:end])
+            labels[start:end] = distances.argmin(axis=1)
+            min_dist[start:end] = distances[np.arange(len(distances)), labels[start:end]]
+        return labels, min_dist
+
+    def _init_centers(self, X, x_sq, rng):
+        """
+        k-means++ 초기화
+        """
+        centers = np.empty((self.n_clusters, X.shape[1]), dtype=np.float64)
+        centers[0] = X[rng.integers(len(X))]
+        closest = _squared_distances(X, centers[:1], x_sq)[:, 0]
+
+        for k in range(1, self.n_clusters):
+            total = closest.sum()
+            if total <= 0:
+                centers[k] = X[rng.integers(len(X))]
+            else:
+                centers[k] = X[rng.choice(len(X), p=closest / total)]
+            closest = np.minimum(closest, _squared_distances(X, centers[k:k + 1], x_sq)[:, 0])
+        return centers
+
+    def _run(self, X, x_sq, rng):
+        centers = self._init_centers(X, x_sq, rng)
+
+        for n_iter in range(1, self.max_iter + 1):
+            labels, min_dist = self._assign(X, centers, x_sq)
+
+            # 군집별 합계/개수 (one-hot 행렬곱 한 번)
+            one_hot = np.zeros((len(X), self.n_clusters), dtype=np.float64)
+            one_hot[np.arange(len(X)), labels] = 1.0
+            counts = one_hot.sum(axis=0)
+            sums = one_hot.T @ X
+
+            new_centers = centers.copy()
+            filled = counts > 0
+            new_centers[filled] = sums[filled] / counts[filled, None]
+
+            # 빈 군집은 현재 중심에서 가장 먼 점으로 재배치
+            for k in np.flatnonzero(~filled):
+                farthest = int(min_dist.argmax())
+                new_centers[k] = X[farthest]
+                min_dist[farthest] = 0.0
+
+            shift = np.abs(new_centers - centers).max()
+            centers = new_centers
+            if shift <= self.tol:
+                break
+
+        labels, min_dist = self._assign(X, centers, x_sq)
+        return labels, centers, float(min_dist.sum()), n_iter
+
+    def fit(self, profiles):
+        """
+        k-means 군집화
+
+        Args:
+            profiles (np.ndarray): [역, 특성] 프로파일
+
+        Returns:
+            np.ndarray: 역별 군집 번호
+        """
+        X = np.asarray(profiles, dtype=np.float64)
+        if len(X) < self.n_clusters:
+            raise ValueError(f"역 수({len(X)})가 군집 수({self.n_clusters})보다 적습니다.")
+
+        rng = np.random.default_rng(self.seed)
+        x_sq = np.einsum('ij,ij->i', X, X)
+
+        best = None
+        for _ in range(self.n_init):
+            result = self._run(X, x_sq, rng)
+            if best is None or result[2] < best[2]:
+                best = result
+
+        labels, centers, inertia, n_iter = best
+
+        # 군집 번호를 크기 순으로 재정렬 (0 = 가장 큰 군집)
+        order = np.argsort(-np.bincount(labels, minlength=self.n_clusters), kind='stable')
+        remap = np.empty_like(order)
+        remap[order] = np.arange(len(order))
+
+        self.labels_ = remap[labels]
+        self.centers_ = centers[order]
+        self.inertia_ = inertia
+        self.n_iter_ = n_iter
+        return self.labels_
+
+    def top_k_similar(self, profiles, k=5):
+        """
+        역별 코사인 유사도 상위 k개 역 (블록 행렬곱)
+
+        Args:
+            profiles (np.ndarray): [역, 특성] 프로파일
+            k (int): 유사 역 수
+
+        Returns:
+            tuple: (유사 역 인덱스 [역, k], 유사도 [역, k]) 유사도 내림차순
+        """
+        X = np.asarray(profiles, dtype=np.float64)
+        norms = np.linalg.norm(X, axis=1)
+        X = X / np.where(norms > 0, norms, 1.0)[:, None]
+
+        n = len(X)
+        k = min(k, n - 1)
+        indices = np.empty((n, k), dtype=np.int64)
+        scores = np.empty((n, k), dtype=np.float64)
+        if k <= 0:
+            return indices, scores
+
+        for start in range(0, n, self.block_size):
+            end = min(start + self.block_size, n)
+            similarity = X[start:end] @ X.T
+            # 자기 자신 제외
+            similarity[np.arange(end - start), np.arange(start, end)] = -np.inf
+
+            top = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(similarity, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind='stable')
+
+            indices[start:end] = np.take_along_axis(top, order, axis=1)
+            scores[start:end] = np.take_along_axis(top_scores, order, axis=1)
+
+        return indices, scores
+
+
+def profile_columns(hours):
+    """
+    프로파일 컬럼명 (ON_07, OFF_18, ...)
+    """
+    return [f'ON_{hour:02d}' for hour in hours] + [f'OFF_{hour:02d}' for hour in hours]
+
+
+def cluster_stations(cube, n_clusters=5, top_k=5, start_date=None, end_date=None,
+                     seed=42, block_size=2048):
+    """
+    역 프로파일 군집화 + 유사 역 검색 결과표 생성
+
+    Args:
+        cube (HourlyCube): 역 × 일자 × 시간대 승하차 배열
+        n_clusters (int): 군집 수
+        top_k (int): 역별 유사 역 수
+        start_date: 시작일 (포함)
+        end_date: 종료일 (포함)
+        seed (int): 난수 시드
+        block_size (int): 블록 크기
+
+    Returns:
+        tuple: (역별 결과 DataFrame, 군집 중심 DataFrame)
+    """
+    profiles, totals = build_station_profiles(cube, start_date, end_date)
+    active = totals > 0
+    stations = cube.stations[active]
+    profiles = profiles[active]
+    totals = totals[active]
+
+    clusterer = StationProfileClusterer(n_clusters=n_clusters, seed=seed, block_size=block_size)
+    labels = clusterer.fit(profiles)
+    similar_idx, similar_scores = clusterer.top_k_similar(profiles, k=top_k)
+
+    columns = profile_columns(cube.hours)
+    result = pd.DataFrame(profiles, columns=columns,
+                          index=pd.Index(stations, name=cube.station_column or 'STTN'))
+    result.insert(0, 'CLUSTER', labels)
+    result.insert(1, 'TOTAL', totals.astype(np.int64))
+    result.insert(2, 'SIMILAR_STATIONS', [', '.join(stations[row]) for row in similar_idx])
+    result.insert(3, 'SIMILARITY', similar_scores[:, 0] if similar_scores.shape[1] else np.nan)
+
+    centers = pd.DataFrame(clusterer.centers_, columns=columns)
+    centers.index.name = 'CLUSTER'
+    centers.insert(0, 'N_STATIONS', np.bincount(labels, minlength=n_clusters))
+
+    return result, centers
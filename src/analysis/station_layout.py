@@ -0,0 +1,197 @@
+"""
+역 단위로 정렬된 데이터 배치 + 역별 오프셋 인덱스 (CSR 행 포인터)
+
+데이터를 (역, 일자) 순으로 정렬해 두고 역 s의 행 구간을
+offsets[s] ~ offsets[s + 1]로 기록한다. 한 역의 전체 이력은
+전체 프레임을 불리언 스캔하지 않고 연속 구간 슬라이스(뷰)로 얻는다.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .columns import STATION_COLUMNS, find_column, get_hour_columns
+
+
+class StationClusteredFrame:
+    """
+    역 × 일자 순으로 정렬된 데이터와 역별 오프셋 인덱스
+
+    Attributes:
+        df (DataFrame): (역, 일자) 순으로 정렬된 데이터
+        stations (np.ndarray): 역명 (정렬됨)
+        offsets (np.ndarray): 역별 시작 행 (길이 = 역 수 + 1)
+        dates (np.ndarray): 행별 일자 (datetime64[D])
+        hours (np.ndarray): 시간대
+        boarding (np.ndarray): 행별 시간대별 승차 [행, 시간대] (C-연속)
+        alighting (np.ndarray): 행별 시간대별 하차 [행, 시간대] (C-연속)
+    """
+
+    def __init__(self, df, station_column, stations, offsets):
+        self.df = df
+        self.station_column = station_column
+        self.stations = np.asarray(stations, dtype=object)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self._lookup = {name: i for i, name in enumerate(self.stations)}
+
+        hour_columns = get_hour_columns(df)
+        self.hours = np.array([hour for hour, _, _ in hour_columns], dtype=np.int64)
+        self.boarding = np.ascontiguousarray(
+            df[[on for _, on, _ in hour_columns]].fillna(0).to_numpy(dtype=np.int64))
+        self.alighting = np.ascontiguousarray(
+            df[[off for _, _, off in hour_columns]].fillna(0).to_numpy(dtype=np.int64))
+
+        if 'USE_DT' in df.columns:
+            self.dates = df['USE_DT'].to_numpy(dtype='datetime64[D]')
+        else:
+            self.dates = np.full(len(df), np.datetime64('NaT'), dtype='datetime64[D]')
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """
+        전처리된 데이터를 (역, 일자) 순으로 정렬하고 오프셋 인덱스 생성
+
+        Args:
+            df (DataFrame): 전처리된 데이터
+
+        Returns:
+            StationClusteredFrame: 정렬된 데이터 (역명 컬럼이 없으면 None)
+        """
+        station_col = find_column(df, STATION_COLUMNS)
+        if station_col is None:
+            return None
+
+        # 역명이 비어 있는 행은 어느 역에도 속하지 않으므로 제외 (factorize 코드 -1)
+        has_station = df[station_col].notna()
+        if not has_station.all():
+            df = df[has_station]
+
+        sort_cols = [station_col] + (['USE_DT'] if 'USE_DT' in df.columns else [])
+        sorted_df = df.sort_values(sort_cols, kind='mergesort').reset_index(drop=True)
+
+        codes, stations = pd.factorize(sorted_df[station_col], sort=True)
+        # CSR 행 포인터: 역 s의 행은 offsets[s] ~ offsets[s + 1]
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(stations)))])
+
+        return cls(sorted_df, station_col, stations, offsets)
+
+    def __len__(self):
+        return len(self.df)
+
+    def __contains__(self, station):
+        return station in self._lookup
+
+    def station_bounds(self, station):
+        """
+        역의 행 구간 [start, end)
+
+        Args:
+            station (str): 역명
+        """
+        if station not in self._lookup:
+            raise KeyError(f"알 수 없는 역: {station}")
+        code = self._lookup[station]
+        return int(self.offsets[code]), int(self.offsets[code + 1])
+
+    def date_bounds(self, station, start_date=None, end_date=None):
+        """
+        역 구간 안에서 날짜 범위 [start_date, end_date]의 행 구간 (이진 탐색)
+        """
+        start, end = self.station_bounds(station)
+        dates = self.dates[start:end]
+        lo, hi = 0, len(dates)
+        if start_date is not None:
+            lo = int(np.searchsorted(dates, np.datetime64(pd.Timestamp(start_date).date(), 'D'), 'left'))
+        if end_date is not None:
+            hi = int(np.searchsorted(dates, np.datetime64(pd.Timestamp(end_date).date(), 'D'), 'right'))
+        return start + lo, start + max(lo, hi)
+
+    def get_station(self, station, start_date=None, end_date=None):
+        """
+        한 역의 전체 이력 (연속 행 슬라이스)
+
+        Args:
+            station (str): 역명
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+
+        Returns:
+            DataFrame: 역의 행 구간
+        """
+        start, end = self.date_bounds(station, start_date, end_date)
+        return self.df.iloc[start:end]
+
+    def station_arrays(self, station, start_date=None, end_date=None):
+        """
+        한 역의 일자/승차/하차 배열 (복사 없는 numpy 뷰)
+
+        Returns:
+            tuple: (일자 [행], 승차 [행, 시간대], 하차 [행, 시간대])
+        """
+        start, end = self.date_bounds(station, start_date, end_date)
+        return self.dates[start:end], self.boarding[start:end], self.alighting[start:end]
+
+    def station_daily(self, station, start_date=None, end_date=None):
+        """
+        한 역의 일자별 승하차 합계 (노선별 행은 일자 단위로 합산)
+
+        Returns:
+            DataFrame: USE_DT, BOARDING, ALIGHTING, TOTAL
+        """
+        dates, boarding, alighting = self.station_arrays(station, start_date, end_date)
+        if len(dates) == 0:
+            return pd.DataFrame(columns=['USE_DT', 'BOARDING', 'ALIGHTING', 'TOTAL'])
+
+        # 일자순 정렬이므로 일자가 바뀌는 위치에서 구간 합계
+        starts = np.flatnonzero(np.concatenate([[True], dates[1:] != dates[:-1]]))
+        daily_boarding = np.add.reduceat(boarding.sum(axis=1), starts)
+        daily_alighting = np.add.reduceat(alighting.sum(axis=1), starts)
+
+        return pd.DataFrame({
+            'USE_DT': dates[starts],
+            'BOARDING': daily_boarding,
+            'ALIGHTING': daily_alighting,
+            'TOTAL': daily_boarding + daily_alighting
+        })
+
+    def station_hourly(self, station, start_date=None, end_date=None):
+        """
+        한 역의 시간대별 승하차 합계
+
+        Returns:
+            DataFrame: HOUR, BOARDING, ALIGHTING, TOTAL
+        """
+        _, boarding, alighting = self.station_arrays(station, start_date, end_date)
+        hourly_boarding = boarding.sum(axis=0)
+        hourly_alighting = alighting.sum(axis=0)
+        return pd.DataFrame({
+            'HOUR': self.hours,
+            'BOARDING': hourly_boarding,
+            'ALIGHTING': hourly_alighting,
+            'TOTAL': hourly_boarding + hourly_alighting
+        })
+
+    def save(self, filepath):
+        """
+        정렬된 데이터와 오프셋 인덱스 저장 (pickle)
+
+        Args:
+            filepath (str): 저장 경로 (.pkl)
+        """
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        pd.to_pickle({
+            'df': self.df,
+            'station_column': self.station_column,
+            'stations': self.stations,
+            'offsets': self.offsets,
+        }, filepath)
+        return filepath
+
+    @classmethod
+    def load(cls, filepath):
+        """
+        save()로 저장한 데이터 불러오기
+        """
+        data = pd.read_pickle(filepath)
+        return cls(data['df'], data['station_column'], data['stations'], data['offsets'])
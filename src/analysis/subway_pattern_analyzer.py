@@ -7,6 +7,20 @@ import numpy as np
 from datetime import datetime
 import os
 
+from .hourly_cube import WEEKDAY_NAMES, day_type_mask, weekday_of
+from .prefix_sum_index import PrefixSumIndex
+from .station_layout import StationClusteredFrame
+from .station_clustering import cluster_stations, profile_columns
+from .anomaly_detection import StationAnomalyDetector
+from .forecasting import SeasonalForecaster, backtest
+from .net_flow import compute_net_flow
+from .peak_metrics import compute_peak_metrics, top_peaky_stations
+from .month_comparison import compare_months
+from .bootstrap import bootstrap_station_type_ci, bootstrap_weekday_ci
+from .approximate import StratifiedSample
+from .sketches import SubwaySketches
+from .validation import month_from_path, print_validation_report, validate_dataframe
+
 
 class SubwayPatternAnalyzer:
     def __init__(self, data_path=None):
@@ -19,6 +33,11 @@ class SubwayPatternAnalyzer:
         self.data_path = data_path
         self.df = None
         self.df_processed = None
+        self.prefix_index = None
+        self.station_layout = None
+        self.anomaly_detector = None
+        self.approx_sample = None
+        self.validation_report = None
         
     def load_data(self, filepath=None):
         """
@@ -43,12 +62,19 @@ class SubwayPatternAnalyzer:
             print(f"❌ 데이터 로드 실패: {str(e)}")
             return None
     
-    def preprocess_data(self):
+    def preprocess_data(self, validate=True, year_month=None, check_month=True):
         """
         데이터 전처리
+        - 무결성 검사 및 중복 제거
         - 날짜 형식 변환
         - 요일 추가
         - 시간대별 컬럼 정리
+        
+        Args:
+            validate (bool): 무결성 검사/중복 제거 수행 여부
+            year_month (str): 요청한 월 'YYYY-MM' - 이 월 밖의 행은 제거
+                (None이면 수집기 파일명 subway_hourly_YYYY-MM.csv일 때만 그 월 사용)
+            check_month (bool): False면 월 범위 검사 없이 전체 기간 유지 (여러 달 파일)
         """
         if self.df is None:
             print("❌ 먼저 데이터를 로드하세요.")
@@ -56,7 +82,16 @@ class SubwayPatternAnalyzer:
             
         print("\n🔧 데이터 전처리 시작...")
         
-        df = self.df.copy()
+        if validate:
+            if not check_month:
+                year_month = None
+            elif year_month is None:
+                year_month = month_from_path(self.data_path)
+            df, self.validation_report = validate_dataframe(self.df, year_month=year_month)
+            print_validation_report(self.validation_report)
+        else:
+            df = self.df.copy()
+            self.validation_report = None
         
         # 날짜 형식 변환
         # 서울 열린데이터광장 API의 실제 컬럼명: JOB_YMD (작업일자)
@@ -92,10 +127,178 @@ class SubwayPatternAnalyzer:
             print(f"   ✅ 하차 컬럼: {len(alighting_cols)}개")
         
         self.df_processed = df
+        self.prefix_index = None
+        self.station_layout = None
+        self.approx_sample = None
         print("✅ 전처리 완료\n")
         
         return df
     
+    def build_prefix_index(self):
+        """
+        역별 일자 × 시간대 누적합 인덱스 생성
+        
+        임의 기간/시간대/역 집합의 합계를 배열 조회 몇 번으로 계산할 수 있어
+        시간대별·요일별·역별 분석이 기간 내 행을 다시 스캔하지 않는다.
+        
+        Returns:
+            PrefixSumIndex: 누적합 인덱스 (시간대 컬럼이 없으면 None)
+        """
+        if self.df_processed is None:
+            print("❌ 먼저 데이터를 전처리하세요.")
+            return None
+        
+        self.prefix_index = PrefixSumIndex.from_dataframe(self.df_processed)
+        if self.prefix_index is not None:
+            print(f"🗂️  누적합 인덱스 생성: 역 {len(self.prefix_index.stations):,}개 × "
+                  f"{len(self.prefix_index.dates):,}일 × {len(self.prefix_index.hours)}개 시간대")
+        return self.prefix_index
+    
+    def get_prefix_index(self):
+        """
+        누적합 인덱스 반환 (없으면 생성)
+        """
+        if self.prefix_index is None and self.df_processed is not None:
+            self.build_prefix_index()
+        return self.prefix_index
+    
+    def build_station_layout(self):
+        """
+        역 × 일자 순 정렬 데이터 + 역별 오프셋 인덱스 생성
+        
+        한 역의 전체 이력을 불리언 스캔 없이 연속 구간 슬라이스로 조회한다.
+        
+        Returns:
+            StationClusteredFrame: 정렬된 데이터 (역명 컬럼이 없으면 None)
+        """
+        if self.df_processed is None:
+            print("❌ 먼저 데이터를 전처리하세요.")
+            return None
+        
+        self.station_layout = StationClusteredFrame.from_dataframe(self.df_processed)
+        if self.station_layout is None:
+            print("⚠️  역명 컬럼을 찾을 수 없습니다.")
+        return self.station_layout
+    
+    def get_station_layout(self):
+        """
+        역별 정렬 데이터 반환 (없으면 생성)
+        """
+        if self.station_layout is None and self.df_processed is not None:
+            self.build_station_layout()
+        return self.station_layout
+    
+    def save_processed_data(self, save_path="data/processed/"):
+        """
+        전처리된 데이터를 역 × 일자 순으로 정렬해 저장 (오프셋 인덱스 포함)
+        
+        Args:
+            save_path (str): 저장 경로
+        
+        Returns:
+            str: 저장된 파일 경로
+        """
+        layout = self.get_station_layout()
+        if layout is None:
+            return None
+        
+        name = os.path.splitext(os.path.basename(self.data_path or 'subway_processed'))[0]
+        filepath = layout.save(os.path.join(save_path, f"{name}_by_station.pkl"))
+        print(f"✅ 역별 정렬 데이터 저장: {filepath}")
+        return filepath
+    
+    def enable_approximate_mode(self, fraction=0.05, min_per_stratum=2, seed=42):
+        """
+        근사 분석 모드 켜기
+        
+        (노선, 역, 일자 유형) 층화 표본을 한 번 뽑아 두고, 이후 시간대별/요일별/역별 분석은
+        표본으로 계산한 추정값과 표준오차(_SE 컬럼)를 반환한다.
+        
+        Args:
+            fraction (float): 층별 추출 비율 - 작을수록 빠르고 오차가 커짐
+            min_per_stratum (int): 층별 최소 표본 행 수
+            seed (int): 난수 시드
+        
+        Returns:
+            StratifiedSample: 층화 표본
+        """
+        if self.df_processed is None:
+            print("❌ 먼저 데이터를 전처리하세요.")
+            return None
+        
+        try:
+            self.approx_sample = StratifiedSample(self.df_processed, fraction=fraction,
+                                                  min_per_stratum=min_per_stratum, seed=seed)
+        except ValueError as e:
+            print(f"⚠️  {e}")
+            return None
+        
+        sample = self.approx_sample
+        print(f"🎲 근사 모드: 층 {len(sample.population_sizes):,}개에서 "
+              f"{len(sample):,}/{sample.n_population:,}행 추출 "
+              f"({len(sample) / max(sample.n_population, 1):.1%}, {sample.build_seconds:.2f}초)")
+        return sample
+    
+    def disable_approximate_mode(self):
+        """
+        근사 분석 모드 끄기 (전체 데이터 정확 계산으로 복귀)
+        """
+        self.approx_sample = None
+        print("🎯 정확 모드로 전환")
+    
+    def _approximate_time_pattern(self, start_date=None, end_date=None):
+        hourly_df = self.approx_sample.hourly_stats(start_date, end_date)
+        
+        print(f"\n📊 시간대별 총 이용객 추정 (TOP 10, ± 표준오차):")
+        for _, row in hourly_df.nlargest(10, 'TOTAL').iterrows():
+            print(f"   {row['TIME']}: {row['TOTAL']:>12,.0f}명 ± {row['TOTAL_SE']:>9,.0f} "
+                  f"(승차 {row['BOARDING']:>10,.0f}, 하차 {row['ALIGHTING']:>10,.0f})")
+        return hourly_df
+    
+    def _approximate_weekday_pattern(self, start_date=None, end_date=None):
+        weekday_stats = self.approx_sample.weekday_stats(start_date, end_date)
+        
+        print(f"\n📊 요일별 평균 이용객 추정 (± 표준오차):")
+        for day, row in weekday_stats.iterrows():
+            print(f"   {day}: {row['평균_총이용']:>12,.0f}명 ± {row['평균_총이용_SE']:>8,.1f} "
+                  f"[{int(row['데이터_일수'])}일]")
+        return weekday_stats
+    
+    def _approximate_station_characteristics(self, top_n=10, start_date=None, end_date=None):
+        station_stats = self.approx_sample.station_stats(start_date, end_date)
+        
+        print(f"\n📊 총 이용객 TOP {top_n} 역 추정 (± 표준오차):")
+        for idx, (station, row) in enumerate(station_stats.nlargest(top_n, 'TOTAL').iterrows(), 1):
+            print(f"{idx:<4} {station:<15} {row['TOTAL']:>12,.0f} ± {row['TOTAL_SE']:>9,.0f} "
+                  f"{row['TYPE']:>6} 아침승차비 {row['MORNING_RATIO']:.1%}±{row['MORNING_RATIO_SE']:.1%} "
+                  f"저녁하차비 {row['EVENING_RATIO']:.1%}±{row['EVENING_RATIO_SE']:.1%}")
+        return station_stats
+    
+    def get_station_detail(self, station, start_date=None, end_date=None):
+        """
+        단일 역 상세 조회 (일자별 추이 + 시간대별 패턴)
+        
+        Args:
+            station (str): 역명
+            start_date: 조회 시작일 (포함)
+            end_date: 조회 종료일 (포함)
+        
+        Returns:
+            dict: {'daily': 일자별 DataFrame, 'hourly': 시간대별 DataFrame}
+        """
+        layout = self.get_station_layout()
+        if layout is None:
+            return None
+        
+        if station not in layout:
+            print(f"❌ 역을 찾을 수 없습니다: {station}")
+            return None
+        
+        return {
+            'daily': layout.station_daily(station, start_date, end_date),
+            'hourly': layout.station_hourly(station, start_date, end_date)
+        }
+    
     def analyze_basic_stats(self):
         """
         기본 통계 분석
@@ -139,59 +342,86 @@ class SubwayPatternAnalyzer:
         
         return df
     
-    def analyze_time_pattern(self):
+    def update_sketches(self, sketches=None, measure='boarding', top_n=5):
+        """
+        스트리밍 스케치 갱신 (고유 역/노선 수, 역별 시간대 이용객 분위수)
+        
+        이전 달까지 누적한 sketches를 넘기면 이 데이터를 더해 갱신한다.
+        원본 데이터 없이도 여러 해에 걸친 고유값 수/분위수를 일정한 메모리로 조회할 수 있다.
+        
+        Args:
+            sketches (SubwaySketches): 누적 스케치 (None이면 새로 생성)
+            measure (str): 분위수 대상 'boarding', 'alighting', 'total'
+            top_n (int): 출력할 p95 상위 역 수
+        
+        Returns:
+            SubwaySketches: 갱신된 스케치
+        """
+        if self.df_processed is None:
+            print("❌ 먼저 데이터를 전처리하세요.")
+            return None
+        
+        if sketches is None:
+            sketches = SubwaySketches(measure=measure)
+        sketches.update(self.df_processed)
+        
+        print(f"\n🧮 스케치 갱신: 누적 {sketches.n_rows:,}행 ({', '.join(sketches.months)})")
+        print(f"   고유 역 수 (HLL 추정): {sketches.stations.count():,}개")
+        print(f"   고유 노선 수 (HLL 추정): {sketches.lines.count():,}개")
+        
+        if sketches.station_quantiles:
+            table = sketches.quantile_table()
+            print(f"   시간당 {measure} p95 상위 {top_n}개 역:")
+            for station, row in table.nlargest(top_n, 'P95').iterrows():
+                print(f"      {station}: p50 {row['P50']:>8,.0f} | p95 {row['P95']:>8,.0f} | "
+                      f"p99 {row['P99']:>8,.0f}")
+        
+        return sketches
+    
+    def analyze_time_pattern(self, start_date=None, end_date=None):
         """
         시간대별 이용 패턴 분석
+        
+        근사 모드(enable_approximate_mode)에서는 층화 표본 추정값과 표준오차(_SE) 컬럼을 반환한다.
+        
+        Args:
+            start_date: 분석 시작일 (포함, None이면 전체 기간)
+            end_date: 분석 종료일 (포함, None이면 전체 기간)
         """
         if self.df_processed is None:
             print("❌ 먼저 데이터를 전처리하세요.")
             return None
-            
-        df = self.df_processed
         
         print("\n" + "="*60)
         print("⏰ 시간대별 이용 패턴 분석")
         print("="*60)
         
+        if self.approx_sample is not None:
+            return self._approximate_time_pattern(start_date, end_date)
+        
         # 시간대별 승하차 컬럼 찾기
         # 서울 열린데이터광장 API는 00~23시까지 시간대별로 컬럼을 제공
         # 예: HR_4_GET_ON_NOPE (4시 승차), HR_4_GET_OFF_NOPE (4시 하차)
+        index = self.get_prefix_index()
         
-        time_cols = {}
-        for hour in range(24):
-            boarding_col = f'HR_{hour}_GET_ON_NOPE'
-            alighting_col = f'HR_{hour}_GET_OFF_NOPE'
-            
-            if boarding_col in df.columns and alighting_col in df.columns:
-                time_cols[hour] = {
-                    'boarding': boarding_col,
-                    'alighting': alighting_col
-                }
-        
-        if not time_cols:
+        if index is None:
             print("⚠️  시간대별 컬럼을 찾을 수 없습니다.")
             print("   데이터 구조를 확인하세요.")
             return None
         
-        print(f"✅ {len(time_cols)}개 시간대 데이터 확인")
+        print(f"✅ {len(index.hours)}개 시간대 데이터 확인")
         
-        # 시간대별 총 이용객 계산
-        hourly_stats = []
+        # 시간대별 총 이용객 계산 (누적합 인덱스 조회)
+        total_boarding = index.hourly('boarding', start_date, end_date).sum(axis=0)
+        total_alighting = index.hourly('alighting', start_date, end_date).sum(axis=0)
         
-        for hour, cols in time_cols.items():
-            total_boarding = df[cols['boarding']].sum()
-            total_alighting = df[cols['alighting']].sum()
-            total_passengers = total_boarding + total_alighting
-            
-            hourly_stats.append({
-                'HOUR': hour,
-                'TIME': f"{hour:02d}:00",
-                'BOARDING': total_boarding,
-                'ALIGHTING': total_alighting,
-                'TOTAL': total_passengers
-            })
-        
-        hourly_df = pd.DataFrame(hourly_stats)
+        hourly_df = pd.DataFrame({
+            'HOUR': index.hours,
+            'TIME': [f"{hour:02d}:00" for hour in index.hours],
+            'BOARDING': total_boarding,
+            'ALIGHTING': total_alighting,
+            'TOTAL': total_boarding + total_alighting
+        })
         
         # 시간대 구분
         def classify_time_period(hour):
@@ -227,9 +457,19 @@ class SubwayPatternAnalyzer:
         
         return hourly_df
     
-    def analyze_weekday_pattern(self):
+    def analyze_weekday_pattern(self, start_date=None, end_date=None, bootstrap=0, seed=42,
+                                ci_level=0.95):
         """
         요일별 이용 패턴 분석
+        
+        근사 모드(enable_approximate_mode)에서는 층화 표본 추정값과 표준오차(_SE) 컬럼을 반환한다.
+        
+        Args:
+            start_date: 분석 시작일 (포함, None이면 전체 기간)
+            end_date: 분석 종료일 (포함, None이면 전체 기간)
+            bootstrap (int): 부트스트랩 반복 수 (0이면 신뢰구간 생략)
+            seed (int): 부트스트랩 난수 시드
+            ci_level (float): 신뢰수준
         """
         if self.df_processed is None:
             print("❌ 먼저 데이터를 전처리하세요.")
@@ -241,26 +481,36 @@ class SubwayPatternAnalyzer:
         print("📆 요일별 이용 패턴 분석")
         print("="*60)
         
+        if self.approx_sample is not None:
+            return self._approximate_weekday_pattern(start_date, end_date)
+        
         # 시간대별 컬럼 찾기
-        boarding_cols = [col for col in df.columns if 'GET_ON_NOPE' in col]
-        alighting_cols = [col for col in df.columns if 'GET_OFF_NOPE' in col]
+        index = self.get_prefix_index()
         
-        if not boarding_cols or not alighting_cols:
+        if index is None:
             print("⚠️  승하차 데이터 컬럼을 찾을 수 없습니다.")
             return None
         
-        # 일별 총 이용객 계산
-        df['DAILY_BOARDING'] = df[boarding_cols].sum(axis=1)
-        df['DAILY_ALIGHTING'] = df[alighting_cols].sum(axis=1)
-        df['DAILY_TOTAL'] = df['DAILY_BOARDING'] + df['DAILY_ALIGHTING']
-        
-        # 요일별 평균 계산
-        weekday_stats = df.groupby('WEEKDAY_KR').agg({
-            'DAILY_BOARDING': 'mean',
-            'DAILY_ALIGHTING': 'mean',
-            'DAILY_TOTAL': 'mean',
-            'USE_DT': 'count'
-        }).round(0)
+        # 일별 총 이용객 계산 (누적합 인덱스 조회)
+        dates, daily_boarding = index.daily('boarding', start_date, end_date)
+        _, daily_alighting = index.daily('alighting', start_date, end_date)
+        daily_boarding = daily_boarding.sum(axis=0)
+        daily_alighting = daily_alighting.sum(axis=0)
+        daily_rows = index.daily_row_counts(start_date, end_date)
+        weekdays = weekday_of(dates)
+        
+        # 요일별 평균 계산 (원본 행 단위 평균)
+        rows = np.bincount(weekdays, weights=daily_rows, minlength=7)
+        boarding = np.bincount(weekdays, weights=daily_boarding, minlength=7)
+        alighting = np.bincount(weekdays, weights=daily_alighting, minlength=7)
+        present = rows > 0
+        
+        weekday_stats = pd.DataFrame({
+            'DAILY_BOARDING': boarding[present] / rows[present],
+            'DAILY_ALIGHTING': alighting[present] / rows[present],
+            'DAILY_TOTAL': (boarding[present] + alighting[present]) / rows[present],
+            'USE_DT': rows[present].astype(np.int64)
+        }, index=pd.Index(np.array(WEEKDAY_NAMES)[present], name='WEEKDAY_KR')).round(0)
         
         weekday_stats.columns = ['평균_승차', '평균_하차', '평균_총이용', '데이터_일수']
         
@@ -268,21 +518,37 @@ class SubwayPatternAnalyzer:
         weekday_order = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
         weekday_stats = weekday_stats.reindex(weekday_order)
         
+        # 부트스트랩 신뢰구간 (일자 재추출)
+        ci = None
+        if bootstrap and len(dates) > 0:
+            ci = bootstrap_weekday_ci(dates, daily_boarding + daily_alighting, daily_rows,
+                                      n_replicates=bootstrap, seed=seed, level=ci_level)
+            weekday_stats['하한_총이용'] = ci['weekday']['LOWER'].reindex(weekday_stats.index)
+            weekday_stats['상한_총이용'] = ci['weekday']['UPPER'].reindex(weekday_stats.index)
+        
         print(f"\n📊 요일별 평균 이용객:")
         for day, row in weekday_stats.iterrows():
             days = int(row['데이터_일수']) if pd.notna(row['데이터_일수']) else 0
+            interval = (f" {ci_level:.0%} CI [{row['하한_총이용']:>10,.0f} ~ {row['상한_총이용']:>10,.0f}]"
+                        if ci is not None and pd.notna(row['하한_총이용']) else "")
             print(f"   {day}: {row['평균_총이용']:>12,.0f}명 "
                   f"(승차 {row['평균_승차']:>10,.0f}, 하차 {row['평균_하차']:>10,.0f}) "
-                  f"[{days}일]")
+                  f"[{days}일]{interval}")
         
         # 평일 vs 주말 비교
         if 'DAY_TYPE' in df.columns:
             print(f"\n📊 평일 vs 주말 비교:")
-            daytype_stats = df.groupby('DAY_TYPE').agg({
-                'DAILY_BOARDING': 'mean',
-                'DAILY_ALIGHTING': 'mean',
-                'DAILY_TOTAL': 'mean'
-            }).round(0)
+            is_weekend = (weekdays >= 5).astype(np.int64)
+            rows = np.bincount(is_weekend, weights=daily_rows, minlength=2)
+            boarding = np.bincount(is_weekend, weights=daily_boarding, minlength=2)
+            alighting = np.bincount(is_weekend, weights=daily_alighting, minlength=2)
+            present = rows > 0
+            
+            daytype_stats = pd.DataFrame({
+                'DAILY_BOARDING': boarding[present] / rows[present],
+                'DAILY_ALIGHTING': alighting[present] / rows[present],
+                'DAILY_TOTAL': (boarding[present] + alighting[present]) / rows[present]
+            }, index=pd.Index(np.array(['평일', '주말'])[present], name='DAY_TYPE')).round(0).sort_index()
             
             for daytype, row in daytype_stats.iterrows():
                 print(f"   {daytype:4s}: {row['DAILY_TOTAL']:>12,.0f}명 "
@@ -294,64 +560,60 @@ class SubwayPatternAnalyzer:
                 weekend_total = daytype_stats.loc['주말', 'DAILY_TOTAL']
                 diff_pct = ((weekday_total - weekend_total) / weekend_total * 100)
                 print(f"\n   💡 평일이 주말보다 {diff_pct:.1f}% {'많음' if diff_pct > 0 else '적음'}")
+                
+                if ci is not None and ci['weekday_vs_weekend'] is not None:
+                    _, lower, upper = ci['weekday_vs_weekend']
+                    significant = lower > 0 or upper < 0
+                    print(f"   📏 {ci_level:.0%} 신뢰구간: {lower:+.1f}% ~ {upper:+.1f}% "
+                          f"({'유의한 차이' if significant else '0을 포함 - 차이가 우연일 수 있음'}, "
+                          f"부트스트랩 {bootstrap:,}회)")
         
         return weekday_stats
     
-    def analyze_station_characteristics(self, top_n=10):
+    def analyze_station_characteristics(self, top_n=10, start_date=None, end_date=None,
+                                        bootstrap=0, seed=42, ci_level=0.95):
         """
         역별 특성 분석 (출근형/퇴근형 역 분류)
         
+        근사 모드(enable_approximate_mode)에서는 층화 표본 추정값과 표준오차(_SE) 컬럼을 반환한다.
+        
         Args:
             top_n (int): 상위 N개 역 분석
+            start_date: 분석 시작일 (포함, None이면 전체 기간)
+            end_date: 분석 종료일 (포함, None이면 전체 기간)
+            bootstrap (int): 부트스트랩 반복 수 (0이면 신뢰구간 생략)
+            seed (int): 부트스트랩 난수 시드
+            ci_level (float): 신뢰수준
         """
         if self.df_processed is None:
             print("❌ 먼저 데이터를 전처리하세요.")
             return None
-            
-        df = self.df_processed
         
         print("\n" + "="*60)
         print(f"🚉 역별 특성 분석 (TOP {top_n})")
         print("="*60)
         
+        if self.approx_sample is not None:
+            return self._approximate_station_characteristics(top_n, start_date, end_date)
+        
         # 출근시간(7-9시) vs 퇴근시간(18-20시) 승하차 비교
-        morning_boarding = []
-        morning_alighting = []
-        evening_boarding = []
-        evening_alighting = []
-        
-        for hour in range(7, 10):  # 7, 8, 9시
-            col_b = f'HR_{hour}_GET_ON_NOPE'
-            col_a = f'HR_{hour}_GET_OFF_NOPE'
-            if col_b in df.columns:
-                morning_boarding.append(col_b)
-            if col_a in df.columns:
-                morning_alighting.append(col_a)
-        
-        for hour in range(18, 21):  # 18, 19, 20시
-            col_b = f'HR_{hour}_GET_ON_NOPE'
-            col_a = f'HR_{hour}_GET_OFF_NOPE'
-            if col_b in df.columns:
-                evening_boarding.append(col_b)
-            if col_a in df.columns:
-                evening_alighting.append(col_a)
-        
-        if not morning_boarding or not evening_boarding:
+        index = self.get_prefix_index()
+        
+        if (index is None or not np.isin([7, 8, 9], index.hours).any()
+                or not np.isin([18, 19, 20], index.hours).any()):
             print("⚠️  출퇴근 시간대 데이터를 찾을 수 없습니다.")
             return None
         
-        # 역별 집계
-        df['MORNING_BOARDING'] = df[morning_boarding].sum(axis=1)
-        df['MORNING_ALIGHTING'] = df[morning_alighting].sum(axis=1)
-        df['EVENING_BOARDING'] = df[evening_boarding].sum(axis=1)
-        df['EVENING_ALIGHTING'] = df[evening_alighting].sum(axis=1)
+        # 역별 집계 (누적합 인덱스 조회)
+        def window(measure, hour_start, hour_end):
+            return index.query(measure, start_date, end_date, hour_start, hour_end)
         
-        station_stats = df.groupby('STTN').agg({
-            'MORNING_BOARDING': 'sum',
-            'MORNING_ALIGHTING': 'sum',
-            'EVENING_BOARDING': 'sum',
-            'EVENING_ALIGHTING': 'sum'
-        })
+        station_stats = pd.DataFrame({
+            'MORNING_BOARDING': window('boarding', 7, 10),
+            'MORNING_ALIGHTING': window('alighting', 7, 10),
+            'EVENING_BOARDING': window('boarding', 18, 21),
+            'EVENING_ALIGHTING': window('alighting', 18, 21)
+        }, index=pd.Index(index.stations, name=index.cube.station_column))
         
         # 특성 지표 계산
         station_stats['TOTAL'] = station_stats.sum(axis=1)
@@ -394,14 +656,448 @@ class SubwayPatternAnalyzer:
             pct = count / len(station_stats) * 100
             print(f"   {station_type:8s}: {count:>4}개 ({pct:>5.1f}%)")
         
+        # 부트스트랩 신뢰구간 (일자 재추출 → 모든 역 재분류)
+        if bootstrap:
+            def daily_window(measure, hour_start, hour_end):
+                return index.daily(measure, start_date, end_date, hour_start, hour_end)[1]
+            
+            dates = index.daily('boarding', start_date, end_date)[0]
+            if len(dates) > 0:
+                ci = bootstrap_station_type_ci(
+                    dates,
+                    daily_window('boarding', 7, 10), daily_window('alighting', 7, 10),
+                    daily_window('boarding', 18, 21), daily_window('alighting', 18, 21),
+                    n_replicates=bootstrap, seed=seed, level=ci_level)
+                
+                for column, values in ci['stations'].items():
+                    station_stats[column] = values.to_numpy()
+                
+                print(f"\n📏 유형 비율 {ci_level:.0%} 신뢰구간 (부트스트랩 {bootstrap:,}회):")
+                for station_type, row in ci['type_share'].iterrows():
+                    print(f"   {station_type:8s}: {row['SHARE']:>5.1f}% [{row['LOWER']:>5.1f}% ~ {row['UPPER']:>5.1f}%]")
+                
+                unstable = (station_stats['TYPE_STABILITY'] < 0.9).sum()
+                print(f"   ⚠️  유형이 흔들리는 역 (재표본의 90% 미만에서 같은 유형): {unstable}개")
+        
         return station_stats
     
-    def generate_summary_report(self, save_path="results/"):
+    def analyze_peak_hours(self, top_k=10, by='PEAK_TO_MEAN', min_daily=1000,
+                           start_date=None, end_date=None, measure='total'):
+        """
+        역별 피크 시간대 및 첨두도 분석 (전체/평일/주말 일괄 계산)
+        
+        Args:
+            top_k (int): 유형별로 출력할 첨두도 상위 역 수
+            by (str): 순위 기준 지표 ('PEAK_TO_MEAN' 또는 'TOP3_SHARE')
+            min_daily (float): 순위에서 제외할 하루 평균 이용객 하한
+            start_date: 분석 시작일 (포함)
+            end_date: 분석 종료일 (포함)
+            measure (str): 'total', 'boarding', 'alighting'
+        
+        Returns:
+            DataFrame: 역 × 일자 유형별 DAILY_AVG, PEAK_HOUR, PEAK_AVG, PEAK_TO_MEAN,
+                       TOP3_HOURS, TOP3_SHARE
+        """
+        if self.df_processed is None:
+            print("❌ 먼저 데이터를 전처리하세요.")
+            return None
+        
+        print("\n" + "="*60)
+        print("⛰️  역별 피크 시간대 / 첨두도 분석")
+        print("="*60)
+        
+        index = self.get_prefix_index()
+        if index is None:
+            print("⚠️  시간대별 컬럼을 찾을 수 없습니다.")
+            return None
+        
+        metrics = compute_peak_metrics(index.cube, start_date, end_date, measure=measure)
+        station_col = index.cube.station_column or 'STTN'
+        
+        for day_type in metrics['DAY_TYPE'].unique():
+            subset = metrics[metrics['DAY_TYPE'] == day_type]
+            peak_hours = subset['PEAK_HOUR'].value_counts().head(3)
+            print(f"\n📅 {day_type}: 역 {len(subset):,}개 | 주요 피크 시간대 "
+                  + ', '.join(f"{hour:02d}시({count}개 역)" for hour, count in peak_hours.items()))
+            
+            print(f"   🔝 {by} 상위 {top_k}개 역 (하루 평균 {min_daily:,}명 이상):")
+            for _, row in top_peaky_stations(metrics, top_k, by, day_type, min_daily).iterrows():
+                print(f"      {row[station_col]:12s} 피크 {row['PEAK_HOUR']:02d}시 | "
+                      f"피크/평균 {row['PEAK_TO_MEAN']:>5.2f} | "
+                      f"상위3시간 {row['TOP3_SHARE']:>5.1f}% ({row['TOP3_HOURS']})")
+        
+        return metrics
+    
+    def analyze_net_flow(self, start_date=None, end_date=None, day_type=None, top_n=5):
+        """
+        역별 순유출입(승차 - 하차) 및 하루 누적 수지 분석
+        
+        Args:
+            start_date: 분석 시작일 (포함)
+            end_date: 분석 종료일 (포함)
+            day_type (str): '평일', '주말' 또는 None(전체)
+            top_n (int): 시간대별 유출/흡수 상위 역 수
+        
+        Returns:
+            dict: net, balance (역 × H00..H23), network (시간대별 전체), extremes, n_days
+        """
+        if self.df_processed is None:
+            print("❌ 먼저 데이터를 전처리하세요.")
+            return None
+        
+        print("\n" + "="*60)
+        print(f"🔄 역별 순유출입 분석 ({day_type or '전체'})")
+        print("="*60)
+        
+        index = self.get_prefix_index()
+        if index is None:
+            print("⚠️  시간대별 컬럼을 찾을 수 없습니다.")
+            return None
+        
+        result = compute_net_flow(index.cube, start_date, end_date, day_type, top_n)
+        if result['n_days'] == 0:
+            print("⚠️  조건에 맞는 일자가 없습니다.")
+            return result
+        
+        network = result['network']
+        peak = network.loc[network['IN_NETWORK'].idxmax()]
+        print(f"\n🚇 네트워크 재차 인원 최대: {int(peak['HOUR']):02d}시 "
+              f"(하루 평균 {peak['IN_NETWORK']:,.0f}명, {result['n_days']}일 기준)")
+        
+        print(f"\n📤 유출(승차 > 하차) / 📥 흡수(하차 > 승차) 상위 역:")
+        for _, row in result['extremes'].iterrows():
+            if row['HOUR'] in (8, 18):
+                print(f"   {row['HOUR']:02d}시 📤 {row['TOP_EMITTING']}")
+                print(f"        📥 {row['TOP_ABSORBING']}")
+        
+        # 하루 누적 수지가 가장 크게 벌어지는 역 (주거형 / 업무형 경향)
+        swing = result['balance'].abs().max(axis=1)
+        print(f"\n⚖️  누적 수지 변동폭 TOP {top_n}:")
+        for station, value in swing.nlargest(top_n).items():
+            print(f"   {station:12s}: {value:>10,.0f}명")
+        
+        return result
+    
+    def get_station_hour_matrix(self, measure='boarding', by_date=False, start_date=None, end_date=None):
+        """
+        역 × 시간대 (또는 역 × 일자·시간대) 이용객 행렬 (래스터 히트맵용)
+        
+        Args:
+            measure (str): 'boarding', 'alighting', 'total'
+            by_date (bool): True면 일자별 시간대를 이어 붙인 열 (한 달이면 약 744열)
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+        
+        Returns:
+            DataFrame: 인덱스 역명, 컬럼 시간대 또는 (USE_DT, HOUR) MultiIndex
+        """
+        if self.df_processed is None:
+            print("❌ 먼저 데이터를 전처리하세요.")
+            return None
+        
+        index = self.get_prefix_index()
+        if index is None:
+            print("⚠️  시간대별 컬럼을 찾을 수 없습니다.")
+            return None
+        
+        cube = index.cube
+        d0, d1 = cube.date_bounds(start_date, end_date)
+        values = cube.measure(measure)[:, d0:d1, :]
+        
+        stations = pd.Index(cube.stations, name=cube.station_column)
+        if not by_date:
+            return pd.DataFrame(values.sum(axis=1), index=stations, columns=cube.hours)
+        
+        columns = pd.MultiIndex.from_product([pd.to_datetime(cube.dates[d0:d1]), cube.hours],
+                                             names=['USE_DT', 'HOUR'])
+        return pd.DataFrame(values.reshape(len(stations), -1), index=stations, columns=columns)
+    
+    def get_station_profiles(self, start_date=None, end_date=None, day_type=None):
+        """
+        전체 역의 하루 평균 시간대별 승하차 (총 이용객 내림차순)
+        
+        Args:
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            day_type (str): '평일', '주말' 또는 None(전체)
+        
+        Returns:
+            DataFrame: 인덱스 역명, 컬럼 ON_XX (승차), OFF_XX (하차)
+        """
+        if self.df_processed is None:
+            print("❌ 먼저 데이터를 전처리하세요.")
+            return None
+        
+        index = self.get_prefix_index()
+        if index is None:
+            print("⚠️  시간대별 컬럼을 찾을 수 없습니다.")
+            return None
+        
+        cube = index.cube
+        d0, d1 = cube.date_bounds(start_date, end_date)
+        selected = day_type_mask(cube.dates[d0:d1], day_type)
+        n_days = max(int(selected.sum()), 1)
+        
+        boarding = cube.boarding[:, d0:d1, :][:, selected, :].sum(axis=1) / n_days
+        alighting = cube.alighting[:, d0:d1, :][:, selected, :].sum(axis=1) / n_days
+        
+        profile_df = pd.DataFrame(np.concatenate([boarding, alighting], axis=1),
+                                  index=pd.Index(cube.stations, name=cube.station_column),
+                                  columns=profile_columns(cube.hours))
+        order = np.argsort(-(boarding.sum(axis=1) + alighting.sum(axis=1)), kind='stable')
+        return profile_df.iloc[order].round(1)
+    
+    def analyze_station_clusters(self, n_clusters=5, top_k=5, start_date=None, end_date=None, seed=42):
+        """
+        역별 24시간 승하차 프로파일 군집화 (k-means) + 유사 역 검색
+        
+        Args:
+            n_clusters (int): 군집 수
+            top_k (int): 역별 유사 역 수
+            start_date: 분석 시작일 (포함)
+            end_date: 분석 종료일 (포함)
+            seed (int): 난수 시드
+        
+        Returns:
+            DataFrame: 역별 군집 번호, 총 이용객, 유사 역, 정규화 프로파일 (ON_XX, OFF_XX)
+        """
+        if self.df_processed is None:
+            print("❌ 먼저 데이터를 전처리하세요.")
+            return None
+        
+        print("\n" + "="*60)
+        print(f"🧩 역별 시간대 프로파일 군집 분석 (k={n_clusters})")
+        print("="*60)
+        
+        index = self.get_prefix_index()
+        if index is None:
+            print("⚠️  시간대별 컬럼을 찾을 수 없습니다.")
+            return None
+        
+        try:
+            cluster_df, centers = cluster_stations(index.cube, n_clusters=n_clusters, top_k=top_k,
+                                                   start_date=start_date, end_date=end_date, seed=seed)
+        except ValueError as e:
+            print(f"⚠️  {e}")
+            return None
+        
+        hours = index.hours
+        n_hours = len(hours)
+        
+        print(f"\n📊 군집별 특성:")
+        for cluster, center in centers.iterrows():
+            profile = center.drop('N_STATIONS').to_numpy(dtype=float)
+            peak_on = hours[profile[:n_hours].argmax()]
+            peak_off = hours[profile[n_hours:].argmax()]
+            members = cluster_df[cluster_df['CLUSTER'] == cluster].nlargest(3, 'TOTAL').index
+            print(f"   군집 {cluster}: {int(center['N_STATIONS']):>4}개 역 | "
+                  f"승차 피크 {peak_on:02d}시, 하차 피크 {peak_off:02d}시 | "
+                  f"대표 역: {', '.join(members)}")
+        
+        print(f"\n🔗 유사 역 예시 (이용객 TOP 5):")
+        for station, row in cluster_df.nlargest(5, 'TOTAL').iterrows():
+            print(f"   {station}: {row['SIMILAR_STATIONS']}")
+        
+        return cluster_df
+    
+    def detect_anomalies(self, method='mad', window=8, threshold=3.5, min_volume=100,
+                         top_n=20, detector=None):
+        """
+        역 × 시간대별 이상 이용량 탐지 (같은 요일 이동 기준선)
+        
+        detector를 넘기면(또는 이전 호출의 self.anomaly_detector를 넘기면)
+        그 상태에 이어서 아직 처리하지 않은 일자만 점수화한다.
+        
+        Args:
+            method (str): 'mad' (이동 중앙값/MAD) 또는 'ewma'
+            window (int): 기준선에 사용할 직전 같은 요일 수
+            threshold (float): 이상으로 판단할 |점수| 기준
+            min_volume (int): 관측값·기준선이 모두 이 값 미만이면 무시
+            top_n (int): 출력할 상위 이상치 수
+            detector (StationAnomalyDetector): 이어서 사용할 탐지기
+        
+        Returns:
+            DataFrame: |점수| 내림차순 이상치 표
+        """
+        if self.df_processed is None:
+            print("❌ 먼저 데이터를 전처리하세요.")
+            return None
+        
+        print("\n" + "="*60)
+        print(f"🚨 역 × 시간대 이상 이용량 탐지 ({method})")
+        print("="*60)
+        
+        index = self.get_prefix_index()
+        if index is None:
+            print("⚠️  시간대별 컬럼을 찾을 수 없습니다.")
+            return None
+        
+        if detector is None:
+            detector = StationAnomalyDetector(method=method, window=window,
+                                              threshold=threshold, min_volume=min_volume)
+        self.anomaly_detector = detector
+        
+        anomalies = detector.update(index.cube)
+        
+        print(f"\n📊 탐지 결과: {len(anomalies):,}건 (|점수| ≥ {detector.threshold})")
+        if len(anomalies) == 0:
+            return anomalies
+        
+        direction_counts = anomalies['DIRECTION'].value_counts()
+        for direction, count in direction_counts.items():
+            print(f"   {direction}: {count:,}건")
+        
+        print(f"\n🔝 상위 {min(top_n, len(anomalies))}건:")
+        for _, row in anomalies.head(top_n).iterrows():
+            print(f"   {row['USE_DT']:%Y-%m-%d}({row['WEEKDAY'][0]}) {row['HOUR']:02d}시 "
+                  f"{row['STTN']:12s} {row['VALUE']:>8,}명 (기준 {row['BASELINE']:>9,.0f}) "
+                  f"점수 {row['SCORE']:>7.1f} {row['DIRECTION']}")
+        
+        return anomalies
+    
+    def forecast_demand(self, horizon=7, trend=False, half_life=None, measure='total'):
+        """
+        역 × 시간대별 향후 수요 예측 (요일 × 시간대 계절 회귀, 전체 일괄 최소제곱)
+        
+        Args:
+            horizon (int): 예측 일수
+            trend (bool): 선형 추세 항 포함 여부
+            half_life (float): 최근 관측 가중 반감기 (일)
+            measure (str): 'total', 'boarding', 'alighting'
+        
+        Returns:
+            DataFrame: STTN, USE_DT, WEEKDAY, HOUR, FORECAST
+        """
+        if self.df_processed is None:
+            print("❌ 먼저 데이터를 전처리하세요.")
+            return None
+        
+        print("\n" + "="*60)
+        print(f"🔮 역 × 시간대 수요 예측 (향후 {horizon}일)")
+        print("="*60)
+        
+        index = self.get_prefix_index()
+        if index is None:
+            print("⚠️  시간대별 컬럼을 찾을 수 없습니다.")
+            return None
+        
+        try:
+            model = SeasonalForecaster(trend=trend, half_life=half_life, measure=measure).fit(index.cube)
+        except ValueError as e:
+            print(f"⚠️  {e}")
+            return None
+        
+        forecast_df = model.forecast_frame(horizon)
+        n_series = len(model.stations) * len(model.hours)
+        print(f"\n⏱️  학습: {n_series:,}개 시계열 × {len(index.dates)}일 → {model.fit_seconds_:.3f}초")
+        
+        daily = forecast_df.groupby(['USE_DT', 'WEEKDAY'])['FORECAST'].sum()
+        print(f"\n📅 일자별 예측 총 이용객:")
+        for (date, weekday), value in daily.items():
+            print(f"   {date:%Y-%m-%d} {weekday}: {value:>14,.0f}명")
+        
+        return forecast_df
+    
+    def backtest_forecast(self, folds=4, horizon=7, trend=False, half_life=None, measure='total'):
+        """
+        수요 예측 롤링 백테스트 (오차 및 학습 시간 보고)
+        
+        Args:
+            folds (int): 검증 구간 수
+            horizon (int): 구간 길이 (일)
+            trend, half_life, measure: forecast_demand와 동일
+        
+        Returns:
+            DataFrame: 구간별 MAE, RMSE, WAPE(%), 계절 naive WAPE(%), 학습 시간(초)
+        """
+        if self.df_processed is None:
+            print("❌ 먼저 데이터를 전처리하세요.")
+            return None
+        
+        print("\n" + "="*60)
+        print(f"🧪 수요 예측 백테스트 ({folds}개 구간 × {horizon}일)")
+        print("="*60)
+        
+        index = self.get_prefix_index()
+        if index is None:
+            print("⚠️  시간대별 컬럼을 찾을 수 없습니다.")
+            return None
+        
+        result = backtest(index.cube, folds=folds, horizon=horizon, trend=trend,
+                          half_life=half_life, measure=measure)
+        if len(result) == 0:
+            print("⚠️  백테스트에 필요한 기간이 부족합니다.")
+            return result
+        
+        print(f"\n{'검증 구간':^25s} {'학습일':>6s} {'MAE':>10s} {'RMSE':>10s} "
+              f"{'WAPE':>8s} {'naive':>8s} {'학습(초)':>9s}")
+        for _, row in result.iterrows():
+            print(f"{row['TEST_START']:%Y-%m-%d} ~ {row['TEST_END']:%Y-%m-%d} "
+                  f"{row['TRAIN_DAYS']:>6d} {row['MAE']:>10,.1f} {row['RMSE']:>10,.1f} "
+                  f"{row['WAPE']:>7.1f}% {row['NAIVE_WAPE']:>7.1f}% {row['FIT_SECONDS']:>9.3f}")
+        
+        print(f"\n📊 평균 WAPE: {result['WAPE'].mean():.1f}% "
+              f"(계절 naive {result['NAIVE_WAPE'].mean():.1f}%)")
+        
+        return result
+    
+    def compare_months(self, others, top_k=10, measure='total'):
+        """
+        다른 달 분석기와 월별 비교 (역 정수 사전으로 역/시간대 정렬)
+        
+        Args:
+            others (list): 비교할 SubwayPatternAnalyzer 목록 (전처리 완료, 이 분석기 다음 달 순서)
+            top_k (int): 월별 증가/감소 상위 역 수
+            measure (str): 'total', 'boarding', 'alighting'
+        
+        Returns:
+            MonthlyComparison: 비교 결과 (station_table(), hourly_table(), movers(), save())
+        """
+        analyzers = [self] + list(others)
+        indexes = [analyzer.get_prefix_index() for analyzer in analyzers]
+        if any(index is None for index in indexes):
+            print("❌ 모든 월 데이터를 전처리해야 하며 시간대별 컬럼이 필요합니다.")
+            return None
+        
+        print("\n" + "="*60)
+        print(f"📆 월별 비교 ({len(analyzers)}개월)")
+        print("="*60)
+        
+        try:
+            comparison = compare_months([index.cube for index in indexes], measure=measure)
+        except ValueError as e:
+            print(f"⚠️  {e}")
+            return None
+        
+        print(f"\n🔤 공통 역 사전: {len(comparison.stations):,}개 역")
+        unit = '하루 평균' if comparison.per_day else '월 합계'
+        totals = comparison.station_totals.sum(axis=1)
+        for i, month in enumerate(comparison.months):
+            line = f"   {month}: {totals[i]:>14,.0f}명 ({unit})"
+            if i > 0 and totals[i - 1] > 0:
+                line += f"  {(totals[i] / totals[i - 1] - 1) * 100:+.1f}%"
+            print(line)
+        
+        movers = comparison.movers(top_k)
+        for month in comparison.months[1:]:
+            print(f"\n📈 {month} 증감 상위 역:")
+            for direction in ('증가', '감소'):
+                subset = movers[(movers['MONTH'] == month) & (movers['DIRECTION'] == direction)]
+                names = ', '.join(f"{row['STTN']}({row['DELTA']:+,.0f})" for _, row in subset.head(5).iterrows())
+                print(f"   {direction}: {names or '-'}")
+        
+        return comparison
+    
+    def generate_summary_report(self, save_path="results/", comparison=None, html=False,
+                                html_max_bytes=1024 ** 2):
         """
         종합 분석 보고서 생성
         
         Args:
             save_path (str): 보고서 저장 경로
+            comparison (MonthlyComparison): 함께 저장할 월별 비교 결과 (compare_months 반환값)
+            html (bool): 서버 없이 열 수 있는 단일 HTML 보고서도 저장 (이미지 렌더링 없음)
+            html_max_bytes (int): HTML 보고서 크기 한도 (넘으면 ValueError)
         """
         os.makedirs(save_path, exist_ok=True)
         
@@ -433,10 +1129,23 @@ class SubwayPatternAnalyzer:
             station_df.to_csv(station_path, encoding='utf-8-sig')
             print(f"✅ 역별 특성 분석 저장: {station_path}")
         
+        if comparison is not None:
+            comparison_paths = comparison.save(save_path, timestamp)
+            for path in comparison_paths.values():
+                print(f"✅ 월별 비교 저장: {path}")
+        
+        html_path = None
+        if html:
+            from ..visualization.html_report import write_html_report
+            html_path = write_html_report(self, save_path, f"summary_report_{timestamp}.html",
+                                          max_bytes=html_max_bytes, weekday_df=weekday_df)
+        
         print(f"\n🎉 분석 완료!")
         
         return {
             'hourly': hourly_df,
             'weekday': weekday_df,
-            'station': station_df
+            'station': station_df,
+            'comparison': comparison,
+            'html': html_path
         }
@@ -0,0 +1,235 @@
+"""
+CardSubwayTime 데이터 무결성 검사 및 중복 제거 (벡터화)
+
+- 중복 키: (일자, 노선, 역) 컬럼을 해시 테이블(factorize)로 정수화해 하나의 키로 묶어 탐지
+- 시간대 수치: 숫자가 아닌 값 / 음수 / 결측 (시간대 컬럼 블록 하나로 검사)
+- 누락 시간대: 0~23시 중 승하차 컬럼 쌍이 없는 시간대
+- 일자: 날짜로 해석할 수 없거나 요청한 월을 벗어난 행 (고유 일자만 해석)
+
+중복은 행 순서와 무관하게 결정적으로 제거한다. 같은 키의 행 중
+시간대 결측이 가장 적은 행, 그다음 행 내용 해시가 가장 작은 행을 남긴다.
+"""
+
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from .columns import LINE_COLUMNS, STATION_COLUMNS, find_column, get_hour_columns
+
+DATE_COLUMN = 'JOB_YMD'
+EXPECTED_HOURS = tuple(range(24))
+
+# 수집기가 저장하는 파일명 (seoul_subway_data_collector: subway_hourly_YYYY-MM.csv)
+_COLLECTOR_FILENAME = re.compile(r'subway_hourly_(\d{4})-(\d{2})\.csv')
+
+
+def month_from_path(filepath):
+    """
+    수집기 파일명에서 'YYYY-MM' 추출 (예: subway_hourly_2024-08.csv → '2024-08')
+
+    파일명 전체가 수집기 형식과 일치할 때만 월로 인정한다.
+    (export_20240312.csv, subway_hourly_2024-01_to_2024-06.csv 등은 None)
+
+    Returns:
+        str: 'YYYY-MM' (수집기 파일명이 아니면 None)
+    """
+    if not filepath:
+        return None
+    match = _COLLECTOR_FILENAME.fullmatch(str(filepath).replace('\\', '/').split('/')[-1])
+    if not match:
+        return None
+    year, month = match.groups()
+    if not 1 <= int(month) <= 12:
+        return None
+    return f"{year}-{month}"
+
+
+def _date_text(values):
+    """
+    일자 값을 'YYYYMMDD' 문자열로 (빈 칸이 섞여 float로 읽힌 20240301.0도 정수 문자열로)
+    """
+    values = pd.Series(values)
+    if pd.api.types.is_numeric_dtype(values):
+        numbers = pd.to_numeric(values, errors='coerce')
+        # 정수가 아닌 값은 결측으로 두어 날짜 오류로 집계
+        return numbers.where(numbers % 1 == 0).astype('Int64').astype(str)
+    return values.astype(str)
+
+
+def _row_hash(df, columns):
+    """
+    지정 컬럼 조합의 행별 64비트 해시
+    """
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy(dtype=np.uint64)
+
+
+def _key_codes(df, columns):
+    """
+    키 컬럼 조합의 행별 정수 키 (컬럼별 factorize 코드를 혼합 진법으로 결합, 충돌 없음)
+    """
+    key = np.zeros(len(df), dtype=np.int64)
+    for col in columns:
+        codes, uniques = pd.factorize(df[col], use_na_sentinel=False)
+        key = key * (len(uniques) + 1) + codes
+    return key
+
+
+def validate_dataframe(df, year_month=None, deduplicate=True, drop_out_of_month=True):
+    """
+    무결성 검사 후 정제된 데이터와 검사 결과 반환
+
+    숫자가 아닌 값과 음수 시간대 이용객은 결측(NaN)으로 바꾼다
+    (집계 시 0으로 처리되어 합계를 오염시키지 않음).
+
+    Args:
+        df (DataFrame): 원본 데이터 (load_data 결과)
+        year_month (str): 요청한 월 'YYYY-MM' (None이면 월 범위 검사 생략)
+        deduplicate (bool): 중복 키 행 제거
+        drop_out_of_month (bool): 요청 월 밖의 행과 날짜 오류 행 제거
+
+    Returns:
+        tuple: (정제된 DataFrame, 검사 결과 dict)
+    """
+    started = time.perf_counter()
+    report = {
+        'n_rows': int(len(df)),
+        'year_month': year_month,
+        'non_numeric': 0,
+        'negative': 0,
+        'missing_values': 0,
+        'missing_hours': [],
+        'invalid_dates': 0,
+        'out_of_month': 0,
+        'duplicates': 0,
+        'conflicting_duplicates': 0,
+        'dropped_rows': 0,
+        'issues_by_column': {},
+    }
+    # 얕은 복사 후 수정할 컬럼만 새 배열로 교체 (원본 데이터는 그대로)
+    df = df.copy(deep=False)
+
+    # 시간대 수치 검사 (컬럼 블록 단위)
+    hour_columns = get_hour_columns(df)
+    value_cols = [col for _, on, off in hour_columns for col in (on, off)]
+    present_hours = {hour for hour, _, _ in hour_columns}
+    report['missing_hours'] = [hour for hour in EXPECTED_HOURS if hour not in present_hours]
+
+    issues = {}
+    if value_cols:
+        text_cols = [col for col in value_cols if not pd.api.types.is_numeric_dtype(df[col])]
+        if text_cols:
+            raw = df[text_cols]
+            coerced = raw.apply(pd.to_numeric, errors='coerce')
+            bad = coerced.isna() & raw.notna()
+            report['non_numeric'] = int(bad.to_numpy().sum())
+            for col, count in bad.sum().items():
+                if count:
+                    issues.setdefault(col, {})['non_numeric'] = int(count)
+            for col in text_cols:
+                df[col] = coerced[col]
+
+        block = df[value_cols].to_numpy(dtype=np.float64)
+        negative = block < 0
+        report['negative'] = int(negative.sum())
+        if report['negative']:
+            block[negative] = np.nan
+            for i, (col, count) in enumerate(zip(value_cols, negative.sum(axis=0))):
+                if count:
+                    issues.setdefault(col, {})['negative'] = int(count)
+                    df[col] = block[:, i]
+
+        missing = np.isnan(block)
+        report['missing_values'] = int(missing.sum()) - report['negative'] - report['non_numeric']
+        missing_per_row = missing.sum(axis=1)
+    else:
+        missing_per_row = np.zeros(len(df), dtype=np.int64)
+    report['issues_by_column'] = issues
+
+    keep = np.ones(len(df), dtype=bool)
+
+    # 일자 검사: 고유 일자만 해석 후 코드로 펼침
+    if DATE_COLUMN in df.columns and len(df) > 0:
+        codes, uniques = pd.factorize(df[DATE_COLUMN], use_na_sentinel=True)
+        parsed = pd.to_datetime(_date_text(uniques), format='%Y%m%d', errors='coerce')
+        valid = parsed.notna().to_numpy()
+        invalid_rows = (codes < 0) | ~np.append(valid, False)[codes]
+        report['invalid_dates'] = int(invalid_rows.sum())
+
+        if year_month:
+            in_month = (parsed.dt.strftime('%Y-%m') == year_month).to_numpy()
+            outside = ~invalid_rows & ~np.append(in_month, False)[codes]
+            report['out_of_month'] = int(outside.sum())
+            if drop_out_of_month:
+                keep &= ~outside
+        if drop_out_of_month:
+            keep &= ~invalid_rows
+
+    # 중복 키 검사: 정수 키 정렬로 중복 그룹을 찾고, 그룹 안에서만
+    # (결측 수, 내용 해시) 순으로 정렬해 첫 행을 유지
+    key_cols = [col for col in (DATE_COLUMN, find_column(df, LINE_COLUMNS), find_column(df, STATION_COLUMNS))
+                if col and col in df.columns]
+    if len(key_cols) >= 2 and len(df) > 0:
+        candidates = np.flatnonzero(keep)
+        keys = _key_codes(df, key_cols)[candidates]
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        repeated = np.zeros(len(order), dtype=bool)
+        repeated[1:] = sorted_keys[1:] == sorted_keys[:-1]
+        repeated[:-1] |= repeated[1:]
+
+        if repeated.any():
+            rows = candidates[order[repeated]]
+            group_keys = sorted_keys[repeated]
+            content_hash = _row_hash(df.iloc[rows], list(df.columns))
+            ranked = np.lexsort((content_hash, missing_per_row[rows], group_keys))
+            rows, group_keys, content_hash = rows[ranked], group_keys[ranked], content_hash[ranked]
+
+            first = np.ones(len(rows), dtype=bool)
+            first[1:] = group_keys[1:] != group_keys[:-1]
+            report['duplicates'] = int((~first).sum())
+            # 같은 키인데 내용이 다른 중복 (재수집 등으로 값이 바뀐 경우)
+            group_first = np.maximum.accumulate(np.where(first, np.arange(len(rows)), 0))
+            report['conflicting_duplicates'] = int((content_hash != content_hash[group_first]).sum())
+            if deduplicate:
+                keep[rows[~first]] = False
+
+    report['dropped_rows'] = int((~keep).sum())
+    if report['dropped_rows']:
+        df = df[keep].reset_index(drop=True)
+
+    report['n_rows_clean'] = int(len(df))
+    report['seconds'] = time.perf_counter() - started
+    return df, report
+
+
+def print_validation_report(report):
+    """
+    검사 결과 요약 출력
+    """
+    print("   🔎 무결성 검사:")
+    checks = [
+        ('숫자가 아닌 값', report['non_numeric'], '칸 → 결측 처리'),
+        ('음수 이용객', report['negative'], '칸 → 결측 처리'),
+        ('결측 이용객', report['missing_values'], '칸'),
+        ('날짜 오류', report['invalid_dates'], '행'),
+        ('요청 월 밖의 일자', report['out_of_month'], '행'),
+        ('중복 키 (일자×노선×역)', report['duplicates'], '행'),
+    ]
+    problems = [(name, count, unit) for name, count, unit in checks if count]
+    for name, count, unit in problems:
+        print(f"      ⚠️  {name}: {count:,}{unit}")
+    if report['conflicting_duplicates']:
+        print(f"      ⚠️  값이 다른 중복: {report['conflicting_duplicates']:,}행 (결측 적은 행 유지)")
+    if report['missing_hours']:
+        hours = ', '.join(f"{hour}시" for hour in report['missing_hours'])
+        print(f"      ⚠️  누락 시간대: {hours}")
+        problems.append(('누락 시간대', len(report['missing_hours']), ''))
+
+    if not problems:
+        print("      ✅ 이상 없음")
+    if report['dropped_rows']:
+        print(f"      🗑️  제거: {report['dropped_rows']:,}행 "
+              f"({report['n_rows']:,} → {report['n_rows_clean']:,})")
+    print(f"      ⏱️  {report['seconds'] * 1000:,.0f}ms")
@@ -0,0 +1,464 @@
+"""
+지하철 분석 결과 제공용 로컬 HTTP API 서버 (표준 라이브러리 기반)
+
+엔드포인트:
+    GET /health             - 상태 및 데이터 버전
+    GET /hourly             - 시간대별 승하차 합계
+    GET /weekday            - 요일별 평균 이용객
+    GET /stations/rank      - 역별 이용 순위
+    GET /stations/heatmap   - 역별 시간대별 이용량 (상위 N개 역)
+    GET /stations/detail    - 단일 역 상세 (station 필수, view=daily|hourly)
+
+공통 필터 (쿼리 파라미터):
+    start, end  - 날짜 범위 (YYYY-MM-DD 또는 YYYYMMDD)
+    line        - 노선명
+    day_type    - 평일 | 주말
+    top_n       - 상위 N개 (역 순위/히트맵)
+    format      - json (기본) | arrow (pyarrow 설치 시)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+from ..analysis.columns import LINE_COLUMNS, STATION_COLUMNS, find_column, get_hour_columns
+from ..analysis.hourly_cube import WEEKDAY_NAMES
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pyarrow는 선택 의존성
+    pa = None
+
+
+class QueryError(ValueError):
+    """
+    잘못된 쿼리 파라미터
+    """
+
+
+def compute_dataset_version(data_path=None, df=None):
+    """
+    데이터셋 버전 계산 (ETag 기준값)
+
+    파일 경로가 있으면 경로/크기/수정시각으로, 없으면 데이터 내용 해시로 계산
+
+    Args:
+        data_path (str): 원본 CSV 경로
+        df (DataFrame): 데이터프레임
+
+    Returns:
+        str: 버전 문자열 (16자리 hex)
+    """
+    hasher = hashlib.sha1()
+    if data_path and os.path.exists(data_path):
+        stat = os.stat(data_path)
+        hasher.update(f"{os.path.abspath(data_path)}|{stat.st_size}|{stat.st_mtime_ns}".encode('utf-8'))
+    elif df is not None:
+        hasher.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return hasher.hexdigest()[:16]
+
+
+class AggregateStore:
+    """
+    API 응답용 사전 집계 저장소
+
+    전처리된 데이터를 행 단위 정수 코드(날짜/요일/노선/역)와
+    시간대별 승하차 행렬로 변환해 두고, 요청마다 마스크 + bincount로 집계
+    (역명/노선명이 비어 있는 행은 HourlyCube와 같이 제외)
+    """
+
+    def __init__(self, df, version=None, cache_size=256, station_layout=None):
+        """
+        Args:
+            df (DataFrame): 전처리된 데이터 (SubwayPatternAnalyzer.df_processed)
+            version (str): 데이터셋 버전 (None이면 데이터 해시로 계산)
+            cache_size (int): 응답 캐시 최대 항목 수
+            station_layout (StationClusteredFrame): 역별 정렬 데이터 (단일 역 조회용)
+        """
+        hour_columns = get_hour_columns(df)
+        if not hour_columns:
+            raise ValueError("시간대별 승하차 컬럼을 찾을 수 없습니다.")
+        if 'USE_DT' not in df.columns:
+            raise ValueError("USE_DT 컬럼이 없습니다. 먼저 데이터를 전처리하세요.")
+
+        station_col = find_column(df, STATION_COLUMNS)
+        line_col = find_column(df, LINE_COLUMNS)
+
+        self.version = version or compute_dataset_version(df=df)
+
+        # 역명/노선명 결측 행(factorize 코드 -1)은 bincount에 넣을 수 없으므로 제외
+        key_cols = [col for col in (station_col, line_col) if col]
+        if key_cols:
+            has_keys = df[key_cols].notna().all(axis=1)
+            if not has_keys.all():
+                df = df[has_keys]
+        self.hours = np.array([hour for hour, _, _ in hour_columns], dtype=np.int64)
+
+        self.boarding = df[[on for _, on, _ in hour_columns]].fillna(0).to_numpy(dtype=np.int64)
+        self.alighting = df[[off for _, _, off in hour_columns]].fillna(0).to_numpy(dtype=np.int64)
+        self.daily_boarding = self.boarding.sum(axis=1)
+        self.daily_alighting = self.alighting.sum(axis=1)
+
+        self.dates = df['USE_DT'].to_numpy(dtype='datetime64[D]')
+        self.weekday = df['USE_DT'].dt.dayofweek.to_numpy()
+
+        if station_col:
+            self.station_codes, self.station_names = pd.factorize(df[station_col], sort=True)
+        else:
+            self.station_codes, self.station_names = None, pd.Index([])
+
+        if line_col:
+            self.line_codes, self.line_names = pd.factorize(df[line_col], sort=True)
+        else:
+            self.line_codes, self.line_names = None, pd.Index([])
+
+        self.station_layout = station_layout
+
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_analyzer(cls, analyzer):
+        """
+        SubwayPatternAnalyzer로부터 저장소 생성
+
+        Args:
+            analyzer (SubwayPatternAnalyzer): 전처리까지 완료된 분석기
+        """
+        if analyzer.df_processed is None:
+            raise ValueError("먼저 데이터를 전처리하세요.")
+        version = compute_dataset_version(analyzer.data_path, analyzer.df_processed)
+        return cls(analyzer.df_processed, version=version,
+                   station_layout=analyzer.get_station_layout())
+
+    def _parse_date(self, value):
+        try:
+            return np.datetime64(pd.Timestamp(value).date(), 'D')
+        except (ValueError, TypeError):
+            raise QueryError(f"잘못된 날짜 형식: {value}")
+
+    def _mask(self, params):
+        """
+        필터 파라미터로 행 마스크 생성
+        """
+        mask = np.ones(len(self.dates), dtype=bool)
+
+        if params.get('start'):
+            mask &= self.dates >= self._parse_date(params['start'])
+        if params.get('end'):
+            mask &= self.dates <= self._parse_date(params['end'])
+
+        day_type = params.get('day_type')
+        if day_type in ('평일', 'weekday'):
+            mask &= self.weekday < 5
+        elif day_type in ('주말', 'weekend'):
+            mask &= self.weekday >= 5
+        elif day_type:
+            raise QueryError(f"잘못된 day_type: {day_type}")
+
+        line = params.get('line')
+        if line:
+            if self.line_codes is None or line not in self.line_names:
+                raise QueryError(f"알 수 없는 노선: {line}")
+            mask &= self.line_codes == self.line_names.get_loc(line)
+
+        return mask
+
+    def _top_n(self, params, default):
+        try:
+            top_n = int(params.get('top_n', default))
+        except ValueError:
+            raise QueryError(f"잘못된 top_n: {params.get('top_n')}")
+        if top_n <= 0:
+            raise QueryError("top_n은 1 이상이어야 합니다.")
+        return top_n
+
+    def hourly(self, params):
+        """
+        시간대별 승하차 합계
+        """
+        mask = self._mask(params)
+        boarding = self.boarding[mask].sum(axis=0)
+        alighting = self.alighting[mask].sum(axis=0)
+        return {
+            'HOUR': self.hours,
+            'BOARDING': boarding,
+            'ALIGHTING': alighting,
+            'TOTAL': boarding + alighting,
+        }
+
+    def weekday_stats(self, params):
+        """
+        요일별 평균 이용객 (analyze_weekday_pattern과 동일한 행 단위 평균)
+        """
+        mask = self._mask(params)
+        weekday = self.weekday[mask]
+
+        counts = np.bincount(weekday, minlength=7)
+        boarding = np.bincount(weekday, weights=self.daily_boarding[mask], minlength=7)
+        alighting = np.bincount(weekday, weights=self.daily_alighting[mask], minlength=7)
+
+        present = counts > 0
+        safe_counts = np.where(present, counts, 1)
+        return {
+            'WEEKDAY': np.array(WEEKDAY_NAMES, dtype=object)[present],
+            'MEAN_BOARDING': np.round(boarding / safe_counts)[present],
+            'MEAN_ALIGHTING': np.round(alighting / safe_counts)[present],
+            'MEAN_TOTAL': np.round((boarding + alighting) / safe_counts)[present],
+            'ROWS': counts[present],
+        }
+
+    def _station_sums(self, mask, values):
+        n_stations = len(self.station_names)
+        return np.bincount(self.station_codes[mask], weights=values[mask],
+                           minlength=n_stations)
+
+    def _top_station_codes(self, totals, top_n):
+        top_n = min(top_n, len(totals))
+        if top_n == 0:
+            return np.array([], dtype=np.int64)
+        top = np.argpartition(-totals, top_n - 1)[:top_n]
+        return top[np.argsort(-totals[top], kind='stable')]
+
+    def station_rank(self, params):
+        """
+        역별 이용 순위
+        """
+        if self.station_codes is None:
+            raise QueryError("역명 컬럼이 없습니다.")
+
+        mask = self._mask(params)
+        top_n = self._top_n(params, 20)
+
+        boarding = self._station_sums(mask, self.daily_boarding)
+        alighting = self._station_sums(mask, self.daily_alighting)
+        totals = boarding + alighting
+        top = self._top_station_codes(totals, top_n)
+
+        return {
+            'RANK': np.arange(1, len(top) + 1),
+            'STATION': np.asarray(self.station_names)[top],
+            'BOARDING': boarding[top].astype(np.int64),
+            'ALIGHTING': alighting[top].astype(np.int64),
+            'TOTAL': totals[top].astype(np.int64),
+        }
+
+    def station_heatmap(self, params):
+        """
+        역별 시간대별 이용량 (승차 + 하차, 상위 N개 역)
+        """
+        if self.station_codes is None:
+            raise QueryError("역명 컬럼이 없습니다.")
+
+        mask = self._mask(params)
+        top_n = self._top_n(params, 30)
+
+        totals = self._station_sums(mask, self.daily_boarding + self.daily_alighting)
+        top = self._top_station_codes(totals, top_n)
+
+        codes = self.station_codes[mask]
+        hourly_total = self.boarding[mask] + self.alighting[mask]
+        n_stations = len(self.station_names)
+
+        table = {'STATION': np.asarray(self.station_names)[top]}
+        for i, hour in enumerate(self.hours):
+            per_station = np.bincount(codes, weights=hourly_total[:, i], minlength=n_stations)
+            table[f'H{hour:02d}'] = per_station[top].astype(np.int64)
+        return table
+
+    def station_detail(self, params):
+        """
+        단일 역 상세 (역별 오프셋 인덱스로 연속 구간만 조회)
+        """
+        if self.station_layout is None:
+            raise QueryError("역별 정렬 데이터가 없습니다.")
+
+        station = params.get('station')
+        if not station:
+            raise QueryError("station 파라미터가 필요합니다.")
+        if station not in self.station_layout:
+            raise QueryError(f"알 수 없는 역: {station}")
+
+        start = self._parse_date(params['start']) if params.get('start') else None
+        end = self._parse_date(params['end']) if params.get('end') else None
+
+        view = params.get('view', 'daily')
+        if view == 'daily':
+            detail = self.station_layout.station_daily(station, start, end)
+            detail['USE_DT'] = pd.to_datetime(detail['USE_DT']).dt.strftime('%Y-%m-%d')
+        elif view == 'hourly':
+            detail = self.station_layout.station_hourly(station, start, end)
+        else:
+            raise QueryError(f"잘못된 view: {view} (daily | hourly)")
+
+        return {col: detail[col].to_numpy() for col in detail.columns}
+
+    def etag(self, path, params):
+        """
+        데이터셋 버전 + 요청 경로/파라미터 기반 ETag
+        """
+        key = json.dumps([self.version, path, sorted(params.items())], ensure_ascii=False)
+        return '"' + hashlib.sha1(key.encode('utf-8')).hexdigest()[:20] + '"'
+
+    def get_cached(self, key):
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        return None
+
+    def put_cached(self, key, value):
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+
+def _to_builtin(values):
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == 'f':
+            # NaN은 null로, 정수값 실수는 정수로 (응답 크기 축소)
+            return [None if v != v else (int(v) if v.is_integer() else v)
+                    for v in values.tolist()]
+        return values.tolist()
+    return list(values)
+
+
+def encode_json(table, version):
+    """
+    컬럼 지향 JSON 직렬화 (공백 없는 압축 형식)
+    """
+    body = {
+        'version': version,
+        'rows': len(next(iter(table.values()))) if table else 0,
+        'columns': {name: _to_builtin(values) for name, values in table.items()},
+    }
+    return json.dumps(body, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def encode_arrow(table):
+    """
+    Arrow IPC 스트림 직렬화 (pyarrow 필요)
+    """
+    arrow_table = pa.table({name: pa.array(_to_builtin(values)) for name, values in table.items()})
+    sink = pa.BufferOutputStream()
+    with pa_ipc.new_stream(sink, arrow_table.schema) as writer:
+        writer.write_table(arrow_table)
+    return sink.getvalue().to_pybytes()
+
+
+class AggregateRequestHandler(BaseHTTPRequestHandler):
+    """
+    집계 API 요청 핸들러
+    """
+
+    routes = {
+        '/hourly': 'hourly',
+        '/weekday': 'weekday_stats',
+        '/stations/rank': 'station_rank',
+        '/stations/heatmap': 'station_heatmap',
+        '/stations/detail': 'station_detail',
+    }
+
+    protocol_version = 'HTTP/1.1'
+
+    @property
+    def store(self):
+        return self.server.store
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path.rstrip('/') or '/'
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+
+        if path == '/health':
+            body = json.dumps({'status': 'ok', 'version': self.store.version}).encode('utf-8')
+            self._send(HTTPStatus.OK, body, 'application/json; charset=utf-8')
+            return
+
+        method_name = self.routes.get(path)
+        if method_name is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"알 수 없는 경로: {path}")
+            return
+
+        fmt = params.pop('format', 'json')
+        if fmt not in ('json', 'arrow'):
+            self._send_error(HTTPStatus.BAD_REQUEST, f"지원하지 않는 형식: {fmt}")
+            return
+        if fmt == 'arrow' and pa is None:
+            self._send_error(HTTPStatus.NOT_ACCEPTABLE, "arrow 형식은 pyarrow 설치가 필요합니다.")
+            return
+
+        etag = self.store.etag(path, {**params, 'format': fmt})
+        if etag in [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]:
+            self._send(HTTPStatus.NOT_MODIFIED, b'', None, etag=etag)
+            return
+
+        body = self.store.get_cached(etag)
+        if body is None:
+            try:
+                table = getattr(self.store, method_name)(params)
+            except QueryError as e:
+                self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+                return
+            except Exception as e:
+                # 응답 없이 연결이 끊기지 않도록 서버 오류로 응답
+                self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, f"집계 중 오류: {e}")
+                return
+            body = encode_arrow(table) if fmt == 'arrow' else encode_json(table, self.store.version)
+            self.store.put_cached(etag, body)
+
+        content_type = ('application/vnd.apache.arrow.stream' if fmt == 'arrow'
+                        else 'application/json; charset=utf-8')
+        self._send(HTTPStatus.OK, body, content_type, etag=etag)
+
+    def _send(self, status, body, content_type, etag=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _send_error(self, status, message):
+        body = json.dumps({'error': message}, ensure_ascii=False).encode('utf-8')
+        self._send(status, body, 'application/json; charset=utf-8')
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class AggregateServer(ThreadingHTTPServer):
+    """
+    동시 요청 처리용 스레드 기반 HTTP 서버
+    """
+
+    daemon_threads = True
+
+    def __init__(self, store, host='127.0.0.1', port=8000, verbose=False):
+        """
+        Args:
+            store (AggregateStore): 집계 저장소
+            host (str): 바인딩 주소
+            port (int): 포트 (0이면 임의 포트)
+            verbose (bool): 요청 로그 출력 여부
+        """
+        self.store = store
+        self.verbose = verbose
+        super().__init__((host, port), AggregateRequestHandler)
@@ -1,7 +1,32 @@
 """
 데이터 수집 모듈
+
+하위 모듈은 이름을 처음 참조할 때 import한다 (PEP 562).
+패키지 import만으로 pandas/requests까지 불러오지 않도록 하기 위함.
 """
 
-from .seoul_subway_data_collector import SeoulSubwayDataCollector
+import importlib
+
+_LAZY_ATTRS = {
+    'SeoulSubwayDataCollector': '.seoul_subway_data_collector',
+    'profile_dataframe': '.dataset_profiler',
+    'save_profile': '.dataset_profiler',
+    'generate_card_subway_time': '.synthetic_data',
+    'write_synthetic_csv': '.synthetic_data',
+}
+
+__all__ = ['SeoulSubwayDataCollector', 'profile_dataframe', 'save_profile',
+           'generate_card_subway_time', 'write_synthetic_csv']
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # 이후 참조는 모듈 속성으로 바로 찾음
+    return value
+
 
-__all__ = ['SeoulSubwayDataCollector']
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,176 @@
+"""
+CardSubwayTime 데이터셋 프로파일러
+
+컬럼별 타입/결측/최솟값·최댓값/고유값 수/메모리와 노선별·역별 행 수를
+컬럼 블록 단위 벡터 연산으로 한 번에 계산하고, JSON으로 저장할 수 있는 dict로 반환한다.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from ..analysis.columns import LINE_COLUMNS, STATION_COLUMNS, find_column, get_hour_columns
+
+DATE_COLUMNS = ('JOB_YMD', 'USE_DT', 'USE_MM')
+
+
+def _to_builtin(value):
+    """
+    numpy/pandas 스칼라를 JSON 직렬화 가능한 값으로 변환
+    """
+    if value is None:
+        return None
+    if isinstance(value, (np.integer,)):
+        return int(value)
+    if isinstance(value, (np.floating, float)):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return None if pd.isna(value) else str(pd.Timestamp(value).date())
+    if isinstance(value, np.bool_):
+        return bool(value)
+    return value if isinstance(value, (int, str, bool)) else str(value)
+
+
+def _counts(series):
+    """
+    값별 행 수 (해시 기반 value_counts 한 번, 행 수 내림차순)
+    """
+    counts = series.value_counts(dropna=False)
+    return {str(key): int(count) for key, count in counts.items()}
+
+
+def profile_dataframe(df, sample_rows=3):
+    """
+    데이터프레임 프로파일 계산
+
+    Args:
+        df (DataFrame): 수집/로드한 원본 데이터
+        sample_rows (int): 프로파일에 포함할 샘플 행 수
+
+    Returns:
+        dict: n_rows, n_columns, memory_bytes, columns, date_range, lines, stations,
+              hour_columns, sample
+    """
+    memory = df.memory_usage(index=False, deep=True)
+    nulls = df.isna().sum()
+    cardinality = df.nunique(dropna=True)
+
+    # 수치 컬럼은 하나의 2차원 블록으로 최솟값/최댓값 계산
+    numeric = df.select_dtypes(include='number')
+    numeric_min, numeric_max = {}, {}
+    if numeric.shape[1] > 0 and len(df) > 0:
+        block = numeric.to_numpy(dtype=np.float64)
+        missing = np.isnan(block)
+        mins = np.where(missing, np.inf, block).min(axis=0)
+        maxs = np.where(missing, -np.inf, block).max(axis=0)
+        numeric_min = dict(zip(numeric.columns, mins))
+        numeric_max = dict(zip(numeric.columns, maxs))
+
+    columns = []
+    for col in df.columns:
+        if col in numeric_min:
+            col_min, col_max = numeric_min[col], numeric_max[col]
+            if not np.isfinite(col_min):
+                col_min = col_max = None
+        else:
+            # 문자열 등은 정렬 가능한 경우에만 (코드값/날짜 문자열 범위 확인용)
+            try:
+                non_null = df[col].dropna()
+                col_min, col_max = (non_null.min(), non_null.max()) if len(non_null) else (None, None)
+            except TypeError:
+                col_min = col_max = None
+
+        columns.append({
+            'name': col,
+            'dtype': str(df[col].dtype),
+            'null_count': int(nulls[col]),
+            'min': _to_builtin(col_min),
+            'max': _to_builtin(col_max),
+            'cardinality': int(cardinality[col]),
+            'memory_bytes': int(memory[col]),
+        })
+
+    profile = {
+        'n_rows': int(len(df)),
+        'n_columns': int(df.shape[1]),
+        'memory_bytes': int(memory.sum()),
+        'columns': columns,
+        'date_range': None,
+        'lines': None,
+        'stations': None,
+        'hour_columns': len(get_hour_columns(df)),
+        'sample': json.loads(df.head(sample_rows).to_json(orient='records', force_ascii=False)),
+    }
+
+    date_col = find_column(df, DATE_COLUMNS)
+    if date_col and len(df) > 0:
+        dates = df[date_col]
+        profile['date_range'] = {
+            'column': date_col,
+            'min': _to_builtin(dates.min()),
+            'max': _to_builtin(dates.max()),
+            'n_days': int(cardinality[date_col]),
+        }
+
+    line_col = find_column(df, LINE_COLUMNS)
+    if line_col:
+        profile['lines'] = {'column': line_col, 'counts': _counts(df[line_col])}
+
+    station_col = find_column(df, STATION_COLUMNS)
+    if station_col:
+        profile['stations'] = {'column': station_col, 'counts': _counts(df[station_col])}
+
+    return profile
+
+
+def print_profile(profile, top_n=10):
+    """
+    프로파일 요약 출력
+    """
+    print("\n📊 === 데이터 구조 탐색 ===\n")
+    print(f"🔍 데이터 크기: {profile['n_rows']:,}행 × {profile['n_columns']}열 "
+          f"(메모리 {profile['memory_bytes'] / 1024 ** 2:,.1f} MB)")
+
+    print(f"\n📋 컬럼 정보:")
+    print(f"   {'컬럼':<22} {'타입':<9} {'결측':>7} {'고유값':>8} {'최솟값':>12} {'최댓값':>12} {'메모리(KB)':>11}")
+    for column in profile['columns']:
+        col_min = '' if column['min'] is None else str(column['min'])[:12]
+        col_max = '' if column['max'] is None else str(column['max'])[:12]
+        print(f"   {column['name']:<22} {column['dtype']:<9} {column['null_count']:>7,} "
+              f"{column['cardinality']:>8,} {col_min:>12} {col_max:>12} "
+              f"{column['memory_bytes'] / 1024:>11,.1f}")
+
+    if profile['date_range']:
+        date_range = profile['date_range']
+        print(f"\n🗓️ 날짜 범위 ({date_range['column']}): {date_range['min']} ~ {date_range['max']}")
+        print(f"   총 일수: {date_range['n_days']}일")
+
+    if profile['lines']:
+        print(f"\n🚇 지하철 노선 ({profile['lines']['column']}):")
+        for line, count in sorted(profile['lines']['counts'].items()):
+            print(f"   {line}: {count:,}건")
+
+    if profile['stations']:
+        counts = profile['stations']['counts']
+        print(f"\n🚉 총 역 수: {len(counts)}개 ({profile['stations']['column']})")
+        print(f"   행 수 TOP {min(top_n, len(counts))}:")
+        for station, count in list(counts.items())[:top_n]:
+            print(f"      {station}: {count:,}건")
+
+    print(f"\n⏰ 시간대 컬럼: {profile['hour_columns']}쌍")
+
+
+def save_profile(profile, filepath):
+    """
+    프로파일 JSON 저장
+
+    Args:
+        profile (dict): profile_dataframe() 결과
+        filepath (str): 저장 경로 (.json)
+    """
+    os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, ensure_ascii=False, indent=2)
+    return filepath
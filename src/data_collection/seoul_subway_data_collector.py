@@ -9,6 +9,8 @@ import time
 from datetime import datetime
 import os
 
+from .dataset_profiler import profile_dataframe, print_profile, save_profile
+
 class SeoulSubwayDataCollector:
     def __init__(self, api_key):
         """
@@ -139,43 +141,30 @@ class SeoulSubwayDataCollector:
 
         return all_results
 
-    def explore_data_structure(self, df):
+    def explore_data_structure(self, df, json_path=None):
         """
-        수집된 데이터의 구조 탐색
+        수집된 데이터의 구조 탐색 (컬럼 블록 단위 벡터 연산 한 번으로 프로파일)
+
+        Args:
+            df (DataFrame): 수집된 데이터
+            json_path (str): 프로파일 JSON 저장 경로 (None이면 저장하지 않음)
+
+        Returns:
+            dict: 프로파일 (컬럼별 타입/결측/범위/고유값 수/메모리, 노선별·역별 행 수)
         """
         if df is None or df.empty:
             print("❌ 탐색할 데이터가 없습니다.")
             return
 
-        print("\n📊 === 데이터 구조 탐색 ===\n")
-
-        # 기본 정보
-        print(f"🔍 데이터 크기: {df.shape[0]:,}행 × {df.shape[1]}열")
-
-        # 컬럼 정보
-        print(f"\n📋 컬럼 목록:")
-        for i, col in enumerate(df.columns):
-            print(f"   {i+1}. {col}")
-
-        # 날짜 정보 확인
-        if 'USE_DT' in df.columns:
-            print(f"\n🗓️ 날짜 범위: {df['USE_DT'].min()} ~ {df['USE_DT'].max()}")
-            print(f"   총 일수: {df['USE_DT'].nunique()}일")
-
-        # 지하철 노선 확인
-        if 'LINE_NUM' in df.columns:
-            print(f"\n🚇 지하철 노선:")
-            lines = sorted(df['LINE_NUM'].unique())
-            for line in lines:
-                count = len(df[df['LINE_NUM'] == line])
-                print(f"   {line}: {count:,}건")
-
-        # 역 정보
-        if 'SUB_STA_NM' in df.columns:
-            print(f"\n🚉 총 역 수: {df['SUB_STA_NM'].nunique()}개")
+        profile = profile_dataframe(df)
+        print_profile(profile)
 
         # 샘플 데이터 출력
         print(f"\n📋 샘플 데이터 (처음 3행):")
         print(df.head(3).to_string())
 
-        return df
\ No newline at end of file
+        if json_path:
+            save_profile(profile, json_path)
+            print(f"\n💾 프로파일 저장: {json_path}")
+
+        return profile
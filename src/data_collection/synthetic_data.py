@@ -0,0 +1,208 @@
+"""
+합성 CardSubwayTime 데이터 생성 (벤치마크 / 재현 가능한 테스트 입력용)
+
+서울 열린데이터광장 CardSubwayTime과 같은 모양의 표를 만든다.
+(JOB_YMD, SBWY_ROUT_LN_NM, STTN, HR_{0..23}_GET_ON_NOPE / HR_{0..23}_GET_OFF_NOPE, USE_MM)
+
+- 역 유형: 주거형(아침 승차/저녁 하차), 업무형(아침 하차/저녁 승차), 환승·혼합형, 번화가형(심야 하차 적음)
+- 역 규모: 로그정규 분포 (소수의 대형 역과 다수의 소형 역)
+- 평일 출퇴근 피크, 주말·공휴일은 피크가 낮고 낮 시간대가 두꺼움, 새벽(1~4시)은 거의 0
+- 월별 계절성, 연간 완만한 증가 추세, 역·일 단위 과분산(감마-포아송) 잡음
+
+같은 seed면 항상 같은 데이터가 나오며, 달 단위로 나눠 만들어 5년 × 600개 역도 메모리에 한 번에 올리지 않고 CSV로 쓸 수 있다.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+# 생성 규칙이 바뀌면 올림 (벤치마크가 재사용하는 CSV 파일명에 들어감)
+SYNTHETIC_VERSION = 1
+
+HOURS = np.arange(24)
+LINE_NAMES = ('1호선', '2호선', '3호선', '4호선', '5호선', '6호선', '7호선', '8호선', '9호선')
+
+STATION_TYPES = ('주거형', '업무형', '혼합형', '번화가형')
+_TYPE_WEIGHTS = (0.5, 0.2, 0.2, 0.1)
+
+# 고정 공휴일 (월, 일) - 주말과 같은 패턴으로 생성
+_FIXED_HOLIDAYS = {(1, 1), (3, 1), (5, 5), (6, 6), (8, 15), (10, 3), (10, 9), (12, 25)}
+
+# 월별 계절 계수 (방학/휴가철 감소, 봄·가을 증가)
+_SEASONAL = np.array([0.92, 0.93, 1.02, 1.04, 1.03, 1.0, 0.96, 0.93, 1.02, 1.05, 1.04, 0.98])
+
+
+def _bump(center, width):
+    return np.exp(-0.5 * ((HOURS - center) / width) ** 2)
+
+
+def _service_mask():
+    # 새벽 1~4시는 운행이 거의 없음
+    mask = np.ones(24)
+    mask[1:5] = 0.02
+    mask[0] = 0.25
+    mask[5] = 0.4
+    return mask
+
+
+def hourly_shapes():
+    """
+    역 유형 × 요일 구분(평일/휴일) × 승하차별 24시간 비중
+
+    Returns:
+        np.ndarray: [유형, 2(평일/휴일), 2(승차/하차), 24], 시간축 합이 1
+    """
+    base = 0.15 + 0.35 * _bump(13, 3.5) + 0.25 * _bump(21, 1.5)
+    morning = _bump(8, 0.9)
+    evening = _bump(18.5, 1.1)
+    night = _bump(22.5, 1.2)
+
+    weekday = {
+        '주거형': (base + 3.0 * morning + 0.9 * evening, base + 0.7 * morning + 2.6 * evening),
+        '업무형': (base + 0.6 * morning + 3.2 * evening, base + 3.4 * morning + 0.7 * evening),
+        '혼합형': (base + 2.0 * morning + 2.0 * evening, base + 2.0 * morning + 2.0 * evening),
+        '번화가형': (base + 0.8 * morning + 1.5 * evening + 1.8 * night,
+                  base + 0.6 * morning + 2.2 * evening + 0.6 * night),
+    }
+    holiday_base = 0.1 + 0.9 * _bump(14, 3.5)
+    holiday = {
+        '주거형': (holiday_base + 0.3 * morning, holiday_base + 0.4 * evening),
+        '업무형': (0.6 * holiday_base + 0.2 * evening, 0.6 * holiday_base + 0.2 * morning),
+        '혼합형': (holiday_base, holiday_base),
+        '번화가형': (holiday_base + 1.2 * night, 1.4 * holiday_base + 0.3 * evening),
+    }
+
+    service = _service_mask()
+    shapes = np.zeros((len(STATION_TYPES), 2, 2, 24))
+    for t, name in enumerate(STATION_TYPES):
+        for d, table in enumerate((weekday, holiday)):
+            for k in range(2):
+                profile = table[name][k] * service
+                shapes[t, d, k] = profile / profile.sum()
+    return shapes
+
+
+def make_stations(n_stations=600, n_lines=9, seed=42):
+    """
+    합성 역 목록 (이름, 노선, 유형, 평일 하루 평균 승차 규모)
+
+    Returns:
+        DataFrame: STTN, SBWY_ROUT_LN_NM, STATION_TYPE, DAILY_SCALE
+    """
+    rng = np.random.default_rng(seed)
+    lines = [LINE_NAMES[i % len(LINE_NAMES)] if i < len(LINE_NAMES) else f"{i + 1}호선"
+             for i in range(n_lines)]
+    types = rng.choice(len(STATION_TYPES), size=n_stations, p=_TYPE_WEIGHTS)
+    # 업무형/혼합형(환승역)이 평균적으로 더 큼
+    size_boost = np.array([1.0, 1.6, 1.4, 1.3])[types]
+    scale = np.exp(rng.normal(np.log(9000), 0.8, size=n_stations)) * size_boost
+    return pd.DataFrame({
+        'STTN': [f"합성역{i + 1:03d}" for i in range(n_stations)],
+        'SBWY_ROUT_LN_NM': [lines[i % n_lines] for i in range(n_stations)],
+        'STATION_TYPE': np.array(STATION_TYPES)[types],
+        'DAILY_SCALE': scale.round(1),
+    })
+
+
+def _month_starts(start, months):
+    first = pd.Period(start, freq='M')
+    return [first + i for i in range(months)]
+
+
+def generate_month(stations, month, seed=42, shapes=None, growth_per_year=0.02, start_year=None):
+    """
+    한 달 분량 합성 데이터
+
+    Args:
+        stations (DataFrame): make_stations 결과
+        month (str | pd.Period): 'YYYY-MM'
+        seed (int): 난수 시드 (달마다 seed와 달로부터 파생)
+        growth_per_year (float): 연간 이용객 증가율
+        start_year (int): 증가 추세 기준 연도 (None이면 해당 달 연도)
+
+    Returns:
+        DataFrame: CardSubwayTime 모양 (역 × 일자 행)
+    """
+    period = pd.Period(month, freq='M')
+    shapes = hourly_shapes() if shapes is None else shapes
+    rng = np.random.default_rng([seed, period.year, period.month])
+
+    dates = pd.date_range(period.start_time, period.end_time.normalize(), freq='D')
+    n_days, n_stations = len(dates), len(stations)
+    holiday = np.array([d.dayofweek >= 5 or (d.month, d.day) in _FIXED_HOLIDAYS for d in dates])
+    types = pd.Categorical(stations['STATION_TYPE'], categories=STATION_TYPES).codes
+
+    # 일자 계수: 요일(금요일 약간 증가, 주말/공휴일 감소) × 계절 × 추세
+    weekday_factor = np.array([1.0, 1.01, 1.01, 1.02, 1.06, 0.72, 0.55])[dates.dayofweek.to_numpy()]
+    weekday_factor = np.where(holiday & (dates.dayofweek.to_numpy() < 5), 0.55, weekday_factor)
+    years = (period.year - (start_year or period.year)) + (period.month - 1) / 12
+    day_factor = weekday_factor * _SEASONAL[period.month - 1] * (1 + growth_per_year) ** years
+
+    # 행 순서: 일자 바깥, 역 안쪽 (API 응답과 같은 순서)
+    row_scale = day_factor[:, None] * stations['DAILY_SCALE'].to_numpy()[None, :]
+    # 역·일 단위 과분산 (감마 잡음, 평균 1)
+    row_scale = row_scale * rng.gamma(20.0, 1 / 20.0, size=row_scale.shape)
+    day_type = holiday.astype(np.int64)[:, None].repeat(n_stations, axis=1)
+
+    profile = shapes[types[None, :], day_type]  # [일, 역, 승하차, 24]
+    expected = row_scale[:, :, None, None] * profile * np.array([1.0, 0.97])[None, None, :, None]
+    counts = rng.poisson(expected).astype(np.int32).reshape(n_days * n_stations, 2, 24)
+
+    data = {
+        'JOB_YMD': np.repeat(dates.strftime('%Y%m%d').to_numpy(), n_stations),
+        'SBWY_ROUT_LN_NM': np.tile(stations['SBWY_ROUT_LN_NM'].to_numpy(), n_days),
+        'STTN': np.tile(stations['STTN'].to_numpy(), n_days),
+    }
+    for h in HOURS:
+        data[f'HR_{h}_GET_ON_NOPE'] = counts[:, 0, h]
+        data[f'HR_{h}_GET_OFF_NOPE'] = counts[:, 1, h]
+    data['USE_MM'] = period.strftime('%Y%m')
+    return pd.DataFrame(data)
+
+
+def generate_card_subway_time(start='2024-01', months=1, n_stations=600, n_lines=9, seed=42):
+    """
+    여러 달 합성 데이터를 하나의 DataFrame으로 생성 (작은 규모용, 큰 규모는 write_synthetic_csv)
+
+    Args:
+        start (str): 시작 월 'YYYY-MM'
+        months (int): 개월 수 (1 ~ 60)
+        n_stations (int): 역 수
+        n_lines (int): 노선 수
+        seed (int): 난수 시드
+
+    Returns:
+        DataFrame: CardSubwayTime 모양 데이터
+    """
+    stations = make_stations(n_stations, n_lines, seed)
+    shapes = hourly_shapes()
+    start_year = pd.Period(start, freq='M').year
+    frames = [generate_month(stations, month, seed, shapes, start_year=start_year)
+              for month in _month_starts(start, months)]
+    return pd.concat(frames, ignore_index=True)
+
+
+def write_synthetic_csv(filepath, start='2024-01', months=1, n_stations=600, n_lines=9, seed=42):
+    """
+    합성 데이터를 달 단위로 만들어 CSV 하나에 이어 쓰기 (메모리에는 한 달 분량만)
+
+    Returns:
+        dict: {'path', 'rows', 'months', 'stations', 'bytes'}
+    """
+    os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+    stations = make_stations(n_stations, n_lines, seed)
+    shapes = hourly_shapes()
+    start_year = pd.Period(start, freq='M').year
+
+    tmp_path = f"{filepath}.tmp"
+    rows = 0
+    for i, month in enumerate(_month_starts(start, months)):
+        df = generate_month(stations, month, seed, shapes, start_year=start_year)
+        df.to_csv(tmp_path, mode='w' if i == 0 else 'a', header=i == 0, index=False,
+                  encoding='utf-8-sig' if i == 0 else 'utf-8')
+        rows += len(df)
+    os.replace(tmp_path, filepath)
+
+    return {'path': filepath, 'rows': rows, 'months': months, 'stations': n_stations,
+            'bytes': os.path.getsize(filepath)}
@@ -0,0 +1,26 @@
+"""
+단계별 계측 모듈
+
+하위 모듈은 이름을 처음 참조할 때 import한다 (PEP 562).
+"""
+
+import importlib
+
+_LAZY_ATTRS = {
+    'StageRecorder': '.stage_recorder',
+}
+
+__all__ = ['StageRecorder']
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # 이후 참조는 모듈 속성으로 바로 찾음
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
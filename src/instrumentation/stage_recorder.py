@@ -0,0 +1,292 @@
+"""
+단계별 시간 / 메모리 계측 (선택 사용)
+
+수집기, 분석기, 시각화 객체의 단계 메서드(load_data, preprocess_data, analyze_*, plot_* 등)를
+인스턴스 단위로 감싸서 호출마다 다음을 기록한다.
+
+- 경과 시간(wall), CPU 시간 (현재 프로세스 기준, 병렬 렌더링 작업 프로세스는 제외)
+- Python 힙 최대 사용량 (tracemalloc, numpy/pandas 배열 포함) - 단계 시작 대비 증가분
+- 프로세스 최대 RSS (getrusage, 프로세스 전체 고점) 및 단계 동안의 고점 증가분
+- 입력 행 수 (객체의 df_processed / df), 결과 행 수 (DataFrame/배열 반환 시)
+
+기록은 한 줄에 하나씩 JSON-lines 파일로 남기고, 끝에 단계별 요약 표를 출력한다.
+profile=True면 최상위 단계마다 cProfile을 돌려 가장 느린 단계의 통계를 .pstats로 저장한다.
+tracemalloc은 할당이 많은 코드를 눈에 띄게 느리게 하므로 memory=False로 끌 수 있다.
+"""
+
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 감쌀 단계 메서드 이름 접두어 (get_prefix_index 같은 가벼운 조회 메서드는 제외)
+STAGE_PREFIXES = (
+    'load_', 'preprocess_', 'analyze_', 'build_', 'generate_', 'detect_', 'forecast_',
+    'backtest_', 'compare_', 'save_', 'update_', 'plot_', 'render_', 'get_subway_', 'explore_',
+)
+
+
+def _rss_peak_mb():
+    """
+    프로세스 최대 RSS (MB, 측정 불가면 None)
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 bytes 단위
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+def _row_count(value):
+    """
+    DataFrame/Series/배열이면 행 수, 아니면 None
+    """
+    if hasattr(value, 'shape') and getattr(value, 'shape', None):
+        return int(value.shape[0])
+    return None
+
+
+def _input_rows(obj):
+    for name in ('df_processed', 'df'):
+        value = getattr(obj, name, None)
+        if value is not None and hasattr(value, 'shape'):
+            return int(value.shape[0])
+    return None
+
+
+class StageRecorder:
+    """
+    단계별 계측 기록기
+
+    Args:
+        jsonl_path (str): 기록을 추가할 JSON-lines 파일 (None이면 메모리에만 보관)
+        memory (bool): tracemalloc으로 Python 힙 최대 사용량 측정
+        profile (bool): 최상위 단계마다 cProfile 실행 (가장 느린 단계 통계 보관)
+    """
+
+    def __init__(self, jsonl_path=None, memory=True, profile=False):
+        self.jsonl_path = jsonl_path
+        self.memory = memory
+        self.profile = profile
+        self.records = []
+        self._stack = []
+        self._seq = 0
+        self._slowest = None  # (wall 초, 단계 이름, cProfile.Profile)
+        self._started_tracemalloc = False
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        if jsonl_path:
+            os.makedirs(os.path.dirname(jsonl_path) or '.', exist_ok=True)
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def close(self):
+        """
+        이 기록기가 시작한 tracemalloc 중지
+        """
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextlib.contextmanager
+    def stage(self, name, rows_in=None):
+        """
+        with 블록 하나를 단계로 계측
+
+        Yields:
+            dict: 기록 (블록 안에서 record['rows_out'] 등을 채울 수 있음)
+        """
+        parent = self._stack[-1] if self._stack else None
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent['_py_peak'] = max(parent['_py_peak'], peak)
+            tracemalloc.reset_peak()
+        else:
+            current = 0
+
+        self._seq += 1
+        record = {
+            'run_id': self.run_id,
+            'seq': self._seq,
+            'stage': name,
+            'parent': parent['stage'] if parent else None,
+            'depth': len(self._stack),
+            'rows_in': rows_in,
+            'rows_out': None,
+            'status': 'ok',
+            '_py_start': current,
+            '_py_peak': current,
+            '_rss_start': _rss_peak_mb(),
+        }
+        self._stack.append(record)
+
+        profiler = None
+        if self.profile and parent is None:
+            profiler = cProfile.Profile()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield record
+        except BaseException as e:
+            record['status'] = 'error'
+            record['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            self._stack.pop()
+            self._finish(record, wall, cpu, parent)
+            if profiler is not None and (self._slowest is None or wall > self._slowest[0]):
+                self._slowest = (wall, name, profiler)
+
+    def _finish(self, record, wall, cpu, parent):
+        if self.memory:
+            peak = max(record['_py_peak'], tracemalloc.get_traced_memory()[1])
+            if parent is not None:
+                parent['_py_peak'] = max(parent['_py_peak'], peak)
+            tracemalloc.reset_peak()
+            record['py_peak_mb'] = round((peak - record['_py_start']) / 1024 ** 2, 2)
+        else:
+            record['py_peak_mb'] = None
+
+        rss_peak = _rss_peak_mb()
+        record['rss_peak_mb'] = round(rss_peak, 1) if rss_peak is not None else None
+        record['rss_growth_mb'] = (round(rss_peak - record['_rss_start'], 1)
+                                   if rss_peak is not None else None)
+        record['wall_s'] = round(wall, 4)
+        record['cpu_s'] = round(cpu, 4)
+        record['finished'] = datetime.now().isoformat(timespec='milliseconds')
+        for key in ('_py_start', '_py_peak', '_rss_start'):
+            record.pop(key)
+
+        self.records.append(record)
+        if self.jsonl_path:
+            with open(self.jsonl_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def wrap(self, obj, prefixes=STAGE_PREFIXES, label=None):
+        """
+        객체의 단계 메서드를 인스턴스 속성으로 감싸 계측 (클래스는 바꾸지 않음)
+
+        메서드 안에서 self.analyze_*처럼 다른 단계를 부르면 하위 단계로 함께 기록된다.
+
+        Args:
+            obj: 수집기 / 분석기 / 시각화 객체
+            prefixes (tuple): 감쌀 메서드 이름 접두어
+            label (str): 기록에 쓸 이름 접두어 (None이면 클래스 이름)
+
+        Returns:
+            obj: 같은 객체 (체이닝용)
+        """
+        label = label or type(obj).__name__
+        for name in dir(type(obj)):
+            if name.startswith('_') or not name.startswith(prefixes):
+                continue
+            method = getattr(obj, name)
+            if not callable(method):
+                continue
+            setattr(obj, name, self._wrap_method(obj, method, f"{label}.{name}"))
+        return obj
+
+    def _wrap_method(self, obj, method, stage_name):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with self.stage(stage_name, rows_in=_input_rows(obj)) as record:
+                result = method(*args, **kwargs)
+                record['rows_out'] = _row_count(result)
+                return result
+        return wrapper
+
+    def summary(self):
+        """
+        단계 이름별 집계 (처음 호출된 순서)
+
+        Returns:
+            list: dict (stage, depth, calls, wall_s, cpu_s, py_peak_mb, rss_peak_mb, rows_in, rows_out, errors)
+        """
+        rows = {}
+        for record in self.records:
+            row = rows.setdefault(record['stage'], {
+                'stage': record['stage'], 'depth': record['depth'], 'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0,
+                'py_peak_mb': None, 'rss_peak_mb': None, 'rows_in': None, 'rows_out': None, 'errors': 0,
+                'seq': record['seq'],
+            })
+            row['depth'] = min(row['depth'], record['depth'])
+            row['calls'] += 1
+            row['wall_s'] += record['wall_s']
+            row['cpu_s'] += record['cpu_s']
+            row['errors'] += record['status'] != 'ok'
+            for key in ('py_peak_mb', 'rss_peak_mb', 'rows_in', 'rows_out'):
+                if record[key] is not None:
+                    row[key] = record[key] if row[key] is None else max(row[key], record[key])
+
+        # 기록은 끝난 순서(하위 단계가 먼저)이므로 시작 순서(seq)로 정렬
+        return sorted(rows.values(), key=lambda row: row['seq'])
+
+    def print_summary(self):
+        """
+        단계별 요약 표 출력
+        """
+        rows = self.summary()
+        if not rows:
+            print("⚠️  계측된 단계가 없습니다.")
+            return rows
+
+        def fmt(value, width, spec):
+            return format(value, f">{width}{spec}") if value is not None else format('-', f">{width}")
+
+        print("\n" + "=" * 110)
+        print("⏱️  단계별 계측 요약")
+        print("=" * 110)
+        print(f"   {'단계':<54} {'호출':>4} {'경과(초)':>9} {'CPU(초)':>9} {'힙 고점(MB)':>11} "
+              f"{'RSS(MB)':>8} {'입력 행':>10} {'결과 행':>9}")
+        for row in rows:
+            name = ("  " * row['depth'] + row['stage'])[:56]
+            flag = " ❌" if row['errors'] else ""
+            print(f"   {name:<56} {row['calls']:>4} {row['wall_s']:>9.3f} {row['cpu_s']:>9.3f} "
+                  f"{fmt(row['py_peak_mb'], 13, ',.1f')} {fmt(row['rss_peak_mb'], 8, ',.0f')} "
+                  f"{fmt(row['rows_in'], 10, ',')} {fmt(row['rows_out'], 9, ',')}{flag}")
+
+        top = [record for record in self.records if record['depth'] == 0]
+        print(f"\n   최상위 단계 합계: {sum(record['wall_s'] for record in top):.2f}초 "
+              f"(CPU {sum(record['cpu_s'] for record in top):.2f}초)")
+        return rows
+
+    def dump_slowest_profile(self, filepath, top_n=15):
+        """
+        가장 느린 최상위 단계의 cProfile 통계 저장 및 상위 함수 출력
+
+        Returns:
+            str: 저장한 .pstats 경로 (profile=False였거나 기록이 없으면 None)
+        """
+        if self._slowest is None:
+            return None
+
+        wall, name, profiler = self._slowest
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        profiler.dump_stats(filepath)
+
+        buffer = io.StringIO()
+        pstats.Stats(profiler, stream=buffer).sort_stats('cumulative').print_stats(top_n)
+        print(f"\n🔬 가장 느린 단계: {name} ({wall:.2f}초) - 누적 시간 상위 {top_n}개 함수")
+        print(buffer.getvalue().rstrip())
+        print(f"\n💾 cProfile 저장: {filepath} (python -m pstats {filepath})")
+        return filepath
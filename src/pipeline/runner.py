@@ -0,0 +1,264 @@
+"""
+의존 관계 그래프(DAG) 기반 파이프라인 실행기
+
+- 단계(Stage)마다 입력(파라미터 + 상위 단계 키)의 해시를 캐시 키로 사용
+- 캐시 기록(manifest)의 키가 같고 출력 파일이 모두 남아 있으면 실행하지 않고 건너뜀
+- 상위 단계가 끝난 단계부터 프로세스 풀에 제출 (서로 독립인 단계는 병렬 실행)
+- 단계 출력(print)은 단계별 로그 파일로 보내고, 끝나면 단계별 시간 요약을 남김
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+
+# 단계 코드가 바뀌어 캐시를 모두 무효화해야 할 때 올림
+PIPELINE_VERSION = 1
+
+STATUS_RUN = '실행'
+STATUS_CACHED = '캐시'
+STATUS_FAILED = '실패'
+STATUS_SKIPPED = '건너뜀'
+
+
+class Stage:
+    """
+    파이프라인 단계 하나
+
+    Args:
+        name (str): 고유 이름 (예: 'preprocess:2024-08')
+        func (callable): 모듈 최상위 함수 func(inputs, **params) -> 출력 dict
+            inputs는 상위 단계 이름 → 그 단계의 출력 dict
+            출력 dict 값 중 문자열 경로는 캐시 유효성 검사 대상 (파일/폴더가 있어야 함)
+        deps (list): 상위 단계 이름 목록
+        params (dict): 캐시 키에 들어가는 파라미터 (JSON 직렬화 가능해야 함)
+        key_func (callable): 입력 파일 내용 등 파라미터 밖의 입력을 키에 넣을 때 key_func(params) -> str
+        always_run (bool): 캐시와 관계없이 항상 실행
+    """
+
+    def __init__(self, name, func, deps=(), params=None, key_func=None, always_run=False):
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.params = params or {}
+        self.key_func = key_func
+        self.always_run = always_run
+
+    @property
+    def kind(self):
+        return self.name.split(':', 1)[0]
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """
+    파일 내용 해시 (blake2b, 16바이트)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _output_paths(outputs):
+    return [value for value in outputs.values() if isinstance(value, str)] + [
+        path for value in outputs.values() if isinstance(value, (list, tuple))
+        for path in value if isinstance(path, str)]
+
+
+def _run_stage(func, inputs, params, log_path):
+    """
+    단계 함수 실행 (프로세스 풀 작업 단위, 출력은 로그 파일로)
+
+    Returns:
+        tuple: (출력 dict, 실행 시간(초))
+    """
+    started = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log, \
+            contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        outputs = func(inputs, **params)
+    return outputs, time.perf_counter() - started
+
+
+class PipelineRunner:
+    """
+    단계 그래프 실행기
+
+    Args:
+        cache_dir (str): 캐시 기록/로그 폴더
+        max_workers (int): 최대 프로세스 수 (1이면 현재 프로세스에서 순서대로 실행)
+        force (bool): 캐시를 무시하고 모든 단계 다시 실행
+    """
+
+    def __init__(self, cache_dir="data/processed/pipeline/", max_workers=None, force=False):
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.force = force
+        self.stages = {}
+        self.results = []
+        self.outputs = {}
+        os.makedirs(os.path.join(cache_dir, 'manifests'), exist_ok=True)
+        os.makedirs(os.path.join(cache_dir, 'logs'), exist_ok=True)
+
+    def add(self, stage):
+        """
+        단계 추가 (상위 단계가 먼저 추가되어 있어야 함)
+        """
+        missing = [dep for dep in stage.deps if dep not in self.stages]
+        if missing:
+            raise ValueError(f"{stage.name}: 알 수 없는 상위 단계 {', '.join(missing)}")
+        self.stages[stage.name] = stage
+        return stage
+
+    def _file_stem(self, name):
+        return name.replace(':', '_').replace(os.sep, '_')
+
+    def _manifest_path(self, name):
+        return os.path.join(self.cache_dir, 'manifests', f"{self._file_stem(name)}.json")
+
+    def _log_path(self, name):
+        return os.path.join(self.cache_dir, 'logs', f"{self._file_stem(name)}.log")
+
+    def _stage_key(self, stage, dep_keys):
+        """
+        캐시 키 = 단계 이름 + 파라미터 + 상위 단계 키 (+ key_func 결과)의 해시
+        """
+        payload = {
+            'version': PIPELINE_VERSION,
+            'stage': stage.name,
+            'params': stage.params,
+            'deps': [dep_keys[dep] for dep in stage.deps],
+            'extra': stage.key_func(stage.params) if stage.key_func else None,
+        }
+        text = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _load_manifest(self, name):
+        path = self._manifest_path(name)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_manifest(self, name, key, outputs, seconds):
+        path = self._manifest_path(name)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'outputs': outputs, 'seconds': seconds,
+                       'finished': datetime.now().isoformat(timespec='seconds')},
+                      f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def _cached_outputs(self, stage, key):
+        """
+        같은 키로 만든 출력이 모두 남아 있으면 그 출력 dict, 아니면 None
+        """
+        if self.force or stage.always_run:
+            return None
+        manifest = self._load_manifest(stage.name)
+        if manifest is None or manifest['key'] != key:
+            return None
+        if not all(os.path.exists(path) for path in _output_paths(manifest['outputs'])):
+            return None
+        return manifest['outputs']
+
+    def _finish(self, stage, status, seconds=0.0, error=''):
+        self.results.append({
+            'STAGE': stage.kind,
+            'NAME': stage.name,
+            'STATUS': status,
+            'SECONDS': round(seconds, 3),
+            'ERROR': error,
+        })
+        timing = f" {seconds:.2f}초" if status == STATUS_RUN else ""
+        icon = {STATUS_RUN: '✅', STATUS_CACHED: '♻️ ', STATUS_FAILED: '❌', STATUS_SKIPPED: '⏭️ '}[status]
+        detail = f" - {error}" if error else ""
+        print(f"   {icon} {stage.name:<28} {status}{timing}{detail}")
+
+    def run(self):
+        """
+        모든 단계 실행
+
+        Returns:
+            list: 단계별 결과 dict (STAGE, NAME, STATUS, SECONDS, ERROR)
+        """
+        self.results = []
+        keys = {}
+        outputs = {}
+        failed = set()
+        remaining = dict(self.stages)
+        running = {}
+
+        pool = ProcessPoolExecutor(max_workers=self.max_workers) if self.max_workers > 1 else None
+        try:
+            while remaining or running:
+                progressed = False
+                for name, stage in list(remaining.items()):
+                    if any(dep in failed for dep in stage.deps):
+                        del remaining[name]
+                        failed.add(name)
+                        self._finish(stage, STATUS_SKIPPED, error='상위 단계 실패')
+                        progressed = True
+                        continue
+                    if not all(dep in outputs for dep in stage.deps):
+                        continue
+
+                    del remaining[name]
+                    progressed = True
+                    try:
+                        keys[name] = self._stage_key(stage, keys)
+                    except Exception as e:
+                        failed.add(name)
+                        self._finish(stage, STATUS_FAILED, error=f"{type(e).__name__}: {e}")
+                        continue
+
+                    cached = self._cached_outputs(stage, keys[name])
+                    if cached is not None:
+                        outputs[name] = cached
+                        self._finish(stage, STATUS_CACHED)
+                        continue
+
+                    inputs = {dep: outputs[dep] for dep in stage.deps}
+                    args = (stage.func, inputs, stage.params, self._log_path(name))
+                    if pool is None:
+                        try:
+                            outputs[name], seconds = _run_stage(*args)
+                        except Exception as e:
+                            failed.add(name)
+                            self._log_error(name, e)
+                            self._finish(stage, STATUS_FAILED, error=f"{type(e).__name__}: {e}")
+                            continue
+                        self._save_manifest(name, keys[name], outputs[name], seconds)
+                        self._finish(stage, STATUS_RUN, seconds)
+                    else:
+                        running[pool.submit(_run_stage, *args)] = stage
+
+                if running:
+                    done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        stage = running.pop(future)
+                        try:
+                            outputs[stage.name], seconds = future.result()
+                        except Exception as e:
+                            failed.add(stage.name)
+                            self._log_error(stage.name, e)
+                            self._finish(stage, STATUS_FAILED, error=f"{type(e).__name__}: {e}")
+                            continue
+                        self._save_manifest(stage.name, keys[stage.name], outputs[stage.name], seconds)
+                        self._finish(stage, STATUS_RUN, seconds)
+                elif not progressed and remaining:
+                    raise ValueError(f"순환 의존 관계: {', '.join(remaining)}")
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        self.outputs = outputs
+        return self.results
+
+    def _log_error(self, name, error):
+        with open(self._log_path(name), 'a', encoding='utf-8') as log:
+            log.write("\n" + "".join(traceback.format_exception(type(error), error, error.__traceback__)))
@@ -0,0 +1,219 @@
+"""
+월별 분석 파이프라인 단계 정의
+
+collect → ingest → preprocess → (analyze, render) 를 달마다 만들고,
+여러 달이면 모든 preprocess 뒤에 월별 비교(compare) 단계를 붙인다.
+
+- collect: data/raw/subway_hourly_YYYY-MM.csv가 없을 때만 API로 수집 (SEOUL_API_KEY 필요)
+- ingest: CSV를 읽어 pickle로 저장 (캐시 키에 CSV 내용 해시 포함 → 파일이 바뀌면 다시 실행)
+- preprocess: 무결성 검사 + 전처리 결과 저장
+- analyze: 종합 보고서 (CSV + HTML)
+- render: 차트 일괄 생성 (matplotlib)
+- compare: 월별 비교 CSV
+
+단계 함수는 프로세스 풀에서 실행되므로 모듈 최상위 함수이고, 무거운 모듈은 함수 안에서 import한다.
+"""
+
+import os
+
+from .runner import Stage, file_digest
+
+STAGE_KINDS = ('collect', 'ingest', 'preprocess', 'analyze', 'render', 'compare')
+TARGET_STAGES = ('analyze', 'render', 'compare')
+
+
+def _shift_month(year_month, offset):
+    year, month = (int(part) for part in year_month.split('-'))
+    index = year * 12 + (month - 1) + offset
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def parse_months(text):
+    """
+    월 범위 문자열 해석
+
+    '2024-01:2024-06' (범위, 양 끝 포함), '2024-01,2024-03' (목록), '2024-08' (한 달)
+
+    Returns:
+        list: 'YYYY-MM' 목록 (정렬, 중복 제거)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 범위가 거꾸로일 때
+    """
+    months = set()
+    for part in (item.strip() for item in text.split(',')):
+        if not part:
+            continue
+        start, _, end = part.partition(':')
+        for value in (start, end or start):
+            year, sep, month = value.partition('-')
+            if not (sep and len(year) == 4 and year.isdigit() and month.isdigit() and 1 <= int(month) <= 12):
+                raise ValueError(f"잘못된 월 형식: {value} (YYYY-MM)")
+        start, end = _shift_month(start, 0), _shift_month(end or start, 0)
+        if end < start:
+            raise ValueError(f"월 범위가 거꾸로입니다: {part}")
+        month = start
+        while month <= end:
+            months.add(month)
+            month = _shift_month(month, 1)
+    return sorted(months)
+
+
+def raw_csv_path(raw_dir, month):
+    return os.path.join(raw_dir, f"subway_hourly_{month}.csv")
+
+
+def _load_analyzer(csv, processed_path):
+    """
+    preprocess 단계 결과로 전처리가 끝난 분석기 복원
+    """
+    import pandas as pd
+    from ..analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
+
+    saved = pd.read_pickle(processed_path)
+    analyzer = SubwayPatternAnalyzer(csv)
+    analyzer.df_processed = saved['df_processed']
+    analyzer.validation_report = saved['validation_report']
+    return analyzer
+
+
+def _new_files(save_path, before):
+    return sorted(os.path.join(save_path, name) for name in set(os.listdir(save_path)) - before)
+
+
+def collect_month(inputs, month, raw_dir):
+    """
+    월별 원본 CSV 확보 (이미 있으면 수집하지 않음)
+    """
+    csv = raw_csv_path(raw_dir, month)
+    if not os.path.exists(csv):
+        from dotenv import load_dotenv
+        from ..data_collection.seoul_subway_data_collector import SeoulSubwayDataCollector
+
+        load_dotenv()
+        api_key = os.getenv('SEOUL_API_KEY')
+        if not api_key:
+            raise RuntimeError(f"{csv} 없음, API 키(SEOUL_API_KEY)가 없어 수집할 수 없습니다")
+        if SeoulSubwayDataCollector(api_key).get_subway_monthly_data(month, raw_dir) is None:
+            raise RuntimeError(f"{month} 데이터 수집 실패")
+    return {'csv': csv}
+
+
+def ingest_month(inputs, month, csv, out):
+    """
+    CSV 읽기 → pickle 저장 (이후 단계는 CSV 파싱 없이 pickle만 읽음)
+    """
+    from ..analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
+
+    df = SubwayPatternAnalyzer(csv).load_data()
+    if df is None:
+        raise RuntimeError(f"{csv} 로드 실패")
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    df.to_pickle(out)
+    return {'raw': out, 'rows': len(df)}
+
+
+def preprocess_month(inputs, month, csv, out, validate=True):
+    """
+    무결성 검사 + 전처리 결과 저장
+    """
+    import pandas as pd
+    from ..analysis.subway_pattern_analyzer import SubwayPatternAnalyzer
+
+    analyzer = SubwayPatternAnalyzer(csv)
+    analyzer.df = pd.read_pickle(inputs[f'ingest:{month}']['raw'])
+    if analyzer.preprocess_data(validate=validate, year_month=month) is None:
+        raise RuntimeError(f"{month} 전처리 실패")
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    pd.to_pickle({'df_processed': analyzer.df_processed,
+                  'validation_report': analyzer.validation_report}, out)
+    return {'processed': out, 'rows': len(analyzer.df_processed)}
+
+
+def analyze_month(inputs, month, csv, save_path, html=True):
+    """
+    종합 보고서 (CSV + HTML) 생성
+    """
+    analyzer = _load_analyzer(csv, inputs[f'preprocess:{month}']['processed'])
+    os.makedirs(save_path, exist_ok=True)
+    before = set(os.listdir(save_path))
+    analyzer.generate_summary_report(save_path, html=html)
+    return {'files': _new_files(save_path, before)}
+
+
+def render_month(inputs, month, csv, save_path, profile='standard'):
+    """
+    차트 일괄 생성 (작업 프로세스 안에서는 순차 렌더링)
+    """
+    from ..visualization.subway_visualizer import SubwayVisualizer, _init_render_worker
+
+    _init_render_worker()
+    analyzer = _load_analyzer(csv, inputs[f'preprocess:{month}']['processed'])
+    visualizer = SubwayVisualizer(save_path=save_path, profile=profile)
+    charts = visualizer.generate_all_charts(analyzer)
+    return {'files': sorted(path for path in charts.values() if path)}
+
+
+def compare_stage(inputs, months, csvs, save_path):
+    """
+    월별 비교 CSV 저장
+    """
+    analyzers = [_load_analyzer(csv, inputs[f'preprocess:{month}']['processed'])
+                 for month, csv in zip(months, csvs)]
+    comparison = analyzers[0].compare_months(analyzers[1:])
+    if comparison is None:
+        raise RuntimeError("월별 비교 실패")
+    return {'files': sorted(comparison.save(save_path).values())}
+
+
+def _csv_digest(params):
+    return file_digest(params['csv'])
+
+
+def build_pipeline(runner, months, raw_dir="data/raw/", results_dir="results/pipeline/",
+                   targets=TARGET_STAGES, profile='standard', validate=True, html=True):
+    """
+    달별 단계 그래프를 실행기에 추가
+
+    Args:
+        runner (PipelineRunner): 실행기
+        months (list): 'YYYY-MM' 목록
+        raw_dir (str): 원본 CSV 폴더
+        results_dir (str): 보고서/차트 저장 폴더 (달마다 하위 폴더)
+        targets (tuple): 최종 단계 ('analyze', 'render', 'compare' 중 선택)
+        profile (str): 차트 저장 프로파일
+        validate (bool): 전처리 시 무결성 검사 수행
+        html (bool): 종합 보고서에 HTML 포함
+
+    Returns:
+        PipelineRunner: 단계가 추가된 실행기
+    """
+    work_dir = os.path.join(runner.cache_dir, 'data')
+    for month in months:
+        csv = raw_csv_path(raw_dir, month)
+        month_dir = os.path.join(results_dir, month)
+        runner.add(Stage(f'collect:{month}', collect_month,
+                         params={'month': month, 'raw_dir': raw_dir}))
+        runner.add(Stage(f'ingest:{month}', ingest_month, deps=[f'collect:{month}'],
+                         params={'month': month, 'csv': csv,
+                                 'out': os.path.join(work_dir, f"raw_{month}.pkl")},
+                         key_func=_csv_digest))
+        runner.add(Stage(f'preprocess:{month}', preprocess_month, deps=[f'ingest:{month}'],
+                         params={'month': month, 'csv': csv, 'validate': validate,
+                                 'out': os.path.join(work_dir, f"processed_{month}.pkl")}))
+        if 'analyze' in targets:
+            runner.add(Stage(f'analyze:{month}', analyze_month, deps=[f'preprocess:{month}'],
+                             params={'month': month, 'csv': csv, 'html': html,
+                                     'save_path': os.path.join(month_dir, 'reports')}))
+        if 'render' in targets:
+            runner.add(Stage(f'render:{month}', render_month, deps=[f'preprocess:{month}'],
+                             params={'month': month, 'csv': csv, 'profile': profile,
+                                     'save_path': os.path.join(month_dir, 'charts')}))
+
+    if 'compare' in targets and len(months) > 1:
+        runner.add(Stage(f'compare:{months[0]}~{months[-1]}', compare_stage,
+                         deps=[f'preprocess:{month}' for month in months],
+                         params={'months': list(months),
+                                 'csvs': [raw_csv_path(raw_dir, month) for month in months],
+                                 'save_path': os.path.join(results_dir, 'comparison')}))
+    return runner
@@ -0,0 +1,200 @@
+"""
+내용 주소 기반 차트 캐시
+
+차트 입력 데이터와 그리기 파라미터의 해시를 키로, 이미 렌더링한 PNG 파일을 재사용한다.
+색인은 저장 폴더의 JSON 파일 하나에 두고, 오래 쓰지 않은 렌더링부터 (LRU)
+용량/개수 한도를 넘지 않도록 삭제한다.
+캐시 적중(마지막 사용 시각 갱신)은 색인에 바로 쓰지 않고 flush() 또는 프로세스 종료 시 한 번에 쓴다.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import time
+import weakref
+
+import numpy as np
+import pandas as pd
+
+INDEX_FILENAME = '.chart_cache.json'
+
+
+def _update_digest(digest, value):
+    """
+    값 하나를 해시에 반영 (DataFrame/Series/ndarray는 내용 기준)
+    """
+    if isinstance(value, pd.DataFrame):
+        digest.update(b'DataFrame')
+        digest.update(repr((list(map(str, value.columns)), list(map(str, value.dtypes)))).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, pd.Series):
+        digest.update(b'Series')
+        digest.update(repr((str(value.name), str(value.dtype))).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(b'ndarray')
+        digest.update(repr((value.shape, str(value.dtype))).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b'dict')
+        for key in sorted(value, key=str):
+            digest.update(str(key).encode())
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(type(value).__name__.encode())
+        for item in value:
+            _update_digest(digest, item)
+    else:
+        digest.update(repr(value).encode())
+
+
+def chart_key(name, params):
+    """
+    차트 이름과 파라미터 dict의 내용 해시
+
+    Returns:
+        str: 32자리 16진수 키
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(name.encode())
+    _update_digest(digest, params)
+    return digest.hexdigest()
+
+
+class ChartCache:
+    """
+    렌더링한 차트 파일 캐시 (키 → 파일 경로, LRU 정리)
+    """
+
+    def __init__(self, cache_dir="results/charts/", max_bytes=200 * 1024 ** 2, max_entries=None):
+        """
+        Args:
+            cache_dir (str): 색인 파일을 둘 폴더 (보통 차트 저장 폴더)
+            max_bytes (int): 캐시된 파일 총 용량 한도
+            max_entries (int): 캐시 항목 수 한도 (None이면 제한 없음)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.index_path = os.path.join(cache_dir, INDEX_FILENAME)
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+            # 한도가 바뀌었을 수 있으므로 시작할 때 한 번 정리
+            if self.prune():
+                self._save()
+
+        # 배치 끝에 flush()를 부르지 않은 경우를 위해 종료 시 한 번 저장 (객체 수명은 늘리지 않음)
+        ref = weakref.ref(self)
+        atexit.register(lambda: ref() is not None and ref().flush())
+
+    def get(self, key, save_path=None, save_filename=None):
+        """
+        캐시 조회
+
+        저장 파일명이 따로 주어졌고 캐시 파일과 다르면 캐시 파일을 그 이름으로 복사한다.
+
+        Returns:
+            str: 파일 경로 (없으면 None)
+        """
+        entry = self.entries.get(key)
+        if entry is None or not os.path.exists(entry['path']):
+            if entry is not None:
+                del self.entries[key]
+                self._dirty = True
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entry['last_used'] = time.time()
+        self._dirty = True
+
+        filepath = entry['path']
+        if save_filename:
+            target = os.path.join(save_path or self.cache_dir, save_filename)
+            if os.path.abspath(target) != os.path.abspath(filepath):
+                shutil.copyfile(filepath, target)
+                return target
+        return filepath
+
+    def put(self, key, filepath):
+        """
+        렌더링 결과 등록 후 한도를 넘으면 오래된 항목부터 정리
+        """
+        # 같은 파일을 덮어쓴 이전 항목은 내용이 달라졌으므로 제거
+        stale = [k for k, entry in self.entries.items()
+                 if k != key and os.path.abspath(entry['path']) == os.path.abspath(filepath)]
+        for k in stale:
+            del self.entries[k]
+
+        self.entries[key] = {
+            'path': filepath,
+            'size': os.path.getsize(filepath),
+            'last_used': time.time(),
+        }
+        self.prune(keep=key)
+        self._save()
+
+    def prune(self, keep=None):
+        """
+        LRU 정리 (용량/개수 한도를 넘는 동안 가장 오래 쓰지 않은 파일 삭제)
+
+        Args:
+            keep (str): 삭제하지 않을 키 (방금 등록한 항목)
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        order = sorted(self.entries, key=lambda k: self.entries[k]['last_used'])
+        total = sum(entry['size'] for entry in self.entries.values())
+        removed = 0
+
+        for key in order:
+            over_bytes = self.max_bytes is not None and total > self.max_bytes
+            over_count = self.max_entries is not None and len(self.entries) > self.max_entries
+            if not (over_bytes or over_count):
+                break
+            if key == keep:
+                continue
+            entry = self.entries.pop(key)
+            total -= entry['size']
+            if os.path.exists(entry['path']):
+                os.remove(entry['path'])
+            removed += 1
+
+        return removed
+
+    def clear(self):
+        """
+        캐시된 파일과 색인 모두 삭제
+        """
+        for entry in self.entries.values():
+            if os.path.exists(entry['path']):
+                os.remove(entry['path'])
+        self.entries = {}
+        self._save()
+
+    def flush(self):
+        """
+        적중으로 바뀐 색인(마지막 사용 시각 등)이 있으면 저장
+        """
+        if self._dirty:
+            self._save()
+
+    def _save(self):
+        self._dirty = False
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.index_path)
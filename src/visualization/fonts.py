@@ -0,0 +1,50 @@
+"""
+matplotlib 한글 폰트 설정
+
+운영체제별 폰트 탐색은 모듈 import 시점이 아니라 첫 차트를 그리기 직전에
+한 번만 수행하고 결과를 프로세스 안에서 캐시한다 (렌더링 작업 프로세스에서도 호출).
+"""
+
+import functools
+import os
+import platform
+
+
+@functools.lru_cache(maxsize=None)
+def korean_font_name():
+    """
+    운영체제별 한글 폰트 이름 (프로세스당 한 번만 탐색)
+
+    Returns:
+        str: 폰트 이름 (찾지 못하면 None)
+    """
+    system = platform.system()
+    if system == 'Windows':
+        font_path = r'C:\Windows\Fonts\malgun.ttf'  # Malgun Gothic 경로
+        if os.path.exists(font_path):
+            import matplotlib.font_manager as fm
+            return fm.FontProperties(fname=font_path).get_name()
+        print("⚠️ Malgun Gothic 폰트를 찾을 수 없습니다.")
+        return None
+    if system == 'Darwin':  # Mac
+        return 'AppleGothic'
+    return 'NanumGothic'  # Linux
+
+
+def setup_korean_font():
+    """
+    한글 폰트와 마이너스 기호 설정 적용
+
+    seaborn 스타일 설정이 font.family를 덮어쓰므로 스타일을 바꾼 뒤마다 호출한다.
+    (폰트 탐색은 캐시되어 있어 반복 호출 비용은 rcParams 대입뿐)
+
+    Returns:
+        str: 설정된 폰트 이름 (찾지 못하면 None)
+    """
+    import matplotlib.pyplot as plt
+
+    font_name = korean_font_name()
+    if font_name:
+        plt.rcParams['font.family'] = font_name
+    plt.rcParams['axes.unicode_minus'] = False
+    return font_name
@@ -0,0 +1,589 @@
+"""
+서버 없이 열어 볼 수 있는 단일 HTML 보고서
+
+분석 결과를 작은 집계(시간대별, 요일별, 역 순위, 역 × 시간대 행렬)로 미리 계산해
+타입 배열(little-endian 바이트를 base64로 인코딩)로 HTML 안에 넣고, 차트는 브라우저에서
+내장 스크립트(SVG / canvas)로 그린다. 외부 라이브러리나 이미지 렌더링이 필요 없다.
+
+- 배열마다 값 범위에 맞는 가장 작은 형식(uint8/16/32, float32/64)을 고름
+- 파일 크기 한도(max_bytes)를 만들 때 확인하고, 넘으면 저장하지 않고 ValueError
+"""
+
+import base64
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+
+DEFAULT_MAX_BYTES = 1024 ** 2  # 1MB
+
+_INT_TYPES = (np.uint8, np.uint16, np.uint32, np.int8, np.int16, np.int32)
+
+
+def encode_array(values):
+    """
+    숫자 배열을 HTML 삽입용 타입 배열로 인코딩
+
+    정수 값이면 범위에 맞는 가장 작은 정수 형식, 아니면 float32
+    (32비트 정수 범위를 넘는 정수는 float64로 정확하게 보존)
+
+    Returns:
+        dict: {'dtype': JS 타입 배열 이름 기준 형식, 'shape': 모양, 'data': base64 문자열}
+    """
+    array = np.asarray(values)
+    if array.dtype.kind not in 'iubf':
+        array = array.astype(np.float64)
+
+    is_integral = array.dtype.kind in 'iub' or (
+        np.isfinite(array).all() and np.array_equal(array, np.round(array))
+    )
+
+    dtype = np.dtype(np.float32)
+    if is_integral:
+        lo = array.min() if array.size else 0
+        hi = array.max() if array.size else 0
+        dtype = np.dtype(np.float64)
+        for candidate in _INT_TYPES:
+            info = np.iinfo(candidate)
+            if info.min <= lo and hi <= info.max:
+                dtype = np.dtype(candidate)
+                break
+
+    data = np.ascontiguousarray(array, dtype=dtype.newbyteorder('<'))
+    return {
+        'dtype': dtype.name,
+        'shape': list(array.shape),
+        'data': base64.b64encode(data.tobytes()).decode('ascii'),
+    }
+
+
+def collect_report_data(analyzer, weekday_df=None, max_stations=None, start_date=None, end_date=None,
+                        title='서울시 지하철 이용 패턴 보고서'):
+    """
+    보고서에 넣을 집계 계산 (역 × 시간대 행렬 하나에서 시간대별/역 순위를 함께 계산)
+
+    Args:
+        analyzer (SubwayPatternAnalyzer): 전처리가 끝난 분석기
+        weekday_df (DataFrame): analyze_weekday_pattern 결과 (None이면 새로 계산)
+        max_stations (int): 역 순위/히트맵에 넣을 상위 역 수 (None이면 전체 역)
+        start_date, end_date: 분석 기간 (포함, None이면 전체 기간)
+        title (str): 보고서 제목
+
+    Returns:
+        dict: JSON으로 직렬화할 보고서 데이터 (없으면 None)
+    """
+    boarding = analyzer.get_station_hour_matrix('boarding', start_date=start_date, end_date=end_date)
+    alighting = analyzer.get_station_hour_matrix('alighting', start_date=start_date, end_date=end_date)
+    if boarding is None or alighting is None:
+        return None
+
+    if weekday_df is None:
+        weekday_df = analyzer.analyze_weekday_pattern(start_date, end_date)
+
+    on = boarding.to_numpy()
+    off = alighting.to_numpy()
+    totals = on.sum(axis=1) + off.sum(axis=1)
+
+    # 총 이용객 내림차순 = 역 순위 (이름 배열 순서가 곧 순위)
+    order = np.argsort(-totals, kind='stable')
+    if max_stations is not None:
+        order = order[:max_stations]
+
+    cube = analyzer.get_prefix_index().cube
+    d0, d1 = cube.date_bounds(start_date, end_date)
+    dates = cube.dates[d0:d1]
+
+    data = {
+        'meta': {
+            'title': title,
+            'generated': datetime.now().strftime("%Y-%m-%d %H:%M"),
+            'source': os.path.basename(analyzer.data_path) if analyzer.data_path else '',
+            'start': str(dates[0])[:10] if len(dates) else '',
+            'end': str(dates[-1])[:10] if len(dates) else '',
+            'n_days': int(len(dates)),
+            'n_stations': int(len(order)),
+            'n_stations_total': int(len(totals)),
+            'total_boarding': float(on.sum()),
+            'total_alighting': float(off.sum()),
+        },
+        'hours': encode_array(np.asarray(boarding.columns, dtype=np.int64)),
+        'hourly': {
+            'boarding': encode_array(on.sum(axis=0)),
+            'alighting': encode_array(off.sum(axis=0)),
+        },
+        'stations': {
+            'names': [str(name) for name in boarding.index[order]],
+            'boarding': encode_array(on[order]),
+            'alighting': encode_array(off[order]),
+        },
+    }
+
+    if weekday_df is not None:
+        data['weekday'] = {
+            'names': [str(name) for name in weekday_df.index],
+            'boarding': encode_array(weekday_df['평균_승차'].to_numpy(dtype=np.float64)),
+            'alighting': encode_array(weekday_df['평균_하차'].to_numpy(dtype=np.float64)),
+            'days': encode_array(weekday_df['데이터_일수'].fillna(0).to_numpy(dtype=np.int64)),
+        }
+
+    return data
+
+
+def render_html(data):
+    """
+    보고서 데이터를 HTML 문서 문자열로 변환
+    """
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    payload = payload.replace('</', '<\\/')  # </script>로 스크립트가 끊기지 않도록
+    title = (data['meta']['title']
+             .replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;'))
+    return _TEMPLATE.replace('__TITLE__', title).replace('__DATA__', payload)
+
+
+def section_sizes(data):
+    """
+    보고서 데이터 항목별 크기 (bytes, 한도 초과 원인 확인용)
+    """
+    return {key: len(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+            for key, value in data.items()}
+
+
+def write_html_report(analyzer, save_path="results/", filename=None, max_bytes=DEFAULT_MAX_BYTES,
+                      max_stations=None, weekday_df=None, start_date=None, end_date=None,
+                      title='서울시 지하철 이용 패턴 보고서'):
+    """
+    단일 HTML 보고서 저장
+
+    Args:
+        analyzer (SubwayPatternAnalyzer): 전처리가 끝난 분석기
+        save_path (str): 저장 폴더
+        filename (str): 파일명 (None이면 summary_report_타임스탬프.html)
+        max_bytes (int): 파일 크기 한도 (None이면 확인 안 함)
+        max_stations (int): 역 순위/히트맵에 넣을 상위 역 수 (None이면 전체 역)
+        weekday_df (DataFrame): analyze_weekday_pattern 결과 (None이면 새로 계산)
+
+    Returns:
+        str: 저장한 파일 경로 (데이터가 없으면 None)
+
+    Raises:
+        ValueError: 파일 크기가 한도를 넘을 때 (파일은 저장하지 않음)
+    """
+    data = collect_report_data(analyzer, weekday_df=weekday_df, max_stations=max_stations,
+                               start_date=start_date, end_date=end_date, title=title)
+    if data is None:
+        print("❌ HTML 보고서에 넣을 데이터가 없습니다.")
+        return None
+
+    html = render_html(data)
+    size = len(html.encode('utf-8'))
+    if max_bytes is not None and size > max_bytes:
+        detail = ", ".join(f"{key} {nbytes / 1024:,.0f}KB" for key, nbytes in section_sizes(data).items())
+        raise ValueError(f"HTML 보고서 크기 {size / 1024:,.0f}KB가 한도 {max_bytes / 1024:,.0f}KB를 "
+                         f"넘습니다 ({detail}). max_stations로 역 수를 줄이세요.")
+
+    os.makedirs(save_path, exist_ok=True)
+    if filename is None:
+        filename = f"summary_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+    filepath = os.path.join(save_path, filename)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(html)
+
+    budget = f" / 한도 {max_bytes / 1024:,.0f}KB" if max_bytes is not None else ""
+    print(f"✅ HTML 보고서 저장: {filepath} ({size / 1024:,.0f}KB{budget}, "
+          f"역 {data['meta']['n_stations']}/{data['meta']['n_stations_total']}개)")
+    return filepath
+
+
+_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>__TITLE__</title>
+<style>
+  body { font-family: 'Malgun Gothic', 'AppleGothic', 'NanumGothic', sans-serif; margin: 0;
+         background: #f4f5f7; color: #222; }
+  header { background: #1f3b57; color: #fff; padding: 18px 28px; }
+  header h1 { margin: 0 0 6px; font-size: 22px; }
+  header p { margin: 0; font-size: 13px; opacity: 0.85; }
+  main { display: grid; grid-template-columns: repeat(auto-fit, minmax(520px, 1fr)); gap: 16px;
+         padding: 16px 28px 28px; }
+  .card { background: #fff; border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,0.12); padding: 14px 18px; }
+  .card.wide { grid-column: 1 / -1; }
+  .card h2 { font-size: 16px; margin: 0 0 10px; }
+  .stats { display: flex; flex-wrap: wrap; gap: 12px; }
+  .stat { flex: 1 1 140px; background: #f0f4f8; border-radius: 6px; padding: 10px 12px; }
+  .stat b { display: block; font-size: 20px; margin-top: 4px; }
+  .controls { display: flex; flex-wrap: wrap; gap: 10px; align-items: center; font-size: 13px;
+              margin-bottom: 8px; }
+  .legend span { cursor: pointer; margin-right: 12px; user-select: none; }
+  .legend span.off { opacity: 0.35; }
+  .legend i { display: inline-block; width: 12px; height: 12px; margin-right: 4px; vertical-align: -1px; }
+  svg text { font-size: 11px; fill: #444; }
+  .axis line, .axis path { stroke: #ccc; }
+  #tooltip { position: fixed; pointer-events: none; background: rgba(20,20,20,0.88); color: #fff;
+             font-size: 12px; padding: 6px 8px; border-radius: 4px; display: none; white-space: pre; }
+  canvas { width: 100%; image-rendering: pixelated; cursor: crosshair; }
+</style>
+</head>
+<body>
+<header>
+  <h1 id="title"></h1>
+  <p id="subtitle"></p>
+</header>
+<main>
+  <section class="card wide">
+    <h2>요약</h2>
+    <div class="stats" id="stats"></div>
+  </section>
+  <section class="card">
+    <h2>시간대별 이용 패턴 <span id="hourly-scope"></span></h2>
+    <div class="controls">
+      <label>역 선택 <input id="station-input" list="station-list" placeholder="전체 (역명 입력)"></label>
+      <datalist id="station-list"></datalist>
+      <div class="legend" id="hourly-legend"></div>
+    </div>
+    <svg id="hourly-chart" width="100%" height="300"></svg>
+  </section>
+  <section class="card">
+    <h2>요일별 평균 이용객 (역·일 평균)</h2>
+    <div class="legend" id="weekday-legend"></div>
+    <svg id="weekday-chart" width="100%" height="300"></svg>
+  </section>
+  <section class="card wide">
+    <h2>역별 이용객 순위</h2>
+    <div class="controls">
+      <label>기준 <select id="rank-measure">
+        <option value="total">승하차 합계</option><option value="boarding">승차</option>
+        <option value="alighting">하차</option></select></label>
+      <label>표시 <select id="rank-count">
+        <option>10</option><option selected>20</option><option>50</option></select></label>
+      <span>막대를 누르면 시간대별 차트에 해당 역이 표시됩니다.</span>
+    </div>
+    <svg id="rank-chart" width="100%" height="480"></svg>
+  </section>
+  <section class="card wide">
+    <h2>역 × 시간대 히트맵</h2>
+    <div class="controls">
+      <label>값 <select id="heat-measure">
+        <option value="boarding">승차</option><option value="alighting">하차</option>
+        <option value="total">합계</option></select></label>
+      <label>역 수 <select id="heat-count">
+        <option>30</option><option selected>100</option><option value="0">전체</option></select></label>
+      <label><input type="checkbox" id="heat-normalize"> 역별 최댓값 기준 정규화</label>
+    </div>
+    <canvas id="heatmap"></canvas>
+  </section>
+</main>
+<div id="tooltip"></div>
+<script type="application/json" id="report-data">__DATA__</script>
+<script>
+(function () {
+  'use strict';
+  const DATA = JSON.parse(document.getElementById('report-data').textContent);
+  const TYPES = { uint8: Uint8Array, uint16: Uint16Array, uint32: Uint32Array, int8: Int8Array,
+                  int16: Int16Array, int32: Int32Array, float32: Float32Array, float64: Float64Array };
+  const COLORS = { boarding: '#2E86AB', alighting: '#A23B72', total: '#F18F01' };
+  const LABELS = { boarding: '승차', alighting: '하차', total: '합계' };
+  const SVG_NS = 'http://www.w3.org/2000/svg';
+
+  function decode(encoded) {
+    const binary = atob(encoded.data);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+    return new TYPES[encoded.dtype](bytes.buffer);
+  }
+  const fmt = (v) => Number.isFinite(v) ? Math.round(v).toLocaleString('ko-KR') : '-';
+  const short = (v) => v >= 1e8 ? (v / 1e8).toFixed(1) + '억' : v >= 1e4 ? (v / 1e4).toFixed(0) + '만'
+                                  : Math.round(v).toString();
+
+  const meta = DATA.meta;
+  const hours = Array.from(decode(DATA.hours));
+  const H = hours.length;
+  const names = DATA.stations.names;
+  const S = names.length;
+  const stationOn = decode(DATA.stations.boarding);
+  const stationOff = decode(DATA.stations.alighting);
+  const hourly = { boarding: decode(DATA.hourly.boarding), alighting: decode(DATA.hourly.alighting) };
+
+  function stationValue(measure, s, h) {
+    const i = s * H + h;
+    if (measure === 'boarding') return stationOn[i];
+    if (measure === 'alighting') return stationOff[i];
+    return stationOn[i] + stationOff[i];
+  }
+  const stationTotals = { boarding: new Float64Array(S), alighting: new Float64Array(S), total: new Float64Array(S) };
+  for (let s = 0; s < S; s++) {
+    for (let h = 0; h < H; h++) {
+      stationTotals.boarding[s] += stationOn[s * H + h];
+      stationTotals.alighting[s] += stationOff[s * H + h];
+    }
+    stationTotals.total[s] = stationTotals.boarding[s] + stationTotals.alighting[s];
+  }
+
+  // ---------- 공통 ----------
+  const tooltip = document.getElementById('tooltip');
+  function showTip(event, text) {
+    tooltip.textContent = text;
+    tooltip.style.display = 'block';
+    tooltip.style.left = (event.clientX + 14) + 'px';
+    tooltip.style.top = (event.clientY + 14) + 'px';
+  }
+  function hideTip() { tooltip.style.display = 'none'; }
+  function el(tag, attrs, parent) {
+    const node = document.createElementNS(SVG_NS, tag);
+    for (const key in attrs) node.setAttribute(key, attrs[key]);
+    if (parent) parent.appendChild(node);
+    return node;
+  }
+  function clear(svg) { while (svg.firstChild) svg.removeChild(svg.firstChild); }
+  function legend(container, keys, state, redraw) {
+    container.innerHTML = '';
+    keys.forEach((key) => {
+      const item = document.createElement('span');
+      item.innerHTML = '<i style="background:' + COLORS[key] + '"></i>' + LABELS[key];
+      if (!state[key]) item.className = 'off';
+      item.onclick = () => { state[key] = !state[key]; legend(container, keys, state, redraw); redraw(); };
+      container.appendChild(item);
+    });
+  }
+  function yAxis(svg, x0, x1, y0, y1, maxValue) {
+    const g = el('g', { class: 'axis' }, svg);
+    for (let i = 0; i <= 4; i++) {
+      const y = y1 - (y1 - y0) * i / 4;
+      el('line', { x1: x0, x2: x1, y1: y, y2: y }, g);
+      el('text', { x: x0 - 6, y: y + 4, 'text-anchor': 'end' }, g).textContent = short(maxValue * i / 4);
+    }
+  }
+
+  // ---------- 요약 ----------
+  document.getElementById('title').textContent = meta.title;
+  document.getElementById('subtitle').textContent = meta.start + ' ~ ' + meta.end + ' · ' + meta.source
+    + ' · 생성 ' + meta.generated;
+  [['분석 기간', meta.n_days + '일'], ['역 수', meta.n_stations_total + '개'],
+   ['총 승차', fmt(meta.total_boarding) + '명'], ['총 하차', fmt(meta.total_alighting) + '명'],
+   ['일평균 이용객', fmt((meta.total_boarding + meta.total_alighting) / Math.max(meta.n_days, 1)) + '명']]
+    .forEach(([label, value]) => {
+      const div = document.createElement('div');
+      div.className = 'stat';
+      div.innerHTML = label + '<b></b>';
+      div.querySelector('b').textContent = value;
+      document.getElementById('stats').appendChild(div);
+    });
+
+  // ---------- 시간대별 ----------
+  const hourlySvg = document.getElementById('hourly-chart');
+  const hourlyState = { boarding: true, alighting: true, total: false };
+  let selected = -1;
+
+  function hourlySeries(measure) {
+    const out = new Float64Array(H);
+    for (let h = 0; h < H; h++) {
+      if (selected >= 0) out[h] = stationValue(measure, selected, h);
+      else if (measure === 'total') out[h] = hourly.boarding[h] + hourly.alighting[h];
+      else out[h] = hourly[measure][h];
+    }
+    return out;
+  }
+
+  function drawHourly() {
+    clear(hourlySvg);
+    document.getElementById('hourly-scope').textContent = selected >= 0 ? '- ' + names[selected] : '- 전체';
+    const width = hourlySvg.clientWidth || 600, height = 300;
+    const left = 56, right = 12, top = 10, bottom = 28;
+    const keys = Object.keys(hourlyState).filter((key) => hourlyState[key]);
+    const series = {};
+    let maxValue = 1;
+    keys.forEach((key) => { series[key] = hourlySeries(key); maxValue = Math.max(maxValue, ...series[key]); });
+    const x = (i) => left + (width - left - right) * (H > 1 ? i / (H - 1) : 0.5);
+    const y = (v) => height - bottom - (height - top - bottom) * v / maxValue;
+
+    [[7, 9, '#fff3b0'], [18, 20, '#ffd8a8']].forEach(([a, b, color]) => {
+      const i0 = hours.indexOf(a), i1 = hours.indexOf(b);
+      if (i0 >= 0 && i1 >= 0) el('rect', { x: x(i0), y: top, width: x(i1) - x(i0), height: height - top - bottom,
+                                          fill: color, opacity: 0.6 }, hourlySvg);
+    });
+    yAxis(hourlySvg, left, width - right, top, height - bottom, maxValue);
+    hours.forEach((hour, i) => {
+      if (hour % 3 === 0) el('text', { x: x(i), y: height - 10, 'text-anchor': 'middle' }, hourlySvg)
+        .textContent = String(hour).padStart(2, '0') + '시';
+    });
+    keys.forEach((key) => {
+      const points = Array.from(series[key], (v, i) => x(i) + ',' + y(v)).join(' ');
+      el('polyline', { points: points, fill: 'none', stroke: COLORS[key], 'stroke-width': 2 }, hourlySvg);
+    });
+
+    const guide = el('line', { y1: top, y2: height - bottom, stroke: '#888', 'stroke-dasharray': '3,3',
+                               visibility: 'hidden' }, hourlySvg);
+    const overlay = el('rect', { x: left, y: top, width: width - left - right, height: height - top - bottom,
+                                 fill: 'transparent' }, hourlySvg);
+    overlay.addEventListener('mousemove', (event) => {
+      const box = hourlySvg.getBoundingClientRect();
+      const ratio = (event.clientX - box.left - left) / (width - left - right);
+      const i = Math.max(0, Math.min(H - 1, Math.round(ratio * (H - 1))));
+      guide.setAttribute('x1', x(i)); guide.setAttribute('x2', x(i)); guide.setAttribute('visibility', 'visible');
+      showTip(event, String(hours[i]).padStart(2, '0') + ':00\\n'
+        + keys.map((key) => LABELS[key] + ' ' + fmt(series[key][i]) + '명').join('\\n'));
+    });
+    overlay.addEventListener('mouseleave', () => { guide.setAttribute('visibility', 'hidden'); hideTip(); });
+  }
+
+  const stationInput = document.getElementById('station-input');
+  const stationList = document.getElementById('station-list');
+  names.forEach((name) => { const option = document.createElement('option'); option.value = name;
+                            stationList.appendChild(option); });
+  function selectStation(index) {
+    selected = index;
+    stationInput.value = index >= 0 ? names[index] : '';
+    drawHourly();
+  }
+  stationInput.addEventListener('change', () => selectStation(names.indexOf(stationInput.value.trim())));
+  legend(document.getElementById('hourly-legend'), ['boarding', 'alighting', 'total'], hourlyState, drawHourly);
+
+  // ---------- 요일별 ----------
+  const weekdaySvg = document.getElementById('weekday-chart');
+  const weekdayState = { boarding: true, alighting: true };
+  const weekday = DATA.weekday ? { names: DATA.weekday.names, boarding: decode(DATA.weekday.boarding),
+                                   alighting: decode(DATA.weekday.alighting), days: decode(DATA.weekday.days) }
+                               : null;
+
+  function drawWeekday() {
+    clear(weekdaySvg);
+    if (!weekday) return;
+    const width = weekdaySvg.clientWidth || 600, height = 300;
+    const left = 56, right = 12, top = 10, bottom = 28;
+    const keys = Object.keys(weekdayState).filter((key) => weekdayState[key]);
+    let maxValue = 1;
+    keys.forEach((key) => weekday[key].forEach((v) => { if (Number.isFinite(v)) maxValue = Math.max(maxValue, v); }));
+    yAxis(weekdaySvg, left, width - right, top, height - bottom, maxValue);
+    const slot = (width - left - right) / weekday.names.length;
+    const barWidth = slot * 0.8 / Math.max(keys.length, 1);
+    weekday.names.forEach((name, d) => {
+      el('text', { x: left + slot * (d + 0.5), y: height - 10, 'text-anchor': 'middle' }, weekdaySvg)
+        .textContent = name;
+      keys.forEach((key, k) => {
+        const value = Number.isFinite(weekday[key][d]) ? weekday[key][d] : 0;
+        const barHeight = (height - top - bottom) * value / maxValue;
+        const bar = el('rect', { x: left + slot * d + slot * 0.1 + barWidth * k, y: height - bottom - barHeight,
+                                 width: barWidth, height: barHeight, fill: COLORS[key],
+                                 opacity: d >= 5 ? 0.6 : 0.9 }, weekdaySvg);
+        bar.addEventListener('mousemove', (event) => showTip(event, name + ' ' + LABELS[key] + '\\n'
+          + fmt(weekday[key][d]) + '명 (역·일 ' + fmt(weekday.days[d]) + '건)'));
+        bar.addEventListener('mouseleave', hideTip);
+      });
+    });
+  }
+  legend(document.getElementById('weekday-legend'), ['boarding', 'alighting'], weekdayState, drawWeekday);
+
+  // ---------- 역 순위 ----------
+  const rankSvg = document.getElementById('rank-chart');
+  const rankMeasure = document.getElementById('rank-measure');
+  const rankCount = document.getElementById('rank-count');
+
+  function drawRank() {
+    clear(rankSvg);
+    const measure = rankMeasure.value;
+    const totals = stationTotals[measure];
+    const order = Array.from({ length: S }, (_, i) => i).sort((a, b) => totals[b] - totals[a])
+      .slice(0, Number(rankCount.value));
+    const rowHeight = 22, left = 120, right = 80, top = 4;
+    const width = rankSvg.clientWidth || 900;
+    rankSvg.setAttribute('height', top * 2 + rowHeight * order.length);
+    const maxValue = order.length ? totals[order[0]] || 1 : 1;
+    order.forEach((s, r) => {
+      const y = top + r * rowHeight;
+      el('text', { x: left - 8, y: y + rowHeight * 0.68, 'text-anchor': 'end' }, rankSvg)
+        .textContent = (r + 1) + '. ' + names[s];
+      const barWidth = (width - left - right) * totals[s] / maxValue;
+      const bar = el('rect', { x: left, y: y + 3, width: barWidth, height: rowHeight - 6,
+                               fill: COLORS[measure], opacity: s === selected ? 1 : 0.75,
+                               cursor: 'pointer' }, rankSvg);
+      el('text', { x: left + barWidth + 6, y: y + rowHeight * 0.68 }, rankSvg).textContent = short(totals[s]);
+      bar.addEventListener('mousemove', (event) => showTip(event, names[s] + '\\n승차 '
+        + fmt(stationTotals.boarding[s]) + '명\\n하차 ' + fmt(stationTotals.alighting[s]) + '명'));
+      bar.addEventListener('mouseleave', hideTip);
+      bar.addEventListener('click', () => { selectStation(s); drawRank(); });
+    });
+  }
+  rankMeasure.addEventListener('change', drawRank);
+  rankCount.addEventListener('change', drawRank);
+
+  // ---------- 히트맵 ----------
+  const canvas = document.getElementById('heatmap');
+  const heatMeasure = document.getElementById('heat-measure');
+  const heatCount = document.getElementById('heat-count');
+  const heatNormalize = document.getElementById('heat-normalize');
+  const LABEL_WIDTH = 110, HEADER = 18;
+  let heatRows = [];
+
+  function heatColor(t) {
+    // 노랑 → 주황 → 빨강 (YlOrRd 근사)
+    const stops = [[255, 255, 204], [254, 178, 76], [240, 59, 32], [128, 0, 38]];
+    const p = Math.max(0, Math.min(1, t)) * (stops.length - 1);
+    const i = Math.min(Math.floor(p), stops.length - 2), f = p - i;
+    return stops[i].map((c, k) => Math.round(c + (stops[i + 1][k] - c) * f));
+  }
+
+  function drawHeatmap() {
+    const measure = heatMeasure.value;
+    const count = Number(heatCount.value) || S;
+    heatRows = Array.from({ length: Math.min(count, S) }, (_, i) => i);  // 이미 합계 순위 순서
+    const rowHeight = heatRows.length > 150 ? 3 : heatRows.length > 60 ? 8 : 16;
+    const width = canvas.clientWidth || 900;
+    const height = HEADER + rowHeight * heatRows.length;
+    canvas.width = width; canvas.height = height;
+    canvas.style.height = height + 'px';
+    const ctx = canvas.getContext('2d');
+    ctx.clearRect(0, 0, width, height);
+    const cellWidth = (width - LABEL_WIDTH) / H;
+
+    let globalMax = 1;
+    heatRows.forEach((s) => { for (let h = 0; h < H; h++) globalMax = Math.max(globalMax, stationValue(measure, s, h)); });
+    heatRows.forEach((s, r) => {
+      let rowMax = 1;
+      if (heatNormalize.checked) for (let h = 0; h < H; h++) rowMax = Math.max(rowMax, stationValue(measure, s, h));
+      for (let h = 0; h < H; h++) {
+        const [red, green, blue] = heatColor(stationValue(measure, s, h) / (heatNormalize.checked ? rowMax : globalMax));
+        ctx.fillStyle = 'rgb(' + red + ',' + green + ',' + blue + ')';
+        ctx.fillRect(LABEL_WIDTH + h * cellWidth, HEADER + r * rowHeight, Math.ceil(cellWidth), rowHeight);
+      }
+      if (rowHeight >= 8) {
+        ctx.fillStyle = '#333';
+        ctx.font = Math.min(rowHeight - 2, 12) + 'px sans-serif';
+        ctx.textAlign = 'right';
+        ctx.fillText(names[s], LABEL_WIDTH - 6, HEADER + r * rowHeight + rowHeight - 2);
+      }
+    });
+    ctx.fillStyle = '#333'; ctx.font = '11px sans-serif'; ctx.textAlign = 'center';
+    hours.forEach((hour, h) => ctx.fillText(String(hour).padStart(2, '0'), LABEL_WIDTH + (h + 0.5) * cellWidth, 13));
+    canvas.dataset.rowHeight = rowHeight;
+  }
+
+  function heatCell(event) {
+    const box = canvas.getBoundingClientRect();
+    const px = (event.clientX - box.left) * canvas.width / box.width;
+    const py = (event.clientY - box.top) * canvas.height / box.height;
+    const h = Math.floor((px - LABEL_WIDTH) / ((canvas.width - LABEL_WIDTH) / H));
+    const r = Math.floor((py - HEADER) / Number(canvas.dataset.rowHeight));
+    if (h < 0 || h >= H || r < 0 || r >= heatRows.length) return null;
+    return { s: heatRows[r], h: h };
+  }
+  canvas.addEventListener('mousemove', (event) => {
+    const cell = heatCell(event);
+    if (!cell) { hideTip(); return; }
+    showTip(event, names[cell.s] + ' ' + String(hours[cell.h]).padStart(2, '0') + '시\\n'
+      + LABELS[heatMeasure.value] + ' ' + fmt(stationValue(heatMeasure.value, cell.s, cell.h)) + '명');
+  });
+  canvas.addEventListener('mouseleave', hideTip);
+  canvas.addEventListener('click', (event) => { const cell = heatCell(event); if (cell) { selectStation(cell.s); drawRank(); } });
+  [heatMeasure, heatCount, heatNormalize].forEach((control) => control.addEventListener('change', drawHeatmap));
+
+  function drawAll() { drawHourly(); drawWeekday(); drawRank(); drawHeatmap(); }
+  window.addEventListener('resize', drawAll);
+  drawAll();
+})();
+</script>
+</body>
+</html>
+"""
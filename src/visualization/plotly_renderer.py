@@ -0,0 +1,280 @@
+"""
+대시보드용 Plotly 차트 렌더링 레이어
+
+- 데이터 포인트가 많으면 WebGL 트레이스(Scattergl)로 전환
+- 화면 해상도 이상의 데이터는 서버에서 미리 집계(다운샘플링)
+- 숫자 배열을 int32/float32로 축소해서 전송
+- 차트별 페이로드 크기(bytes) 기록
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+
+def compact_array(values):
+    """
+    숫자 배열을 전송용으로 축소 (정수면 int32, 아니면 float32)
+
+    Args:
+        values (array-like): 숫자 배열
+
+    Returns:
+        np.ndarray: 축소된 배열
+    """
+    arr = np.asarray(values)
+    if arr.dtype.kind not in 'iubf':
+        arr = arr.astype(np.float64)
+
+    is_integral = arr.dtype.kind in 'iub' or (
+        np.isfinite(arr).all() and np.array_equal(arr, np.round(arr))
+    )
+    int32 = np.iinfo(np.int32)
+
+    if is_integral and (arr.size == 0 or (arr.min() >= int32.min and arr.max() <= int32.max)):
+        return arr.astype(np.int32)
+
+    return arr.astype(np.float32)
+
+
+def _bucket_edges(n, max_points):
+    """
+    길이 n을 max_points개 이하 구간으로 나누는 시작 인덱스
+    """
+    n_buckets = min(n, max_points)
+    return np.unique(np.linspace(0, n, n_buckets, endpoint=False).astype(np.int64))
+
+
+def aggregate_axis(values, edges, axis=0, how='mean'):
+    """
+    구간(edges) 단위로 배열을 집계
+
+    Args:
+        values (np.ndarray): 집계할 배열
+        edges (np.ndarray): 각 구간의 시작 인덱스
+        axis (int): 집계할 축
+        how (str): 'mean' | 'sum' | 'max'
+    """
+    values = np.asarray(values, dtype=np.float64)
+
+    if how == 'max':
+        return np.maximum.reduceat(values, edges, axis=axis)
+
+    sums = np.add.reduceat(values, edges, axis=axis)
+    if how == 'sum':
+        return sums
+
+    sizes = np.diff(np.append(edges, values.shape[axis]))
+    shape = [1] * values.ndim
+    shape[axis] = len(sizes)
+    return sums / sizes.reshape(shape)
+
+
+def _bucket_labels(labels, edges):
+    """
+    구간별 라벨 생성 (예: '강남 … 역삼')
+    """
+    labels = list(labels)
+    ends = np.append(edges[1:], len(labels)) - 1
+    result = []
+    for start, end in zip(edges, ends):
+        if start == end:
+            result.append(str(labels[start]))
+        else:
+            result.append(f"{labels[start]} … {labels[end]}")
+    return result
+
+
+class PlotlyChartRenderer:
+    """
+    대시보드 차트 렌더러 (WebGL 전환 + 서버 측 집계 + 페이로드 기록)
+    """
+
+    def __init__(self, webgl_threshold=1000, max_points=2000,
+                 max_heatmap_rows=200, max_heatmap_cols=400, verbose=True):
+        """
+        렌더러 초기화
+
+        Args:
+            webgl_threshold (int): 이 값보다 포인트가 많으면 Scattergl 사용
+            max_points (int): 라인 차트 시리즈당 최대 포인트 수 (초과 시 집계)
+            max_heatmap_rows (int): 히트맵 최대 행 수 (초과 시 행 묶음 평균)
+            max_heatmap_cols (int): 히트맵 최대 열 수 (초과 시 열 묶음 평균)
+            verbose (bool): 페이로드 크기 출력 여부
+        """
+        self.webgl_threshold = webgl_threshold
+        self.max_points = max_points
+        self.max_heatmap_rows = max_heatmap_rows
+        self.max_heatmap_cols = max_heatmap_cols
+        self.verbose = verbose
+        self.payload_log = {}
+
+    def downsample(self, x, series, how='mean'):
+        """
+        라인 차트 데이터를 max_points 이하로 집계
+
+        Args:
+            x (array-like): x축 값
+            series (dict): {시리즈명: y값 배열}
+            how (str): 구간 집계 방식 ('mean' | 'max')
+
+        Returns:
+            tuple: (x, {시리즈명: 집계된 y값})
+        """
+        x = np.asarray(x)
+        if len(x) <= self.max_points:
+            return x, {name: np.asarray(y) for name, y in series.items()}
+
+        edges = _bucket_edges(len(x), self.max_points)
+        x_out = x[edges]
+        series_out = {name: aggregate_axis(y, edges, how=how) for name, y in series.items()}
+        return x_out, series_out
+
+    def line_chart(self, x, series, title, xaxis_title, yaxis_title,
+                   colors=None, height=500, chart_id=None, how='mean'):
+        """
+        라인 차트 생성 (포인트 수에 따라 Scatter/Scattergl 자동 선택)
+
+        Args:
+            x (array-like): x축 값
+            series (dict): {시리즈명: y값 배열}
+            title (str): 차트 제목
+            xaxis_title (str): x축 제목
+            yaxis_title (str): y축 제목
+            colors (dict): {시리즈명: 색상}
+            height (int): 차트 높이
+            chart_id (str): 페이로드 기록용 차트 이름
+            how (str): 다운샘플링 집계 방식
+        """
+        colors = colors or {}
+        x, series = self.downsample(x, series, how=how)
+
+        n_points = len(x) * max(len(series), 1)
+        use_webgl = n_points > self.webgl_threshold
+        trace_cls = go.Scattergl if use_webgl else go.Scatter
+        # 포인트가 많으면 마커를 생략해서 렌더링 부담 감소
+        mode = 'lines' if use_webgl else 'lines+markers'
+
+        fig = go.Figure()
+        for name, y in series.items():
+            fig.add_trace(trace_cls(
+                x=x if x.dtype.kind in 'OUSM' else compact_array(x),
+                y=compact_array(y),
+                mode=mode,
+                name=name,
+                line=dict(color=colors.get(name), width=2 if use_webgl else 3)
+            ))
+
+        fig.update_layout(
+            title=title,
+            xaxis_title=xaxis_title,
+            yaxis_title=yaxis_title,
+            hovermode='x unified',
+            height=height
+        )
+
+        self.record_payload(chart_id or title, fig)
+        return fig
+
+    def bar_chart(self, categories, series, title, xaxis_title, yaxis_title,
+                  colors=None, orientation='v', barmode='group', height=500, chart_id=None):
+        """
+        막대 차트 생성
+
+        Args:
+            categories (array-like): 범주 (요일, 역명 등)
+            series (dict): {시리즈명: 값 배열}
+            orientation (str): 'v' (세로) | 'h' (가로)
+            barmode (str): 'group' | 'stack'
+        """
+        colors = colors or {}
+        categories = list(categories)
+
+        fig = go.Figure()
+        for name, values in series.items():
+            values = compact_array(values)
+            if orientation == 'h':
+                fig.add_trace(go.Bar(y=categories, x=values, name=name,
+                                     orientation='h', marker_color=colors.get(name)))
+            else:
+                fig.add_trace(go.Bar(x=categories, y=values, name=name,
+                                     marker_color=colors.get(name)))
+
+        fig.update_layout(
+            title=title,
+            xaxis_title=xaxis_title,
+            yaxis_title=yaxis_title,
+            barmode=barmode,
+            height=height
+        )
+
+        self.record_payload(chart_id or title, fig)
+        return fig
+
+    def heatmap(self, z, x_labels, y_labels, title, xaxis_title, yaxis_title,
+                colorscale='YlOrRd', height=800, chart_id=None, zmid=None):
+        """
+        히트맵 생성 (행/열이 많으면 구간 평균으로 축소)
+
+        Args:
+            z (array-like): 2차원 값 행렬 (행: y_labels, 열: x_labels)
+            x_labels (list): 열 라벨
+            y_labels (list): 행 라벨
+            zmid (float): 발산형 색상표의 중심값 (예: 순유출입은 0)
+        """
+        z = np.asarray(z, dtype=np.float64)
+        x_labels = list(x_labels)
+        y_labels = list(y_labels)
+
+        if z.shape[0] > self.max_heatmap_rows:
+            edges = _bucket_edges(z.shape[0], self.max_heatmap_rows)
+            z = aggregate_axis(z, edges, axis=0)
+            y_labels = _bucket_labels(y_labels, edges)
+
+        if z.shape[1] > self.max_heatmap_cols:
+            edges = _bucket_edges(z.shape[1], self.max_heatmap_cols)
+            z = aggregate_axis(z, edges, axis=1)
+            x_labels = _bucket_labels(x_labels, edges)
+
+        fig = go.Figure(data=go.Heatmap(
+            z=compact_array(z),
+            x=x_labels,
+            y=y_labels,
+            colorscale=colorscale,
+            zmid=zmid,
+            hoverongaps=False
+        ))
+
+        fig.update_layout(
+            title=title,
+            xaxis_title=xaxis_title,
+            yaxis_title=yaxis_title,
+            height=height
+        )
+
+        self.record_payload(chart_id or title, fig)
+        return fig
+
+    def record_payload(self, chart_id, fig):
+        """
+        차트의 직렬화 크기(bytes) 기록
+
+        Args:
+            chart_id (str): 차트 이름
+            fig (go.Figure): Plotly Figure
+
+        Returns:
+            int: 페이로드 크기 (bytes)
+        """
+        n_bytes = len(fig.to_json().encode('utf-8'))
+        self.payload_log[chart_id] = n_bytes
+
+        if self.verbose:
+            print(f"📦 [{chart_id}] 차트 페이로드: {n_bytes / 1024:,.1f} KB")
+
+        return n_bytes
+
+    def total_payload_bytes(self):
+        """
+        기록된 모든 차트의 페이로드 합계 (bytes)
+        """
+        return sum(self.payload_log.values())
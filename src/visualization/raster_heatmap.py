@@ -0,0 +1,75 @@
+"""
+래스터 히트맵 (행렬 전체를 이미지 한 장으로 그림)
+
+sns.heatmap은 칸마다 사각형(patch)을 하나씩 그리므로 600개 역 × 744시간(한 달) 같은
+큰 행렬에서는 매우 느리다. 여기서는 행렬을 imshow 이미지 하나로 그리고,
+행/열이 출력 픽셀 수보다 많으면 블록 평균으로 줄여서 그린다.
+"""
+
+import numpy as np
+
+SORT_OPTIONS = (None, 'total', 'cluster')
+
+
+def block_mean(matrix, axis, n_out):
+    """
+    한 축을 n_out개 구간의 평균으로 축소 (구간 경계는 균등 분할, reduceat 한 번)
+
+    Returns:
+        tuple: (축소된 행렬, 구간 시작 인덱스)
+    """
+    n = matrix.shape[axis]
+    if n <= n_out:
+        return matrix, np.arange(n)
+    starts = np.linspace(0, n, n_out + 1).astype(np.int64)[:-1]
+    sums = np.add.reduceat(matrix, starts, axis=axis)
+    counts = np.diff(np.append(starts, n))
+    shape = [1, 1]
+    shape[axis] = len(counts)
+    return sums / counts.reshape(shape), starts
+
+
+def downsample_matrix(matrix, max_rows, max_cols):
+    """
+    출력 픽셀 해상도에 맞게 행/열 블록 평균 축소
+
+    Args:
+        matrix (np.ndarray): [행, 열] 값
+        max_rows (int): 최대 행 수 (세로 픽셀 수)
+        max_cols (int): 최대 열 수 (가로 픽셀 수)
+
+    Returns:
+        tuple: (축소된 행렬, 행 구간 시작 인덱스, 열 구간 시작 인덱스)
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    matrix, row_starts = block_mean(matrix, 0, max(int(max_rows), 1))
+    matrix, col_starts = block_mean(matrix, 1, max(int(max_cols), 1))
+    return matrix, row_starts, col_starts
+
+
+def row_order(matrix, sort_by='total', clusters=None):
+    """
+    행(역) 정렬 순서
+
+    Args:
+        matrix (np.ndarray): [역, 열] 값
+        sort_by (str): None (원래 순서), 'total' (합계 내림차순),
+                       'cluster' (군집 번호 순, 군집 안에서 합계 내림차순)
+        clusters (np.ndarray): 역별 군집 번호 (sort_by='cluster'일 때 필요)
+
+    Returns:
+        np.ndarray: 행 인덱스
+    """
+    if sort_by not in SORT_OPTIONS:
+        raise ValueError(f"지원하지 않는 정렬 기준: {sort_by}")
+    n = matrix.shape[0]
+    if sort_by is None:
+        return np.arange(n)
+
+    totals = np.nansum(matrix, axis=1)
+    if sort_by == 'total':
+        return np.argsort(-totals, kind='stable')
+
+    if clusters is None:
+        raise ValueError("군집 정렬에는 역별 군집 번호가 필요합니다.")
+    return np.lexsort((-totals, np.asarray(clusters)))
@@ -0,0 +1,52 @@
+"""
+차트 저장 프로파일 (해상도 / 여백 계산 / 파일 형식)
+
+- draft: 빠른 확인용 저해상도 WebP, tight bbox 생략 (여백 계산용 추가 그리기 없음)
+- preview: 저해상도 PNG
+- standard: 기존 기본값 (300dpi PNG, tight bbox)
+- publication: 벡터 PDF
+- svg: 벡터 SVG (웹 문서 삽입용)
+"""
+
+RENDER_PROFILES = {
+    'draft': {'format': 'webp', 'dpi': 72, 'bbox_inches': None, 'pil_kwargs': {'quality': 80}},
+    'preview': {'format': 'png', 'dpi': 100, 'bbox_inches': None},
+    'standard': {'format': 'png', 'dpi': 300, 'bbox_inches': 'tight'},
+    'publication': {'format': 'pdf', 'dpi': 300, 'bbox_inches': 'tight'},
+    'svg': {'format': 'svg', 'dpi': 300, 'bbox_inches': 'tight'},
+}
+
+DEFAULT_PROFILE = 'standard'
+
+# 벡터 형식 (dpi는 안에 들어가는 래스터 이미지에만 적용)
+VECTOR_FORMATS = ('pdf', 'svg')
+
+
+def get_render_profile(name):
+    """
+    프로파일 설정 dict 반환
+
+    Raises:
+        ValueError: 알 수 없는 프로파일
+    """
+    if name not in RENDER_PROFILES:
+        raise ValueError(f"지원하지 않는 렌더링 프로파일: {name} "
+                         f"(사용 가능: {', '.join(RENDER_PROFILES)})")
+    return RENDER_PROFILES[name]
+
+
+def save_figure(filepath, profile, fig=None, dpi=None):
+    """
+    현재(또는 지정한) 그림을 프로파일 설정으로 저장
+
+    Args:
+        dpi (int): 프로파일 해상도 대신 쓸 해상도 (None이면 프로파일 값)
+    """
+    import matplotlib.pyplot as plt  # 프로파일 목록만 쓰는 곳에서는 matplotlib 불필요
+
+    settings = dict(get_render_profile(profile))
+    fmt = settings.pop('format')
+    if dpi is not None:
+        settings['dpi'] = dpi
+    (fig or plt.gcf()).savefig(filepath, format=fmt, **settings)
+    return filepath
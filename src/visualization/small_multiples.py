@@ -0,0 +1,188 @@
+"""
+역별 24시간 승하차 프로파일 소형 다중 차트 (small multiples) 일괄 렌더링
+
+한 페이지에 rows × cols개 역을 그리고, 그림(figure)과 축(axes), 선(Line2D)은
+프로세스마다 한 번만 만든 뒤 페이지마다 데이터만 바꿔 끼운다.
+- PNG 타일: 페이지 묶음을 프로세스 풀에 나눠 병렬 렌더링
+- PDF: 한 프로세스에서 여러 페이지 PDF 하나로 저장 (PDF 파일은 프로세스 간에 나눠 쓸 수 없음)
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.ticker import MaxNLocator
+
+from .fonts import setup_korean_font
+
+BOARDING_COLOR = '#2E86AB'
+ALIGHTING_COLOR = '#A23B72'
+
+
+class _PageCanvas:
+    """
+    재사용하는 소형 다중 차트 페이지 (그림/축/선을 한 번만 생성)
+    """
+
+    def __init__(self, hours, rows, cols, title):
+        self.rows = rows
+        self.cols = cols
+        self.title = title
+        # 축 공유(sharex)는 축 수의 제곱으로 느려지므로 x 범위를 직접 고정
+        self.fig, axes = plt.subplots(rows, cols, figsize=(cols * 2.4, rows * 1.9), squeeze=False)
+        self.axes = axes.ravel()
+        self.lines = []
+
+        zeros = np.zeros(len(hours))
+        for i, ax in enumerate(self.axes):
+            ax.axvspan(7, 9, alpha=0.15, color='yellow', linewidth=0)
+            ax.axvspan(18, 20, alpha=0.15, color='orange', linewidth=0)
+            on_line, = ax.plot(hours, zeros, color=BOARDING_COLOR, linewidth=1.2)
+            off_line, = ax.plot(hours, zeros, color=ALIGHTING_COLOR, linewidth=1.2)
+            self.lines.append((on_line, off_line))
+            ax.set_xlim(hours[0], hours[-1])
+            ax.set_xticks(range(0, 24, 6))
+            ax.yaxis.set_major_locator(MaxNLocator(3))
+            # 눈금 글자 배치가 렌더링 시간의 대부분이므로 x 눈금 글자는 맨 아래 행에만
+            ax.tick_params(labelsize=6, length=2, pad=1, labelbottom=i // cols == rows - 1)
+            ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
+
+        self.fig.legend([self.lines[0][0], self.lines[0][1]], ['승차', '하차'],
+                        loc='upper right', fontsize=9, ncol=2)
+        self.suptitle = self.fig.suptitle('', fontsize=12, fontweight='bold')
+        self.fig.tight_layout(rect=(0, 0, 1, 0.96), h_pad=0.6, w_pad=0.4)
+
+    def draw(self, page_no, n_pages, stations, boarding, alighting):
+        """
+        한 페이지 분량의 역 데이터로 선/제목/축 범위만 갱신
+        """
+        for i, ax in enumerate(self.axes):
+            on_line, off_line = self.lines[i]
+            if i >= len(stations):
+                ax.set_visible(False)
+                continue
+
+            ax.set_visible(True)
+            on_line.set_ydata(boarding[i])
+            off_line.set_ydata(alighting[i])
+            peak = max(float(boarding[i].max()), float(alighting[i].max()), 1.0)
+            ax.set_ylim(0, peak * 1.1)
+            ax.set_title(f'{stations[i]} ({(boarding[i].sum() + alighting[i].sum()):,.0f}명)',
+                         fontsize=7, pad=2)
+
+        self.suptitle.set_text(f'{self.title} ({page_no + 1}/{n_pages})')
+
+    def close(self):
+        plt.close(self.fig)
+
+
+def split_pages(n_stations, per_page):
+    """
+    역 인덱스를 페이지 구간 [(시작, 끝), ...]으로 분할
+    """
+    return [(start, min(start + per_page, n_stations)) for start in range(0, n_stations, per_page)]
+
+
+def _init_worker():
+    """
+    렌더링 프로세스 초기화 (화면 없는 Agg 백엔드, 한글 폰트)
+    """
+    plt.switch_backend('Agg')
+    setup_korean_font()
+
+
+def _render_png_pages(pages, n_pages, stations, hours, boarding, alighting,
+                      rows, cols, title, file_pattern, dpi):
+    """
+    페이지 묶음을 PNG 타일로 렌더링 (프로세스 풀 작업 단위, 캔버스 하나 재사용)
+
+    Returns:
+        list: [(페이지 번호, 파일 경로), ...]
+    """
+    canvas = _PageCanvas(hours, rows, cols, title)
+    results = []
+    try:
+        for page_no, (start, end) in pages:
+            canvas.draw(page_no, n_pages, stations[start:end], boarding[start:end], alighting[start:end])
+            filepath = file_pattern.format(page=page_no + 1)
+            canvas.fig.savefig(filepath, dpi=dpi)
+            results.append((page_no, filepath))
+    finally:
+        canvas.close()
+    return results
+
+
+def render_station_profiles(stations, hours, boarding, alighting, save_path, prefix,
+                            rows=6, cols=8, output='png', parallel=True, max_workers=None,
+                            dpi=100, title='역별 시간대 승하차 프로파일'):
+    """
+    역별 24시간 프로파일 소형 다중 차트 일괄 렌더링
+
+    Args:
+        stations (array): 역명 (그릴 순서)
+        hours (array): 시간대
+        boarding (np.ndarray): [역, 시간대] 승차
+        alighting (np.ndarray): [역, 시간대] 하차
+        save_path (str): 저장 폴더
+        prefix (str): 파일명 접두어
+        rows, cols (int): 페이지당 행/열 수
+        output (str): 'png' (페이지별 타일 이미지) 또는 'pdf' (여러 페이지 PDF 하나)
+        parallel (bool): PNG 페이지 묶음을 프로세스 풀로 병렬 렌더링
+        max_workers (int): 최대 프로세스 수 (None이면 min(페이지 수, CPU 수))
+        dpi (int): 해상도
+
+    Returns:
+        dict: {'files': 파일 경로 목록, 'n_stations', 'n_pages', 'seconds', 'stations_per_second'}
+    """
+    stations = np.asarray(stations, dtype=object)
+    hours = np.asarray(hours)
+    boarding = np.asarray(boarding, dtype=np.float64)
+    alighting = np.asarray(alighting, dtype=np.float64)
+    per_page = rows * cols
+    pages = list(enumerate(split_pages(len(stations), per_page)))
+    n_pages = len(pages)
+
+    started = time.perf_counter()
+    files = []
+    if output == 'pdf':
+        from matplotlib.backends.backend_pdf import PdfPages  # PDF 백엔드는 필요할 때만 import
+
+        filepath = os.path.join(save_path, f"{prefix}.pdf")
+        canvas = _PageCanvas(hours, rows, cols, title)
+        try:
+            with PdfPages(filepath) as pdf:
+                for page_no, (start, end) in pages:
+                    canvas.draw(page_no, n_pages, stations[start:end],
+                                boarding[start:end], alighting[start:end])
+                    pdf.savefig(canvas.fig)
+        finally:
+            canvas.close()
+        files.append(filepath)
+    elif output == 'png':
+        file_pattern = os.path.join(save_path, f"{prefix}_p{{page:03d}}.png")
+        args = (n_pages, stations, hours, boarding, alighting, rows, cols, title, file_pattern, dpi)
+        workers = max_workers or min(n_pages, os.cpu_count() or 1)
+
+        if parallel and workers > 1 and n_pages > 1:
+            # 연속 페이지 묶음으로 나눠 프로세스마다 캔버스를 한 번만 만들도록 함
+            chunks = [chunk.tolist() for chunk in np.array_split(np.arange(n_pages), workers) if len(chunk)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                futures = [pool.submit(_render_png_pages, [pages[i] for i in chunk], *args)
+                           for chunk in chunks]
+                results = [item for future in futures for item in future.result()]
+        else:
+            results = _render_png_pages(pages, *args)
+        files = [filepath for _, filepath in sorted(results)]
+    else:
+        raise ValueError(f"지원하지 않는 출력 형식: {output}")
+
+    seconds = time.perf_counter() - started
+    return {
+        'files': files,
+        'n_stations': len(stations),
+        'n_pages': n_pages,
+        'seconds': seconds,
+        'stations_per_second': len(stations) / seconds if seconds > 0 else float('inf'),
+    }
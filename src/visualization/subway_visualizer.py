@@ -4,28 +4,143 @@
 
 import pandas as pd
 import numpy as np
-import platform
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
 import os
-import matplotlib.font_manager as fm
-
-# 운영체제별 한글 폰트 자동 설정
-system = platform.system()
-if system == 'Windows':
-    font_path = r'C:\Windows\Fonts\malgun.ttf'  # Malgun Gothic 경로
-    if os.path.exists(font_path):
-        fontprop = fm.FontProperties(fname=font_path)
-        plt.rcParams['font.family'] = fontprop.get_name()
+import time
+import functools
+import inspect
+from concurrent.futures import ProcessPoolExecutor
+
+from .chart_cache import ChartCache, chart_key
+from .fonts import setup_korean_font
+from .raster_heatmap import downsample_matrix, row_order
+from .render_profiles import DEFAULT_PROFILE, VECTOR_FORMATS, get_render_profile, save_figure
+
+
+def station_heatmap_table(df, top_n=30):
+    """
+    역별 시간대별 승차 합계 표 (총 이용객 상위 N개 역, 컬럼 = 시간대)
+
+    Args:
+        df (DataFrame): 전처리된 데이터프레임
+        top_n (int): 상위 N개 역 (None이면 전체 역, 총 이용객 내림차순)
+
+    Returns:
+        DataFrame: 인덱스 역명, 컬럼 시간대(int) (시간대 컬럼이 없으면 None)
+    """
+    boarding_cols = [col for col in df.columns if 'GET_ON_NOPE' in col]
+    if not boarding_cols:
+        return None
+
+    # 역별 시간대별 합계
+    station_hourly = df.groupby('STTN')[boarding_cols].sum()
+
+    # 총 이용객 기준 상위 N개 역
+    station_hourly['TOTAL'] = station_hourly.sum(axis=1)
+    if top_n is None:
+        top_stations = station_hourly.sort_values('TOTAL', ascending=False, kind='stable')
     else:
-        print("⚠️ Malgun Gothic 폰트를 찾을 수 없습니다.")
-elif system == 'Darwin':  # Mac
-    plt.rcParams['font.family'] = 'AppleGothic'
-else:  # Linux
-    plt.rcParams['font.family'] = 'NanumGothic'
+        top_stations = station_hourly.nlargest(top_n, 'TOTAL')
+    top_stations = top_stations.drop('TOTAL', axis=1)
+
+    # 컬럼명을 시간대로 변환 (HR_0_GET_ON_NOPE -> 0)
+    hour_cols = {col: int(col.split('_')[1]) for col in top_stations.columns}
+    top_stations = top_stations.rename(columns=hour_cols)
+    return top_stations.sort_index(axis=1)  # 시간 순서로 정렬
+
+
+def _chart_params(func, args, kwargs):
+    """
+    그리기 메서드 호출 인자를 기본값까지 채운 dict로 정리 (self, save_filename 제외)
+    """
+    bound = inspect.signature(func).bind(None, *args, **kwargs)
+    bound.apply_defaults()
+    params = dict(bound.arguments)
+    params.pop('self', None)
+    save_filename = params.pop('save_filename', None)
+    return params, save_filename
+
+
+def cached_chart(func):
+    """
+    그리기 메서드 캐시 데코레이터
+
+    입력 데이터와 파라미터가 이전 렌더링과 같으면 저장된 파일을 그대로 반환한다.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = getattr(self, 'chart_cache', None)
+        if cache is None:
+            return func(self, *args, **kwargs)
+
+        params, save_filename = _chart_params(func, args, kwargs)
+        params['profile'] = params.get('profile') or self.profile
+        key = chart_key(func.__name__, params)
+        filepath = cache.get(key, self.save_path, save_filename)
+        if filepath:
+            print(f"♻️  변경 없음, 기존 차트 사용: {filepath}")
+            return filepath
+
+        filepath = func(self, *args, **kwargs)
+        if filepath:
+            cache.put(key, filepath)
+        return filepath
+    return wrapper
+
+
+_style_applied = False
+
+
+def apply_plot_style():
+    """
+    seaborn 스타일과 한글 폰트 적용
+    """
+    global _style_applied
+    import seaborn as sns
+
+    sns.set_style("whitegrid")
+    sns.set_palette("husl")
+    setup_korean_font()
+    _style_applied = True
+
+
+def _pyplot():
+    """
+    pyplot 반환 (첫 차트를 그릴 때 import하고 스타일/폰트 적용)
+
+    모듈 import나 시각화 객체 생성, 캐시 적중만으로는 matplotlib/seaborn을 불러오지 않는다.
+    """
+    import matplotlib.pyplot as plt
+
+    if not _style_applied:
+        apply_plot_style()
+    return plt
+
+
+def _init_render_worker():
+    """
+    렌더링 프로세스 초기화 (화면 없는 Agg 백엔드, 부모와 같은 스타일)
+    """
+    import matplotlib.pyplot as plt
+
+    plt.switch_backend('Agg')
+    apply_plot_style()
+
+
+def _render_chart(save_path, method, kwargs, profile=DEFAULT_PROFILE):
+    """
+    차트 명세 하나 렌더링 (프로세스 풀 작업 단위)
 
-plt.rcParams['axes.unicode_minus'] = False
+    Returns:
+        tuple: (파일 경로, 렌더링 시간(초))
+    """
+    visualizer = SubwayVisualizer.__new__(SubwayVisualizer)
+    visualizer.save_path = save_path
+    visualizer.chart_cache = None  # 캐시 조회/등록은 부모 프로세스에서
+    visualizer.profile = profile
+    started = time.perf_counter()
+    filepath = getattr(visualizer, method)(**kwargs)
+    return filepath, time.perf_counter() - started
 
 
 class SubwayVisualizer:
@@ -33,24 +148,42 @@ class SubwayVisualizer:
     지하철 패턴 시각화 클래스
     """
     
-    def __init__(self, save_path="results/charts/"):
+    def __init__(self, save_path="results/charts/", cache=True, cache_max_mb=200, profile=DEFAULT_PROFILE):
         """
         시각화 도구 초기화
         
         Args:
             save_path (str): 그래프 저장 경로
+            cache (bool): 입력이 같은 차트는 다시 그리지 않고 기존 파일 재사용
+            cache_max_mb (float): 캐시된 차트 파일 총 용량 한도 (넘으면 오래된 것부터 삭제)
+            profile (str): 기본 저장 프로파일 ('draft', 'preview', 'standard', 'publication', 'svg')
         """
+        get_render_profile(profile)
         self.save_path = save_path
+        self.profile = profile
+        self.render_times = {}
         os.makedirs(save_path, exist_ok=True)
-        
-        # seaborn 스타일 설정
-        sns.set_style("whitegrid")
-        sns.set_palette("husl")
+        self.chart_cache = ChartCache(save_path, max_bytes=int(cache_max_mb * 1024 ** 2)) if cache else None
         
         print(f"📊 시각화 도구 초기화 완료")
         print(f"💾 저장 경로: {save_path}")
     
-    def plot_hourly_pattern(self, hourly_df, save_filename=None):
+    def set_render_profile(self, profile):
+        """
+        이후 모든 차트의 기본 저장 프로파일 변경 (호출마다 profile 인자로 덮어쓸 수 있음)
+        """
+        get_render_profile(profile)
+        self.profile = profile
+    
+    def _default_filename(self, stem, profile=None):
+        """
+        자동 파일명 (접두어_타임스탬프.프로파일 형식)
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{stem}_{timestamp}.{get_render_profile(profile or self.profile)['format']}"
+    
+    @cached_chart
+    def plot_hourly_pattern(self, hourly_df, save_filename=None, profile=None):
         """
         시간대별 이용 패턴 그래프
         
@@ -58,9 +191,11 @@ class SubwayVisualizer:
             hourly_df (DataFrame): 시간대별 데이터
                 필수 컬럼: HOUR, BOARDING, ALIGHTING, TOTAL
             save_filename (str): 저장할 파일명 (None이면 자동 생성)
+            profile (str): 저장 프로파일 ('draft', 'standard', 'publication' 등, None이면 기본값)
         """
         print("\n📈 시간대별 이용 패턴 그래프 생성 중...")
         
+        plt = _pyplot()
         # 그래프 크기 설정
         fig, ax = plt.subplots(figsize=(14, 6))
         
@@ -107,18 +242,18 @@ class SubwayVisualizer:
         
         # 저장
         if save_filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_filename = f"hourly_pattern_{timestamp}.png"
+            save_filename = self._default_filename("hourly_pattern", profile)
         
         filepath = os.path.join(self.save_path, save_filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
+        save_figure(filepath, profile or self.profile)
         print(f"✅ 저장 완료: {filepath}")
         
         plt.close()
         
         return filepath
     
-    def plot_weekday_pattern(self, weekday_df, save_filename=None):
+    @cached_chart
+    def plot_weekday_pattern(self, weekday_df, save_filename=None, profile=None):
         """
         요일별 이용 패턴 막대 그래프
         
@@ -127,9 +262,11 @@ class SubwayVisualizer:
                 인덱스: 요일명 (월요일, 화요일, ...)
                 필수 컬럼: 평균_총이용
             save_filename (str): 저장할 파일명
+            profile (str): 저장 프로파일 ('draft', 'standard', 'publication' 등, None이면 기본값)
         """
         print("\n📊 요일별 이용 패턴 그래프 생성 중...")
         
+        plt = _pyplot()
         # 그래프 크기
         fig, ax = plt.subplots(figsize=(12, 6))
         
@@ -182,18 +319,18 @@ class SubwayVisualizer:
         
         # 저장
         if save_filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_filename = f"weekday_pattern_{timestamp}.png"
+            save_filename = self._default_filename("weekday_pattern", profile)
         
         filepath = os.path.join(self.save_path, save_filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
+        save_figure(filepath, profile or self.profile)
         print(f"✅ 저장 완료: {filepath}")
         
         plt.close()
         
         return filepath
     
-    def plot_top_stations(self, station_df, top_n=20, save_filename=None):
+    @cached_chart
+    def plot_top_stations(self, station_df, top_n=20, save_filename=None, profile=None):
         """
         역별 TOP N 수평 막대 그래프
         
@@ -203,12 +340,14 @@ class SubwayVisualizer:
                 필수 컬럼: TOTAL, TYPE
             top_n (int): 상위 N개 역
             save_filename (str): 저장할 파일명
+            profile (str): 저장 프로파일 ('draft', 'standard', 'publication' 등, None이면 기본값)
         """
         print(f"\n🏆 역별 TOP {top_n} 그래프 생성 중...")
         
         # 상위 N개 역 추출
         top_stations = station_df.nlargest(top_n, 'TOTAL')
         
+        plt = _pyplot()
         # 그래프 크기 (역이 많으면 세로 크기 늘리기)
         fig, ax = plt.subplots(figsize=(12, max(8, top_n * 0.4)))
         
@@ -262,55 +401,161 @@ class SubwayVisualizer:
         
         # 저장
         if save_filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_filename = f"top_stations_{timestamp}.png"
+            save_filename = self._default_filename("top_stations", profile)
         
         filepath = os.path.join(self.save_path, save_filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
+        save_figure(filepath, profile or self.profile)
         print(f"✅ 저장 완료: {filepath}")
         
         plt.close()
         
         return filepath
     
-    def plot_station_heatmap(self, df, top_n=30, save_filename=None):
+    def plot_station_heatmap(self, df, top_n=30, save_filename=None, raster=False, profile=None):
         """
         역별 시간대별 히트맵 (심화)
         
         Args:
             df (DataFrame): 전처리된 데이터프레임
-            top_n (int): 상위 N개 역만 표시
+            top_n (int): 상위 N개 역만 표시 (raster=True일 때 None이면 전체 역)
             save_filename (str): 저장할 파일명
+            raster (bool): 칸별 사각형 대신 이미지 한 장으로 그림 (전체 역용)
+            profile (str): 저장 프로파일 (None이면 기본값)
         """
-        print(f"\n🔥 역별 시간대별 히트맵 생성 중 (TOP {top_n})...")
+        label = '전체' if top_n is None else f'TOP {top_n}'
+        print(f"\n🔥 역별 시간대별 히트맵 생성 중 ({label}{', 래스터' if raster else ''})...")
         
-        # 시간대별 컬럼 찾기
-        boarding_cols = [col for col in df.columns if 'GET_ON_NOPE' in col]
+        if top_n is None and not raster:
+            print("⚠️  전체 역 히트맵은 raster=True로 그리세요.")
+            return None
         
-        if not boarding_cols:
+        top_stations = station_heatmap_table(df, top_n)
+        if top_stations is None:
             print("⚠️  시간대별 데이터를 찾을 수 없습니다.")
             return None
         
-        # 역별 시간대별 합계
-        station_hourly = df.groupby('STTN')[boarding_cols].sum()
+        if raster:
+            return self.plot_raster_heatmap(
+                top_stations, sort_by='total',
+                title=f'서울시 지하철 역별 시간대별 승차 패턴 ({label})', save_filename=save_filename,
+                profile=profile)
+        return self.plot_heatmap_table(top_stations, top_n, save_filename, profile=profile)
+    
+    @cached_chart
+    def plot_raster_heatmap(self, matrix_df, sort_by='total', clusters=None, title=None,
+                            value_label='승차 인원 (명)', figsize=(16, 10), dpi=None, save_filename=None,
+                            profile=None):
+        """
+        래스터 히트맵 (역 × 시간대 또는 역 × 일자·시간대 행렬을 이미지 한 장으로)
+        
+        행/열이 출력 픽셀보다 많으면 블록 평균으로 줄여서 그린다.
+        
+        Args:
+            matrix_df (DataFrame): 인덱스 역명, 컬럼 시간대 또는 (USE_DT, HOUR) MultiIndex
+                (get_station_hour_matrix / station_heatmap_table 결과)
+            sort_by (str): None, 'total' (합계 내림차순), 'cluster' (군집 순)
+            clusters (Series): 역명 → 군집 번호 (sort_by='cluster'일 때)
+            title (str): 제목
+            value_label (str): 색상 막대 라벨
+            figsize (tuple): 그림 크기 (인치)
+            dpi (int): 이미지 해상도 (None이면 프로파일 해상도, 벡터 형식은 150)
+            save_filename (str): 저장할 파일명
+            profile (str): 저장 프로파일 ('draft', 'standard', 'publication' 등, None이면 기본값)
+        """
+        started = time.perf_counter()
+        profile = profile or self.profile
+        render = get_render_profile(profile)
+        if dpi is None:
+            dpi = 150 if render['format'] in VECTOR_FORMATS else render['dpi']
+        values = matrix_df.to_numpy(dtype=np.float64)
+        cluster_codes = None
+        if clusters is not None:
+            cluster_codes = pd.Series(clusters).reindex(matrix_df.index).fillna(-1).to_numpy(dtype=np.int64)
+        
+        order = row_order(values, sort_by, cluster_codes)
+        values = values[order]
+        stations = matrix_df.index.to_numpy()[order]
+        n_rows, n_cols = values.shape
+        
+        # 출력 픽셀 수 이상의 행/열은 블록 평균으로 축소
+        image, _, _ = downsample_matrix(values, figsize[1] * dpi, figsize[0] * dpi)
+        
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=figsize)
+        im = ax.imshow(image, aspect='auto', interpolation='nearest', cmap='YlOrRd',
+                       extent=(-0.5, n_cols - 0.5, n_rows - 0.5, -0.5))
+        cbar = fig.colorbar(im, ax=ax, pad=0.01)
+        cbar.set_label(value_label, fontsize=11)
+        
+        # y축: 역이 적으면 역명, 군집 정렬이면 군집 경계, 아니면 순위
+        if n_rows <= 60:
+            ax.set_yticks(range(n_rows))
+            ax.set_yticklabels(stations, fontsize=8)
+        elif sort_by == 'cluster' and cluster_codes is not None:
+            sorted_codes = cluster_codes[order]
+            bounds = np.flatnonzero(np.diff(sorted_codes)) + 1
+            for bound in bounds:
+                ax.axhline(bound - 0.5, color='black', linewidth=0.8)
+            starts = np.concatenate([[0], bounds])
+            ends = np.concatenate([bounds, [n_rows]])
+            ax.set_yticks((starts + ends - 1) / 2)
+            ax.set_yticklabels([f'군집 {code}' if code >= 0 else '미분류'
+                                for code in sorted_codes[starts]], fontsize=9)
+        else:
+            ticks = np.arange(0, n_rows, max(n_rows // 10, 1))
+            ax.set_yticks(ticks)
+            ax.set_yticklabels([f'{tick + 1}위' for tick in ticks], fontsize=9)
+        
+        # x축: 일자·시간대 열이면 일자 경계, 아니면 시간대
+        columns = matrix_df.columns
+        if isinstance(columns, pd.MultiIndex):
+            dates = columns.get_level_values(0)
+            day_starts = np.flatnonzero(np.r_[True, dates[1:] != dates[:-1]])
+            step = max(len(day_starts) // 16, 1)
+            ticks = day_starts[::step]
+            ax.set_xticks(ticks - 0.5)
+            ax.set_xticklabels([pd.Timestamp(dates[t]).strftime('%m-%d') for t in ticks],
+                               fontsize=9, rotation=0)
+            ax.set_xlabel('일자 (일자별 0~23시)', fontsize=12, fontweight='bold')
+        else:
+            step = max(n_cols // 24, 1)
+            ticks = np.arange(0, n_cols, step)
+            ax.set_xticks(ticks)
+            ax.set_xticklabels([f'{int(columns[t]):02d}' for t in ticks], fontsize=9)
+            ax.set_xlabel('시간대', fontsize=12, fontweight='bold')
+        
+        ax.set_ylabel('역명', fontsize=12, fontweight='bold')
+        ax.set_title(title or f'서울시 지하철 역별 시간대별 이용 패턴 ({n_rows}개 역)',
+                     fontsize=16, fontweight='bold', pad=20)
+        ax.grid(False)
         
-        # 총 이용객 기준 상위 N개 역
-        station_hourly['TOTAL'] = station_hourly.sum(axis=1)
-        top_stations = station_hourly.nlargest(top_n, 'TOTAL').drop('TOTAL', axis=1)
+        # 레이아웃
+        plt.tight_layout()
         
-        # 컬럼명을 시간대로 변환 (HR_0_GET_ON_NOPE -> 0)
-        hour_cols = {}
-        for col in top_stations.columns:
-            hour = int(col.split('_')[1])
-            hour_cols[col] = hour
+        # 저장
+        if save_filename is None:
+            save_filename = self._default_filename("raster_heatmap", profile)
         
-        top_stations = top_stations.rename(columns=hour_cols)
-        top_stations = top_stations.sort_index(axis=1)  # 시간 순서로 정렬
+        filepath = os.path.join(self.save_path, save_filename)
+        save_figure(filepath, profile, fig=fig, dpi=dpi)
+        print(f"✅ 저장 완료: {filepath} ({n_rows}×{n_cols} → {image.shape[0]}×{image.shape[1]}, "
+              f"{time.perf_counter() - started:.2f}초)")
         
+        plt.close()
+        
+        return filepath
+    
+    @cached_chart
+    def plot_heatmap_table(self, top_stations, top_n=30, save_filename=None, profile=None):
+        """
+        역 × 시간대 승차 표를 히트맵으로 저장 (station_heatmap_table 결과)
+        """
+        plt = _pyplot()
         # 그래프 크기
         fig, ax = plt.subplots(figsize=(16, max(10, top_n * 0.3)))
         
         # 히트맵 생성
+        import seaborn as sns
         sns.heatmap(top_stations, 
                     cmap='YlOrRd',  # 노랑-주황-빨강
                     annot=False,     # 숫자 표시 안함 (너무 많아서)
@@ -337,54 +582,329 @@ class SubwayVisualizer:
         
         # 저장
         if save_filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_filename = f"station_heatmap_{timestamp}.png"
+            save_filename = self._default_filename("station_heatmap", profile)
         
         filepath = os.path.join(self.save_path, save_filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
+        save_figure(filepath, profile or self.profile)
         print(f"✅ 저장 완료: {filepath}")
         
         plt.close()
         
         return filepath
     
-    def generate_all_charts(self, analyzer):
+    @cached_chart
+    def plot_net_flow_heatmap(self, net_df, top_n=30, cumulative=False, save_filename=None, profile=None):
         """
-        모든 차트 일괄 생성
+        역별 시간대별 순유출입(승차 - 하차) 히트맵
         
         Args:
-            analyzer (SubwayPatternAnalyzer): 분석 객체
+            net_df (DataFrame): 역 × 시간대 순유출입 또는 누적 수지
+                인덱스: 역명, 컬럼: H00 ~ H23 (analyze_net_flow 반환값의 'net' / 'balance')
+            top_n (int): 변동폭(|값|의 최댓값) 기준 상위 N개 역
+            cumulative (bool): 누적 수지 여부 (제목/범례 표시용)
+            save_filename (str): 저장할 파일명
+            profile (str): 저장 프로파일 ('draft', 'standard', 'publication' 등, None이면 기본값)
+        """
+        title = '누적 수지' if cumulative else '순유출입'
+        print(f"\n🔄 역별 시간대별 {title} 히트맵 생성 중 (TOP {top_n})...")
+        
+        # 변동폭 기준 상위 N개 역
+        swing = net_df.abs().max(axis=1)
+        top = net_df.loc[swing.nlargest(top_n).index]
+        top.columns = [col[1:] for col in top.columns]  # H08 -> 08
+        
+        plt = _pyplot()
+        # 그래프 크기
+        fig, ax = plt.subplots(figsize=(16, max(10, len(top) * 0.3)))
+        
+        # 0을 중심으로 하는 발산형 색상 (빨강: 유출, 파랑: 흡수)
+        limit = float(np.abs(top.to_numpy()).max()) if len(top) else 1.0
+        import seaborn as sns
+        sns.heatmap(top,
+                    cmap='RdBu_r',
+                    center=0,
+                    vmin=-limit,
+                    vmax=limit,
+                    annot=False,
+                    cbar_kws={'label': f'{title} (명, + 유출 / - 흡수)'},
+                    linewidths=0.5,
+                    linecolor='white',
+                    ax=ax)
+        
+        # 그래프 꾸미기
+        ax.set_xlabel('시간대', fontsize=12, fontweight='bold')
+        ax.set_ylabel('역명', fontsize=12, fontweight='bold')
+        ax.set_title(f'서울시 지하철 역별 시간대별 {title} (하루 평균, TOP {len(top)})',
+                    fontsize=16, fontweight='bold', pad=20)
+        ax.set_xticklabels(ax.get_xticklabels(), rotation=0, fontsize=9)
+        ax.set_yticklabels(ax.get_yticklabels(), fontsize=9, rotation=0)
+        
+        # 레이아웃
+        plt.tight_layout()
+        
+        # 저장
+        if save_filename is None:
+            prefix = 'net_balance' if cumulative else 'net_flow'
+            save_filename = self._default_filename(f"{prefix}_heatmap", profile)
+        
+        filepath = os.path.join(self.save_path, save_filename)
+        save_figure(filepath, profile or self.profile)
+        print(f"✅ 저장 완료: {filepath}")
+        
+        plt.close()
+        
+        return filepath
+    
+    @cached_chart
+    def plot_station_clusters(self, cluster_df, save_filename=None, profile=None):
+        """
+        역 군집별 평균 시간대 프로파일 그래프
+        
+        Args:
+            cluster_df (DataFrame): 역별 군집 결과 (analyze_station_clusters 반환값)
+                필수 컬럼: CLUSTER, ON_XX, OFF_XX
+            save_filename (str): 저장할 파일명
+            profile (str): 저장 프로파일 ('draft', 'standard', 'publication' 등, None이면 기본값)
+        """
+        print("\n🧩 역 군집별 프로파일 그래프 생성 중...")
+        
+        on_cols = [col for col in cluster_df.columns if col.startswith('ON_')]
+        off_cols = [col for col in cluster_df.columns if col.startswith('OFF_')]
+        hours = [int(col.split('_')[1]) for col in on_cols]
+        
+        # 군집별 평균 프로파일 (= k-means 중심)
+        centers = cluster_df.groupby('CLUSTER')[on_cols + off_cols].mean()
+        sizes = cluster_df['CLUSTER'].value_counts()
+        
+        plt = _pyplot()
+        fig, axes = plt.subplots(1, 2, figsize=(16, 6), sharey=True)
+        import seaborn as sns
+        colors = sns.color_palette("husl", len(centers))
+        
+        for (cluster, center), color in zip(centers.iterrows(), colors):
+            label = f'군집 {cluster} ({sizes.get(cluster, 0)}개 역)'
+            axes[0].plot(hours, center[on_cols].values * 100, marker='o', markersize=4,
+                         linewidth=2, color=color, label=label)
+            axes[1].plot(hours, center[off_cols].values * 100, marker='o', markersize=4,
+                         linewidth=2, color=color, label=label)
+        
+        for ax, title in zip(axes, ['승차 프로파일', '하차 프로파일']):
+            ax.axvspan(7, 9, alpha=0.15, color='yellow')
+            ax.axvspan(18, 20, alpha=0.15, color='orange')
+            ax.set_title(title, fontsize=13, fontweight='bold')
+            ax.set_xlabel('시간대', fontsize=12, fontweight='bold')
+            ax.set_xticks(range(0, 24, 2))
+            ax.set_xticklabels([f'{h:02d}' for h in range(0, 24, 2)])
+            ax.grid(True, alpha=0.3, linestyle='--')
+        
+        axes[0].set_ylabel('하루 이용량 대비 비율 (%)', fontsize=12, fontweight='bold')
+        axes[1].legend(loc='upper right', fontsize=10, framealpha=0.9)
+        fig.suptitle('서울시 지하철 역 군집별 시간대 이용 프로파일', fontsize=16, fontweight='bold')
+        
+        # 레이아웃
+        plt.tight_layout()
+        
+        # 저장
+        if save_filename is None:
+            save_filename = self._default_filename("station_clusters", profile)
+        
+        filepath = os.path.join(self.save_path, save_filename)
+        save_figure(filepath, profile or self.profile)
+        print(f"✅ 저장 완료: {filepath}")
+        
+        plt.close()
+        
+        return filepath
+    
+    def plot_station_profiles(self, profile_df, rows=6, cols=8, output='png', parallel=True,
+                              max_workers=None, dpi=100, save_prefix=None):
+        """
+        전체 역 24시간 승하차 프로파일 (페이지당 rows × cols개 역 소형 다중 차트)
+        
+        Args:
+            profile_df (DataFrame): 역별 시간대 승하차 (get_station_profiles 반환값)
+                필수 컬럼: ON_XX, OFF_XX
+            rows, cols (int): 페이지당 행/열 수
+            output (str): 'png' (페이지별 이미지) 또는 'pdf' (여러 페이지 PDF 하나)
+            parallel (bool): PNG 페이지를 프로세스 풀로 병렬 렌더링
+            max_workers (int): 최대 프로세스 수
+            dpi (int): PNG 해상도
+            save_prefix (str): 파일명 접두어 (None이면 자동 생성)
         
         Returns:
-            dict: 생성된 차트 파일 경로들
+            list: 저장된 파일 경로
         """
-        print("\n" + "="*60)
-        print("📊 모든 차트 생성 시작")
-        print("="*60)
+        print(f"\n🗂️  역별 프로파일 소형 다중 차트 생성 중 ({len(profile_df)}개 역, {output.upper()})...")
         
-        charts = {}
+        on_cols = [col for col in profile_df.columns if col.startswith('ON_')]
+        off_cols = [col for col in profile_df.columns if col.startswith('OFF_')]
+        hours = [int(col.split('_')[1]) for col in on_cols]
+        
+        if save_prefix is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            save_prefix = f"station_profiles_{timestamp}"
+        
+        from .small_multiples import render_station_profiles
+        
+        _pyplot()  # 현재 프로세스에서 그리는 경우에도 같은 스타일
+        result = render_station_profiles(profile_df.index.to_numpy(), hours,
+                                          profile_df[on_cols].to_numpy(), profile_df[off_cols].to_numpy(),
+                                          self.save_path, save_prefix, rows=rows, cols=cols,
+                                          output=output, parallel=parallel, max_workers=max_workers, dpi=dpi)
+        
+        print(f"✅ 저장 완료: {result['n_pages']}페이지, 파일 {len(result['files'])}개")
+        print(f"   ⏱️  {result['seconds']:.2f}초 ({result['stations_per_second']:,.1f}역/초)")
+        if result['files']:
+            print(f"   📁 {result['files'][0]}" + (" ..." if len(result['files']) > 1 else ""))
+        
+        return result['files']
+    
+    def chart_specs(self, analyzer):
+        """
+        일괄 생성할 차트 명세 목록 (분석은 여기서 끝내고 그리기에 필요한 데이터만 담음)
+        
+        Args:
+            analyzer (SubwayPatternAnalyzer): 분석 객체
+        
+        Returns:
+            list: [(차트 이름, 그리기 메서드 이름, 인자 dict), ...]
+        """
+        specs = []
+        if analyzer.df_processed is None:
+            return specs
         
         # 1. 시간대별 패턴
-        if analyzer.df_processed is not None:
-            hourly_df = analyzer.analyze_time_pattern()
-            if hourly_df is not None:
-                charts['hourly'] = self.plot_hourly_pattern(hourly_df)
+        hourly_df = analyzer.analyze_time_pattern()
+        if hourly_df is not None:
+            specs.append(('hourly', 'plot_hourly_pattern', {'hourly_df': hourly_df}))
         
         # 2. 요일별 패턴
-        if analyzer.df_processed is not None:
-            weekday_df = analyzer.analyze_weekday_pattern()
-            if weekday_df is not None:
-                charts['weekday'] = self.plot_weekday_pattern(weekday_df)
+        weekday_df = analyzer.analyze_weekday_pattern()
+        if weekday_df is not None:
+            specs.append(('weekday', 'plot_weekday_pattern', {'weekday_df': weekday_df}))
         
         # 3. 역별 TOP 20
-        if analyzer.df_processed is not None:
-            station_df = analyzer.analyze_station_characteristics(top_n=20)
-            if station_df is not None:
-                charts['stations'] = self.plot_top_stations(station_df, top_n=20)
+        station_df = analyzer.analyze_station_characteristics(top_n=20)
+        if station_df is not None:
+            specs.append(('stations', 'plot_top_stations', {'station_df': station_df, 'top_n': 20}))
+        
+        # 4. 히트맵 (원본 대신 상위 역 × 시간대 표만 전달)
+        heatmap_table = station_heatmap_table(analyzer.df_processed, top_n=30)
+        if heatmap_table is not None:
+            specs.append(('heatmap', 'plot_heatmap_table', {'top_stations': heatmap_table, 'top_n': 30}))
+        
+        # 5. 순유출입 히트맵
+        net_flow = analyzer.analyze_net_flow()
+        if net_flow is not None and net_flow['n_days'] > 0:
+            specs.append(('net_flow', 'plot_net_flow_heatmap', {'net_df': net_flow['net'], 'top_n': 30}))
+        
+        # 6. 역 군집 프로파일
+        cluster_df = analyzer.analyze_station_clusters()
+        if cluster_df is not None:
+            specs.append(('clusters', 'plot_station_clusters', {'cluster_df': cluster_df}))
+        
+        # 7. 전체 역 × 일자·시간대 래스터 히트맵 (군집 순 정렬)
+        matrix_df = analyzer.get_station_hour_matrix(by_date=True)
+        if matrix_df is not None and matrix_df.size > 0:
+            specs.append(('network_heatmap', 'plot_raster_heatmap', {
+                'matrix_df': matrix_df,
+                'sort_by': 'cluster' if cluster_df is not None else 'total',
+                'clusters': cluster_df['CLUSTER'] if cluster_df is not None else None,
+                'title': f'서울시 지하철 전체 역 일자·시간대별 승차 ({len(matrix_df)}개 역)',
+            }))
+        
+        return specs
+    
+    def render_charts(self, specs, parallel=False, max_workers=None):
+        """
+        차트 명세 렌더링
+        
+        parallel=True면 명세마다 별도 프로세스(Agg 백엔드)에서 그리므로
+        전체 시간이 가장 느린 차트 하나의 시간에 가까워진다.
+        
+        Args:
+            specs (list): chart_specs() 결과
+            parallel (bool): 프로세스 풀 병렬 렌더링
+            max_workers (int): 최대 프로세스 수 (None이면 min(차트 수, CPU 수))
+        
+        Returns:
+            tuple: (차트 이름 → 파일 경로 dict, 차트 이름 → 렌더링 시간(초) dict)
+        """
+        charts = {}
+        render_times = {}
+        if not specs:
+            return charts, render_times
+        
+        if parallel:
+            # 캐시 적중 차트는 부모에서 바로 반환하고, 나머지만 프로세스 풀로 보냄
+            pending = []
+            for name, method, kwargs in specs:
+                key = None
+                if self.chart_cache is not None:
+                    method_func = getattr(SubwayVisualizer, method)
+                    func = getattr(method_func, '__wrapped__', method_func)
+                    params = _chart_params(func, (), kwargs)[0]
+                    params['profile'] = params.get('profile') or self.profile
+                    key = chart_key(func.__name__, params)
+                    filepath = self.chart_cache.get(key, self.save_path)
+                    if filepath:
+                        print(f"♻️  변경 없음, 기존 차트 사용: {filepath}")
+                        charts[name], render_times[name] = filepath, 0.0
+                        continue
+                pending.append((name, method, kwargs, key))
+            
+            if pending:
+                workers = max_workers or min(len(pending), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as pool:
+                    futures = [(name, key, pool.submit(_render_chart, self.save_path, method, kwargs, self.profile))
+                               for name, method, kwargs, key in pending]
+                    for name, key, future in futures:
+                        try:
+                            charts[name], render_times[name] = future.result()
+                        except Exception as e:
+                            print(f"❌ {name} 차트 생성 실패: {str(e)}")
+                            charts[name] = None
+                            continue
+                        if key is not None and charts[name]:
+                            self.chart_cache.put(key, charts[name])
+        else:
+            for name, method, kwargs in specs:
+                started = time.perf_counter()
+                charts[name] = getattr(self, method)(**kwargs)
+                render_times[name] = time.perf_counter() - started
+        
+        if self.chart_cache is not None:
+            self.chart_cache.flush()  # 적중 기록은 배치마다 한 번 저장
+        
+        # 명세 순서대로 정렬
+        charts = {name: charts[name] for name, _, _ in specs if name in charts}
+        return charts, render_times
+    
+    def generate_all_charts(self, analyzer, parallel=False, max_workers=None, profile=None):
+        """
+        모든 차트 일괄 생성
+        
+        Args:
+            analyzer (SubwayPatternAnalyzer): 분석 객체
+            parallel (bool): 차트별 프로세스 병렬 렌더링
+            max_workers (int): 최대 프로세스 수
+            profile (str): 이번 생성에만 쓸 저장 프로파일 (None이면 기본값)
+        
+        Returns:
+            dict: 생성된 차트 파일 경로들 (차트별 렌더링 시간은 self.render_times)
+        """
+        print("\n" + "="*60)
+        print("📊 모든 차트 생성 시작")
+        print("="*60)
+        
+        specs = self.chart_specs(analyzer)
+        if profile is not None:
+            get_render_profile(profile)
+            specs = [(name, method, {**kwargs, 'profile': profile}) for name, method, kwargs in specs]
         
-        # 4. 히트맵
-        if analyzer.df_processed is not None:
-            charts['heatmap'] = self.plot_station_heatmap(analyzer.df_processed, top_n=30)
+        started = time.perf_counter()
+        charts, self.render_times = self.render_charts(specs, parallel=parallel, max_workers=max_workers)
+        elapsed = time.perf_counter() - started
         
         print("\n" + "="*60)
         print(f"🎉 차트 생성 완료! 총 {len(charts)}개")
@@ -392,6 +912,13 @@ class SubwayVisualizer:
         
         for chart_type, filepath in charts.items():
             if filepath:
-                print(f"  📈 {chart_type}: {filepath}")
+                seconds = self.render_times.get(chart_type)
+                timing = f" ({seconds:.2f}초)" if seconds is not None else ""
+                print(f"  📈 {chart_type}: {filepath}{timing}")
+        
+        mode = "병렬" if parallel else "순차"
+        print(f"\n⏱️  렌더링 {elapsed:.2f}초 ({mode}, 차트별 합계 {sum(self.render_times.values()):.2f}초)")
+        if self.chart_cache is not None:
+            print(f"♻️  캐시 적중 누적 {self.chart_cache.hits}회 / 새로 렌더링 {self.chart_cache.misses}회")
         
         return charts
@@ -0,0 +1,33 @@
+"""
+집계 API 저장소 테스트
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.api.aggregate_server import AggregateStore
+
+
+def _frame():
+    df = pd.DataFrame({
+        'USE_DT': pd.to_datetime(['2024-08-01', '2024-08-01', '2024-08-01', '2024-08-02']),
+        'SBWY_ROUT_LN_NM': ['1호선', '2호선', '1호선', None],
+        'STTN': ['시청', '시청', None, '서울역'],
+    })
+    for h in (8, 9):
+        df[f'HR_{h}_GET_ON_NOPE'] = [10, 20, 999, 5]
+        df[f'HR_{h}_GET_OFF_NOPE'] = [1, 2, 999, 3]
+    return df
+
+
+def test_rows_without_station_or_line_are_excluded():
+    store = AggregateStore(_frame(), version='test')
+
+    rank = store.station_rank({})
+    assert rank['STATION'].tolist() == ['시청']
+    assert rank['TOTAL'].tolist() == [66]
+
+    heatmap = store.station_heatmap({'line': '1호선'})
+    assert heatmap['STATION'].tolist() == ['시청']
+    assert heatmap['H08'].tolist() == [11]
+    assert np.array_equal(store.hourly({})['BOARDING'], [30, 30])
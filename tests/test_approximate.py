@@ -0,0 +1,28 @@
+"""
+층화 표본 근사 분석 테스트
+"""
+
+import pandas as pd
+
+from src.analysis.approximate import StratifiedSample
+
+
+def test_full_sample_matches_exact_totals_with_missing_keys():
+    df = pd.DataFrame({
+        'USE_DT': pd.to_datetime(['2024-08-01', '2024-08-01', '2024-08-02', '2024-08-02', '2024-08-02']),
+        'SBWY_ROUT_LN_NM': ['1호선', '1호선', '1호선', None, '1호선'],
+        'STTN': ['A', 'B', 'A', 'B', None],
+    })
+    df['HR_8_GET_ON_NOPE'] = [10, 5, 30, 500, 500]
+    df['HR_8_GET_OFF_NOPE'] = [0, 0, 0, 0, 0]
+    df['HR_18_GET_ON_NOPE'] = [0, 0, 0, 0, 0]
+    df['HR_18_GET_OFF_NOPE'] = [1, 15, 3, 500, 500]
+
+    sample = StratifiedSample(df, fraction=1.0)
+    stats = sample.station_stats()
+
+    # 역명/노선명이 없는 행은 제외한 정확값과 일치
+    assert stats['TOTAL'].to_dict() == {'A': 44, 'B': 20}
+    assert stats['TOTAL_SE'].tolist() == [0, 0]
+    assert sample.n_population == 3
+    assert sample.hourly_stats()['BOARDING'].tolist() == [45, 0]
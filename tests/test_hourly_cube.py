@@ -0,0 +1,52 @@
+"""
+HourlyCube 생성 테스트
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.hourly_cube import HourlyCube
+
+
+def _frame():
+    df = pd.DataFrame({
+        'USE_DT': pd.to_datetime(['2024-08-01', '2024-08-01', '2024-08-01', '2024-08-02', '2024-08-02']),
+        'SBWY_ROUT_LN_NM': ['1호선', '2호선', '1호선', '1호선', '1호선'],
+        'STTN': ['시청', '시청', None, '서울역', '시청'],
+    })
+    for h in (8, 9):
+        df[f'HR_{h}_GET_ON_NOPE'] = [10, 20, 999, 5, 7]
+        df[f'HR_{h}_GET_OFF_NOPE'] = [1, 2, 999, 3, 4]
+    return df
+
+
+def test_missing_station_rows_are_dropped():
+    df = _frame()
+    cube = HourlyCube.from_dataframe(df)
+
+    assert list(cube.stations) == ['서울역', '시청']
+    expected = df.groupby('STTN')['HR_8_GET_ON_NOPE'].sum()
+    assert cube.boarding[:, :, 0].sum(axis=1).tolist() == expected.loc[list(cube.stations)].tolist()
+    # 환승역(두 노선)은 같은 역·일자로 합산
+    assert cube.boarding[1, 0].tolist() == [30, 30]
+    assert cube.row_counts.tolist() == [2, 2]
+
+
+def test_missing_date_rows_are_dropped():
+    df = _frame()
+    df.loc[0, 'USE_DT'] = pd.NaT
+    cube = HourlyCube.from_dataframe(df)
+
+    assert len(cube.dates) == 2
+    assert cube.boarding[1, 0].tolist() == [20, 20]
+    assert np.array_equal(cube.row_counts, [1, 2])
+
+
+def test_measure_selects_array_and_rejects_unknown_name():
+    cube = HourlyCube.from_dataframe(_frame())
+
+    assert cube.measure('boarding') is cube.boarding
+    assert np.array_equal(cube.measure('total'), cube.boarding + cube.alighting)
+    with pytest.raises(ValueError):
+        cube.measure('bogus')
@@ -0,0 +1,48 @@
+"""
+SubwaySketches 분위수 / 병합 테스트
+"""
+
+import pandas as pd
+
+from src.analysis.sketches import SubwaySketches
+
+
+def _frame(dates):
+    rows = []
+    for date in dates:
+        # 환승역(시청)은 노선별로 두 행
+        rows.append({'USE_DT': date, 'SBWY_ROUT_LN_NM': '1호선', 'STTN': '시청', 'HR_8_GET_ON_NOPE': 100})
+        rows.append({'USE_DT': date, 'SBWY_ROUT_LN_NM': '2호선', 'STTN': '시청', 'HR_8_GET_ON_NOPE': 50})
+        rows.append({'USE_DT': date, 'SBWY_ROUT_LN_NM': '1호선', 'STTN': '서울역', 'HR_8_GET_ON_NOPE': 70})
+    df = pd.DataFrame(rows)
+    df['USE_DT'] = pd.to_datetime(df['USE_DT'])
+    df['HR_8_GET_OFF_NOPE'] = 0
+    return df
+
+
+def test_transfer_station_lines_are_summed():
+    sketches = SubwaySketches(measure='boarding').update(_frame(['2024-08-01', '2024-08-02']))
+
+    assert sketches.station_quantiles['시청'].n == 2
+    assert sketches.station_quantiles['시청'].quantile(0.5) == 150
+    assert sketches.station_quantiles['서울역'].quantile(0.5) == 70
+
+
+def test_merge_does_not_share_sketches_with_source():
+    source = SubwaySketches().update(_frame(['2024-08-01']))
+    target = SubwaySketches().merge(source)
+    target.update(_frame(['2024-09-01']))
+
+    assert source.station_quantiles['시청'].n == 1
+    assert target.station_quantiles['시청'].n == 2
+
+
+def test_missing_names_are_not_counted():
+    df = _frame(['2024-08-01'])
+    df.loc[2, 'STTN'] = None
+    df.loc[1, 'SBWY_ROUT_LN_NM'] = None
+    sketches = SubwaySketches().update(df)
+
+    assert sketches.stations.count() == 1
+    assert sketches.lines.count() == 1
+    assert sorted(sketches.station_quantiles) == ['시청']
@@ -0,0 +1,23 @@
+"""
+StationClusteredFrame 오프셋 인덱스 테스트
+"""
+
+import pandas as pd
+
+from src.analysis.station_layout import StationClusteredFrame
+
+
+def test_missing_station_rows_are_excluded_from_offsets():
+    df = pd.DataFrame({
+        'USE_DT': pd.to_datetime(['2024-08-02', '2024-08-01', '2024-08-01', '2024-08-01', '2024-08-02']),
+        'STTN': ['시청', None, '시청', '서울역', None],
+        'HR_8_GET_ON_NOPE': [1, 2, 3, 4, 5],
+        'HR_8_GET_OFF_NOPE': [1, 2, 3, 4, 5],
+    })
+    layout = StationClusteredFrame.from_dataframe(df)
+
+    assert list(layout.stations) == ['서울역', '시청']
+    assert layout.offsets.tolist() == [0, 1, 3]
+    last = layout.get_station('시청')
+    assert last['STTN'].tolist() == ['시청', '시청']
+    assert last['HR_8_GET_ON_NOPE'].tolist() == [3, 1]
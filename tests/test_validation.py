@@ -0,0 +1,28 @@
+"""
+데이터 무결성 검사 테스트
+"""
+
+import io
+
+import pandas as pd
+
+from src.analysis.validation import validate_dataframe
+
+
+def test_blank_date_drops_only_that_row():
+    # 빈 일자가 하나라도 있으면 JOB_YMD가 float64로 읽힘
+    csv = (
+        "JOB_YMD,SBWY_ROUT_LN_NM,STTN,HR_8_GET_ON_NOPE,HR_8_GET_OFF_NOPE\n"
+        "20240301,1호선,시청,10,1\n"
+        ",1호선,서울역,20,2\n"
+        "20240302,1호선,시청,30,3\n"
+    )
+    df = pd.read_csv(io.StringIO(csv))
+    assert df['JOB_YMD'].dtype == 'float64'
+
+    clean, report = validate_dataframe(df, year_month='2024-03')
+
+    assert report['invalid_dates'] == 1
+    assert report['out_of_month'] == 0
+    assert clean['STTN'].tolist() == ['시청', '시청']
+    assert clean['HR_8_GET_ON_NOPE'].tolist() == [10, 30]